@@ -7,6 +7,8 @@ Key behavior:
 - Selects multiple strong reference images per product (hero + alternatives)
 - Produces token-efficient compact output for narrated script generation
 - Writes learning-loop artifacts to Obsidian-compatible markdown + JSONL
+- Drives the browser over one persistent CDP session (several product tabs
+  at once); falls back to one `openclaw browser` process per command
 
 No Firecrawl dependency.
 """
@@ -14,12 +16,15 @@ No Firecrawl dependency.
 from __future__ import annotations
 
 import argparse
+import asyncio
+import concurrent.futures
 import hashlib
 import json
 import os
 import re
 import subprocess
 import sys
+import threading
 import time
 import urllib.parse
 import urllib.request
@@ -156,7 +161,8 @@ def _parse_product_urls(urls: list[str]) -> list[ProductSeed]:
     return seeds
 
 
-def _run_browser_json(args: list[str], timeout_ms: int = 45000, attempts: int = 3) -> dict[str, Any]:
+def _run_browser_cli(args: list[str], timeout_ms: int = 45000, attempts: int = 3) -> dict[str, Any]:
+    """One `openclaw browser --json` subprocess per command (the fallback path)."""
     if attempts < 1:
         attempts = 1
     backoff = [0.8, 2.0, 5.0]
@@ -230,6 +236,296 @@ def _run_browser_json(args: list[str], timeout_ms: int = 45000, attempts: int =
     raise BrowserError(last_error)
 
 
+def _run_browser_json(args: list[str], timeout_ms: int = 45000, attempts: int = 3) -> dict[str, Any]:
+    """Run one browser command and return its JSON payload.
+
+    Goes through the persistent session when one is attached to the current
+    profile; commands it does not implement (snapshot, click, start, ...) and
+    any session failure fall back to the per-command CLI, serialized so
+    concurrent product workers never spawn overlapping CLI processes.
+    """
+    global _SESSION
+    session = _SESSION
+    if session is not None and session.profile == BROWSER_PROFILE:
+        try:
+            return session.run(args, timeout_ms=timeout_ms)
+        except _SessionUnsupported:
+            pass
+        except _SessionLost as exc:
+            print(f"[amazon_intel] browser session lost ({exc}); using CLI fallback", file=sys.stderr, flush=True)
+            if _SESSION is session:
+                _SESSION = None
+            session.close()
+    with _CLI_LOCK:
+        return _run_browser_cli(args, timeout_ms=timeout_ms, attempts=attempts)
+
+
+# ---------------------------------------------------------------------------
+# Persistent browser session (one CDP connection, recycled tabs)
+# ---------------------------------------------------------------------------
+
+DEFAULT_CDP_URL = "http://127.0.0.1:18800"
+_CLI_LOCK = threading.Lock()
+
+
+class _SessionUnsupported(Exception):
+    """Command is not implemented natively; caller should use the CLI."""
+
+
+class _SessionLost(Exception):
+    """The CDP connection is gone; the session cannot be used any more."""
+
+
+def _cli_flags(args: list[str]) -> tuple[list[str], dict[str, str]]:
+    """Split CLI-style args into (positionals, {--flag: value})."""
+    positional: list[str] = []
+    flags: dict[str, str] = {}
+    i = 0
+    while i < len(args):
+        token = str(args[i])
+        if token.startswith("--") and i + 1 < len(args):
+            flags[token[2:]] = str(args[i + 1])
+            i += 2
+            continue
+        positional.append(token)
+        i += 1
+    return positional, flags
+
+
+class PersistentBrowser:
+    """Long-lived client for the OpenClaw browser over one pooled CDP connection.
+
+    Speaks the same JSON command protocol as `openclaw browser --json`
+    (open / focus / wait / evaluate / close / tabs) so call sites do not
+    change, but every command is a message on an existing connection instead
+    of a process launch plus CDP handshake. Commands from any thread are run
+    on one background event loop, so several product tabs load and evaluate
+    concurrently in the same browser. Closed tabs are parked on about:blank
+    and reused by the next open, up to ``keep_tabs``.
+    """
+
+    def __init__(self, cdp_url: str, *, profile: str = "", keep_tabs: int = 4, connect=None):
+        self.cdp_url = cdp_url
+        self.profile = profile
+        self.keep_tabs = max(0, int(keep_tabs))
+        self._connect = connect or self._connect_playwright
+        self._pages: dict[str, Any] = {}
+        self._idle: list[Any] = []
+        self._browser: Any = None
+        self._closer: Any = None
+        self._closed = False
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="amazon-intel-cdp", daemon=True)
+        self._thread.start()
+
+    # -- lifecycle ---------------------------------------------------------
+
+    async def _connect_playwright(self, cdp_url: str) -> tuple[Any, Any]:
+        from playwright.async_api import async_playwright
+
+        pw = await async_playwright().start()
+        try:
+            browser = await pw.chromium.connect_over_cdp(cdp_url)
+        except Exception:
+            await pw.stop()
+            raise
+        return browser, pw.stop
+
+    def connect(self, timeout_sec: float = 30.0) -> "PersistentBrowser":
+        async def _go() -> None:
+            self._browser, self._closer = await self._connect(self.cdp_url)
+
+        try:
+            self._submit(_go(), timeout_sec)
+        except Exception as exc:
+            self.close()
+            raise _SessionLost(f"cdp_connect_failed:{exc}") from None
+        return self
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+
+        async def _shutdown() -> None:
+            for page in self._idle:
+                try:
+                    await page.close()
+                except Exception:
+                    pass
+            self._idle.clear()
+            if self._closer is not None:
+                await self._closer()
+
+        if self._loop.is_running():
+            try:
+                asyncio.run_coroutine_threadsafe(_shutdown(), self._loop).result(timeout=15)
+            except Exception:
+                pass
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(timeout=5)
+
+    def _submit(self, coro, timeout_sec: float) -> Any:
+        future = asyncio.run_coroutine_threadsafe(coro, self._loop)
+        try:
+            return future.result(timeout=timeout_sec)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise BrowserError("browser_command_timeout") from None
+
+    # -- protocol ----------------------------------------------------------
+
+    def run(self, args: list[str], timeout_ms: int = 45000) -> dict[str, Any]:
+        """Execute one CLI-style command; returns the CLI's JSON shape."""
+        if self._closed:
+            raise _SessionLost("session_closed")
+        positional, flags = _cli_flags(args)
+        if not positional:
+            raise _SessionUnsupported("empty_command")
+        handler = getattr(self, f"_cmd_{positional[0]}", None)
+        if handler is None:
+            raise _SessionUnsupported(positional[0])
+        if DEBUG_BROWSER:
+            print(f"[amazon_intel][session] {' '.join(str(a) for a in args)}", file=sys.stderr, flush=True)
+        try:
+            return self._submit(handler(positional[1:], flags, timeout_ms), timeout_ms / 1000.0 + 5.0)
+        except (BrowserError, _SessionUnsupported):
+            raise
+        except Exception as exc:
+            if self._browser is not None and not self._browser.is_connected():
+                raise _SessionLost(str(exc)) from None
+            raise BrowserError(str(exc)) from None
+
+    async def _target_id(self, page: Any) -> str:
+        for tid, known in self._pages.items():
+            if known is page:
+                return tid
+        cdp = await page.context.new_cdp_session(page)
+        try:
+            info = await cdp.send("Target.getTargetInfo")
+        finally:
+            await cdp.detach()
+        tid = str(info["targetInfo"]["targetId"])
+        self._pages[tid] = page
+        return tid
+
+    def _all_pages(self) -> list[Any]:
+        return [page for ctx in self._browser.contexts for page in ctx.pages]
+
+    async def _page(self, target_id: str) -> Any:
+        page = self._pages.get(target_id)
+        if page is not None and not page.is_closed():
+            return page
+        for candidate in self._all_pages():
+            if await self._target_id(candidate) == target_id:
+                return candidate
+        raise BrowserError(f"browser target closed: {target_id}")
+
+    async def _cmd_open(self, pos: list[str], flags: dict[str, str], timeout_ms: int) -> dict[str, Any]:
+        if not pos:
+            raise BrowserError("browser_open_missing_url")
+        page = None
+        while self._idle and page is None:
+            candidate = self._idle.pop()
+            page = None if candidate.is_closed() else candidate
+        if page is None:
+            contexts = self._browser.contexts
+            context = contexts[0] if contexts else await self._browser.new_context()
+            page = await context.new_page()
+        await page.goto(pos[0], wait_until="commit", timeout=timeout_ms)
+        return {"ok": True, "targetId": await self._target_id(page), "url": page.url}
+
+    async def _cmd_focus(self, pos: list[str], flags: dict[str, str], timeout_ms: int) -> dict[str, Any]:
+        page = await self._page(pos[0] if pos else flags.get("target-id", ""))
+        await page.bring_to_front()
+        return {"ok": True}
+
+    async def _cmd_wait(self, pos: list[str], flags: dict[str, str], timeout_ms: int) -> dict[str, Any]:
+        wait_timeout = int(flags.get("timeout-ms", timeout_ms))
+        if "time" in flags:
+            await asyncio.sleep(int(flags["time"]) / 1000.0)
+            return {"ok": True}
+        page = await self._page(flags.get("target-id", ""))
+        if "load" in flags:
+            await page.wait_for_load_state(flags["load"], timeout=wait_timeout)
+        if "fn" in flags:
+            await page.wait_for_function(flags["fn"], timeout=wait_timeout)
+        return {"ok": True}
+
+    async def _cmd_evaluate(self, pos: list[str], flags: dict[str, str], timeout_ms: int) -> dict[str, Any]:
+        page = await self._page(flags.get("target-id", ""))
+        return {"ok": True, "result": await page.evaluate(flags.get("fn", "() => null"))}
+
+    async def _cmd_close(self, pos: list[str], flags: dict[str, str], timeout_ms: int) -> dict[str, Any]:
+        target_id = pos[0] if pos else flags.get("target-id", "")
+        page = await self._page(target_id)
+        self._pages.pop(target_id, None)
+        if len(self._idle) < self.keep_tabs:
+            # Recycle: park the tab instead of tearing down its renderer
+            await page.goto("about:blank")
+            self._pages[target_id] = page
+            self._idle.append(page)
+        else:
+            await page.close()
+        return {"ok": True, "targetId": target_id}
+
+    async def _cmd_tabs(self, pos: list[str], flags: dict[str, str], timeout_ms: int) -> dict[str, Any]:
+        tabs = []
+        for page in self._all_pages():
+            if page in self._idle:
+                continue
+            tabs.append({
+                "targetId": await self._target_id(page),
+                "type": "page",
+                "url": page.url,
+                "title": await page.title(),
+            })
+        return {"tabs": tabs}
+
+
+_SESSION: PersistentBrowser | None = None
+
+
+def _resolve_cdp_url() -> str:
+    """CDP endpoint of the OpenClaw browser for the current profile."""
+    explicit = os.getenv("OPENCLAW_CDP_URL", "").strip()
+    if explicit:
+        return explicit
+    try:
+        status = _run_browser_cli(["status"], timeout_ms=15000, attempts=1)
+    except BrowserError:
+        status = {}
+    for key in ("cdpUrl", "cdpHttpUrl"):
+        if str(status.get(key) or "").startswith("http"):
+            return str(status[key])
+    if status.get("cdpPort"):
+        return f"http://127.0.0.1:{int(status['cdpPort'])}"
+    return DEFAULT_CDP_URL
+
+
+def _open_browser_session(keep_tabs: int) -> PersistentBrowser | None:
+    """Attach a persistent session to BROWSER_PROFILE, or None to stay on the CLI."""
+    global _SESSION
+    try:
+        import playwright  # noqa: F401
+    except ImportError:
+        print("[amazon_intel] playwright not installed; using per-command CLI", file=sys.stderr, flush=True)
+        return None
+    try:
+        _SESSION = PersistentBrowser(_resolve_cdp_url(), profile=BROWSER_PROFILE, keep_tabs=keep_tabs).connect()
+    except _SessionLost as exc:
+        print(f"[amazon_intel] browser session unavailable ({exc}); using per-command CLI", file=sys.stderr, flush=True)
+        _SESSION = None
+    return _SESSION
+
+
+def _close_browser_session() -> None:
+    global _SESSION
+    if _SESSION is not None:
+        _SESSION.close()
+        _SESSION = None
+
+
 def _browser_prepare() -> None:
     try:
         _run_browser_json(["start"], timeout_ms=45000)
@@ -1481,6 +1777,43 @@ def _collect_one_product(
     return intel
 
 
+def _collect_with_retries(
+    seed: ProductSeed,
+    profile: str,
+    attempts: int,
+    collect_kwargs: dict[str, Any],
+) -> tuple[dict[str, Any] | None, str]:
+    """Collect one product on one profile. Returns (intel or None, last_error)."""
+    last_error = "unknown_error"
+    for attempt in range(1, attempts + 1):
+        try:
+            intel = _collect_one_product(seed, **collect_kwargs)
+            intel["source_meta"]["browser_profile"] = profile
+            return intel, ""
+        except Exception as exc:
+            last_error = f"[profile={profile}] {exc}"
+            if attempt < attempts:
+                if _SESSION is None:
+                    with _CLI_LOCK:
+                        subprocess.run(
+                            [
+                                "openclaw",
+                                "browser",
+                                "--json",
+                                "--timeout",
+                                "60000",
+                                "--browser-profile",
+                                profile,
+                                "start",
+                            ],
+                            capture_output=True,
+                            text=True,
+                            check=False,
+                        )
+                time.sleep(min(8.0, 1.5 * attempt))
+    return None, last_error
+
+
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Collect deep product intelligence from Amazon pages via OpenClaw browser")
     parser.add_argument("--category", default="unspecified")
@@ -1504,6 +1837,17 @@ def parse_args() -> argparse.Namespace:
         help="If robot check appears, wait N seconds for manual solve before re-checking.",
     )
     parser.add_argument("--no-pre-cleanup", action="store_true", help="Do not close existing Amazon tabs before run.")
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=3,
+        help="Product tabs scraped at once over the persistent browser session.",
+    )
+    parser.add_argument(
+        "--no-browser-session",
+        action="store_true",
+        help="Spawn one `openclaw browser` process per command (legacy path, one product at a time).",
+    )
     parser.add_argument("--browser-profile", default="")
     parser.add_argument(
         "--browser-profiles",
@@ -1571,55 +1915,52 @@ def main() -> int:
             cleanup_meta["profiles"].append(item)
 
     errors: list[dict[str, Any]] = []
-    products: list[dict[str, Any]] = []
+    collect_kwargs = {
+        "category": str(args.category).strip(),
+        "max_reviews": max(6, int(args.max_reviews_per_product)),
+        "image_candidates": max(4, int(args.max_image_candidates)),
+        "download_count": max(0, int(args.download_image_count)),
+        "assets_dir": assets_dir,
+        "raw_dir": raw_dir,
+        "close_tab": not bool(args.keep_product_tabs),
+        "wait_on_robot_check_sec": max(0, int(args.wait_on_robot_check_sec)),
+        "require_sitestripe_shortlink": not bool(args.allow_missing_sitestripe_shortlink),
+    }
+    attempts = max(1, int(args.product_attempts))
+    results: list[dict[str, Any] | None] = [None] * len(seeds)
+    last_errors = ["unknown_error"] * len(seeds)
 
-    for seed in seeds:
-        last_error = "unknown_error"
-        attempts = max(1, int(args.product_attempts))
-        for profile in profile_order:
-            BROWSER_PROFILE = profile
-            _browser_prepare()
-            for attempt in range(1, attempts + 1):
-                try:
-                    intel = _collect_one_product(
-                        seed,
-                        category=str(args.category).strip(),
-                        max_reviews=max(6, int(args.max_reviews_per_product)),
-                        image_candidates=max(4, int(args.max_image_candidates)),
-                        download_count=max(0, int(args.download_image_count)),
-                        assets_dir=assets_dir,
-                        raw_dir=raw_dir,
-                        close_tab=not bool(args.keep_product_tabs),
-                        wait_on_robot_check_sec=max(0, int(args.wait_on_robot_check_sec)),
-                        require_sitestripe_shortlink=not bool(args.allow_missing_sitestripe_shortlink),
-                    )
-                    intel["source_meta"]["browser_profile"] = profile
-                    products.append(intel)
-                    last_error = ""
-                    break
-                except Exception as exc:
-                    last_error = f"[profile={profile}] {exc}"
-                    if attempt < attempts:
-                        subprocess.run(
-                            [
-                                "openclaw",
-                                "browser",
-                                "--json",
-                                "--timeout",
-                                "60000",
-                                "--browser-profile",
-                                BROWSER_PROFILE,
-                                "start",
-                            ],
-                            capture_output=True,
-                            text=True,
-                            check=False,
-                        )
-                        time.sleep(min(8.0, 1.5 * attempt))
-                    continue
-            if not last_error:
-                break
-        if last_error:
+    # First profile: one persistent session, several product tabs at once.
+    BROWSER_PROFILE = profile_order[0]
+    _browser_prepare()
+    workers = 1
+    if not args.no_browser_session:
+        if _open_browser_session(keep_tabs=max(1, int(args.concurrency))) is not None:
+            workers = max(1, min(int(args.concurrency), len(seeds)))
+    try:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as pool:
+            outcomes = pool.map(
+                lambda seed: _collect_with_retries(seed, profile_order[0], attempts, collect_kwargs),
+                seeds,
+            )
+            for i, (intel, last_error) in enumerate(outcomes):
+                results[i], last_errors[i] = intel, last_error
+    finally:
+        _close_browser_session()
+
+    # Remaining profiles: per-command CLI, one product at a time.
+    for profile in profile_order[1:]:
+        pending = [i for i, intel in enumerate(results) if intel is None]
+        if not pending:
+            break
+        BROWSER_PROFILE = profile
+        _browser_prepare()
+        for i in pending:
+            results[i], last_errors[i] = _collect_with_retries(seeds[i], profile, attempts, collect_kwargs)
+
+    products: list[dict[str, Any]] = [intel for intel in results if intel is not None]
+    for seed, intel, last_error in zip(seeds, results, last_errors):
+        if intel is None:
             errors.append({"asin": seed.asin, "product_url": seed.product_url, "error": last_error})
 
     compact_pack = {
@@ -463,5 +463,190 @@ class TestNormalizeSitestripeEdgeCases(unittest.TestCase):
 import re
 
 
+
+# ---------------------------------------------------------------------------
+# Test: persistent browser session (fake async CDP browser)
+# ---------------------------------------------------------------------------
+
+import asyncio
+import threading
+import time
+from unittest import mock
+
+
+class _FakeCdp:
+    def __init__(self, page):
+        self.page = page
+
+    async def send(self, method):
+        return {"targetInfo": {"targetId": self.page.tid}}
+
+    async def detach(self):
+        pass
+
+
+class _FakePage:
+    LOAD_SEC = 0.3
+
+    def __init__(self, context, tid):
+        self.context, self.tid, self.url, self._closed = context, tid, "about:blank", False
+        self.evaluated: list[str] = []
+
+    async def goto(self, url, **kw):
+        if url != "about:blank":
+            await asyncio.sleep(self.LOAD_SEC)
+        self.url = url
+
+    async def evaluate(self, fn):
+        self.evaluated.append(fn)
+        return {"href": self.url}
+
+    async def wait_for_load_state(self, state, timeout=None):
+        pass
+
+    async def wait_for_function(self, fn, timeout=None):
+        pass
+
+    async def bring_to_front(self):
+        pass
+
+    async def title(self):
+        return "Amazon"
+
+    async def close(self):
+        self._closed = True
+        self.context.pages.remove(self)
+
+    def is_closed(self):
+        return self._closed
+
+
+class _FakeContext:
+    def __init__(self):
+        self.pages: list[_FakePage] = []
+        self.created = 0
+
+    async def new_page(self):
+        self.created += 1
+        page = _FakePage(self, f"T{self.created}")
+        self.pages.append(page)
+        return page
+
+    async def new_cdp_session(self, page):
+        return _FakeCdp(page)
+
+
+class _FakeBrowser:
+    def __init__(self):
+        self.contexts = [_FakeContext()]
+        self.connected = True
+
+    def is_connected(self):
+        return self.connected
+
+
+class TestPersistentBrowser(unittest.TestCase):
+    def setUp(self):
+        self.browser = _FakeBrowser()
+        self.stopped = False
+
+        async def connect(url):
+            async def stop():
+                self.stopped = True
+            return self.browser, stop
+
+        self.session = mod.PersistentBrowser("http://cdp", profile="p", keep_tabs=2, connect=connect).connect()
+        self.addCleanup(self.session.close)
+
+    def test_same_protocol_as_cli(self):
+        out = self.session.run(["open", "https://www.amazon.com/dp/B000000001"])
+        tid = out["targetId"]
+        self.assertEqual(tid, "T1")
+        self.session.run(["wait", "--target-id", tid, "--load", "domcontentloaded", "--timeout-ms", "30000"])
+        res = self.session.run(["evaluate", "--target-id", tid, "--fn", "() => location.href"])
+        self.assertEqual(res["result"], {"href": "https://www.amazon.com/dp/B000000001"})
+        tabs = self.session.run(["tabs"])["tabs"]
+        self.assertEqual([t["targetId"] for t in tabs], ["T1"])
+        with self.assertRaises(mod._SessionUnsupported):
+            self.session.run(["snapshot", "--target-id", tid, "--format", "ai"])
+
+    def test_closed_tabs_are_recycled(self):
+        first = self.session.run(["open", "https://www.amazon.com/dp/B000000001"])["targetId"]
+        self.session.run(["close", first])
+        self.assertEqual(self.session.run(["tabs"])["tabs"], [])
+        second = self.session.run(["open", "https://www.amazon.com/dp/B000000002"])["targetId"]
+        self.assertEqual(second, first)
+        self.assertEqual(self.browser.contexts[0].created, 1)
+
+    def test_tabs_run_concurrently(self):
+        def product(n):
+            tid = self.session.run(["open", f"https://www.amazon.com/dp/B00000000{n}"])["targetId"]
+            self.session.run(["wait", "--time", "200"])
+            self.session.run(["close", tid])
+
+        threads = [threading.Thread(target=product, args=(n,)) for n in range(4)]
+        start = time.monotonic()
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        # Serial would be 4 x (0.3 s load + 0.2 s wait)
+        self.assertLess(time.monotonic() - start, 2 * (_FakePage.LOAD_SEC + 0.2))
+
+    def test_unknown_target_is_browser_error(self):
+        with self.assertRaises(mod.BrowserError):
+            self.session.run(["evaluate", "--target-id", "nope", "--fn", "() => 1"])
+
+    def test_close_stops_connection(self):
+        self.session.close()
+        self.assertTrue(self.stopped)
+        with self.assertRaises(mod._SessionLost):
+            self.session.run(["tabs"])
+
+
+class TestRunBrowserJsonDispatch(unittest.TestCase):
+    def setUp(self):
+        self._saved = (mod._SESSION, mod.BROWSER_PROFILE)
+        mod.BROWSER_PROFILE = "p"
+
+    def tearDown(self):
+        mod._SESSION, mod.BROWSER_PROFILE = self._saved
+
+    def test_session_used_for_native_commands(self):
+        session = mock.Mock(profile="p")
+        session.run.return_value = {"tabs": []}
+        mod._SESSION = session
+        with mock.patch.object(mod, "_run_browser_cli") as cli:
+            self.assertEqual(mod._run_browser_json(["tabs"]), {"tabs": []})
+        cli.assert_not_called()
+
+    def test_unsupported_command_falls_back_to_cli(self):
+        session = mock.Mock(profile="p")
+        session.run.side_effect = mod._SessionUnsupported("snapshot")
+        mod._SESSION = session
+        with mock.patch.object(mod, "_run_browser_cli", return_value={"refs": {}}) as cli:
+            self.assertEqual(mod._run_browser_json(["snapshot"]), {"refs": {}})
+        cli.assert_called_once()
+        self.assertIs(mod._SESSION, session)
+
+    def test_lost_session_detached(self):
+        session = mock.Mock(profile="p")
+        session.run.side_effect = mod._SessionLost("ws closed")
+        mod._SESSION = session
+        with mock.patch.object(mod, "_run_browser_cli", return_value={}) as cli:
+            mod._run_browser_json(["tabs"])
+            mod._run_browser_json(["tabs"])
+        self.assertIsNone(mod._SESSION)
+        self.assertEqual(cli.call_count, 2)
+        self.assertEqual(session.run.call_count, 1)
+
+    def test_other_profile_uses_cli(self):
+        mod._SESSION = mock.Mock(profile="other")
+        with mock.patch.object(mod, "_run_browser_cli", return_value={}) as cli:
+            mod._run_browser_json(["tabs"])
+        mod._SESSION.run.assert_not_called()
+        cli.assert_called_once()
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -16,7 +16,9 @@ import hashlib
 import hmac
 import json
 import os
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
@@ -26,6 +28,9 @@ from urllib.request import Request, urlopen
 
 from rayvault.agent.jobs import JobExecutionError, execute_job
 from rayvault.agent.protocol import Envelope, JOB_STEPS, build_envelope, compute_inputs_hash, normalize_step_name, utc_now_iso
+from rayvault.agent.scheduler import NodeScheduler
+from rayvault.agent.transfer import stream_download
+from rayvault.blob_store import BlobStore, default_blob_root
 
 
 MAC_ONLY_STEPS = {
@@ -44,6 +49,9 @@ LEGACY_JOB_TYPE_MAP = {
 
 DEFAULT_STATE_DIR = Path("state/cluster")
 DEFAULT_NODES_FILE = DEFAULT_STATE_DIR / "nodes.json"
+DEFAULT_MAX_PARALLEL_DOWNLOADS = 4
+DEFAULT_EVENTS_WAIT_SEC = 25
+TERMINAL_JOB_STATUSES = {"succeeded", "failed", "cancelled", "completed", "error"}
 
 
 class ControllerError(RuntimeError):
@@ -59,6 +67,7 @@ class ClusterNode:
     enabled: bool = True
     timeout_sec: int = 15
     tags: List[str] = field(default_factory=list)
+    max_parallel_downloads: int = DEFAULT_MAX_PARALLEL_DOWNLOADS
 
     @property
     def base_url(self) -> str:
@@ -274,9 +283,15 @@ class RayVaultController:
             self.remote_poll_timeout_sec = int(controller_cfg.get("poll_timeout_sec", 900) or 900)
         except (ValueError, TypeError):
             self.remote_poll_timeout_sec = 900
+        try:
+            self.remote_events_wait_sec = int(controller_cfg.get("events_wait_sec", DEFAULT_EVENTS_WAIT_SEC))
+        except (ValueError, TypeError):
+            self.remote_events_wait_sec = DEFAULT_EVENTS_WAIT_SEC
 
         self.nodes = self._load_nodes(cfg)
         self._caps_cache: Dict[str, Dict[str, Any]] = {}
+        self.scheduler = NodeScheduler(self.state_dir / "scheduler.json")
+        self.blob_store = BlobStore(default_blob_root(self.state_dir / "blobs"))
 
     def _load_nodes(self, cfg: Dict[str, Any]) -> List[ClusterNode]:
         raw_nodes = cfg.get("nodes") if isinstance(cfg.get("nodes"), list) else []
@@ -296,6 +311,10 @@ class RayVaultController:
                 _timeout = int(item.get("timeout_sec", self.request_timeout_sec) or self.request_timeout_sec)
             except (ValueError, TypeError):
                 _timeout = self.request_timeout_sec
+            try:
+                _parallel = max(1, int(item.get("max_parallel_downloads", DEFAULT_MAX_PARALLEL_DOWNLOADS)))
+            except (ValueError, TypeError):
+                _parallel = DEFAULT_MAX_PARALLEL_DOWNLOADS
             out.append(
                 ClusterNode(
                     node_id=node_id,
@@ -305,6 +324,7 @@ class RayVaultController:
                     enabled=bool(item.get("enabled", True)),
                     timeout_sec=_timeout,
                     tags=[str(x) for x in item.get("tags", []) if str(x).strip()],
+                    max_parallel_downloads=_parallel,
                 )
             )
         return out
@@ -398,29 +418,17 @@ class RayVaultController:
         url_signed: str,
         url_secrets: List[str],
         out_path: Path,
-    ) -> None:
-        req = Request(url_signed, method="GET")
-        try:
-            with urlopen(req, timeout=node.timeout_sec) as resp:
-                data = resp.read()
-        except Exception as first_exc:
-            data = b""
-            ok = False
-            for url_secret in url_secrets:
-                try:
-                    req = Request(url_secret, method="GET")
-                    with urlopen(req, timeout=node.timeout_sec) as resp:
-                        data = resp.read()
-                    ok = True
-                    break
-                except Exception:
-                    continue
-            if not ok:
-                raise first_exc
-        out_path.parent.mkdir(parents=True, exist_ok=True)
-        tmp = out_path.with_suffix(out_path.suffix + ".tmp")
-        tmp.write_bytes(data)
-        os.replace(tmp, out_path)
+        expected_sha256: str = "",
+        expected_size: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """Stream one artifact to disk (resumable, sha256-checked)."""
+        return stream_download(
+            [url_signed, *url_secrets],
+            out_path,
+            expected_sha256=expected_sha256,
+            expected_size=expected_size,
+            timeout=node.timeout_sec,
+        )
 
     def _receipt_dir(self, run_id: str, job_id: str) -> Path:
         out = self.receipts_root / run_id / job_id
@@ -500,10 +508,12 @@ class RayVaultController:
         artifact_dir = receipt_dir / "artifacts"
         downloaded_files: List[Dict[str, Any]] = []
 
+        downloads: List[Tuple[str, Path, str, List[str], Dict[str, Any]]] = []
         for row in artifact_rows:
             if not isinstance(row, dict):
                 continue
-            name = str(row.get("name", "")).strip()
+            # Workers report {path, sha256, size_bytes}; the file name is the URL key
+            name = str(row.get("name") or Path(str(row.get("path", ""))).name).strip()
             if not name:
                 continue
             safe_name = name.replace("\\", "_").replace("/", "_")
@@ -514,30 +524,43 @@ class RayVaultController:
                 f"{node.base_url}/job/{job_id}/artifacts/{artifact_name_q}?{self._secret_query(sec)}"
                 for sec in self.secret_candidates
             ]
+            downloads.append((name, out_path, signed_u, secret_urls, row))
+
+        def _fetch(item: Tuple[str, Path, str, List[str], Dict[str, Any]]) -> Dict[str, Any]:
+            name, out_path, signed_u, secret_urls, row = item
             try:
-                self._download_remote_file(
+                size = int(row["size_bytes"]) if row.get("size_bytes") is not None else None
+            except (ValueError, TypeError):
+                size = None
+            try:
+                got = self._download_remote_file(
                     node=node,
                     url_signed=signed_u,
                     url_secrets=secret_urls,
                     out_path=out_path,
+                    expected_sha256=str(row.get("sha256") or ""),
+                    expected_size=size,
                 )
-                downloaded_files.append(
-                    {
-                        "name": name,
-                        "local_path": str(out_path),
-                        "size": out_path.stat().st_size if out_path.exists() else None,
-                        "sha256": row.get("sha256"),
-                    }
-                )
+                return {
+                    "name": name,
+                    "local_path": str(out_path),
+                    "size": got["size"],
+                    "sha256": row.get("sha256"),
+                    "sha256_verified": bool(row.get("sha256")),
+                    "resumed_bytes": got["resumed_bytes"],
+                }
             except Exception as exc:  # noqa: BLE001
-                downloaded_files.append(
-                    {
-                        "name": name,
-                        "local_path": "",
-                        "error": str(exc),
-                        "sha256": row.get("sha256"),
-                    }
-                )
+                return {
+                    "name": name,
+                    "local_path": "",
+                    "error": str(exc),
+                    "sha256": row.get("sha256"),
+                }
+
+        if downloads:
+            workers = max(1, min(node.max_parallel_downloads, len(downloads)))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                downloaded_files = list(pool.map(_fetch, downloads))
 
         # Optional bulk zip download (best-effort)
         zip_path = receipt_dir / "artifacts.zip"
@@ -595,6 +618,22 @@ class RayVaultController:
         timeout_sec: int,
     ) -> Tuple[Path, Dict[str, Any]]:
         deadline = time.time() + max(5, timeout_sec)
+        if self.remote_events_wait_sec > 0:
+            payload = self._wait_remote_events(
+                node=node,
+                run_id=run_id,
+                job_id=job_id,
+                inputs_hash=inputs_hash,
+                deadline=deadline,
+            )
+            if payload is not None:
+                return self._write_remote_artifacts_snapshot(
+                    node=node,
+                    run_id=run_id,
+                    job_id=job_id,
+                    inputs_hash=inputs_hash,
+                    status_payload=payload,
+                )
         while time.time() < deadline:
             query = self._signed_query(
                 run_id=run_id,
@@ -609,7 +648,7 @@ class RayVaultController:
                 timeout=node.timeout_sec,
             )
             status = str(_extract_job_record(payload).get("status", "")).strip().lower()
-            if status in {"succeeded", "failed", "cancelled", "completed", "error"}:
+            if status in TERMINAL_JOB_STATUSES:
                 return self._write_remote_artifacts_snapshot(
                     node=node,
                     run_id=run_id,
@@ -623,10 +662,121 @@ class RayVaultController:
             f"remote job polling timed out after {timeout_sec}s: node={node.node_id} job_id={job_id}"
         )
 
+    def _wait_remote_events(
+        self,
+        *,
+        node: ClusterNode,
+        run_id: str,
+        job_id: str,
+        inputs_hash: str,
+        deadline: float,
+    ) -> Optional[Dict[str, Any]]:
+        """Long-poll /job/{id}/events until the job is terminal.
+
+        Returns a status payload ({"ok", "job"}) or None when the worker has
+        no events endpoint (older workers) or the call fails; the caller then
+        falls back to interval polling.
+        """
+        since = 0
+        while time.time() < deadline:
+            wait = max(1, min(self.remote_events_wait_sec, int(deadline - time.time())))
+            query = self._signed_query(
+                run_id=run_id,
+                job_id=job_id,
+                step_name="JOB_EVENTS",
+                inputs_hash=inputs_hash,
+            )
+            url = f"{node.base_url}/job/{job_id}/events?{query}&{urlencode({'since': since, 'wait': wait})}"
+            try:
+                payload = _http_json("GET", url, timeout=node.timeout_sec + wait)
+            except ControllerError:
+                return None
+            try:
+                since = int(payload.get("cursor", since))
+            except (ValueError, TypeError):
+                return None
+            if payload.get("done"):
+                return {"ok": True, "job": payload.get("job") or {}}
+        return None
+
+    def watch_remote_jobs(
+        self,
+        *,
+        node: ClusterNode,
+        run_id: str,
+        job_ids: List[str],
+        timeout_sec: Optional[int] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """Wait for many jobs on one node over a single long-poll stream.
+
+        Returns {job_id: job_record} for every job that reached a terminal
+        state before the timeout. Raises ControllerError when the worker has
+        no /events endpoint.
+        """
+        ids = sorted({str(j).strip() for j in job_ids if str(j).strip()})
+        if not ids:
+            return {}
+        inputs_hash = compute_inputs_hash({"jobs": ids})
+        deadline = time.time() + max(5, timeout_sec or self.remote_poll_timeout_sec)
+        wait_cap = max(1, self.remote_events_wait_sec or DEFAULT_EVENTS_WAIT_SEC)
+        since = 0
+        finished: Dict[str, Dict[str, Any]] = {}
+        while time.time() < deadline:
+            wait = max(1, min(wait_cap, int(deadline - time.time())))
+            query = self._signed_query(
+                run_id=run_id,
+                job_id="events",
+                step_name="JOB_EVENTS",
+                inputs_hash=inputs_hash,
+            )
+            params = urlencode({"jobs": ",".join(ids), "since": since, "wait": wait})
+            payload = _http_json("GET", f"{node.base_url}/events?{query}&{params}", timeout=node.timeout_sec + wait)
+            since = int(payload.get("cursor", since) or since)
+            records = payload.get("jobs") if isinstance(payload.get("jobs"), dict) else {}
+            for jid, rec in records.items():
+                if str((rec or {}).get("status", "")).strip().lower() in TERMINAL_JOB_STATUSES:
+                    finished[jid] = rec
+            if payload.get("done"):
+                break
+        return finished
+
     def _local_cache_path(self, *, step_name: str, inputs_hash: str) -> Path:
         safe = f"{step_name.lower()}_{inputs_hash}.json"
         return self.state_dir / "local_cache" / safe
 
+    def _store_local_blobs(self, artifacts: List[Any], cache_key: str) -> List[Dict[str, str]]:
+        """Move local artifacts into the blob store so a cache hit survives cleanup."""
+        out: List[Dict[str, str]] = []
+        for art in artifacts:
+            if not isinstance(art, dict) or not art.get("path"):
+                continue
+            p = Path(str(art["path"]))
+            if not p.is_file():
+                continue
+            try:
+                sha = self.blob_store.put_file(p, sha256=str(art.get("sha256") or ""))
+            except OSError:
+                continue
+            self.blob_store.add_ref(sha, f"key:local_cache/{cache_key}")
+            out.append({"path": str(p), "sha256": sha})
+        return out
+
+    def _restore_local_blobs(self, cached: Dict[str, Any]) -> bool:
+        """Relink any artifact of a cached local result that was deleted.
+
+        False when a file is gone from both its path and the store: the
+        cached result can no longer be served.
+        """
+        for row in cached.get("blobs") or []:
+            p = Path(str(row.get("path", "")))
+            if p.is_file():
+                continue
+            sha = str(row.get("sha256", ""))
+            if not self.blob_store.has(sha):
+                return False
+            self.blob_store.materialize(sha, p)
+        return True
+
     def _run_local(
         self,
         *,
@@ -638,7 +788,7 @@ class RayVaultController:
         force: bool,
     ) -> SubmitResult:
         cache_path = self._local_cache_path(step_name=step_name, inputs_hash=inputs_hash)
-        if cache_path.exists() and not force:
+        if cache_path.exists() and not force and self._restore_local_blobs(_read_json(cache_path)):
             cached = _read_json(cache_path)
             return SubmitResult(
                 ok=bool(cached.get("ok", True)),
@@ -698,6 +848,7 @@ class RayVaultController:
                     "status": status,
                     "exit_code": exit_code,
                     "receipt_path": str(receipt_path),
+                    "blobs": self._store_local_blobs(receipt["artifacts"], cache_path.stem),
                 },
             )
             return SubmitResult(
@@ -903,6 +1054,164 @@ class RayVaultController:
             status_payload=status_payload,
         )
 
+    def _refresh_load(self, node: ClusterNode) -> None:
+        if not self.scheduler.health_stale(node.node_id):
+            return
+        try:
+            health = _http_json("GET", f"{node.base_url}/health", timeout=node.timeout_sec)
+        except ControllerError:
+            return
+        if isinstance(health, dict):
+            self.scheduler.update_health(node.node_id, health)
+
+    def _rank_workers(self, nodes: List[ClusterNode], step: str, inputs_hash: str = "") -> List[ClusterNode]:
+        """Order nodes by expected completion (live load x EWMA step time)."""
+        if len(nodes) < 2:
+            return list(nodes)
+        for node in nodes:
+            self._refresh_load(node)
+        return self.scheduler.rank(nodes, step, inputs_hash)
+
+    def _dispatch_remote(
+        self,
+        node: ClusterNode,
+        *,
+        run_id: str,
+        job_id: str,
+        step: str,
+        payload: Dict[str, Any],
+        hash_value: str,
+    ) -> SubmitResult:
+        """Submit one job to node and wait for its receipt.
+
+        Returns ok=False when the job ran and failed; raises on transport or
+        auth errors so callers can try another node.
+        """
+        self.scheduler.begin(node.node_id, step)
+        try:
+            return self._dispatch_remote_once(
+                node, run_id=run_id, job_id=job_id, step=step, payload=payload, hash_value=hash_value,
+            )
+        finally:
+            self.scheduler.end(node.node_id, step)
+            try:
+                self.scheduler.save()
+            except OSError:
+                pass
+
+    def _dispatch_remote_once(
+        self,
+        node: ClusterNode,
+        *,
+        run_id: str,
+        job_id: str,
+        step: str,
+        payload: Dict[str, Any],
+        hash_value: str,
+    ) -> SubmitResult:
+        caps = self._caps_cache.get(node.node_id, {})
+        compat_mode = str((caps or {}).get("_compat_mode", "")).strip()
+
+        if compat_mode.startswith("legacy_"):
+            submitted = {}
+            legacy_base = {
+                "run_id": run_id,
+                "job_id": job_id,
+                "step_name": step.lower(),
+                "job_type": _legacy_job_type(step),
+                "params": payload or {},
+            }
+            submitted_ok = False
+            for idx, sec in enumerate(self.secret_candidates):
+                try:
+                    signed_body = self._sign_legacy_body(legacy_base, secret=sec, candidate=-1)
+                    submitted = _http_json(
+                        "POST",
+                        f"{node.base_url}/job",
+                        body=signed_body,
+                        timeout=node.timeout_sec,
+                    )
+                    if isinstance(submitted, dict):
+                        submitted["_auth_mode"] = "hmac_strong"
+                        submitted["_auth_secret_index"] = idx
+                    submitted_ok = True
+                    break
+                except ControllerError:
+                    continue
+
+            if not submitted_ok and self.allow_plain_fallback:
+                for idx, sec in enumerate(self.secret_candidates):
+                    try:
+                        plain_body = dict(legacy_base)
+                        plain_body["auth_token"] = sec
+                        submitted = _http_json(
+                            "POST",
+                            f"{node.base_url}/job",
+                            body=plain_body,
+                            timeout=node.timeout_sec,
+                        )
+                        if isinstance(submitted, dict):
+                            submitted["_auth_mode"] = "plain_fallback"
+                            submitted["_auth_secret_index"] = idx
+                        submitted_ok = True
+                        break
+                    except ControllerError:
+                        continue
+
+            if not submitted_ok:
+                raise ControllerError(
+                    f"{node.node_id}: legacy job submit auth failed (hmac and plain={self.allow_plain_fallback})"
+                )
+        else:
+            env = build_envelope(
+                run_id=run_id,
+                job_id=job_id,
+                step_name=step,
+                inputs_hash=hash_value,
+                secret=self.cluster_secret,
+                timestamp=utc_now_iso(),
+            )
+            body = dict(env)
+            body["message_type"] = "submit_job"
+            body["payload"] = payload or {}
+            submitted = _http_json("POST", f"{node.base_url}/job", body=body, timeout=node.timeout_sec)
+        submitted_job_id = (
+            str((_extract_job_record(submitted).get("job_id") or job_id)).strip() or job_id
+        )
+
+        receipt_path, receipt = self._poll_remote_status(
+            node=node,
+            run_id=run_id,
+            job_id=submitted_job_id,
+            inputs_hash=hash_value,
+            timeout_sec=self.remote_poll_timeout_sec,
+        )
+        job_status = str(receipt.get("status", "unknown"))
+        ok_status = _job_is_success(
+            receipt.get("job_status")
+            if isinstance(receipt.get("job_status"), dict)
+            else {"status": job_status}
+        )
+        self.scheduler.observe_receipt(
+            node.node_id, step, receipt, inputs_hash=hash_value if ok_status else "",
+        )
+        return SubmitResult(
+            ok=ok_status,
+            mode="remote",
+            run_id=run_id,
+            job_id=submitted_job_id,
+            step_name=step,
+            status=job_status,
+            node_id=node.node_id,
+            idempotent=bool(submitted.get("idempotent", False)),
+            exit_code=int(receipt.get("exit_code", 0) or 0),
+            message="" if ok_status else (
+                f"{node.node_id}: remote job failed status={job_status} "
+                f"receipt={receipt_path}"
+            ),
+            receipt_path=str(receipt_path),
+        )
+
     def submit_job(
         self,
         *,
@@ -917,9 +1226,7 @@ class RayVaultController:
     ) -> SubmitResult:
         step = normalize_step_name(step_name)
         hash_value = (inputs_hash or compute_inputs_hash(payload or {})).strip().lower()
-        reqs = requirements if isinstance(requirements, dict) else {}
-        if not reqs and isinstance(payload.get("requirements"), dict):
-            reqs = payload["requirements"]
+        reqs = _job_requirements(requirements, payload)
 
         if step in MAC_ONLY_STEPS or step not in JOB_STEPS:
             return self._run_local(
@@ -973,6 +1280,8 @@ class RayVaultController:
                 return fallback
             raise ControllerError(msg)
 
+        candidate_workers = self._rank_workers(candidate_workers, step, hash_value)
+
         attempts = 2  # initial + one retry
         last_error = ""
         fatal_remote_error = False
@@ -986,108 +1295,18 @@ class RayVaultController:
                         unsupported_count += 1
                         continue
 
-                    caps = self._caps_cache.get(node.node_id, {})
-                    compat_mode = str((caps or {}).get("_compat_mode", "")).strip()
-
-                    if compat_mode.startswith("legacy_"):
-                        submitted = {}
-                        legacy_base = {
-                            "run_id": run_id,
-                            "job_id": job_id,
-                            "step_name": step.lower(),
-                            "job_type": _legacy_job_type(step),
-                            "params": payload or {},
-                        }
-                        submitted_ok = False
-                        for idx, sec in enumerate(self.secret_candidates):
-                            try:
-                                signed_body = self._sign_legacy_body(legacy_base, secret=sec, candidate=-1)
-                                submitted = _http_json(
-                                    "POST",
-                                    f"{node.base_url}/job",
-                                    body=signed_body,
-                                    timeout=node.timeout_sec,
-                                )
-                                if isinstance(submitted, dict):
-                                    submitted["_auth_mode"] = "hmac_strong"
-                                    submitted["_auth_secret_index"] = idx
-                                submitted_ok = True
-                                break
-                            except ControllerError:
-                                continue
-
-                        if not submitted_ok and self.allow_plain_fallback:
-                            for idx, sec in enumerate(self.secret_candidates):
-                                try:
-                                    plain_body = dict(legacy_base)
-                                    plain_body["auth_token"] = sec
-                                    submitted = _http_json(
-                                        "POST",
-                                        f"{node.base_url}/job",
-                                        body=plain_body,
-                                        timeout=node.timeout_sec,
-                                    )
-                                    if isinstance(submitted, dict):
-                                        submitted["_auth_mode"] = "plain_fallback"
-                                        submitted["_auth_secret_index"] = idx
-                                    submitted_ok = True
-                                    break
-                                except ControllerError:
-                                    continue
-
-                        if not submitted_ok:
-                            raise ControllerError(
-                                f"{node.node_id}: legacy job submit auth failed (hmac and plain={self.allow_plain_fallback})"
-                            )
-                    else:
-                        env = build_envelope(
-                            run_id=run_id,
-                            job_id=job_id,
-                            step_name=step,
-                            inputs_hash=hash_value,
-                            secret=self.cluster_secret,
-                            timestamp=utc_now_iso(),
-                        )
-                        body = dict(env)
-                        body["message_type"] = "submit_job"
-                        body["payload"] = payload or {}
-                        submitted = _http_json("POST", f"{node.base_url}/job", body=body, timeout=node.timeout_sec)
-                    submitted_job_id = (
-                        str((_extract_job_record(submitted).get("job_id") or job_id)).strip() or job_id
-                    )
-
-                    receipt_path, receipt = self._poll_remote_status(
-                        node=node,
+                    result = self._dispatch_remote(
+                        node,
                         run_id=run_id,
-                        job_id=submitted_job_id,
-                        inputs_hash=hash_value,
-                        timeout_sec=self.remote_poll_timeout_sec,
+                        job_id=job_id,
+                        step=step,
+                        payload=payload,
+                        hash_value=hash_value,
                     )
-                    job_status = str(receipt.get("status", "unknown"))
-                    ok_status = _job_is_success(
-                        receipt.get("job_status")
-                        if isinstance(receipt.get("job_status"), dict)
-                        else {"status": job_status}
-                    )
-                    if not ok_status:
-                        last_error = (
-                            f"{node.node_id}: remote job failed status={job_status} "
-                            f"receipt={receipt_path}"
-                        )
+                    if not result.ok:
+                        last_error = result.message
                         continue
-                    return SubmitResult(
-                        ok=ok_status,
-                        mode="remote",
-                        run_id=run_id,
-                        job_id=submitted_job_id,
-                        step_name=step,
-                        status=job_status,
-                        node_id=node.node_id,
-                        idempotent=bool(submitted.get("idempotent", False)),
-                        exit_code=int(receipt.get("exit_code", 0) or 0),
-                        message="",
-                        receipt_path=str(receipt_path),
-                    )
+                    return result
                 except Exception as exc:  # noqa: BLE001
                     last_error = str(exc)
                     low = last_error.lower()
@@ -1118,6 +1337,159 @@ class RayVaultController:
 
         raise ControllerError(f"Remote submit failed after retries: {last_error}")
 
+    def submit_batch(
+        self,
+        *,
+        run_id: str,
+        step_name: str,
+        jobs: List[Dict[str, Any]],
+        requirements: Optional[Dict[str, Any]] = None,
+        force: bool = False,
+        allow_local_fallback: bool = True,
+    ) -> List[SubmitResult]:
+        """Fan many jobs of one step out across all eligible workers.
+
+        jobs: [{"job_id", "payload", "inputs_hash"?}, ...]. Jobs wait in a
+        controller-side queue; every node gets one dispatcher per lane slot
+        (from /health) and pulls the next job when a slot frees, so idle
+        nodes take work a busy node has not started yet. A node that errors
+        stops pulling; its failed jobs go through submit_job() (retries on
+        other nodes, then local fallback).
+
+        Requirements resolve per job as in submit_job(): the batch-level
+        argument, else payload["requirements"]; a node only pulls jobs it
+        satisfies. Returns one result per job in input order; a job that
+        could not run anywhere gets ok=False, mode="error".
+        """
+        step = normalize_step_name(step_name)
+        items: List[Dict[str, Any]] = []
+        for job in jobs:
+            payload = job.get("payload") if isinstance(job.get("payload"), dict) else {}
+            items.append(
+                {
+                    "job_id": str(job.get("job_id", "")).strip(),
+                    "payload": payload,
+                    "requirements": _job_requirements(requirements, payload),
+                    "inputs_hash": (
+                        str(job.get("inputs_hash") or "") or compute_inputs_hash(payload)
+                    ).strip().lower(),
+                }
+            )
+
+        def _single(item: Dict[str, Any]) -> SubmitResult:
+            try:
+                return self.submit_job(
+                    run_id=run_id,
+                    job_id=item["job_id"],
+                    step_name=step,
+                    payload=item["payload"],
+                    requirements=item["requirements"],
+                    inputs_hash=item["inputs_hash"],
+                    force=force,
+                    allow_local_fallback=allow_local_fallback,
+                )
+            except Exception as exc:  # noqa: BLE001
+                return SubmitResult(
+                    ok=False,
+                    mode="error",
+                    run_id=run_id,
+                    job_id=item["job_id"],
+                    step_name=step,
+                    status="failed",
+                    message=str(exc),
+                )
+
+        nodes: List[ClusterNode] = []
+        if step not in MAC_ONLY_STEPS and step in JOB_STEPS:
+            for node in self.enabled_workers():
+                try:
+                    if self._remote_step_supported(node, step)[0]:
+                        nodes.append(node)
+                except Exception:  # noqa: BLE001
+                    continue
+
+        # Node ids that satisfy each job's requirements (checked once per distinct set)
+        eligible: List[set] = []
+        by_reqs: Dict[str, set] = {}
+        for item in items:
+            key = json.dumps(item["requirements"], sort_keys=True, default=str)
+            if key not in by_reqs:
+                ids = set()
+                for node in nodes:
+                    try:
+                        if self._worker_meets_requirements(node, item["requirements"])[0]:
+                            ids.add(node.node_id)
+                    except Exception:  # noqa: BLE001
+                        continue
+                by_reqs[key] = ids
+            eligible.append(by_reqs[key])
+
+        nodes = [node for node in nodes if any(node.node_id in ids for ids in eligible)]
+        if not nodes:
+            return [_single(item) for item in items]
+
+        for node in nodes:
+            self._refresh_load(node)
+        nodes = self.scheduler.rank(nodes, step)
+
+        results: List[Optional[SubmitResult]] = [None] * len(items)
+        pending = [idx for idx in range(len(items)) if eligible[idx]]
+        retry: List[int] = [idx for idx in range(len(items)) if not eligible[idx]]
+        bad_nodes: set = set()
+        lock = threading.Lock()
+
+        def _lane(node: ClusterNode) -> None:
+            while True:
+                with lock:
+                    if node.node_id in bad_nodes:
+                        return
+                    idx = next((i for i in pending if node.node_id in eligible[i]), None)
+                    if idx is None:
+                        return
+                    pending.remove(idx)
+                item = items[idx]
+                try:
+                    res = self._dispatch_remote(
+                        node,
+                        run_id=run_id,
+                        job_id=item["job_id"],
+                        step=step,
+                        payload=item["payload"],
+                        hash_value=item["inputs_hash"],
+                    )
+                except Exception:  # noqa: BLE001
+                    with lock:
+                        bad_nodes.add(node.node_id)
+                        retry.append(idx)
+                    return
+                if res.ok:
+                    results[idx] = res
+                else:
+                    with lock:
+                        retry.append(idx)
+
+        lanes = [node for node in nodes for _ in range(self.scheduler.step_slots(node.node_id, step))]
+        lanes = lanes[: max(1, len(items))]
+        with ThreadPoolExecutor(max_workers=len(lanes)) as pool:
+            list(pool.map(_lane, lanes))
+
+        # Anything left (every node went bad), failed remotely, or with no
+        # eligible node takes the single-job path
+        for idx in sorted(set(retry) | set(pending)):
+            results[idx] = _single(items[idx])
+        return [
+            r if r is not None else _single(items[idx])
+            for idx, r in enumerate(results)
+        ]
+
+
+def _job_requirements(requirements: Optional[Dict[str, Any]], payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Batch/CLI requirements when given, else the job's payload["requirements"]."""
+    if isinstance(requirements, dict) and requirements:
+        return requirements
+    reqs = (payload or {}).get("requirements")
+    return reqs if isinstance(reqs, dict) else {}
+
 
 def _load_payload_arg(payload_json: str, payload_file: str) -> Dict[str, Any]:
     if payload_file:
@@ -1209,6 +1581,30 @@ def _cmd_submit(ctrl: RayVaultController, args: argparse.Namespace) -> int:
     return 0 if out.ok else 2
 
 
+def _cmd_submit_batch(ctrl: RayVaultController, args: argparse.Namespace) -> int:
+    p = Path(args.jobs_file).expanduser()
+    if not p.exists():
+        raise ControllerError(f"jobs file not found: {p}")
+    jobs = json.loads(p.read_text(encoding="utf-8"))
+    if isinstance(jobs, dict):
+        jobs = jobs.get("jobs")
+    if not isinstance(jobs, list) or not all(isinstance(j, dict) for j in jobs):
+        raise ControllerError("jobs file must contain a list of job objects (or {\"jobs\": [...]})")
+    requirements = _load_object_arg(args.requirements_json, args.requirements_file)
+
+    results = ctrl.submit_batch(
+        run_id=args.run_id,
+        step_name=args.step_name,
+        jobs=jobs,
+        requirements=requirements,
+        force=bool(args.force),
+        allow_local_fallback=not bool(args.no_local_fallback),
+    )
+    ok = all(r.ok for r in results)
+    print(json.dumps({"ok": ok, "results": [r.to_dict() for r in results]}, indent=2))
+    return 0 if ok else 2
+
+
 def _cmd_sync_artifacts(ctrl: RayVaultController, args: argparse.Namespace) -> int:
     workers = ctrl.enabled_workers()
     if not workers:
@@ -1260,6 +1656,16 @@ def build_parser() -> argparse.ArgumentParser:
     p_submit.add_argument("--no-local-fallback", action="store_true")
     p_submit.set_defaults(func=_cmd_submit)
 
+    p_batch = sub.add_parser("submit-batch", help="Fan out many jobs of one step across workers")
+    p_batch.add_argument("--run-id", required=True)
+    p_batch.add_argument("--step-name", required=True)
+    p_batch.add_argument("--jobs-file", required=True, help='JSON list of {"job_id", "payload", "inputs_hash"?}')
+    p_batch.add_argument("--requirements-json", default="")
+    p_batch.add_argument("--requirements-file", default="")
+    p_batch.add_argument("--force", action="store_true")
+    p_batch.add_argument("--no-local-fallback", action="store_true")
+    p_batch.set_defaults(func=_cmd_submit_batch)
+
     p_sync = sub.add_parser("sync-artifacts", help="Download remote artifacts/logs for an existing job_id")
     p_sync.add_argument("--run-id", required=True)
     p_sync.add_argument("--job-id", required=True)
@@ -0,0 +1,82 @@
+"""In-memory job event log behind the worker's long-poll events endpoints.
+
+Every status change and log line of a job becomes an event with a
+worker-wide sequence number. Clients keep the highest seq they have seen
+as a cursor and call wait() again with since=cursor; wait() blocks on a
+condition variable until something newer arrives, every watched job is
+terminal, or the timeout passes. One cursor works across any number of
+jobs, so a controller can watch a whole run over a single connection.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Tuple
+
+from rayvault.agent.protocol import utc_now_iso
+
+TERMINAL_STATUSES = {"succeeded", "failed", "cancelled", "completed", "error"}
+MAX_EVENTS_PER_JOB = 1000
+MAX_WAIT_SEC = 60.0
+
+
+class JobEventLog:
+    def __init__(self, max_events_per_job: int = MAX_EVENTS_PER_JOB):
+        self._cond = threading.Condition()
+        self._seq = 0
+        self._events: Dict[str, List[Dict[str, Any]]] = {}
+        self._terminal: Dict[str, bool] = {}
+        self._max = max(1, int(max_events_per_job))
+
+    def emit(self, job_id: str, kind: str, **data: Any) -> Dict[str, Any]:
+        """Record one event and wake every waiter."""
+        with self._cond:
+            self._seq += 1
+            ev = {"seq": self._seq, "ts": utc_now_iso(), "job_id": job_id, "type": kind, **data}
+            rows = self._events.setdefault(job_id, [])
+            rows.append(ev)
+            if len(rows) > self._max:
+                # Oldest log lines go first; a late reader still gets the tail
+                del rows[: len(rows) - self._max]
+            if kind == "status":
+                self._terminal[job_id] = str(data.get("status", "")).lower() in TERMINAL_STATUSES
+            self._cond.notify_all()
+            return ev
+
+    def cursor(self) -> int:
+        with self._cond:
+            return self._seq
+
+    def is_terminal(self, job_id: str) -> bool:
+        with self._cond:
+            return self._terminal.get(job_id, False)
+
+    def _since(self, job_ids: List[str], since: int) -> List[Dict[str, Any]]:
+        out: List[Dict[str, Any]] = []
+        for job_id in job_ids:
+            out.extend(ev for ev in self._events.get(job_id, ()) if ev["seq"] > since)
+        out.sort(key=lambda ev: ev["seq"])
+        return out
+
+    def wait(
+        self, job_ids: Iterable[str], since: int = 0, timeout: float = 25.0,
+    ) -> Tuple[List[Dict[str, Any]], int, bool]:
+        """Events newer than since for job_ids -> (events, cursor, all_terminal).
+
+        Returns as soon as there is at least one event or all jobs are
+        terminal; otherwise after timeout (capped at MAX_WAIT_SEC).
+        """
+        ids = list(dict.fromkeys(job_ids))
+        deadline = time.monotonic() + max(0.0, min(float(timeout), MAX_WAIT_SEC))
+        with self._cond:
+            while True:
+                events = self._since(ids, since)
+                done = all(self._terminal.get(j, False) for j in ids)
+                cursor = events[-1]["seq"] if events else max(since, 0)
+                if events or done:
+                    return events, cursor, done
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return events, cursor, done
+                self._cond.wait(remaining)
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import hashlib
 import json
 import os
 import platform
@@ -15,11 +14,21 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from rayvault.agent.protocol import Envelope
+from rayvault.blob_store import BlobStore, default_blob_root
 from rayvault.audio_postcheck import run_audio_postcheck
-from rayvault.tts_provider import cached_synthesize, get_provider, tts_input_hash
+from rayvault.frame_sampler import red_ratio, sample_frame_means
+from rayvault.tts_provider import (
+    SynthesisTask,
+    cached_synthesize,
+    get_provider,
+    provider_limiter,
+    run_synthesis,
+    tts_input_hash,
+)
 
 
 from rayvault.io import atomic_write_json as _atomic_write_json
+from rayvault.io import sha256_file
 
 
 class JobExecutionError(RuntimeError):
@@ -39,11 +48,7 @@ class JobArtifact:
 
 
 def _sha256_file(path: Path) -> str:
-    h = hashlib.sha256()
-    with open(path, "rb") as f:
-        for chunk in iter(lambda: f.read(1024 * 1024), b""):
-            h.update(chunk)
-    return h.hexdigest()
+    return sha256_file(path)
 
 
 def _artifact(path: Path) -> JobArtifact:
@@ -275,6 +280,54 @@ def detect_capabilities() -> Dict[str, Any]:
     return caps
 
 
+def _positive_int(value: Any) -> Optional[int]:
+    try:
+        n = int(value)
+    except (TypeError, ValueError):
+        return None
+    return n if n > 0 else None
+
+
+def _tts_chunk_task(
+    provider: Any,
+    text: str,
+    voice_id: str,
+    model_id: str,
+    settings: Dict[str, Any],
+    *,
+    cache_dir: Path,
+    out_dir: Path,
+    chunk_id: str,
+    wav_path: Path,
+) -> SynthesisTask:
+    """Provider request for one chunk; non-mock output is converted mp3→wav."""
+    if provider.name == "mock":
+        def synth() -> Path:
+            cached_synthesize(
+                provider, text, voice_id, wav_path,
+                cache_dir=cache_dir, model_id=model_id, settings=settings,
+            )
+            return wav_path
+
+        return SynthesisTask(key=chunk_id, text=text, synthesize=synth)
+
+    tmp_mp3 = out_dir / f"{chunk_id}.mp3"
+
+    def synth_mp3() -> Path:
+        cached_synthesize(
+            provider, text, voice_id, tmp_mp3,
+            cache_dir=cache_dir, model_id=model_id, settings=settings,
+        )
+        return tmp_mp3
+
+    def to_wav(mp3: Path) -> Path:
+        _convert_to_wav(mp3, wav_path)
+        mp3.unlink(missing_ok=True)
+        return wav_path
+
+    return SynthesisTask(key=chunk_id, text=text, synthesize=synth_mp3, post=to_wav)
+
+
 def _execute_tts_render_chunks(
     env: Envelope,
     payload: Dict[str, Any],
@@ -294,10 +347,13 @@ def _execute_tts_render_chunks(
     out_dir = _safe_output_dir(workspace_root, payload, f"artifacts/{env.job_id}/tts")
     cache_dir = (workspace_root / "cache" / "tts_chunks").resolve()
     cache_dir.mkdir(parents=True, exist_ok=True)
+    store = BlobStore(default_blob_root(workspace_root / "cache" / "blobs"))
+    force = bool(payload.get("force", False))
 
-    artifacts: List[JobArtifact] = []
-    chunk_meta: List[Dict[str, Any]] = []
-
+    # Pass 1: validate, resolve cache hits, and queue one synthesis per
+    # distinct input hash (repeated lines in a script are rendered once).
+    specs: List[Dict[str, Any]] = []
+    pending: Dict[str, SynthesisTask] = {}
     for i, chunk in enumerate(chunks, 1):
         if not isinstance(chunk, dict):
             raise JobExecutionError("INVALID_INPUT", f"chunk {i} must be object")
@@ -313,47 +369,69 @@ def _execute_tts_render_chunks(
             model_id=model_id,
             settings=settings,
         )
-        wav_name = f"{chunk_id}.wav"
-        wav_path = out_dir / wav_name
+        wav_path = out_dir / f"{chunk_id}.wav"
         cached_wav = cache_dir / f"{input_hash}.wav"
 
-        cache_hit = False
-        if cached_wav.exists() and not bool(payload.get("force", False)):
-            shutil.copy2(cached_wav, wav_path)
-            cache_hit = True
+        cached_sha = None if force else store.get_key("tts_chunks", input_hash)
+        if cached_sha is None and not force and cached_wav.exists():
+            # Pre-blob-store cache entry: adopt it
+            cached_sha = store.put_file(cached_wav)
+            store.set_key("tts_chunks", input_hash, cached_sha)
+        if cached_sha:
+            store.materialize(cached_sha, wav_path)
         else:
-            if provider.name == "mock":
-                cached_synthesize(
-                    provider,
-                    text,
-                    voice_id,
-                    wav_path,
-                    cache_dir=cache_dir,
-                    model_id=model_id,
-                    settings=settings,
-                )
-            else:
-                tmp_mp3 = out_dir / f"{chunk_id}.mp3"
-                cached_synthesize(
-                    provider,
-                    text,
-                    voice_id,
-                    tmp_mp3,
-                    cache_dir=cache_dir,
-                    model_id=model_id,
-                    settings=settings,
+            # wav_path may be a link into the store from an earlier run
+            wav_path.unlink(missing_ok=True)
+            if input_hash not in pending:
+                pending[input_hash] = _tts_chunk_task(
+                    provider, text, voice_id, model_id, settings,
+                    cache_dir=cache_dir, out_dir=out_dir, chunk_id=chunk_id,
+                    wav_path=wav_path,
                 )
-                _convert_to_wav(tmp_mp3, wav_path)
-                tmp_mp3.unlink(missing_ok=True)
+        specs.append({
+            "chunk_id": chunk_id,
+            "wav_path": wav_path,
+            "cached_wav": cached_wav,
+            "input_hash": input_hash,
+            "cache_hit": bool(cached_sha),
+        })
+
+    # Pass 2: synthesize misses concurrently under the provider's quota.
+    limiter = provider_limiter(provider.name)
+    outcomes = run_synthesis(
+        list(pending.values()),
+        limiter,
+        max_workers=_positive_int(payload.get("concurrency")),
+    )
+    for outcome in outcomes:
+        if outcome.error is not None:
+            raise outcome.error
 
-            if not cached_wav.exists():
-                shutil.copy2(wav_path, cached_wav)
+    # Pass 3: publish to the blob store and build the manifest in chunk order.
+    artifacts: List[JobArtifact] = []
+    chunk_meta: List[Dict[str, Any]] = []
+    synthesized: Dict[str, str] = {}
+    for spec in specs:
+        wav_path = spec["wav_path"]
+        input_hash = spec["input_hash"]
+        cache_hit = spec["cache_hit"]
+        if not cache_hit and input_hash in synthesized:
+            store.materialize(synthesized[input_hash], wav_path)
+            cache_hit = True
 
         art = _artifact(wav_path)
         artifacts.append(art)
+        if not cache_hit:
+            store.put_file(wav_path, sha256=art.sha256)
+            store.set_key("tts_chunks", input_hash, art.sha256)
+            synthesized[input_hash] = art.sha256
+            # Both are only ever rewritten after an unlink: share the blob
+            store.materialize(art.sha256, wav_path)
+            if spec["cached_wav"].exists():
+                store.materialize(art.sha256, spec["cached_wav"])
         chunk_meta.append(
             {
-                "chunk_id": chunk_id,
+                "chunk_id": spec["chunk_id"],
                 "path": str(wav_path),
                 "sha256": art.sha256,
                 "size_bytes": art.size_bytes,
@@ -377,6 +455,8 @@ def _execute_tts_render_chunks(
         "status": "succeeded",
         "metrics": {
             "chunks": len(chunks),
+            "synthesized": len(pending),
+            "concurrency": limiter.max_concurrency,
             "provider": provider.name,
             "voice_id": voice_id,
         },
@@ -477,6 +557,9 @@ def _execute_frame_sampling(env: Envelope, payload: Dict[str, Any], *, workspace
     if not video_path.exists():
         raise JobExecutionError("INVALID_INPUT", f"video_path not found: {video_path}")
 
+    if payload.get("timestamps"):
+        return _execute_frame_means(env, payload, video_path, workspace_root=workspace_root)
+
     try:
         every_sec = float(payload.get("every_sec", 5.0) or 5.0)
     except (ValueError, TypeError):
@@ -522,6 +605,49 @@ def _execute_frame_sampling(env: Envelope, payload: Dict[str, Any], *, workspace
     }
 
 
+def _execute_frame_means(
+    env: Envelope,
+    payload: Dict[str, Any],
+    video_path: Path,
+    *,
+    workspace_root: Path,
+) -> Dict[str, Any]:
+    """FRAME_SAMPLING with payload.timestamps: per-frame RGB means, one ffmpeg pass."""
+    try:
+        timestamps = [float(t) for t in payload.get("timestamps") or []]
+    except (ValueError, TypeError):
+        raise JobExecutionError("INVALID_INPUT", "payload.timestamps must be a list of seconds")
+
+    means = sample_frame_means(video_path, timestamps)
+    frames = [
+        {
+            "timestamp": round(ts, 3),
+            "rgb_mean": [round(v, 3) for v in m] if m is not None else None,
+            "red_ratio": round(red_ratio(m), 4) if m is not None else None,
+        }
+        for ts, m in zip(timestamps, means)
+    ]
+    sampled = sum(1 for f in frames if f["rgb_mean"] is not None)
+    if not sampled:
+        raise JobExecutionError("FRAME_SAMPLING_EMPTY", "No frames sampled")
+
+    out_dir = _safe_output_dir(workspace_root, payload, f"artifacts/{env.job_id}/frames")
+    means_path = out_dir / "frame_means.json"
+    _atomic_write_json(means_path, {
+        "run_id": env.run_id,
+        "job_id": env.job_id,
+        "count": sampled,
+        "frames": frames,
+    })
+
+    return {
+        "exit_code": 0,
+        "status": "succeeded",
+        "metrics": {"frames": sampled, "timestamps": len(timestamps)},
+        "artifacts": [_artifact(means_path).__dict__],
+    }
+
+
 def _execute_openclaw_task(env: Envelope, payload: Dict[str, Any], *, workspace_root: Path) -> Dict[str, Any]:
     if shutil.which("openclaw") is None:
         raise JobExecutionError("OPENCLAW_MISSING", "openclaw CLI not found")
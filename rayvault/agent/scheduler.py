@@ -0,0 +1,223 @@
+"""Load-aware node ranking for RayVaultController.
+
+Tracks, per node:
+  - live load from GET /health (per-step lanes: queued / running / slots)
+  - jobs this controller has dispatched and not yet seen finish (inflight)
+  - an EWMA of step execution time, fed from job receipts
+    (job_status.started_at -> finished_at)
+and remembers which node last ran a given (step, inputs_hash) so a repeat
+lands where the worker's idempotent cache already holds the result.
+
+rank() orders candidate nodes by expected completion time:
+
+    ceil((backlog + 1) / slots) * ewma_seconds(node, step)
+
+EWMA and affinity persist to <state_dir>/scheduler.json so one-shot CLI
+invocations still learn from earlier runs.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, TypeVar
+
+from rayvault.agent.protocol import ProtocolError, parse_timestamp
+from rayvault.io import atomic_write_json, read_json
+
+EWMA_ALPHA = 0.3
+HEALTH_TTL_SEC = 5.0
+MAX_AFFINITY = 5000
+
+# Seed estimates (seconds) before any receipt has been observed
+DEFAULT_STEP_SECONDS = {
+    "TTS_RENDER_CHUNKS": 20.0,
+    "AUDIO_POSTCHECK": 15.0,
+    "FFMPEG_PROBE": 2.0,
+    "FRAME_SAMPLING": 10.0,
+    "OPENCLAW_TASK": 60.0,
+}
+_FALLBACK_STEP_SECONDS = 30.0
+
+N = TypeVar("N")
+
+
+@dataclass
+class NodeLoad:
+    lanes: Dict[str, Dict[str, int]] = field(default_factory=dict)
+    queue_depth: int = 0
+    fetched_at: float = 0.0
+
+
+def receipt_duration_seconds(receipt: Dict[str, Any]) -> Optional[float]:
+    """Execution time from a remote receipt's job_status timestamps."""
+    job = receipt.get("job_status") if isinstance(receipt.get("job_status"), dict) else {}
+    started, finished = job.get("started_at"), job.get("finished_at")
+    if not started or not finished:
+        return None
+    try:
+        secs = (parse_timestamp(finished) - parse_timestamp(started)).total_seconds()
+    except ProtocolError:
+        return None
+    return secs if secs >= 0 else None
+
+
+class NodeScheduler:
+    def __init__(self, state_path: Optional[Path] = None, alpha: float = EWMA_ALPHA):
+        self.state_path = state_path
+        self.alpha = alpha
+        self._lock = threading.Lock()
+        # Serializes writers of state_path (atomic_write_json uses a fixed
+        # tmp name) without holding _lock through the fsync
+        self._save_lock = threading.Lock()
+        self._ewma: Dict[str, Dict[str, float]] = {}
+        self._affinity: Dict[str, str] = {}
+        self._loads: Dict[str, NodeLoad] = {}
+        self._inflight: Dict[str, Dict[str, int]] = {}
+        self._load_state()
+
+    # -- persistence -------------------------------------------------------
+
+    def _load_state(self) -> None:
+        if not self.state_path or not self.state_path.exists():
+            return
+        try:
+            data = read_json(self.state_path)
+        except (OSError, ValueError):
+            return
+        ewma = data.get("ewma") if isinstance(data.get("ewma"), dict) else {}
+        for key, row in ewma.items():
+            if isinstance(row, dict) and isinstance(row.get("seconds"), (int, float)):
+                self._ewma[key] = {"seconds": float(row["seconds"]), "n": int(row.get("n", 1))}
+        affinity = data.get("affinity") if isinstance(data.get("affinity"), dict) else {}
+        self._affinity = {str(k): str(v) for k, v in affinity.items()}
+
+    def save(self) -> None:
+        if not self.state_path:
+            return
+        with self._save_lock:
+            with self._lock:
+                data = {
+                    "ewma": {k: dict(v) for k, v in self._ewma.items()},
+                    "affinity": dict(self._affinity),
+                }
+            atomic_write_json(self.state_path, data)
+
+    # -- history -----------------------------------------------------------
+
+    @staticmethod
+    def _key(node_id: str, step: str) -> str:
+        return f"{node_id}|{step}"
+
+    def observe(self, node_id: str, step: str, seconds: float, inputs_hash: str = "") -> None:
+        with self._lock:
+            key = self._key(node_id, step)
+            row = self._ewma.get(key)
+            if row is None:
+                self._ewma[key] = {"seconds": float(seconds), "n": 1}
+            else:
+                row["seconds"] = self.alpha * float(seconds) + (1 - self.alpha) * row["seconds"]
+                row["n"] += 1
+            if inputs_hash:
+                akey = f"{step}|{inputs_hash}"
+                self._affinity.pop(akey, None)
+                self._affinity[akey] = node_id
+                while len(self._affinity) > MAX_AFFINITY:
+                    self._affinity.pop(next(iter(self._affinity)))
+
+    def observe_receipt(
+        self, node_id: str, step: str, receipt: Dict[str, Any], inputs_hash: str = "",
+    ) -> Optional[float]:
+        secs = receipt_duration_seconds(receipt)
+        if secs is not None:
+            self.observe(node_id, step, secs, inputs_hash)
+        return secs
+
+    def expected_seconds(self, node_id: str, step: str) -> float:
+        with self._lock:
+            row = self._ewma.get(self._key(node_id, step))
+            if row:
+                return row["seconds"]
+            # Unknown node: use the mean over nodes that have run this step
+            others = [r["seconds"] for k, r in self._ewma.items() if k.endswith(f"|{step}")]
+        if others:
+            return sum(others) / len(others)
+        return DEFAULT_STEP_SECONDS.get(step, _FALLBACK_STEP_SECONDS)
+
+    def affinity(self, step: str, inputs_hash: str) -> str:
+        with self._lock:
+            return self._affinity.get(f"{step}|{inputs_hash}", "")
+
+    # -- live load ---------------------------------------------------------
+
+    def update_health(self, node_id: str, health: Dict[str, Any]) -> None:
+        lanes = health.get("lanes") if isinstance(health.get("lanes"), dict) else {}
+        try:
+            depth = int(health.get("queue_depth") or 0)
+        except (ValueError, TypeError):
+            depth = 0
+        with self._lock:
+            self._loads[node_id] = NodeLoad(
+                lanes={str(k): dict(v) for k, v in lanes.items() if isinstance(v, dict)},
+                queue_depth=depth,
+                fetched_at=time.time(),
+            )
+
+    def health_stale(self, node_id: str, ttl: float = HEALTH_TTL_SEC) -> bool:
+        with self._lock:
+            load = self._loads.get(node_id)
+        return load is None or time.time() - load.fetched_at > ttl
+
+    def step_slots(self, node_id: str, step: str) -> int:
+        with self._lock:
+            lane = (self._loads.get(node_id) or NodeLoad()).lanes.get(step) or {}
+        try:
+            return max(1, int(lane.get("slots") or 1))
+        except (ValueError, TypeError):
+            return 1
+
+    def begin(self, node_id: str, step: str) -> None:
+        with self._lock:
+            per = self._inflight.setdefault(node_id, {})
+            per[step] = per.get(step, 0) + 1
+
+    def end(self, node_id: str, step: str) -> None:
+        with self._lock:
+            per = self._inflight.setdefault(node_id, {})
+            per[step] = max(0, per.get(step, 0) - 1)
+
+    def expected_completion(self, node_id: str, step: str) -> float:
+        """Seconds until a job of this step submitted now would finish."""
+        with self._lock:
+            load = self._loads.get(node_id) or NodeLoad()
+            lane = load.lanes.get(step)
+            inflight = self._inflight.get(node_id, {}).get(step, 0)
+        if lane:
+            slots = max(1, int(lane.get("slots") or 1))
+            remote = int(lane.get("queued") or 0) + int(lane.get("running") or 0)
+        else:
+            # Older workers only report a single FIFO queue
+            slots = 1
+            remote = load.queue_depth
+        backlog = max(inflight, remote)
+        return math.ceil((backlog + 1) / slots) * self.expected_seconds(node_id, step)
+
+    def rank(
+        self, nodes: Sequence[N], step: str, inputs_hash: str = "", key=lambda n: n.node_id,
+    ) -> List[N]:
+        """Nodes by expected completion; the affinity node (if idle enough) first."""
+        scored = [(self.expected_completion(key(n), step), i, n) for i, n in enumerate(nodes)]
+        scored.sort(key=lambda row: (row[0], row[1]))
+        ordered = [n for _, _, n in scored]
+        preferred = self.affinity(step, inputs_hash) if inputs_hash else ""
+        if preferred:
+            for i, n in enumerate(ordered):
+                if key(n) == preferred:
+                    # A cached result is near-free, but not worth a long queue
+                    if scored[i][0] <= 2 * scored[0][0]:
+                        ordered.insert(0, ordered.pop(i))
+                    break
+        return ordered
@@ -0,0 +1,224 @@
+"""Streaming, resumable artifact transfer between controller and worker.
+
+Worker side:
+  parse_range_header() + iter_file_range() back the range-capable
+  GET /job/{job_id}/artifacts/{name} endpoint.
+
+Controller side:
+  stream_download() copies a remote artifact to disk in fixed-size chunks,
+  hashing on the fly. Bytes land in "<out>.part"; a dropped connection (or a
+  later call) resumes from the partial file with "Range: bytes=N-". The file
+  is only renamed into place after size and sha256 match what the worker
+  reported, so memory stays constant regardless of artifact size.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import http.client
+import os
+import re
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from urllib.error import HTTPError, URLError
+from urllib.request import Request, urlopen
+
+CHUNK_SIZE = 1024 * 1024
+MAX_RESUME_ATTEMPTS = 5
+
+_RANGE_RE = re.compile(r"^\s*bytes\s*=\s*(\d*)\s*-\s*(\d*)\s*$")
+_CONTENT_RANGE_RE = re.compile(r"^\s*bytes\s+(\d+)-(\d+)/(\d+|\*)\s*$")
+
+
+class TransferError(RuntimeError):
+    pass
+
+
+class RangeNotSatisfiable(ValueError):
+    pass
+
+
+# ---------------------------------------------------------------------------
+# Worker side
+# ---------------------------------------------------------------------------
+
+
+def parse_range_header(header: Optional[str], size: int) -> Optional[Tuple[int, int]]:
+    """Parse a single "bytes=a-b" range into inclusive (start, end).
+
+    Returns None when there is no usable Range header (serve the whole file).
+    Raises RangeNotSatisfiable when the range starts past the end.
+    Multi-range requests are not supported and fall back to the full body.
+    """
+    if not header or "," in header:
+        return None
+    m = _RANGE_RE.match(header)
+    if not m:
+        return None
+    first, last = m.group(1), m.group(2)
+    if not first and not last:
+        return None
+    if not first:
+        # Suffix range: last N bytes
+        n = int(last)
+        if n == 0:
+            raise RangeNotSatisfiable(header)
+        return max(0, size - n), size - 1
+    start = int(first)
+    end = int(last) if last else size - 1
+    if start >= size or end < start:
+        raise RangeNotSatisfiable(header)
+    return start, min(end, size - 1)
+
+
+def iter_file_range(
+    path: Path, start: int = 0, end: Optional[int] = None, chunk_size: int = CHUNK_SIZE,
+) -> Iterator[bytes]:
+    """Yield bytes [start, end] (inclusive) of path in chunk_size pieces."""
+    if end is None:
+        end = path.stat().st_size - 1
+    remaining = end - start + 1
+    with open(path, "rb") as f:
+        f.seek(start)
+        while remaining > 0:
+            data = f.read(min(chunk_size, remaining))
+            if not data:
+                break
+            remaining -= len(data)
+            yield data
+
+
+# ---------------------------------------------------------------------------
+# Controller side
+# ---------------------------------------------------------------------------
+
+
+def _hash_existing(path: Path, chunk_size: int) -> Tuple[Any, int]:
+    h = hashlib.sha256()
+    n = 0
+    if path.exists():
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(chunk_size), b""):
+                h.update(chunk)
+                n += len(chunk)
+    return h, n
+
+
+def _open(url: str, offset: int, timeout: int):
+    headers = {"Accept": "application/octet-stream"}
+    if offset > 0:
+        headers["Range"] = f"bytes={offset}-"
+    return urlopen(Request(url, method="GET", headers=headers), timeout=timeout)
+
+
+def _open_first(urls: List[str], offset: int, timeout: int):
+    """Open the first URL that answers; auth failures fall through to the next."""
+    first_exc: Optional[Exception] = None
+    for i, url in enumerate(urls):
+        try:
+            return i, _open(url, offset, timeout)
+        except HTTPError as exc:
+            if exc.code == 416:
+                raise
+            first_exc = first_exc or exc
+        except (URLError, OSError, http.client.HTTPException) as exc:
+            first_exc = first_exc or exc
+    raise first_exc or TransferError("no download URL")
+
+
+def stream_download(
+    urls: List[str],
+    out_path: Path,
+    *,
+    expected_sha256: str = "",
+    expected_size: Optional[int] = None,
+    timeout: int = 15,
+    chunk_size: int = CHUNK_SIZE,
+    max_attempts: int = MAX_RESUME_ATTEMPTS,
+) -> Dict[str, Any]:
+    """Download the first working URL to out_path with resume and sha256 check.
+
+    Returns {"size", "sha256", "resumed_bytes", "attempts"}. Raises
+    TransferError on checksum/size mismatch (the partial file is discarded)
+    or after max_attempts failed connections.
+    """
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    part = out_path.with_suffix(out_path.suffix + ".part")
+    expected_sha256 = (expected_sha256 or "").strip().lower()
+
+    h, offset = _hash_existing(part, chunk_size)
+    if expected_size is not None and offset > expected_size:
+        part.unlink()
+        h, offset = hashlib.sha256(), 0
+    resumed_bytes = offset
+
+    attempts = 0
+    url_idx = 0
+    while expected_size is None or offset < expected_size:
+        attempts += 1
+        try:
+            if attempts == 1:
+                url_idx, resp = _open_first(urls, offset, timeout)
+            else:
+                resp = _open(urls[url_idx], offset, timeout)
+        except HTTPError as exc:
+            if exc.code == 416 and offset > 0:
+                # Server says we already have everything (or the part is bogus):
+                # let the checksum below decide.
+                break
+            if 400 <= exc.code < 500 and exc.code not in (408, 429):
+                raise TransferError(f"HTTP {exc.code}: {exc.reason}") from exc
+            if attempts >= max_attempts:
+                raise TransferError(f"download failed after {attempts} attempts: {exc}") from exc
+            continue
+        except (URLError, OSError, http.client.HTTPException) as exc:
+            if attempts >= max_attempts:
+                raise TransferError(f"download failed after {attempts} attempts: {exc}") from exc
+            continue
+
+        with resp:
+            status = getattr(resp, "status", 200)
+            if offset > 0 and status != 206:
+                # Server ignored Range: restart from zero
+                h, offset, resumed_bytes = hashlib.sha256(), 0, 0
+                mode = "wb"
+            else:
+                if offset > 0:
+                    m = _CONTENT_RANGE_RE.match(resp.headers.get("Content-Range", "") or "")
+                    if m and int(m.group(1)) != offset:
+                        raise TransferError(
+                            f"Content-Range starts at {m.group(1)}, expected {offset}"
+                        )
+                mode = "ab" if offset > 0 else "wb"
+            try:
+                with open(part, mode) as f:
+                    while True:
+                        data = resp.read(chunk_size)
+                        if not data:
+                            break
+                        f.write(data)
+                        h.update(data)
+                        offset += len(data)
+            except (URLError, OSError, http.client.HTTPException) as exc:
+                if attempts >= max_attempts:
+                    raise TransferError(f"download failed after {attempts} attempts: {exc}") from exc
+                continue
+        if expected_size is None:
+            break
+        if offset < expected_size and attempts >= max_attempts:
+            raise TransferError(f"short download: {offset}/{expected_size} bytes")
+
+    digest = h.hexdigest()
+    if expected_size is not None and offset != expected_size:
+        part.unlink(missing_ok=True)
+        raise TransferError(f"size mismatch: got {offset}, expected {expected_size}")
+    if expected_sha256 and digest != expected_sha256:
+        part.unlink(missing_ok=True)
+        raise TransferError(f"sha256 mismatch: got {digest}, expected {expected_sha256}")
+    os.replace(part, out_path)
+    return {
+        "size": offset,
+        "sha256": digest,
+        "resumed_bytes": resumed_bytes,
+        "attempts": attempts,
+    }
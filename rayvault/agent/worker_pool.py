@@ -0,0 +1,179 @@
+"""Per-step executor lanes for the RayVault worker.
+
+Each JOB_STEPS entry gets its own lane: a priority queue plus a fixed
+number of worker threads (slots). A long TTS_RENDER_CHUNKS job therefore
+only occupies the TTS lane while probes and frame sampling keep flowing.
+Within a lane, jobs run by priority (high < normal < low), then FIFO.
+
+Concurrency per step comes from DEFAULT_STEP_CONCURRENCY, overridable with
+RAYVAULT_WORKER_CONCURRENCY / --concurrency ("FFMPEG_PROBE=8,TTS_RENDER_CHUNKS=1").
+"""
+
+from __future__ import annotations
+
+import itertools
+import os
+import queue
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+PRIORITY_HIGH = 0
+PRIORITY_NORMAL = 1
+PRIORITY_LOW = 2
+
+PRIORITY_NAMES = {
+    "high": PRIORITY_HIGH,
+    "normal": PRIORITY_NORMAL,
+    "low": PRIORITY_LOW,
+}
+
+
+def _cpu_count() -> int:
+    return os.cpu_count() or 1
+
+
+def default_step_concurrency() -> Dict[str, int]:
+    """Default slots per step: serial for TTS/UI work, wide for ffmpeg probes."""
+    cpus = _cpu_count()
+    return {
+        "TTS_RENDER_CHUNKS": 1,
+        "AUDIO_POSTCHECK": max(1, cpus // 4),
+        "FFMPEG_PROBE": max(2, cpus),
+        "FRAME_SAMPLING": max(1, cpus // 2),
+        "OPENCLAW_TASK": 1,
+    }
+
+
+def parse_concurrency(spec: str) -> Dict[str, int]:
+    """Parse "STEP=N,STEP=N" into {STEP: N}; malformed entries are skipped."""
+    out: Dict[str, int] = {}
+    for part in (spec or "").split(","):
+        if "=" not in part:
+            continue
+        step, _, raw = part.partition("=")
+        step = step.strip().upper()
+        try:
+            n = int(raw.strip())
+        except ValueError:
+            continue
+        if step and n > 0:
+            out[step] = n
+    return out
+
+
+def parse_priority(value: Any) -> int:
+    """Map payload.priority ("high"/"normal"/"low" or 0-2) to a lane priority."""
+    if isinstance(value, str):
+        return PRIORITY_NAMES.get(value.strip().lower(), PRIORITY_NORMAL)
+    try:
+        return min(PRIORITY_LOW, max(PRIORITY_HIGH, int(value)))
+    except (TypeError, ValueError):
+        return PRIORITY_NORMAL
+
+
+class _Lane:
+    def __init__(self, step_name: str, slots: int):
+        self.step_name = step_name
+        self.slots = max(1, int(slots))
+        self.q: "queue.PriorityQueue[Tuple[int, int, Optional[str]]]" = queue.PriorityQueue()
+        self.running = 0
+        self.threads: List[threading.Thread] = []
+
+
+class StepExecutor:
+    """Fixed-size thread lanes keyed by step_name.
+
+    run_job(job_id) is invoked on a lane thread; it must not raise (any
+    exception is swallowed so the slot survives).
+    """
+
+    def __init__(
+        self,
+        run_job: Callable[[str], None],
+        steps: Iterable[str],
+        concurrency: Optional[Dict[str, int]] = None,
+    ):
+        self._run_job = run_job
+        self._lock = threading.Lock()
+        self._seq = itertools.count()
+        self._started = False
+        limits = default_step_concurrency()
+        limits.update(concurrency or {})
+        self._lanes: Dict[str, _Lane] = {
+            step: _Lane(step, limits.get(step, 1)) for step in sorted(steps)
+        }
+
+    def start(self) -> None:
+        with self._lock:
+            if self._started:
+                return
+            self._started = True
+            for lane in self._lanes.values():
+                for i in range(lane.slots):
+                    t = threading.Thread(
+                        target=self._lane_loop, args=(lane,),
+                        name=f"lane-{lane.step_name}-{i}", daemon=True,
+                    )
+                    lane.threads.append(t)
+                    t.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Drain sentinels into every slot and join the lane threads."""
+        with self._lock:
+            if not self._started:
+                return
+            self._started = False
+            lanes = list(self._lanes.values())
+        for lane in lanes:
+            for _ in lane.threads:
+                # Sentinel sorts after every real job
+                lane.q.put((PRIORITY_LOW + 1, next(self._seq), None))
+        for lane in lanes:
+            for t in lane.threads:
+                t.join(timeout=timeout)
+            lane.threads = []
+
+    def submit(self, step_name: str, job_id: str, priority: int = PRIORITY_NORMAL) -> None:
+        lane = self._lanes.get(step_name)
+        if lane is None:
+            raise KeyError(f"no lane for step_name={step_name}")
+        lane.q.put((priority, next(self._seq), job_id))
+
+    def _lane_loop(self, lane: _Lane) -> None:
+        while True:
+            _, _, job_id = lane.q.get()
+            if job_id is None:
+                lane.q.task_done()
+                return
+            with self._lock:
+                lane.running += 1
+            try:
+                self._run_job(job_id)
+            except Exception:  # noqa: BLE001
+                pass
+            finally:
+                with self._lock:
+                    lane.running -= 1
+                lane.q.task_done()
+
+    def join(self) -> None:
+        """Block until every submitted job has finished (tests/shutdown)."""
+        for lane in self._lanes.values():
+            lane.q.join()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lanes = {
+                step: {
+                    "queued": lane.q.qsize(),
+                    "running": lane.running,
+                    "slots": lane.slots,
+                }
+                for step, lane in self._lanes.items()
+            }
+        return {
+            "queue_depth": sum(v["queued"] for v in lanes.values()),
+            "running": sum(v["running"] for v in lanes.values()),
+            "slots": sum(v["slots"] for v in lanes.values()),
+            "lanes": lanes,
+        }
@@ -9,6 +9,12 @@ Endpoints:
 - GET  /job/{job_id}
 - GET  /job/{job_id}/logs
 - GET  /job/{job_id}/artifacts
+- GET  /job/{job_id}/artifacts/{name}   (streams the file; honours Range)
+- GET  /job/{job_id}/events             (long-poll: status, log lines, terminal state)
+- GET  /events?jobs=a,b,c               (long-poll several jobs of one run)
+
+Jobs run on per-step executor lanes (rayvault.agent.worker_pool), so a long
+TTS job does not block probes queued behind it.
 """
 
 from __future__ import annotations
@@ -16,7 +22,6 @@ from __future__ import annotations
 import argparse
 import json
 import os
-import queue
 import threading
 import time
 from dataclasses import dataclass, field
@@ -24,13 +29,17 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from fastapi import FastAPI, HTTPException, Query, Request
-from fastapi.responses import JSONResponse, PlainTextResponse
+from fastapi.responses import JSONResponse, PlainTextResponse, Response, StreamingResponse
 
+from rayvault.agent.job_events import JobEventLog
 from rayvault.agent.jobs import JobExecutionError, detect_capabilities, execute_job
+from rayvault.agent.transfer import RangeNotSatisfiable, iter_file_range, parse_range_header
+from rayvault.agent.worker_pool import StepExecutor, parse_concurrency, parse_priority
 from rayvault.agent.protocol import (
     JOB_STEPS,
     Envelope,
     ProtocolError,
+    compute_inputs_hash,
     require_valid_auth,
     utc_now_iso,
 )
@@ -59,7 +68,14 @@ class JobRecord:
 
 
 class WorkerState:
-    def __init__(self, *, workspace_root: Path, worker_id: str, secret: str):
+    def __init__(
+        self,
+        *,
+        workspace_root: Path,
+        worker_id: str,
+        secret: str,
+        concurrency: Optional[Dict[str, int]] = None,
+    ):
         self.workspace_root = workspace_root.resolve()
         self.worker_id = worker_id
         self.secret = secret
@@ -72,8 +88,8 @@ class WorkerState:
         self.jobs: Dict[str, JobRecord] = {}
         self.jobs_by_hash: Dict[str, str] = {}
         self.lock = threading.Lock()
-        self.q: queue.Queue[str] = queue.Queue()
-        self.stop_event = threading.Event()
+        self.executor = StepExecutor(self.run_job, JOB_STEPS, concurrency)
+        self.events = JobEventLog()
 
     def _job_key(self, env: Envelope) -> str:
         return f"{env.step_name}:{env.inputs_hash}"
@@ -111,7 +127,10 @@ class WorkerState:
             rec.receipt_path = str((self.jobs_dir / env.job_id / "job_receipt.json").resolve())
             self.jobs[env.job_id] = rec
             self.jobs_by_hash[key] = env.job_id
-            self.q.put(env.job_id)
+            self._emit_status(rec)
+            self.executor.submit(
+                env.step_name, env.job_id, parse_priority((payload or {}).get("priority")),
+            )
 
         self.append_log(env.job_id, f"[{utc_now_iso()}] queued step={env.step_name}")
         return {
@@ -135,6 +154,18 @@ class WorkerState:
         }
         with open(p, "a", encoding="utf-8") as f:
             f.write(json.dumps(row, ensure_ascii=False, sort_keys=True) + "\n")
+        self.events.emit(job_id, "log", level=row["level"], message=row["message"])
+
+    def _emit_status(self, rec: JobRecord) -> None:
+        # Terminal events carry the full record so watchers need no extra GET
+        data: Dict[str, Any] = {
+            "status": rec.status,
+            "progress": rec.progress,
+            "message": rec.message,
+        }
+        if rec.finished_at:
+            data["job"] = serialize_record(rec)
+        self.events.emit(rec.envelope.job_id, "status", **data)
 
     def _write_receipt(self, rec: JobRecord) -> None:
         p = Path(rec.receipt_path)
@@ -159,60 +190,62 @@ class WorkerState:
         from rayvault.io import atomic_write_json
         atomic_write_json(p, payload)
 
-    def worker_loop(self) -> None:
-        while not self.stop_event.is_set():
-            try:
-                job_id = self.q.get(timeout=0.5)
-            except queue.Empty:
-                continue
+    def start(self) -> None:
+        self.executor.start()
+
+    def stop(self) -> None:
+        self.executor.stop()
+
+    def run_job(self, job_id: str) -> None:
+        """Execute one queued job on an executor lane thread."""
+        with self.lock:
+            rec = self.jobs.get(job_id)
+            if not rec:
+                return
+            rec.status = "running"
+            rec.progress = 0.1
+            rec.message = "running"
+            rec.started_at = utc_now_iso()
+            self._emit_status(rec)
+        self.append_log(job_id, f"[{utc_now_iso()}] started")
 
+        try:
+            out = execute_job(rec.envelope, rec.payload, workspace_root=self.workspace_root)
+            with self.lock:
+                rec.status = str(out.get("status", "succeeded"))
+                rec.progress = 1.0
+                rec.message = rec.status
+                rec.exit_code = int(out.get("exit_code", 0))
+                rec.metrics = out.get("metrics", {}) if isinstance(out.get("metrics"), dict) else {}
+                rec.artifacts = out.get("artifacts", []) if isinstance(out.get("artifacts"), list) else []
+                rec.finished_at = utc_now_iso()
+            self.append_log(job_id, f"[{utc_now_iso()}] finished status={rec.status} exit={rec.exit_code}")
+        except JobExecutionError as exc:
+            with self.lock:
+                rec.status = "failed"
+                rec.progress = 1.0
+                rec.message = exc.message
+                rec.exit_code = 2
+                rec.error_code = exc.code
+                rec.error_message = exc.message
+                rec.finished_at = utc_now_iso()
+            self.append_log(job_id, f"[{utc_now_iso()}] failed code={exc.code} msg={exc.message}")
+        except Exception as exc:  # noqa: BLE001
+            with self.lock:
+                rec.status = "failed"
+                rec.progress = 1.0
+                rec.message = str(exc)
+                rec.exit_code = 1
+                rec.error_code = "UNHANDLED_EXCEPTION"
+                rec.error_message = str(exc)
+                rec.finished_at = utc_now_iso()
+            self.append_log(job_id, f"[{utc_now_iso()}] failed code=UNHANDLED_EXCEPTION msg={exc}")
+        finally:
             with self.lock:
                 rec = self.jobs.get(job_id)
-                if not rec:
-                    continue
-                rec.status = "running"
-                rec.progress = 0.1
-                rec.message = "running"
-                rec.started_at = utc_now_iso()
-            self.append_log(job_id, f"[{utc_now_iso()}] started")
-
-            try:
-                out = execute_job(rec.envelope, rec.payload, workspace_root=self.workspace_root)
-                with self.lock:
-                    rec.status = str(out.get("status", "succeeded"))
-                    rec.progress = 1.0
-                    rec.message = rec.status
-                    rec.exit_code = int(out.get("exit_code", 0))
-                    rec.metrics = out.get("metrics", {}) if isinstance(out.get("metrics"), dict) else {}
-                    rec.artifacts = out.get("artifacts", []) if isinstance(out.get("artifacts"), list) else []
-                    rec.finished_at = utc_now_iso()
-                self.append_log(job_id, f"[{utc_now_iso()}] finished status={rec.status} exit={rec.exit_code}")
-            except JobExecutionError as exc:
-                with self.lock:
-                    rec.status = "failed"
-                    rec.progress = 1.0
-                    rec.message = exc.message
-                    rec.exit_code = 2
-                    rec.error_code = exc.code
-                    rec.error_message = exc.message
-                    rec.finished_at = utc_now_iso()
-                self.append_log(job_id, f"[{utc_now_iso()}] failed code={exc.code} msg={exc.message}")
-            except Exception as exc:  # noqa: BLE001
-                with self.lock:
-                    rec.status = "failed"
-                    rec.progress = 1.0
-                    rec.message = str(exc)
-                    rec.exit_code = 1
-                    rec.error_code = "UNHANDLED_EXCEPTION"
-                    rec.error_message = str(exc)
-                    rec.finished_at = utc_now_iso()
-                self.append_log(job_id, f"[{utc_now_iso()}] failed code=UNHANDLED_EXCEPTION msg={exc}")
-            finally:
-                with self.lock:
-                    rec = self.jobs.get(job_id)
-                    if rec:
-                        self._write_receipt(rec)
-                self.q.task_done()
+                if rec:
+                    self._write_receipt(rec)
+                    self._emit_status(rec)
 
 
 def serialize_record(rec: JobRecord) -> Dict[str, Any]:
@@ -265,22 +298,35 @@ def _require_message_type(body: Dict[str, Any], expected: str) -> None:
         raise HTTPException(status_code=400, detail=f"message_type must be {expected!r}")
 
 
-def create_app(*, workspace_root: Path, worker_id: str, secret: str) -> FastAPI:
-    state = WorkerState(workspace_root=workspace_root, worker_id=worker_id, secret=secret)
+def create_app(
+    *,
+    workspace_root: Path,
+    worker_id: str,
+    secret: str,
+    concurrency: Optional[Dict[str, int]] = None,
+) -> FastAPI:
+    state = WorkerState(
+        workspace_root=workspace_root,
+        worker_id=worker_id,
+        secret=secret,
+        concurrency=concurrency,
+    )
     app = FastAPI(title="RayVault Worker", version="1.1.0")
-
-    worker_thread = threading.Thread(target=state.worker_loop, daemon=True)
-    worker_thread.start()
+    state.start()
 
     @app.get("/health")
     def health() -> Dict[str, Any]:
         caps = detect_capabilities()
+        load = state.executor.stats()
         return {
             "ok": True,
             "version": app.version,
             "worker_id": worker_id,
             "time": utc_now_iso(),
-            "queue_depth": state.q.qsize(),
+            "queue_depth": load["queue_depth"],
+            "running": load["running"],
+            "slots": load["slots"],
+            "lanes": load["lanes"],
             "caps": caps,
         }
 
@@ -391,6 +437,91 @@ def create_app(*, workspace_root: Path, worker_id: str, secret: str) -> FastAPI:
             return PlainTextResponse("", status_code=200)
         return PlainTextResponse(log_path.read_text(encoding="utf-8"), status_code=200)
 
+    @app.get("/job/{job_id}/events")
+    def job_events(
+        job_id: str,
+        run_id: str = Query(...),
+        step_name: str = Query(...),
+        inputs_hash: str = Query(...),
+        timestamp: str = Query(...),
+        auth_token: str = Query(...),
+        since: int = Query(0),
+        wait: float = Query(25.0),
+    ) -> Dict[str, Any]:
+        try:
+            env = require_valid_auth(
+                secret,
+                _query_envelope(
+                    run_id=run_id,
+                    job_id=job_id,
+                    step_name=step_name,
+                    inputs_hash=inputs_hash,
+                    timestamp=timestamp,
+                    auth_token=auth_token,
+                ),
+                allowed_steps={"JOB_EVENTS"},
+            )
+        except ProtocolError as exc:
+            raise HTTPException(status_code=401, detail=str(exc)) from exc
+
+        with state.lock:
+            rec = state.jobs.get(job_id)
+            if not rec:
+                raise HTTPException(status_code=404, detail=f"job_id not found: {job_id}")
+            if rec.envelope.run_id != env.run_id or rec.envelope.inputs_hash != env.inputs_hash:
+                raise HTTPException(status_code=403, detail="job envelope mismatch")
+
+        events, cursor, done = state.events.wait([job_id], since, wait)
+        with state.lock:
+            job = serialize_record(rec)
+        return {"ok": True, "events": events, "cursor": cursor, "done": done, "job": job}
+
+    @app.get("/events")
+    def run_events(
+        jobs: str = Query(...),
+        run_id: str = Query(...),
+        job_id: str = Query(...),
+        step_name: str = Query(...),
+        inputs_hash: str = Query(...),
+        timestamp: str = Query(...),
+        auth_token: str = Query(...),
+        since: int = Query(0),
+        wait: float = Query(25.0),
+    ) -> Dict[str, Any]:
+        job_ids = sorted({j.strip() for j in jobs.split(",") if j.strip()})
+        try:
+            env = require_valid_auth(
+                secret,
+                _query_envelope(
+                    run_id=run_id,
+                    job_id=job_id,
+                    step_name=step_name,
+                    inputs_hash=inputs_hash,
+                    timestamp=timestamp,
+                    auth_token=auth_token,
+                ),
+                allowed_steps={"JOB_EVENTS"},
+            )
+        except ProtocolError as exc:
+            raise HTTPException(status_code=401, detail=str(exc)) from exc
+        # The signature covers inputs_hash, which binds it to this job list
+        if not job_ids or env.inputs_hash != compute_inputs_hash({"jobs": job_ids}):
+            raise HTTPException(status_code=403, detail="job list does not match inputs_hash")
+
+        with state.lock:
+            known = [j for j in job_ids if j in state.jobs and state.jobs[j].envelope.run_id == env.run_id]
+        events, cursor, done = state.events.wait(known, since, wait)
+        with state.lock:
+            records = {j: serialize_record(state.jobs[j]) for j in known}
+        return {
+            "ok": True,
+            "events": events,
+            "cursor": cursor,
+            "done": done,
+            "jobs": records,
+            "missing": [j for j in job_ids if j not in records],
+        }
+
     @app.get("/job/{job_id}/artifacts")
     def job_artifacts(
         job_id: str,
@@ -426,11 +557,82 @@ def create_app(*, workspace_root: Path, worker_id: str, secret: str) -> FastAPI:
                 "ok": True,
                 "job_id": job_id,
                 "status": rec.status,
-                "artifacts": rec.artifacts,
+                "artifacts": [
+                    {"name": Path(str(a.get("path", ""))).name, **a} if isinstance(a, dict) else a
+                    for a in rec.artifacts
+                ],
                 "receipt_path": rec.receipt_path,
             }
         return JSONResponse(payload, status_code=200)
 
+    @app.get("/job/{job_id}/artifacts/{name}")
+    def job_artifact_file(
+        job_id: str,
+        name: str,
+        req: Request,
+        run_id: str = Query(...),
+        step_name: str = Query(...),
+        inputs_hash: str = Query(...),
+        timestamp: str = Query(...),
+        auth_token: str = Query(...),
+    ) -> Response:
+        try:
+            env = require_valid_auth(
+                secret,
+                _query_envelope(
+                    run_id=run_id,
+                    job_id=job_id,
+                    step_name=step_name,
+                    inputs_hash=inputs_hash,
+                    timestamp=timestamp,
+                    auth_token=auth_token,
+                ),
+                allowed_steps={"JOB_ARTIFACTS"},
+            )
+        except ProtocolError as exc:
+            raise HTTPException(status_code=401, detail=str(exc)) from exc
+
+        with state.lock:
+            rec = state.jobs.get(job_id)
+            if not rec:
+                raise HTTPException(status_code=404, detail=f"job_id not found: {job_id}")
+            if rec.envelope.run_id != env.run_id or rec.envelope.inputs_hash != env.inputs_hash:
+                raise HTTPException(status_code=403, detail="job envelope mismatch")
+            # Only files the job itself reported are served
+            art = next(
+                (a for a in rec.artifacts
+                 if isinstance(a, dict) and Path(str(a.get("path", ""))).name == name),
+                None,
+            )
+        if art is None:
+            raise HTTPException(status_code=404, detail=f"artifact not found: {name}")
+        path = Path(str(art["path"]))
+        if not path.is_file():
+            raise HTTPException(status_code=404, detail=f"artifact missing on disk: {name}")
+
+        size = path.stat().st_size
+        headers = {"Accept-Ranges": "bytes"}
+        if art.get("sha256"):
+            headers["ETag"] = f'"{art["sha256"]}"'
+        try:
+            byte_range = parse_range_header(req.headers.get("range"), size)
+        except RangeNotSatisfiable:
+            headers["Content-Range"] = f"bytes */{size}"
+            return Response(status_code=416, headers=headers)
+        if byte_range is None:
+            headers["Content-Length"] = str(size)
+            return StreamingResponse(
+                iter_file_range(path), status_code=200,
+                media_type="application/octet-stream", headers=headers,
+            )
+        start, end = byte_range
+        headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+        headers["Content-Length"] = str(end - start + 1)
+        return StreamingResponse(
+            iter_file_range(path, start, end), status_code=206,
+            media_type="application/octet-stream", headers=headers,
+        )
+
     return app
 
 
@@ -453,6 +655,11 @@ def main() -> int:
         default=os.environ.get("RAYVAULT_CLUSTER_SECRET", ""),
         help="Shared HMAC secret",
     )
+    parser.add_argument(
+        "--concurrency",
+        default=os.environ.get("RAYVAULT_WORKER_CONCURRENCY", ""),
+        help="Per-step slots, e.g. FFMPEG_PROBE=8,TTS_RENDER_CHUNKS=1",
+    )
     args = parser.parse_args()
 
     secret = str(args.cluster_secret or "").strip()
@@ -463,6 +670,7 @@ def main() -> int:
         workspace_root=Path(args.workspace_root).expanduser(),
         worker_id=args.worker_id,
         secret=secret,
+        concurrency=parse_concurrency(args.concurrency),
     )
 
     try:
@@ -0,0 +1,510 @@
+#!/usr/bin/env python3
+"""RayVault Alignment Index — word-level timing for the narration track.
+
+Timelines used to be laid out from word counts at a fixed WPM, which drifts
+from the real voiceover and surfaces later as pacing / temporal-consistency
+failures and re-renders. The alignment index records where each script word
+actually starts and ends in the audio, so timelines fit on the first pass.
+
+Two sources:
+  - provider : character timestamps returned by the TTS provider
+               (ElevenLabs /with-timestamps "alignment" block), per chunk,
+               shifted by the chunk offsets from 02_audio.timing.json
+  - energy   : local aligner over the WAV. Speech/silence is detected from
+               10 ms RMS energy; words are spread over speech time by
+               length and sentence ends are snapped onto nearby pauses.
+
+The index is stored next to the audio as a compact array file
+(02_audio.wav → 02_audio.align.json): one word list plus a flat
+[start_ms, end_ms, ...] integer array, keyed by the audio sha1 so a
+re-voiced track invalidates it.
+
+Stdlib only.
+
+Usage:
+    python3 -m rayvault.alignment --run-dir state/runs/RUN_2026_02_14_A
+    python3 -m rayvault.alignment --run-dir RUN --provider-alignment tts_alignment.json
+
+Exit codes:
+    0: index written
+    1: runtime error
+    2: missing script/audio
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import operator
+import re
+import sys
+import wave
+from array import array
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from rayvault.io import atomic_write_json, read_json, sha1_file, wav_duration_seconds
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+ALIGNMENT_VERSION = 1
+HOP_SEC = 0.010  # energy frame
+ENERGY_STRIDE = 4  # subsample within a hop; speech energy is low-frequency heavy
+MIN_GAP_SEC = 0.08  # shorter dips are inter-word, not pauses
+SNAP_WINDOW_SEC = 1.0  # max distance a sentence end may move onto a pause
+SILENCE_FLOOR = 100.0  # absolute RMS (int16) treated as silence
+_SENTENCE_END = re.compile(r"[.!?…]+[\"')\]]*$")
+_STAGE_DIRECTION = re.compile(r"\[.*?\]|\(.*?\)")
+
+
+def alignment_path_for(audio_path: Path) -> Path:
+    """02_audio.wav → 02_audio.align.json"""
+    return audio_path.with_suffix(".align.json")
+
+
+def script_words(text: str) -> List[str]:
+    """Spoken words of a script, without [tags] / (stage directions)."""
+    return _STAGE_DIRECTION.sub(" ", text).split()
+
+
+# ---------------------------------------------------------------------------
+# Index
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class AlignmentIndex:
+    """Per-word start/end times (seconds) in narration order."""
+
+    words: List[str]
+    starts: List[float]
+    ends: List[float]
+    duration_sec: float
+    source: str = "energy"
+    audio_sha1: str = ""
+    meta: Dict[str, Any] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    # -- queries -----------------------------------------------------------
+
+    def sentences(self) -> List[Tuple[str, float, float]]:
+        """(text, start, end) per sentence."""
+        out: List[Tuple[str, float, float]] = []
+        first = 0
+        for i, word in enumerate(self.words):
+            if _SENTENCE_END.search(word) or i == len(self.words) - 1:
+                out.append((" ".join(self.words[first:i + 1]), self.starts[first], self.ends[i]))
+                first = i + 1
+        return out
+
+    def boundaries_for_word_counts(self, counts: Sequence[int]) -> List[float]:
+        """Cut points between consecutive sections of ``counts`` words.
+
+        Returns len(counts)+1 times from 0 to duration_sec. Each inner cut
+        sits in the gap before the section's first word. When the script's
+        word total differs from the index (numbers spoken as words, edits)
+        word positions are mapped proportionally.
+        """
+        total = sum(max(0, c) for c in counts)
+        n = len(self.words)
+        cuts = [0.0]
+        seen = 0
+        for c in list(counts)[:-1]:
+            seen += max(0, c)
+            if n == 0 or total == 0:
+                cuts.append(self.duration_sec * seen / max(1, total))
+                continue
+            idx = min(n - 1, max(0, round(seen * n / total)))
+            prev_end = self.ends[idx - 1] if idx > 0 else 0.0
+            cuts.append(max(cuts[-1], (prev_end + self.starts[idx]) / 2.0))
+        cuts.append(max(cuts[-1], self.duration_sec))
+        return cuts
+
+    def durations_for_word_counts(self, counts: Sequence[int]) -> List[float]:
+        cuts = self.boundaries_for_word_counts(counts)
+        return [round(b - a, 3) for a, b in zip(cuts, cuts[1:])]
+
+    def pauses(self, min_sec: float = 0.15) -> List[Tuple[float, float]]:
+        """Inter-word gaps of at least ``min_sec``."""
+        return [
+            (self.ends[i], self.starts[i + 1])
+            for i in range(len(self.words) - 1)
+            if self.starts[i + 1] - self.ends[i] >= min_sec
+        ]
+
+    def snap(self, t: float, window_sec: float = SNAP_WINDOW_SEC) -> float:
+        """Move ``t`` to the middle of the nearest pause within the window."""
+        best, best_d = t, window_sec
+        for a, b in self.pauses():
+            mid = (a + b) / 2.0
+            d = abs(mid - t)
+            if d <= best_d:
+                best, best_d = mid, d
+        return best
+
+    # -- construction ------------------------------------------------------
+
+    @classmethod
+    def from_characters(
+        cls,
+        characters: Sequence[str],
+        starts: Sequence[float],
+        ends: Sequence[float],
+        *,
+        offset_sec: float = 0.0,
+        duration_sec: Optional[float] = None,
+    ) -> "AlignmentIndex":
+        """Words from provider character timestamps (ElevenLabs alignment)."""
+        words: List[str] = []
+        w_starts: List[float] = []
+        w_ends: List[float] = []
+        buf: List[str] = []
+        for ch, s, e in zip(characters, starts, ends):
+            if ch.isspace():
+                if buf:
+                    words.append("".join(buf))
+                    buf = []
+                continue
+            if not buf:
+                w_starts.append(float(s) + offset_sec)
+                w_ends.append(float(e) + offset_sec)
+            else:
+                w_ends[-1] = float(e) + offset_sec
+            buf.append(ch)
+        if buf:
+            words.append("".join(buf))
+        end = w_ends[-1] if w_ends else offset_sec
+        return cls(
+            words=words, starts=w_starts, ends=w_ends,
+            duration_sec=duration_sec if duration_sec is not None else end,
+            source="provider",
+        )
+
+    @classmethod
+    def concat(cls, parts: Sequence["AlignmentIndex"], duration_sec: float) -> "AlignmentIndex":
+        """Join per-chunk indexes whose times are already absolute."""
+        out = cls(words=[], starts=[], ends=[], duration_sec=duration_sec,
+                  source=parts[0].source if parts else "provider")
+        for p in parts:
+            out.words.extend(p.words)
+            out.starts.extend(p.starts)
+            out.ends.extend(p.ends)
+        return out
+
+    # -- persistence -------------------------------------------------------
+
+    def to_dict(self) -> Dict[str, Any]:
+        flat: List[int] = []
+        for s, e in zip(self.starts, self.ends):
+            flat.extend((int(round(s * 1000)), int(round(e * 1000))))
+        return {
+            "version": ALIGNMENT_VERSION,
+            "source": self.source,
+            "audio_sha1": self.audio_sha1,
+            "duration_ms": int(round(self.duration_sec * 1000)),
+            "words": self.words,
+            "t_ms": flat,
+            **({"meta": self.meta} if self.meta else {}),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "AlignmentIndex":
+        flat = data.get("t_ms") or []
+        return cls(
+            words=list(data.get("words") or []),
+            starts=[v / 1000.0 for v in flat[0::2]],
+            ends=[v / 1000.0 for v in flat[1::2]],
+            duration_sec=data.get("duration_ms", 0) / 1000.0,
+            source=data.get("source", "energy"),
+            audio_sha1=data.get("audio_sha1", ""),
+            meta=data.get("meta") or {},
+        )
+
+    def save(self, path: Path) -> None:
+        atomic_write_json(path, self.to_dict())
+
+
+def load_alignment(audio_path: Path, *, verify: bool = True) -> Optional[AlignmentIndex]:
+    """Load the index next to ``audio_path``; None if absent or stale."""
+    path = alignment_path_for(audio_path)
+    if not path.exists():
+        return None
+    try:
+        index = AlignmentIndex.from_dict(read_json(path))
+    except (ValueError, OSError, TypeError):
+        return None
+    if verify and index.audio_sha1 and audio_path.exists():
+        if sha1_file(audio_path) != index.audio_sha1:
+            return None
+    return index
+
+
+# ---------------------------------------------------------------------------
+# Energy aligner
+# ---------------------------------------------------------------------------
+
+
+def wav_energy(path: Path, hop_sec: float = HOP_SEC, stride: int = ENERGY_STRIDE) -> Tuple[List[float], float]:
+    """RMS per hop of a 16-bit PCM WAV (first channel). Returns (rms, hop_sec).
+
+    Reads one hop block at a time, so memory stays flat for long tracks.
+    """
+    with wave.open(str(path), "rb") as wf:
+        if wf.getsampwidth() != 2:
+            raise ValueError(f"{path.name}: only 16-bit PCM WAV is supported")
+        rate = wf.getframerate()
+        channels = wf.getnchannels()
+        hop = max(1, int(round(rate * hop_sec)))
+        step = stride * channels
+        rms: List[float] = []
+        block = 256  # hops per read
+        while True:
+            raw = wf.readframes(hop * block)
+            if not raw:
+                break
+            samples = array("h")
+            samples.frombytes(raw[: len(raw) - len(raw) % 2])
+            if sys.byteorder == "big":
+                samples.byteswap()
+            span = hop * channels
+            for off in range(0, len(samples), span):
+                sub = samples[off:off + span:step]
+                if sub:
+                    rms.append(math.sqrt(sum(map(operator.mul, sub, sub)) / len(sub)))
+    return rms, hop / float(rate)
+
+
+def speech_regions(
+    rms: Sequence[float],
+    hop_sec: float,
+    *,
+    min_gap_sec: float = MIN_GAP_SEC,
+) -> List[Tuple[float, float]]:
+    """Speech intervals (seconds) from per-hop RMS with an adaptive threshold."""
+    if not rms:
+        return []
+    ordered = sorted(rms)
+    floor = ordered[int(0.10 * (len(ordered) - 1))]
+    loud = ordered[int(0.90 * (len(ordered) - 1))]
+    threshold = max(SILENCE_FLOOR, floor + 0.1 * (loud - floor))
+    min_gap = max(1, int(round(min_gap_sec / hop_sec)))
+
+    regions: List[Tuple[int, int]] = []
+    start: Optional[int] = None
+    quiet = 0
+    for i, v in enumerate(rms):
+        if v >= threshold:
+            if start is None:
+                start = i
+            quiet = 0
+        elif start is not None:
+            quiet += 1
+            if quiet >= min_gap:
+                regions.append((start, i - quiet + 1))
+                start, quiet = None, 0
+    if start is not None:
+        regions.append((start, len(rms) - quiet))
+    return [(a * hop_sec, b * hop_sec) for a, b in regions if b > a]
+
+
+def _spread(
+    weights: Sequence[float],
+    regions: Sequence[Tuple[float, float]],
+) -> List[Tuple[float, float]]:
+    """Place consecutive items with ``weights`` across speech ``regions``."""
+    speech = sum(b - a for a, b in regions)
+    total = sum(weights) or 1.0
+
+    def at(pos: float) -> float:
+        for a, b in regions:
+            if pos <= b - a:
+                return a + pos
+            pos -= b - a
+        return regions[-1][1]
+
+    out: List[Tuple[float, float]] = []
+    cum = 0.0
+    for w in weights:
+        s = at(speech * cum / total)
+        cum += w
+        # End just inside the region the word ends in, never across a pause
+        out.append((s, max(s, at(speech * cum / total - 1e-9))))
+    return out
+
+
+def _clip_regions(
+    regions: Sequence[Tuple[float, float]], t0: float, t1: float,
+) -> List[Tuple[float, float]]:
+    out = [(max(a, t0), min(b, t1)) for a, b in regions if b > t0 and a < t1]
+    return [(a, b) for a, b in out if b > a] or [(t0, max(t0, t1))]
+
+
+def energy_align(
+    words: Sequence[str],
+    regions: Sequence[Tuple[float, float]],
+    duration_sec: float,
+    *,
+    snap_window_sec: float = SNAP_WINDOW_SEC,
+) -> AlignmentIndex:
+    """Align script words to speech regions.
+
+    Words are spread over speech time by letter count; each sentence end is
+    then anchored to the nearest pause (within snap_window_sec) and words
+    are re-spread between anchors, so per-sentence timing follows the real
+    pauses rather than accumulated drift.
+    """
+    words = list(words)
+    if not words:
+        return AlignmentIndex([], [], [], duration_sec)
+    regions = list(regions) or [(0.0, duration_sec)]
+    weights = [float(max(1, sum(ch.isalnum() for ch in w))) for w in words]
+    first = _spread(weights, regions)
+
+    # Anchor sentence ends onto pauses between regions (monotonic, each used once)
+    gaps = [(regions[i][1], regions[i + 1][0]) for i in range(len(regions) - 1)]
+    anchors: List[Tuple[int, float, float]] = []  # (word index, gap start, gap end)
+    g = 0
+    for i, w in enumerate(words[:-1]):
+        if not _SENTENCE_END.search(w):
+            continue
+        end = first[i][1]
+        best: Optional[int] = None
+        for j in range(g, len(gaps)):
+            d = abs((gaps[j][0] + gaps[j][1]) / 2.0 - end)
+            if gaps[j][0] - end > snap_window_sec:
+                break
+            if d <= snap_window_sec and (best is None or d < abs(sum(gaps[best]) / 2.0 - end)):
+                best = j
+        if best is not None:
+            anchors.append((i, gaps[best][0], gaps[best][1]))
+            g = best + 1
+
+    starts: List[float] = []
+    ends: List[float] = []
+    lo_word, lo_t = 0, regions[0][0]
+    for idx, gap_start, gap_end in anchors + [(len(words) - 1, regions[-1][1], regions[-1][1])]:
+        span = _spread(weights[lo_word:idx + 1], _clip_regions(regions, lo_t, gap_start))
+        starts.extend(s for s, _ in span)
+        ends.extend(e for _, e in span)
+        lo_word, lo_t = idx + 1, gap_end
+
+    return AlignmentIndex(
+        words=words,
+        starts=[round(s, 3) for s in starts],
+        ends=[round(e, 3) for e in ends],
+        duration_sec=duration_sec,
+        source="energy",
+        meta={"speech_regions": len(regions), "anchored_sentences": len(anchors)},
+    )
+
+
+def align_wav(audio_path: Path, script_text: str) -> AlignmentIndex:
+    """Energy-align ``script_text`` against a WAV."""
+    rms, hop = wav_energy(audio_path)
+    duration = wav_duration_seconds(audio_path) or len(rms) * hop
+    index = energy_align(script_words(script_text), speech_regions(rms, hop), duration)
+    index.audio_sha1 = sha1_file(audio_path)
+    return index
+
+
+def provider_alignment(
+    chunks: Sequence[Dict[str, Any]],
+    audio_path: Path,
+    timing: Optional[Dict[str, Any]] = None,
+) -> AlignmentIndex:
+    """Index from per-chunk provider alignments.
+
+    ``chunks`` are ElevenLabs-style dicts ({"chunk_id", "alignment": {
+    "characters", "character_start_times_seconds",
+    "character_end_times_seconds"}}) in track order. Offsets come from the
+    voice track timing manifest when given, else chunks are assumed
+    back to back.
+    """
+    offsets = {e["chunk_id"]: e["start_sec"] for e in (timing or {}).get("chunks", [])}
+    parts: List[AlignmentIndex] = []
+    cursor = 0.0
+    for c in chunks:
+        al = c.get("alignment") or c.get("normalized_alignment") or {}
+        offset = offsets.get(c.get("chunk_id"), cursor)
+        part = AlignmentIndex.from_characters(
+            al.get("characters") or [],
+            al.get("character_start_times_seconds") or [],
+            al.get("character_end_times_seconds") or [],
+            offset_sec=offset,
+        )
+        parts.append(part)
+        cursor = part.duration_sec
+    duration = wav_duration_seconds(audio_path) or cursor
+    index = AlignmentIndex.concat(parts, duration)
+    index.audio_sha1 = sha1_file(audio_path) if audio_path.exists() else ""
+    return index
+
+
+def ensure_alignment(audio_path: Path, script_text: str) -> Optional[AlignmentIndex]:
+    """Load a fresh index for ``audio_path`` or build one with the energy aligner.
+
+    Returns None when the audio is missing or not a readable 16-bit WAV.
+    """
+    index = load_alignment(audio_path)
+    if index is not None:
+        return index
+    if wav_duration_seconds(audio_path) is None:
+        return None
+    try:
+        index = align_wav(audio_path, script_text)
+    except (ValueError, wave.Error, EOFError, OSError):
+        return None
+    index.save(alignment_path_for(audio_path))
+    return index
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+
+def main(argv: Optional[list] = None) -> int:
+    ap = argparse.ArgumentParser(description="RayVault alignment index for 02_audio.wav")
+    ap.add_argument("--run-dir", required=True)
+    ap.add_argument("--provider-alignment", default="",
+                    help="JSON list of per-chunk provider alignments (track order)")
+    ap.add_argument("--timing", default="",
+                    help="Voice track timing manifest (default: 02_audio.timing.json)")
+    args = ap.parse_args(argv)
+
+    run_dir = Path(args.run_dir).expanduser().resolve()
+    audio_path = run_dir / "02_audio.wav"
+    script_path = run_dir / "01_script.txt"
+    if not audio_path.exists() or not script_path.exists():
+        print("ERROR: 01_script.txt and 02_audio.wav are required", file=sys.stderr)
+        return 2
+
+    try:
+        if args.provider_alignment:
+            chunks = json.loads(Path(args.provider_alignment).read_text(encoding="utf-8"))
+            timing_path = Path(args.timing) if args.timing else audio_path.with_suffix(".timing.json")
+            timing = read_json(timing_path) if timing_path.exists() else None
+            index = provider_alignment(chunks, audio_path, timing)
+        else:
+            index = align_wav(audio_path, script_path.read_text(encoding="utf-8"))
+        out = alignment_path_for(audio_path)
+        index.save(out)
+    except Exception as exc:
+        print(f"ERROR: {exc}", file=sys.stderr)
+        return 1
+
+    print(
+        f"alignment: {len(index)} words | {index.duration_sec:.2f}s "
+        f"| source={index.source} | {out.name}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
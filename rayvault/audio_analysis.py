@@ -0,0 +1,438 @@
+"""RayVault Audio Analysis — decode-once PCM engine for audio postcheck.
+
+Decodes the mixed audio of a media file ONCE into a memory-mapped float32
+PCM buffer and answers every postcheck question from it with vectorized
+NumPy instead of launching one ffmpeg per window:
+
+  - band RMS (VAD, ducking linter, spectral clash)
+  - K-weighted loudness: integrated LUFS, LRA, windowed LUFS (BS.1770-4)
+  - true peak (4x oversampled)
+  - per-window sample peaks (clipping)
+  - silence gaps (silencedetect semantics)
+
+NumPy is optional: AudioAnalysis.decode() returns None when NumPy is not
+installed or ffmpeg cannot decode the file, and callers fall back to the
+per-window ffmpeg measurements.
+
+Usage:
+    from rayvault.audio_analysis import AudioAnalysis
+    with AudioAnalysis.decode(video_path) as analysis:
+        analysis.loudness()
+"""
+
+from __future__ import annotations
+
+import math
+import os
+import subprocess
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from rayvault.probe_cache import probe
+
+try:
+    import numpy as np
+    _HAS_NUMPY = True
+except ImportError:
+    _HAS_NUMPY = False
+
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+ANALYSIS_SAMPLE_RATE = 48000
+HOP_SEC = 0.1  # 100 ms hops: gating step and clipping window
+MOMENTARY_HOPS = 4  # 400 ms gating block
+SHORT_TERM_HOPS = 30  # 3 s short-term block (LRA)
+ABSOLUTE_GATE_LUFS = -70.0
+RELATIVE_GATE_LU = -10.0
+LRA_RELATIVE_GATE_LU = -20.0
+TRUE_PEAK_OVERSAMPLE = 4
+_HOPS_PER_CHUNK = 600  # bound working memory to ~60 s of audio per pass
+_TP_CHUNK = 1 << 16
+_TP_TAPS = 48
+
+
+def has_numpy() -> bool:
+    return _HAS_NUMPY
+
+
+@dataclass
+class LoudnessStats:
+    integrated_lufs: float
+    true_peak_db: float
+    lra: float
+
+
+# ---------------------------------------------------------------------------
+# K-weighting (BS.1770 pre-filter + RLB high-pass)
+# ---------------------------------------------------------------------------
+
+
+def _k_weighting_coeffs(fs: int) -> List[Tuple[List[float], List[float]]]:
+    """Return [(b, a), (b, a)] biquads for the K-weighting curve at fs."""
+    # Stage 1: high shelf (+4 dB above ~1.7 kHz)
+    g_db = 3.99984385397
+    q = 0.7071752369554193
+    fc = 1681.974450955533
+    k = math.tan(math.pi * fc / fs)
+    vh = 10 ** (g_db / 20.0)
+    vb = vh ** 0.4996667741545416
+    a0 = 1.0 + k / q + k * k
+    shelf = (
+        [(vh + vb * k / q + k * k) / a0, 2.0 * (k * k - vh) / a0,
+         (vh - vb * k / q + k * k) / a0],
+        [1.0, 2.0 * (k * k - 1.0) / a0, (1.0 - k / q + k * k) / a0],
+    )
+    # Stage 2: RLB high-pass (~38 Hz)
+    q = 0.5003270373253953
+    fc = 38.13547087613982
+    k = math.tan(math.pi * fc / fs)
+    a0 = 1.0 + k / q + k * k
+    highpass = (
+        [1.0, -2.0, 1.0],
+        [1.0, 2.0 * (k * k - 1.0) / a0, (1.0 - k / q + k * k) / a0],
+    )
+    return [shelf, highpass]
+
+
+def _biquad_power_response(b: List[float], a: List[float], freqs_norm: "np.ndarray") -> "np.ndarray":
+    """|H(e^jw)|^2 of a biquad at normalized frequencies (cycles/sample)."""
+    z1 = np.exp(-2j * np.pi * freqs_norm)
+    z2 = z1 * z1
+    num = b[0] + b[1] * z1 + b[2] * z2
+    den = a[0] + a[1] * z1 + a[2] * z2
+    return np.abs(num / den) ** 2
+
+
+def _parseval_weights(n: int) -> "np.ndarray":
+    """One-sided rfft bin weights so sum(w*|X|^2)/n^2 == mean square."""
+    w = np.full(n // 2 + 1, 2.0)
+    w[0] = 1.0
+    if n % 2 == 0:
+        w[-1] = 1.0
+    return w
+
+
+def _true_peak_phases() -> "np.ndarray":
+    """Fractional-delay interpolators for the oversampled phases 1..N-1.
+
+    Hann-windowed sinc, _TP_TAPS long; phase 0 is the original sample grid.
+    """
+    k = np.arange(_TP_TAPS) - (_TP_TAPS // 2 - 1)
+    window = np.hanning(_TP_TAPS + 2)[1:-1]
+    phases = []
+    for p in range(1, TRUE_PEAK_OVERSAMPLE):
+        h = np.sinc(k - p / TRUE_PEAK_OVERSAMPLE) * window
+        phases.append(h / h.sum())
+    return np.array(phases)
+
+
+def _power_to_lufs(power: "np.ndarray") -> "np.ndarray":
+    with np.errstate(divide="ignore"):
+        return -0.691 + 10.0 * np.log10(power)
+
+
+def _to_db(value: float) -> Optional[float]:
+    if value <= 0.0:
+        return None
+    return 20.0 * math.log10(value)
+
+
+# ---------------------------------------------------------------------------
+# Engine
+# ---------------------------------------------------------------------------
+
+
+class AudioAnalysis:
+    """Shared PCM buffer (frames x channels, float32) plus cached per-hop stats."""
+
+    def __init__(
+        self,
+        samples: "np.ndarray",
+        sample_rate: int = ANALYSIS_SAMPLE_RATE,
+        backing_path: Optional[Path] = None,
+    ):
+        if samples.ndim == 1:
+            samples = samples.reshape(-1, 1)
+        self.samples = samples
+        self.sample_rate = sample_rate
+        self.channels = samples.shape[1]
+        self.hop = int(round(HOP_SEC * sample_rate))
+        self._backing_path = backing_path
+        self._hop_power: Optional["np.ndarray"] = None
+        self._hop_peak: Optional["np.ndarray"] = None
+        self._true_peak: Optional[float] = None
+
+    # -- lifecycle ---------------------------------------------------------
+
+    @classmethod
+    def decode(
+        cls,
+        media_path: Path,
+        tmp_dir: Optional[Path] = None,
+        timeout: int = 300,
+    ) -> Optional["AudioAnalysis"]:
+        """Decode media audio once to a memory-mapped float32 file.
+
+        Returns None when NumPy is unavailable or decoding fails.
+        """
+        if not _HAS_NUMPY:
+            return None
+        channels = _probe_channels(media_path)
+        if channels is None:
+            return None
+        channels = min(channels, 2)  # downmix surround for analysis
+        fd, tmp_name = tempfile.mkstemp(
+            prefix="rv_pcm_", suffix=".f32", dir=str(tmp_dir) if tmp_dir else None,
+        )
+        os.close(fd)
+        tmp_path = Path(tmp_name)
+        try:
+            proc = subprocess.run(
+                ["ffmpeg", "-v", "error", "-y", "-i", str(media_path), "-vn",
+                 "-ac", str(channels), "-ar", str(ANALYSIS_SAMPLE_RATE),
+                 "-f", "f32le", "-acodec", "pcm_f32le", str(tmp_path)],
+                capture_output=True, text=True, timeout=timeout,
+            )
+            size = tmp_path.stat().st_size
+            if proc.returncode != 0 or size < 4 * channels:
+                tmp_path.unlink(missing_ok=True)
+                return None
+            frames = size // (4 * channels)
+            samples = np.memmap(
+                tmp_path, dtype=np.float32, mode="r", shape=(frames, channels),
+            )
+            return cls(samples, ANALYSIS_SAMPLE_RATE, backing_path=tmp_path)
+        except Exception:
+            tmp_path.unlink(missing_ok=True)
+            return None
+
+    @classmethod
+    def from_array(
+        cls, samples: "np.ndarray", sample_rate: int = ANALYSIS_SAMPLE_RATE,
+    ) -> "AudioAnalysis":
+        """Build from an in-memory array (frames,) or (frames, channels)."""
+        return cls(np.asarray(samples, dtype=np.float32), sample_rate)
+
+    def close(self) -> None:
+        """Release the memory map and remove the backing PCM file."""
+        samples = self.samples
+        self.samples = None
+        mm = getattr(samples, "_mmap", None)
+        del samples
+        if mm is not None:
+            try:
+                mm.close()
+            except Exception:
+                pass
+        if self._backing_path is not None:
+            try:
+                self._backing_path.unlink(missing_ok=True)
+            except OSError:
+                pass
+            self._backing_path = None
+
+    def __enter__(self) -> "AudioAnalysis":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    @property
+    def duration_sec(self) -> float:
+        return self.samples.shape[0] / float(self.sample_rate)
+
+    def _slice(self, start_sec: float, end_sec: float) -> "np.ndarray":
+        s = max(0, int(round(start_sec * self.sample_rate)))
+        e = min(self.samples.shape[0], int(round(end_sec * self.sample_rate)))
+        return self.samples[s:max(s, e)]
+
+    # -- per-hop statistics (computed once, chunked) -----------------------
+
+    def _ensure_hop_stats(self) -> None:
+        if self._hop_power is not None:
+            return
+        hop = self.hop
+        n_hops = self.samples.shape[0] // hop
+        freqs = np.fft.rfftfreq(hop)
+        weight = _parseval_weights(hop)
+        for b, a in _k_weighting_coeffs(self.sample_rate):
+            weight = weight * _biquad_power_response(b, a, freqs)
+        weight = weight / float(hop * hop)
+
+        power = np.zeros((n_hops, self.channels), dtype=np.float64)
+        peak = np.zeros(n_hops, dtype=np.float64)
+        for h0 in range(0, n_hops, _HOPS_PER_CHUNK):
+            h1 = min(n_hops, h0 + _HOPS_PER_CHUNK)
+            block = np.asarray(self.samples[h0 * hop:h1 * hop], dtype=np.float64)
+            block = block.reshape(h1 - h0, hop, self.channels)
+            peak[h0:h1] = np.abs(block).max(axis=(1, 2))
+            spec = np.fft.rfft(block, axis=1)
+            power[h0:h1] = np.einsum("hfc,f->hc", np.abs(spec) ** 2, weight)
+        self._hop_power = power
+        self._hop_peak = peak
+
+    def _block_powers(self, hops: int, h0: int = 0, h1: Optional[int] = None) -> "np.ndarray":
+        """Channel-summed mean-square power of sliding blocks (step = 1 hop)."""
+        self._ensure_hop_stats()
+        hp = self._hop_power[h0:h1].sum(axis=1)  # G = 1.0 for L/R/mono
+        if hp.shape[0] < hops:
+            return np.zeros(0)
+        csum = np.concatenate(([0.0], np.cumsum(hp)))
+        return (csum[hops:] - csum[:-hops]) / hops
+
+    # -- loudness -----------------------------------------------------------
+
+    def _gated_loudness(self, h0: int = 0, h1: Optional[int] = None) -> Optional[float]:
+        blocks = self._block_powers(MOMENTARY_HOPS, h0, h1)
+        if blocks.size == 0:
+            return None
+        gated = blocks[_power_to_lufs(blocks) > ABSOLUTE_GATE_LUFS]
+        if gated.size == 0:
+            return None
+        rel_gate = float(_power_to_lufs(np.array([gated.mean()]))[0]) + RELATIVE_GATE_LU
+        gated = gated[_power_to_lufs(gated) > rel_gate]
+        if gated.size == 0:
+            return None
+        return float(_power_to_lufs(np.array([gated.mean()]))[0])
+
+    def integrated_lufs(self) -> Optional[float]:
+        return self._gated_loudness()
+
+    def window_lufs(self, start_sec: float, end_sec: float) -> Optional[float]:
+        """Gated integrated loudness of a time window (None if < 400 ms)."""
+        h0 = max(0, int(start_sec / HOP_SEC))
+        h1 = max(h0, int(end_sec / HOP_SEC))
+        return self._gated_loudness(h0, h1)
+
+    def loudness_range(self) -> float:
+        """EBU Tech 3342 LRA from 3 s short-term blocks."""
+        blocks = self._block_powers(SHORT_TERM_HOPS)
+        if blocks.size == 0:
+            return 0.0
+        lufs = _power_to_lufs(blocks)
+        gated = blocks[lufs > ABSOLUTE_GATE_LUFS]
+        if gated.size == 0:
+            return 0.0
+        rel_gate = float(_power_to_lufs(np.array([gated.mean()]))[0]) + LRA_RELATIVE_GATE_LU
+        kept = lufs[(lufs > ABSOLUTE_GATE_LUFS) & (lufs > rel_gate)]
+        if kept.size == 0:
+            return 0.0
+        lo, hi = np.percentile(kept, [10, 95])
+        return float(hi - lo)
+
+    def true_peak_db(self) -> float:
+        """Maximum inter-sample peak (dBTP) via 4x polyphase oversampling."""
+        if self._true_peak is None:
+            n = self.samples.shape[0]
+            taps = _true_peak_phases()
+            half = taps.shape[1] // 2
+            best = 0.0
+            for c0 in range(0, n, _TP_CHUNK):
+                c1 = min(n, c0 + _TP_CHUNK)
+                s = max(0, c0 - half)
+                e = min(n, c1 + half)
+                block = np.asarray(self.samples[s:e], dtype=np.float64)
+                lo = c0 - s
+                hi = lo + (c1 - c0)
+                best = max(best, float(np.abs(block[lo:hi]).max(initial=0.0)))
+                for phase in taps:
+                    for ch in range(self.channels):
+                        interp = np.convolve(block[:, ch], phase, mode="same")
+                        best = max(best, float(np.abs(interp[lo:hi]).max(initial=0.0)))
+            self._true_peak = _to_db(best) if best > 0 else -200.0
+        return self._true_peak
+
+    def loudness(self) -> Optional[LoudnessStats]:
+        integrated = self.integrated_lufs()
+        if integrated is None:
+            return None
+        return LoudnessStats(
+            integrated_lufs=round(integrated, 2),
+            true_peak_db=round(self.true_peak_db(), 2),
+            lra=round(self.loudness_range(), 2),
+        )
+
+    # -- band RMS -----------------------------------------------------------
+
+    def band_rms_db(
+        self, start_sec: float, end_sec: float, band_hz: Tuple[int, int],
+    ) -> Optional[float]:
+        """RMS level (dBFS) of the window restricted to band_hz."""
+        block = np.asarray(self._slice(start_sec, end_sec), dtype=np.float64)
+        n = block.shape[0]
+        if n < 2:
+            return None
+        freqs = np.fft.rfftfreq(n, d=1.0 / self.sample_rate)
+        mask = (freqs >= band_hz[0]) & (freqs <= band_hz[1])
+        spec = np.abs(np.fft.rfft(block, axis=0)) ** 2
+        weight = _parseval_weights(n) * mask / float(n * n)
+        mean_square = float((spec * weight[:, None]).sum(axis=0).mean())
+        return _to_db(math.sqrt(mean_square)) if mean_square > 0 else None
+
+    # -- clipping / silence ---------------------------------------------------
+
+    def clipped_windows(self, threshold_db: float = -0.1) -> List[Dict[str, Any]]:
+        """100 ms windows whose sample peak is at or above threshold_db."""
+        self._ensure_hop_stats()
+        peak = self._hop_peak
+        with np.errstate(divide="ignore"):
+            peak_db = 20.0 * np.log10(peak)
+        idx = np.nonzero(peak_db >= threshold_db)[0]
+        return [
+            {"window": int(i), "peak_db": round(float(peak_db[i]), 2)}
+            for i in idx
+        ]
+
+    def silence_gaps(
+        self, max_gap_ms: int, noise_db: float = -50.0,
+    ) -> List[Dict[str, Any]]:
+        """Runs where every channel stays below noise_db for > max_gap_ms."""
+        threshold = 10 ** (noise_db / 20.0)
+        min_len = max_gap_ms / 1000.0 * self.sample_rate
+        gaps: List[Dict[str, Any]] = []
+        n = self.samples.shape[0]
+        chunk = _HOPS_PER_CHUNK * self.hop
+        run_start: Optional[int] = None
+        for c0 in range(0, n, chunk):
+            quiet = (np.abs(self.samples[c0:c0 + chunk]) < threshold).all(axis=1)
+            edges = np.diff(quiet.astype(np.int8), prepend=np.int8(0 if run_start is None else 1))
+            starts = list(np.nonzero(edges == 1)[0] + c0)
+            ends = list(np.nonzero(edges == -1)[0] + c0)
+            if run_start is not None:
+                starts.insert(0, run_start)
+            run_start = None
+            for i, s in enumerate(starts):
+                if i < len(ends):
+                    self._append_gap(gaps, s, ends[i], min_len)
+                else:
+                    run_start = s
+        if run_start is not None:
+            self._append_gap(gaps, run_start, n, min_len)
+        return gaps
+
+    def _append_gap(self, gaps: List[Dict[str, Any]], s: int, e: int, min_len: float) -> None:
+        if e - s > min_len:
+            start = int(s) / float(self.sample_rate)
+            end = int(e) / float(self.sample_rate)
+            gaps.append({
+                "start": round(start, 3),
+                "end": round(end, 3),
+                "duration_ms": round((end - start) * 1000, 1),
+            })
+
+
+def _probe_channels(media_path: Path) -> Optional[int]:
+    """Channel count of the first audio stream, or None."""
+    info = probe(media_path)
+    for stream in (info or {}).get("streams", []):
+        if stream.get("codec_type") == "audio":
+            try:
+                return int(stream["channels"])
+            except (KeyError, TypeError, ValueError):
+                return None
+    return None
@@ -15,6 +15,10 @@ Gates (FAIL/WARN):
   H: Click/Clipping detection (WARN/FAIL)
   I: Silence gaps > 300ms (WARN)
 
+The mixed audio is decoded once (rayvault.audio_analysis) and every gate
+reads from that shared PCM buffer. Without NumPy, or if the decode fails,
+each gate falls back to its own ffmpeg measurement.
+
 Usage:
     from rayvault.audio_postcheck import run_audio_postcheck
     result = run_audio_postcheck(video_path, render_config, expected_duration)
@@ -29,6 +33,8 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
+from rayvault.audio_analysis import AudioAnalysis
+from rayvault.probe_cache import probe_duration
 from rayvault.policies import (
     SOUNDTRACK_LUFS_RANGE,
     SOUNDTRACK_DURATION_EPS_SEC,
@@ -145,8 +151,24 @@ class PostcheckResult:
 # ---------------------------------------------------------------------------
 
 
-def measure_loudness(video_path: Path) -> LoudnessResult:
-    """Measure integrated loudness via ffmpeg loudnorm analysis."""
+def measure_loudness(
+    video_path: Path,
+    analysis: Optional[AudioAnalysis] = None,
+) -> LoudnessResult:
+    """Measure integrated loudness (decoded buffer, else ffmpeg loudnorm)."""
+    if analysis is not None:
+        try:
+            stats = analysis.loudness()
+            if stats is not None:
+                return LoudnessResult(
+                    integrated_lufs=stats.integrated_lufs,
+                    true_peak_db=stats.true_peak_db,
+                    lra=stats.lra,
+                    ok=True,
+                )
+            return LoudnessResult(ok=False, error="audio below absolute gate")
+        except Exception as e:
+            return LoudnessResult(ok=False, error=str(e))
     try:
         cmd = [
             "ffmpeg", "-i", str(video_path), "-af",
@@ -184,19 +206,10 @@ def check_duration(
 
     Returns (passed, actual_duration).
     """
-    try:
-        cmd = [
-            "ffprobe", "-v", "quiet", "-print_format", "json",
-            "-show_format", str(video_path),
-        ]
-        proc = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-        if proc.returncode == 0:
-            data = json.loads(proc.stdout)
-            actual = float(data["format"]["duration"])
-            return (abs(actual - expected_sec) <= eps, actual)
-    except Exception:
-        pass
-    return (False, 0.0)
+    actual = probe_duration(video_path)
+    if actual is None:
+        return (False, 0.0)
+    return (abs(actual - expected_sec) <= eps, actual)
 
 
 # ---------------------------------------------------------------------------
@@ -211,6 +224,7 @@ def run_vad(
     window_ms: int = VAD_WINDOW_MS,
     floor_percentile: int = VAD_NOISE_FLOOR_PERCENTILE,
     threshold_db: float = VAD_THRESHOLD_ABOVE_FLOOR_DB,
+    analysis: Optional[AudioAnalysis] = None,
 ) -> VADResult:
     """Energy-based voice activity detection.
 
@@ -250,7 +264,9 @@ def run_vad(
     # Measure RMS in voice band for each window
     rms_values: List[float] = []
     for w_start, w_end in sample_points:
-        rms = _measure_band_rms(video_path, w_start, w_end, voice_band)
+        rms = _measure_band_rms(
+            video_path, w_start, w_end, voice_band, analysis=analysis,
+        )
         if rms is not None:
             rms_values.append(rms)
             windows.append(VADWindow(
@@ -290,8 +306,17 @@ def _measure_band_rms(
     start_sec: float,
     end_sec: float,
     band_hz: Tuple[int, int],
+    analysis: Optional[AudioAnalysis] = None,
 ) -> Optional[float]:
-    """Measure RMS in a frequency band for a time window using ffmpeg."""
+    """Measure RMS in a frequency band for a time window.
+
+    Reads the shared decoded buffer when given, else spawns ffmpeg.
+    """
+    if analysis is not None:
+        try:
+            return analysis.band_rms_db(start_sec, end_sec, band_hz)
+        except Exception:
+            return None
     duration = end_sec - start_sec
     lo, hi = band_hz
     try:
@@ -337,6 +362,7 @@ def lint_ducking(
     presence_band: Tuple[int, int] = DUCKING_PRESENCE_BAND_HZ,
     expected_duck_db: float = SOUNDTRACK_DUCK_AMOUNT_DB,
     min_ratio: float = DUCKING_MIN_REDUCTION_RATIO,
+    analysis: Optional[AudioAnalysis] = None,
 ) -> DuckingLintResult:
     """Check that music ducks during VO-present windows.
 
@@ -358,9 +384,11 @@ def lint_ducking(
 
     vo_rms = _measure_band_rms(
         video_path, vo_w.start_sec, vo_w.end_sec, presence_band,
+        analysis=analysis,
     )
     no_vo_rms = _measure_band_rms(
         video_path, no_vo_w.start_sec, no_vo_w.end_sec, presence_band,
+        analysis=analysis,
     )
 
     if vo_rms is None or no_vo_rms is None:
@@ -397,6 +425,7 @@ def detect_spectral_clash(
     video_path: Path,
     vad_result: VADResult,
     presence_band: Tuple[int, int] = DUCKING_PRESENCE_BAND_HZ,
+    analysis: Optional[AudioAnalysis] = None,
 ) -> Optional[str]:
     """Detect if presence band doesn't reduce during VO.
 
@@ -416,9 +445,11 @@ def detect_spectral_clash(
 
     vo_rms = _measure_band_rms(
         video_path, vo_w.start_sec, vo_w.end_sec, presence_band,
+        analysis=analysis,
     )
     no_vo_rms = _measure_band_rms(
         video_path, no_vo_w.start_sec, no_vo_w.end_sec, presence_band,
+        analysis=analysis,
     )
 
     if vo_rms is None or no_vo_rms is None:
@@ -444,6 +475,7 @@ def run_breath_check(
     voiceover_manifest: Optional[Dict[str, Any]],
     vad_result: VADResult,
     max_silence_ms: int = SOUNDTRACK_MAX_SILENCE_GAP_MS,
+    analysis: Optional[AudioAnalysis] = None,
 ) -> BreathCheckResult:
     """Check that silence/activity matches voiceover intent.
 
@@ -468,7 +500,9 @@ def run_breath_check(
         return False
 
     # Detect silence gaps
-    silence_gaps = detect_silence_gaps(video_path, max_silence_ms)
+    silence_gaps = detect_silence_gaps(
+        video_path, max_silence_ms, analysis=analysis,
+    )
 
     for gap in silence_gaps:
         gap_start = gap["start"]
@@ -499,14 +533,20 @@ def run_breath_check(
 # ---------------------------------------------------------------------------
 
 
-def detect_clipping(video_path: Path) -> ClippingResult:
-    """Detect clipping using ffmpeg's astats maximum level.
+def detect_clipping(
+    video_path: Path,
+    analysis: Optional[AudioAnalysis] = None,
+) -> ClippingResult:
+    """Detect clipping from per-100ms peak levels near 0 dBFS.
 
-    Checks for true peak near 0 dBFS which indicates clipping.
-    Also uses ametadata to detect consecutive peak samples.
+    Uses the decoded buffer's window peaks when given, else ffmpeg astats.
     """
     result = ClippingResult()
     try:
+        if analysis is not None:
+            result.clipped_regions = analysis.clipped_windows(-0.1)
+            _grade_clipping(result)
+            return result
         cmd = [
             "ffmpeg", "-i", str(video_path),
             "-af", "astats=metadata=1:reset=1:length=0.1",
@@ -531,13 +571,7 @@ def detect_clipping(video_path: Path) -> ClippingResult:
                         pass
                 window_idx += 1
 
-        if result.clipped_regions:
-            n = len(result.clipped_regions)
-            if n > 5:
-                result.ok = False
-                result.warning = f"CLIPPING: {n} regions near 0 dBFS"
-            else:
-                result.warning = f"CLIPPING_WARN: {n} region(s) near 0 dBFS"
+        _grade_clipping(result)
 
     except Exception:
         pass
@@ -545,6 +579,16 @@ def detect_clipping(video_path: Path) -> ClippingResult:
     return result
 
 
+def _grade_clipping(result: ClippingResult) -> None:
+    if result.clipped_regions:
+        n = len(result.clipped_regions)
+        if n > 5:
+            result.ok = False
+            result.warning = f"CLIPPING: {n} regions near 0 dBFS"
+        else:
+            result.warning = f"CLIPPING_WARN: {n} region(s) near 0 dBFS"
+
+
 # ---------------------------------------------------------------------------
 # Gate I: Silence gap detection
 # ---------------------------------------------------------------------------
@@ -553,8 +597,17 @@ def detect_clipping(video_path: Path) -> ClippingResult:
 def detect_silence_gaps(
     video_path: Path,
     max_gap_ms: int = SOUNDTRACK_MAX_SILENCE_GAP_MS,
+    analysis: Optional[AudioAnalysis] = None,
 ) -> List[Dict[str, Any]]:
-    """Detect silence gaps longer than max_gap_ms using ffmpeg silencedetect."""
+    """Detect silence gaps (< -50 dB) longer than max_gap_ms.
+
+    Scans the decoded buffer when given, else ffmpeg silencedetect.
+    """
+    if analysis is not None:
+        try:
+            return analysis.silence_gaps(max_gap_ms, noise_db=-50.0)
+        except Exception:
+            return []
     gaps: List[Dict[str, Any]] = []
     threshold_sec = max_gap_ms / 1000.0
     try:
@@ -601,6 +654,7 @@ def detect_silence_gaps(
 def check_vo_music_balance(
     video_path: Path,
     render_config: Dict[str, Any],
+    analysis: Optional[AudioAnalysis] = None,
 ) -> BalanceResult:
     """Heuristic check for VO-vs-Music loudness balance."""
     segments = render_config.get("segments", [])
@@ -623,8 +677,12 @@ def check_vo_music_balance(
     if not vo_windows or not music_windows:
         return BalanceResult(ok=True)
 
-    vo_lufs = _measure_window_lufs(video_path, vo_windows[0][0], vo_windows[0][1])
-    music_lufs = _measure_window_lufs(video_path, music_windows[0][0], music_windows[0][1])
+    vo_lufs = _measure_window_lufs(
+        video_path, vo_windows[0][0], vo_windows[0][1], analysis=analysis,
+    )
+    music_lufs = _measure_window_lufs(
+        video_path, music_windows[0][0], music_windows[0][1], analysis=analysis,
+    )
 
     if vo_lufs is None or music_lufs is None:
         return BalanceResult(ok=True)
@@ -649,8 +707,15 @@ def check_vo_music_balance(
 
 def _measure_window_lufs(
     video_path: Path, start_sec: float, end_sec: float,
+    analysis: Optional[AudioAnalysis] = None,
 ) -> Optional[float]:
     """Measure integrated LUFS for a time window."""
+    if analysis is not None:
+        try:
+            lufs = analysis.window_lufs(start_sec, end_sec)
+            return round(lufs, 2) if lufs is not None else None
+        except Exception:
+            return None
     try:
         duration = end_sec - start_sec
         cmd = [
@@ -701,10 +766,31 @@ def run_audio_postcheck(
     if not video_path.exists():
         return PostcheckResult(ok=False, errors=["VIDEO_NOT_FOUND"])
 
+    # Decode once; every gate below reads the same PCM buffer
+    analysis = AudioAnalysis.decode(video_path)
+    try:
+        _run_gates(
+            result, video_path, render_config, expected_duration,
+            voiceover_manifest, analysis,
+        )
+    finally:
+        if analysis is not None:
+            analysis.close()
+    return result
+
+
+def _run_gates(
+    result: PostcheckResult,
+    video_path: Path,
+    render_config: Dict[str, Any],
+    expected_duration: float,
+    voiceover_manifest: Optional[Dict[str, Any]],
+    analysis: Optional[AudioAnalysis],
+) -> None:
     segments = render_config.get("segments", [])
 
     # Gate A: loudness
-    loudness = measure_loudness(video_path)
+    loudness = measure_loudness(video_path, analysis=analysis)
     if loudness.ok:
         result.metrics["integrated_lufs"] = loudness.integrated_lufs
         result.metrics["true_peak_db"] = loudness.true_peak_db
@@ -745,7 +831,7 @@ def run_audio_postcheck(
         )
 
     # Gate D: VAD
-    vad = run_vad(video_path, segments)
+    vad = run_vad(video_path, segments, analysis=analysis)
     if vad.ok and vad.windows:
         result.metrics["vad"] = {
             "noise_floor_db": vad.noise_floor_db,
@@ -755,7 +841,7 @@ def run_audio_postcheck(
         }
 
         # Gate E: ducking linter
-        ducking_lint = lint_ducking(video_path, vad)
+        ducking_lint = lint_ducking(video_path, vad, analysis=analysis)
         if ducking_lint.vo_presence_rms_db is not None:
             result.metrics["ducking_lint"] = {
                 "vo_presence_rms_db": ducking_lint.vo_presence_rms_db,
@@ -767,13 +853,13 @@ def run_audio_postcheck(
             result.warnings.append(ducking_lint.warning)
 
         # Gate F: spectral clash
-        clash_warning = detect_spectral_clash(video_path, vad)
+        clash_warning = detect_spectral_clash(video_path, vad, analysis=analysis)
         if clash_warning:
             result.warnings.append(clash_warning)
 
         # Gate G: breath check
         breath = run_breath_check(
-            video_path, voiceover_manifest, vad,
+            video_path, voiceover_manifest, vad, analysis=analysis,
         )
         if not breath.ok:
             result.ok = False
@@ -782,7 +868,7 @@ def run_audio_postcheck(
             result.warnings.extend(breath.warnings)
 
     # Gate H: clipping
-    clipping = detect_clipping(video_path)
+    clipping = detect_clipping(video_path, analysis=analysis)
     if clipping.clipped_regions:
         result.metrics["clipped_regions"] = len(clipping.clipped_regions)
     if not clipping.ok:
@@ -792,7 +878,7 @@ def run_audio_postcheck(
         result.warnings.append(clipping.warning)
 
     # Gate I: silence gaps
-    gaps = detect_silence_gaps(video_path)
+    gaps = detect_silence_gaps(video_path, analysis=analysis)
     if gaps:
         result.metrics["silence_gaps"] = gaps
         result.warnings.append(
@@ -800,7 +886,7 @@ def run_audio_postcheck(
         )
 
     # Legacy balance check
-    balance = check_vo_music_balance(video_path, render_config)
+    balance = check_vo_music_balance(video_path, render_config, analysis=analysis)
     if balance.vo_dominant_lufs is not None:
         result.metrics["vo_dominant_lufs"] = balance.vo_dominant_lufs
         result.metrics["music_dominant_lufs"] = balance.music_dominant_lufs
@@ -808,8 +894,6 @@ def run_audio_postcheck(
     if not balance.ok:
         result.warnings.append(f"VO_MUSIC_BALANCE: {balance.warning}")
 
-    return result
-
 
 # ---------------------------------------------------------------------------
 # Output: write postcheck JSON
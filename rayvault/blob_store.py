@@ -0,0 +1,286 @@
+"""RayVault Blob Store — sha256 content-addressed file store.
+
+One copy of each distinct file, shared by the worker TTS chunk cache,
+ffmpeg_render segment cache, the controller's local result cache and the
+TruthCache image library. Consumers get files into place by hardlink
+(reflink, then copy, when the store is on another filesystem), so
+duplicated assets across runs cost a directory entry, not bytes.
+
+Layout:
+    <root>/objects/ab/abcdef...      blob (sha256 of contents)
+    <root>/refs/ab/abcdef.../<id>    one file per holder of the blob
+    <root>/keys/<namespace>/<key>    cache key -> sha256 (e.g. tts_chunks)
+
+Holders are either a file path (stale once the path is gone, points
+at a different inode or was rewritten) or a logical key
+("key:<ns>/<key>"). gc() drops stale refs and deletes blobs nobody
+holds.
+
+put_file() stores a private copy and leaves the caller's file alone.
+Materialized files share the blob's inode: never write to them in
+place. Writers unlink (or write to a tmp file and os.replace) first.
+
+Usage:
+    from rayvault.blob_store import BlobStore
+    store = BlobStore(Path("state/blobs"))
+    sha = store.put_file(wav_path)
+    store.set_key("tts_chunks", input_hash, sha)
+    store.materialize(sha, run_dir / "chunk_01.wav")
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from rayvault.io import sha256_file
+
+DEFAULT_BLOB_ROOT = Path("state/blobs")
+GC_GRACE_SEC = 3600
+
+try:
+    import fcntl
+    _FICLONE = 0x40049409  # linux/fs.h
+except ImportError:  # pragma: no cover - non-POSIX
+    fcntl = None
+    _FICLONE = 0
+
+
+def default_blob_root(fallback: Optional[Path] = None) -> Path:
+    """RAYVAULT_BLOB_ROOT, else fallback, else state/blobs."""
+    env = os.environ.get("RAYVAULT_BLOB_ROOT", "").strip()
+    if env:
+        return Path(env).expanduser()
+    return fallback if fallback is not None else DEFAULT_BLOB_ROOT
+
+
+def _reflink(src: Path, dest: Path) -> bool:
+    if fcntl is None:
+        return False
+    try:
+        with open(src, "rb") as s, open(dest, "wb") as d:
+            fcntl.ioctl(d.fileno(), _FICLONE, s.fileno())
+        return True
+    except OSError:
+        dest.unlink(missing_ok=True)
+        return False
+
+
+class BlobStore:
+    def __init__(self, root: Path):
+        self.root = root.resolve()
+        self.objects = self.root / "objects"
+        self.refs = self.root / "refs"
+        self.keys = self.root / "keys"
+        self.tmp = self.root / "tmp"
+
+    # --- Objects ---
+
+    def path(self, sha: str) -> Path:
+        return self.objects / sha[:2] / sha
+
+    def has(self, sha: str) -> bool:
+        return bool(sha) and self.path(sha).is_file()
+
+    def put_file(self, src: Path, sha256: str = "", holder: bool = True) -> str:
+        """Add src to the store and return its sha256.
+
+        The blob is a private reflink or copy of src, so src stays the
+        caller's own writable file; it is recorded as a holder. Callers
+        that never rewrite src in place can materialize() the blob back
+        onto it to keep one copy on disk. Pass sha256 when the caller
+        has just hashed the file.
+        """
+        sha = (sha256 or sha256_file(src)).lower()
+        obj = self.path(sha)
+        if not obj.exists():
+            obj.parent.mkdir(parents=True, exist_ok=True)
+            self.tmp.mkdir(parents=True, exist_ok=True)
+            tmp = self.tmp / f"{sha}.{os.getpid()}.{time.monotonic_ns()}"
+            # Never hardlink src here: the chmod would hit the caller's inode
+            if not _reflink(src, tmp):
+                shutil.copy2(src, tmp)
+            os.chmod(tmp, 0o444)
+            os.replace(tmp, obj)
+        if holder:
+            self.add_ref(sha, str(src))
+        return sha
+
+    def put_bytes(self, data: bytes) -> str:
+        sha = hashlib.sha256(data).hexdigest()
+        obj = self.path(sha)
+        if not obj.exists():
+            obj.parent.mkdir(parents=True, exist_ok=True)
+            self.tmp.mkdir(parents=True, exist_ok=True)
+            tmp = self.tmp / f"{sha}.{os.getpid()}.{time.monotonic_ns()}"
+            tmp.write_bytes(data)
+            os.chmod(tmp, 0o444)
+            os.replace(tmp, obj)
+        return sha
+
+    def _relink(self, obj: Path, dest: Path) -> str:
+        """Atomically point dest at obj: hardlink, reflink, else copy."""
+        try:
+            if dest.exists() and os.path.samefile(obj, dest):
+                return "link"
+        except OSError:
+            pass
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        tmp = dest.with_name(f".{dest.name}.blob{os.getpid()}")
+        tmp.unlink(missing_ok=True)
+        try:
+            os.link(obj, tmp)
+            mode = "link"
+        except OSError:
+            if _reflink(obj, tmp):
+                mode = "reflink"
+            else:
+                shutil.copy2(obj, tmp)
+                mode = "copy"
+        os.replace(tmp, dest)
+        return mode
+
+    def materialize(self, sha: str, dest: Path) -> str:
+        """Place blob sha at dest and record dest as a holder.
+
+        Returns the mode used ("link", "reflink" or "copy").
+        Raises FileNotFoundError when the blob is not in the store.
+        """
+        obj = self.path(sha)
+        if not obj.is_file():
+            raise FileNotFoundError(f"blob not found: {sha}")
+        mode = self._relink(obj, dest)
+        self.add_ref(sha, str(dest))
+        return mode
+
+    # --- Refs ---
+
+    def _ref_dir(self, sha: str) -> Path:
+        return self.refs / sha[:2] / sha
+
+    def add_ref(self, sha: str, holder: str) -> None:
+        """Record a holder: a file path, or "key:..." for logical owners."""
+        d = self._ref_dir(sha)
+        d.mkdir(parents=True, exist_ok=True)
+        ref: Dict[str, Any] = {"holder": holder}
+        if not holder.startswith("key:"):
+            try:
+                st = os.stat(holder)
+                ref["ino"] = st.st_ino
+                ref["mtime_ns"] = st.st_mtime_ns
+            except OSError:
+                pass
+        name = hashlib.sha1(holder.encode("utf-8")).hexdigest()
+        (d / name).write_text(json.dumps(ref), encoding="utf-8")
+
+    def remove_ref(self, sha: str, holder: str) -> None:
+        name = hashlib.sha1(holder.encode("utf-8")).hexdigest()
+        (self._ref_dir(sha) / name).unlink(missing_ok=True)
+
+    def refcount(self, sha: str) -> int:
+        d = self._ref_dir(sha)
+        return sum(1 for _ in d.iterdir()) if d.is_dir() else 0
+
+    # --- Keys ---
+
+    def _key_path(self, namespace: str, key: str) -> Path:
+        safe = key.replace("/", "_").replace("\\", "_")
+        return self.keys / namespace / safe
+
+    def set_key(self, namespace: str, key: str, sha: str) -> None:
+        """Map a cache key to a blob; the key holds a ref on the blob."""
+        p = self._key_path(namespace, key)
+        old = self.get_key(namespace, key)
+        holder = f"key:{namespace}/{key}"
+        if old and old != sha:
+            self.remove_ref(old, holder)
+        p.parent.mkdir(parents=True, exist_ok=True)
+        tmp = p.with_name(p.name + ".tmp")
+        tmp.write_text(sha, encoding="utf-8")
+        os.replace(tmp, p)
+        self.add_ref(sha, holder)
+
+    def get_key(self, namespace: str, key: str) -> Optional[str]:
+        """sha256 for a cache key, or None when unset or the blob is gone."""
+        p = self._key_path(namespace, key)
+        try:
+            sha = p.read_text(encoding="utf-8").strip()
+        except OSError:
+            return None
+        return sha if self.has(sha) else None
+
+    def drop_key(self, namespace: str, key: str) -> None:
+        sha = self.get_key(namespace, key)
+        if sha:
+            self.remove_ref(sha, f"key:{namespace}/{key}")
+        self._key_path(namespace, key).unlink(missing_ok=True)
+
+    # --- GC ---
+
+    @staticmethod
+    def _ref_is_live(ref: Dict[str, Any]) -> bool:
+        holder = str(ref.get("holder", ""))
+        if holder.startswith("key:"):
+            return True
+        try:
+            st = os.stat(holder)
+        except OSError:
+            return False
+        # Inode numbers are reused once a private holder copy is deleted
+        for field, value in (("ino", st.st_ino), ("mtime_ns", st.st_mtime_ns)):
+            if field in ref and ref[field] != value:
+                return False
+        return True
+
+    def gc(self, grace_sec: int = GC_GRACE_SEC, dry_run: bool = False) -> Dict[str, Any]:
+        """Drop stale refs, then delete unreferenced blobs older than grace_sec."""
+        now = time.time()
+        stale_refs = 0
+        deleted = 0
+        freed = 0
+        if not self.objects.is_dir():
+            return {"stale_refs": 0, "deleted": 0, "freed_bytes": 0}
+        for obj in sorted(self.objects.glob("??/*")):
+            sha = obj.name
+            d = self._ref_dir(sha)
+            live = 0
+            if d.is_dir():
+                for ref_file in list(d.iterdir()):
+                    try:
+                        ref = json.loads(ref_file.read_text(encoding="utf-8"))
+                    except (OSError, ValueError):
+                        ref = {}
+                    if self._ref_is_live(ref):
+                        live += 1
+                    else:
+                        stale_refs += 1
+                        if not dry_run:
+                            ref_file.unlink(missing_ok=True)
+            if live:
+                continue
+            try:
+                st = obj.stat()
+            except OSError:
+                continue
+            if now - st.st_mtime < grace_sec:
+                continue
+            deleted += 1
+            freed += st.st_size
+            if not dry_run:
+                obj.unlink(missing_ok=True)
+                shutil.rmtree(d, ignore_errors=True)
+        return {"stale_refs": stale_refs, "deleted": deleted, "freed_bytes": freed}
+
+    def stats(self) -> Dict[str, int]:
+        blobs = 0
+        size = 0
+        if self.objects.is_dir():
+            for obj in self.objects.glob("??/*"):
+                blobs += 1
+                size += obj.stat().st_size
+        return {"blobs": blobs, "bytes": size}
@@ -7,10 +7,24 @@ been used (served to a run) within a configurable window.
 Uses last_used_utc from cache_info.json. Falls back to last_fetched_utc
 or images_fetched_at_utc if last_used_utc is missing.
 
+With --max-bytes, least-recently-used ASINs are evicted after the age
+pass until the library fits the budget (BROKEN entries and ASINs with
+approved b-roll are never evicted for budget).
+
+When the TruthCache library index (state/library/index.db) exists, status,
+activity and sizes come from it: only ASINs whose files changed since they
+were indexed are re-read, so no per-file size walk is needed.
+
+Library images are hardlinks into the blob store (state/library/blobs).
+Evicting an ASIN only drops its links; --apply then runs the store's gc()
+so blobs nobody else holds leave the disk. Images still linked from a run
+are not counted as freed and stay in remaining_bytes.
+
 Usage:
     python3 -m rayvault.cache_prune --root state/library/products
     python3 -m rayvault.cache_prune --root state/library/products --apply
     python3 -m rayvault.cache_prune --max-unused-days 60
+    python3 -m rayvault.cache_prune --max-bytes 200000000000 --apply --jobs 8
 
 Exit codes:
     0: success (including dry-run)
@@ -25,10 +39,12 @@ import os
 import shutil
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from rayvault.blob_store import BlobStore, default_blob_root
 from rayvault.io import read_json, utc_now_iso
 
 
@@ -52,10 +68,92 @@ def _last_activity_ts(info: Dict[str, Any]) -> Optional[float]:
     return None
 
 
+def _has_approved_broll(asin_dir: Path) -> bool:
+    return (asin_dir / "approved_broll" / "approved.mp4").exists()
+
+
+def _scan_bytes(asin_dir: Path, info: Dict[str, Any]) -> int:
+    """Size of an ASIN dir, from cache_info disk_bytes when recorded."""
+    dir_bytes = info.get("disk_bytes")
+    if isinstance(dir_bytes, int) and not _has_approved_broll(asin_dir):
+        return dir_bytes
+    dir_bytes = 0
+    for f in asin_dir.rglob("*"):
+        if f.is_file():
+            try:
+                dir_bytes += f.stat().st_size
+            except OSError:
+                pass
+    return dir_bytes
+
+
+def _shared_bytes(asin_dir: Path) -> int:
+    """Bytes of files also linked outside the library and the blob store.
+
+    Evicting the ASIN does not free these: a run still holds the blob.
+    """
+    shared = 0
+    for f in asin_dir.rglob("*"):
+        try:
+            st = f.stat()
+        except OSError:
+            continue
+        if f.is_file() and st.st_nlink > 2:
+            shared += st.st_size
+    return shared
+
+
+def _scan_entries(root: Path) -> List[Dict[str, Any]]:
+    """One entry per ASIN dir, read from each cache_info.json."""
+    entries: List[Dict[str, Any]] = []
+    for asin_dir in sorted(root.iterdir()):
+        if not asin_dir.is_dir() or asin_dir.name.startswith("."):
+            continue
+        info_path = asin_dir / "cache_info.json"
+        info: Optional[Dict[str, Any]] = None
+        if info_path.exists():
+            try:
+                info = read_json(info_path)
+            except Exception:
+                info = None
+        entries.append({
+            "asin": asin_dir.name,
+            "status": (info or {}).get("status"),
+            "last_ts": _last_activity_ts(info) if info is not None else None,
+            "info": info or {},
+            "bytes": None,
+            "shared": None,
+        })
+    return entries
+
+
+def _index_entries(cache: Any) -> List[Dict[str, Any]]:
+    """One entry per ASIN from the TruthCache library index."""
+    entries: List[Dict[str, Any]] = []
+    for row in cache.usage():
+        info = {
+            "last_used_utc": row["last_used"],
+            "images_fetched_at_utc": row["images_fetched_at"],
+            "meta_fetched_at_utc": row["meta_fetched_at"],
+        }
+        entries.append({
+            "asin": row["asin"],
+            "status": row["status"],
+            "last_ts": _last_activity_ts(info),
+            "info": info,
+            "bytes": int(row["disk_bytes"]),
+            "shared": None,
+        })
+    return entries
+
+
 def prune(
     root: Path,
     max_unused_days: int = 30,
     apply: bool = False,
+    max_bytes: Optional[int] = None,
+    jobs: int = 4,
+    use_index: Optional[bool] = None,
 ) -> Dict[str, Any]:
     """Prune unused ASIN cache directories.
 
@@ -63,6 +161,16 @@ def prune(
         root: Product cache root (e.g., state/library/products)
         max_unused_days: Delete entries unused for longer than this
         apply: Actually delete (False = dry-run)
+        max_bytes: Size budget for the whole root. After the age pass,
+            least-recently-used entries are evicted until the remaining
+            entries fit; BROKEN entries and ASINs with approved b-roll
+            are never evicted for budget.
+        jobs: Parallel deletions when applying. The blob store is
+            gc'ed afterwards so evicted images actually leave the disk.
+        use_index: Read status, activity and sizes from the TruthCache
+            library index (<root>/../index.db) instead of parsing every
+            cache_info.json and walking every file. None = use it when
+            the index exists.
 
     Returns:
         Summary dict with deleted ASINs and stats
@@ -76,64 +184,102 @@ def prune(
             "kept_count": 0,
         }
 
-    cutoff_ts = time.time() - (max_unused_days * 86400)
-    deleted: List[str] = []
-    kept: List[str] = []
-    skipped: List[str] = []
-    bytes_freed = 0
+    if use_index is None:
+        use_index = root.name == "products" and (root.parent / "index.db").exists()
+    cache = None
+    blobs: Optional[BlobStore] = None
+    if use_index:
+        from rayvault.truth_cache import TruthCache
+        cache = TruthCache(root.parent)
+        blobs = cache.blobs
+        entries = _index_entries(cache)
+    else:
+        if root.name == "products":
+            blobs = BlobStore(default_blob_root(root.parent / "blobs"))
+        entries = _scan_entries(root)
 
-    for asin_dir in sorted(root.iterdir()):
-        if not asin_dir.is_dir() or asin_dir.name.startswith("."):
-            continue
+    def size_of(e: Dict[str, Any]) -> int:
+        if e["bytes"] is None:
+            e["bytes"] = _scan_bytes(root / e["asin"], e["info"])
+        return e["bytes"]
 
-        info_path = asin_dir / "cache_info.json"
-        if not info_path.exists():
-            skipped.append(asin_dir.name)
-            continue
+    def freed_by(e: Dict[str, Any]) -> int:
+        if e["shared"] is None:
+            e["shared"] = _shared_bytes(root / e["asin"])
+        return size_of(e) - e["shared"]
 
-        try:
-            info = read_json(info_path)
-        except Exception:
-            skipped.append(asin_dir.name)
-            continue
+    cutoff_ts = time.time() - (max_unused_days * 86400)
+    evict: List[Dict[str, Any]] = []
+    kept: List[Dict[str, Any]] = []
+    skipped: List[Dict[str, Any]] = []
 
+    for e in entries:
         # Don't prune broken entries (may need investigation)
-        if info.get("status") == "BROKEN":
-            kept.append(asin_dir.name)
-            continue
+        if e["status"] == "BROKEN":
+            kept.append(e)
+        elif e["last_ts"] is None:
+            skipped.append(e)
+        elif e["last_ts"] < cutoff_ts:
+            evict.append(e)
+        else:
+            kept.append(e)
 
-        last_ts = _last_activity_ts(info)
-        if last_ts is None:
-            skipped.append(asin_dir.name)
-            continue
+    evicted_for_budget = 0
+    remaining_bytes: Optional[int] = None
+    if max_bytes is not None:
+        remaining_bytes = sum(size_of(e) for e in kept + skipped)
+        remaining_bytes += sum(size_of(e) - freed_by(e) for e in evict)
+        lru = sorted(
+            (
+                e for e in kept
+                if e["status"] != "BROKEN"
+                and not _has_approved_broll(root / e["asin"])
+            ),
+            key=lambda e: e["last_ts"],
+        )
+        for e in lru:
+            if remaining_bytes <= max_bytes:
+                break
+            remaining_bytes -= freed_by(e)
+            kept.remove(e)
+            evict.append(e)
+            evicted_for_budget += 1
 
-        if last_ts < cutoff_ts:
-            # Calculate size before deletion
-            dir_bytes = 0
-            for f in asin_dir.rglob("*"):
-                if f.is_file():
-                    try:
-                        dir_bytes += f.stat().st_size
-                    except OSError:
-                        pass
-            bytes_freed += dir_bytes
-
-            if apply:
-                shutil.rmtree(asin_dir, ignore_errors=True)
-            deleted.append(asin_dir.name)
-        else:
-            kept.append(asin_dir.name)
+    bytes_freed = sum(freed_by(e) for e in evict)
+
+    blob_gc: Optional[Dict[str, Any]] = None
+    if apply and evict:
+        def _delete(asin: str) -> None:
+            if cache is not None:
+                cache.evict(asin)
+            else:
+                shutil.rmtree(root / asin, ignore_errors=True)
+
+        with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+            list(pool.map(_delete, [e["asin"] for e in evict]))
+        if blobs is not None:
+            blob_gc = blobs.gc()
 
-    return {
+    deleted = [e["asin"] for e in evict]
+    result: Dict[str, Any] = {
         "at_utc": utc_now_iso(),
         "apply": apply,
         "max_unused_days": max_unused_days,
+        "source": "index" if use_index else "scan",
         "deleted": deleted,
         "deleted_count": len(deleted),
         "kept_count": len(kept),
         "skipped_count": len(skipped),
         "bytes_freed_est": bytes_freed,
     }
+    if blob_gc is not None:
+        result["blob_gc"] = blob_gc
+    if max_bytes is not None:
+        result["max_bytes"] = max_bytes
+        result["evicted_for_budget"] = evicted_for_budget
+        result["remaining_bytes"] = remaining_bytes
+        result["over_budget"] = remaining_bytes > max_bytes
+    return result
 
 
 def main(argv: Optional[list] = None) -> int:
@@ -146,11 +292,27 @@ def main(argv: Optional[list] = None) -> int:
         help="Product cache root directory",
     )
     ap.add_argument("--max-unused-days", type=int, default=30)
+    ap.add_argument(
+        "--max-bytes", type=int, default=None,
+        help="Evict least-recently-used ASINs until the root fits this budget",
+    )
+    ap.add_argument("--jobs", type=int, default=4, help="Parallel deletions with --apply")
+    ap.add_argument(
+        "--no-index", action="store_true",
+        help="Scan every cache_info.json instead of using the library index",
+    )
     ap.add_argument("--apply", action="store_true", help="Actually delete (default: dry-run)")
     args = ap.parse_args(argv)
 
     root = Path(args.root).expanduser().resolve()
-    result = prune(root, max_unused_days=args.max_unused_days, apply=args.apply)
+    result = prune(
+        root,
+        max_unused_days=args.max_unused_days,
+        apply=args.apply,
+        max_bytes=args.max_bytes,
+        jobs=args.jobs,
+        use_index=False if args.no_index else None,
+    )
 
     mode = "APPLY" if args.apply else "DRY-RUN"
     print(
@@ -158,6 +320,14 @@ def main(argv: Optional[list] = None) -> int:
         f"kept={result['kept_count']} skipped={result['skipped_count']} "
         f"bytes_freed={result['bytes_freed_est']}"
     )
+    if result.get("blob_gc"):
+        gc = result["blob_gc"]
+        print(f"  blob gc: deleted={gc['deleted']} freed_bytes={gc['freed_bytes']}")
+    if result.get("over_budget"):
+        print(
+            f"  over budget: remaining={result['remaining_bytes']} "
+            f"> max_bytes={result['max_bytes']} (only BROKEN / b-roll entries left)"
+        )
     if result["deleted"]:
         for asin in result["deleted"][:20]:
             print(f"  - {asin}")
@@ -61,6 +61,8 @@ from rayvault.policies import (
     SOUNDTRACK_CROSSFADE_OUT_SEC,
 )
 from rayvault.fairlight_contract import FairlightContract, verify_bus_contract
+from rayvault.frame_sampler import red_ratio, sample_frame_means
+from rayvault.probe_cache import format_duration, probe
 
 # Render states (for manifest tracking)
 RS_STARTED = "RENDER_STARTED"
@@ -81,28 +83,12 @@ RESOLVE_CACHE_DIR_MACOS = Path.home() / "Library" / "Application Support" / "Bla
 
 
 def ffprobe_json(path: Path) -> Optional[Dict[str, Any]]:
-    """Run ffprobe and return parsed JSON output."""
-    try:
-        proc = subprocess.run(
-            ["ffprobe", "-v", "quiet", "-print_format", "json",
-             "-show_format", "-show_streams", str(path)],
-            capture_output=True, text=True, timeout=30,
-        )
-        if proc.returncode == 0:
-            return json.loads(proc.stdout)
-    except Exception:
-        pass
-    return None
+    """ffprobe JSON output (format + streams) via the shared probe cache."""
+    return probe(path)
 
 
 def ffprobe_duration(path: Path) -> Optional[float]:
-    info = ffprobe_json(path)
-    if info:
-        try:
-            return float(info["format"]["duration"])
-        except (KeyError, ValueError):
-            pass
-    return None
+    return format_duration(ffprobe_json(path))
 
 
 def measure_loudness(path: Path) -> Optional[Dict[str, float]]:
@@ -203,7 +189,8 @@ def detect_black_frames(
     Strategy:
       1. Run blackdetect filter on whole video (cheap, reliable)
       2. If segments provided, sample 1 frame at start + 1 at mid per segment
-         and check for dominant red (media offline indicator)
+         and check for dominant red (media offline indicator). All samples
+         come from a single batched ffmpeg pass (rayvault.frame_sampler).
 
     Returns {ok, black_ranges, offline_suspects, sampled_frames}.
     """
@@ -252,57 +239,36 @@ def detect_black_frames(
 
     # --- Phase 2: per-segment red (offline) detection ---
     if segments:
+        samples: List[Tuple[float, str]] = []
         for seg in segments:
             t0 = seg.get("t0", 0)
             t1 = seg.get("t1", t0 + 1)
             mid = (t0 + t1) / 2
-
             for ts in (t0 + 0.1, mid):
-                red_ratio = _sample_frame_red_ratio(video_path, ts)
-                result["sampled_count"] += 1
-                if red_ratio is not None and red_ratio > RED_CHANNEL_DOMINANCE:
-                    result["offline_suspects"].append({
-                        "timestamp": round(ts, 2),
-                        "segment_id": seg.get("id", ""),
-                        "red_ratio": round(red_ratio, 3),
-                    })
-                    result["ok"] = False
+                samples.append((ts, seg.get("id", "")))
+
+        means = sample_frame_means(video_path, [ts for ts, _ in samples])
+        for (ts, seg_id), frame_means in zip(samples, means):
+            ratio = red_ratio(frame_means)
+            result["sampled_count"] += 1
+            if ratio is not None and ratio > RED_CHANNEL_DOMINANCE:
+                result["offline_suspects"].append({
+                    "timestamp": round(ts, 2),
+                    "segment_id": seg_id,
+                    "red_ratio": round(ratio, 3),
+                })
+                result["ok"] = False
 
     return result
 
 
 def _sample_frame_red_ratio(video_path: Path, timestamp: float) -> Optional[float]:
-    """Extract a single frame and compute R/(R+G+B) ratio.
+    """Compute R/(R+G+B) for the frame at timestamp. Returns None on failure.
 
-    Uses ffmpeg to extract raw RGB data, then computes channel averages.
-    Returns None on failure.
+    Single-timestamp convenience over frame_sampler.sample_frame_means();
+    batch timestamps through that directly when sampling more than one.
     """
-    try:
-        cmd = [
-            "ffmpeg", "-ss", str(timestamp), "-i", str(video_path),
-            "-vframes", "1", "-f", "rawvideo", "-pix_fmt", "rgb24",
-            "-loglevel", "quiet", "-",
-        ]
-        proc = subprocess.run(cmd, capture_output=True, timeout=15)
-        if proc.returncode != 0 or len(proc.stdout) < 3:
-            return None
-
-        data = proc.stdout
-        n_pixels = len(data) // 3
-        if n_pixels == 0:
-            return None
-
-        # Sum channels
-        r_sum = sum(data[i] for i in range(0, len(data), 3))
-        g_sum = sum(data[i] for i in range(1, len(data), 3))
-        b_sum = sum(data[i] for i in range(2, len(data), 3))
-
-        total = r_sum + g_sum + b_sum
-        if total == 0:
-            return 0.0
-        return r_sum / total
-    except Exception:
-        return None
+    return red_ratio(sample_frame_means(video_path, [timestamp])[0])
 
 
 # ---------------------------------------------------------------------------
@@ -0,0 +1,357 @@
+#!/usr/bin/env python3
+"""RayVault Encode Profiles — named, encoder-aware video encode settings.
+
+Three tiers, each with one profile per supported encoder:
+    draft    — seconds-per-segment scratch renders
+    preview  — Gate 2 review renders (fast, clearly watchable)
+    final    — publish renders (final-x264 == the historical libx264/slow/crf18)
+
+Encoders: libx264, libx265, libsvtav1, and h264_vaapi / h264_qsv when
+ffmpeg lists them and the box has a DRI device. A profile is applied by
+merging its settings into render_config output settings; encode_args()
+turns those settings into ffmpeg args for whichever encoder they name.
+
+Profile table (state/encode_profiles.json, or $RAYVAULT_ENCODE_PROFILES):
+bench_profiles() encodes a reference clip under every available profile
+and records fps, bitrate and SSIM against the lossless reference.
+select_profile() then picks, per tier, the fastest profile whose SSIM
+meets the tier's quality floor. Without a table (or on another host) the
+libx264 profile of the tier is used.
+
+Usage:
+    python3 -m rayvault.ffmpeg_render --bench
+    python3 -m rayvault.ffmpeg_render --run-dir RUN --apply --profile preview
+"""
+
+from __future__ import annotations
+
+import os
+import platform
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+
+from rayvault.io import atomic_write_json, read_json, utc_now_iso
+
+DEFAULT_PROFILE_TABLE = Path("state/encode_profiles.json")
+DEFAULT_VAAPI_DEVICE = "/dev/dri/renderD128"
+BENCH_SECONDS = 5.0
+
+TIERS = ("draft", "preview", "final")
+
+# Minimum SSIM (0-1, vs lossless reference) a benched profile needs per tier
+QUALITY_FLOORS = {"draft": 0.90, "preview": 0.95, "final": 0.985}
+
+# Output-settings keys a profile owns; everything else (w/h/fps) stays
+PROFILE_KEYS = ("vcodec", "crf", "preset", "pix_fmt", "hw")
+
+
+@dataclass(frozen=True)
+class EncodeProfile:
+    name: str
+    tier: str
+    vcodec: str
+    crf: int  # crf / qp / global_quality depending on encoder
+    preset: str
+    pix_fmt: str = "yuv420p"
+    hw: str = ""  # "", "vaapi" or "qsv"
+
+    def output_settings(self) -> Dict[str, Any]:
+        return {
+            "vcodec": self.vcodec,
+            "crf": self.crf,
+            "preset": self.preset,
+            "pix_fmt": self.pix_fmt,
+            "hw": self.hw,
+        }
+
+
+PROFILES: Dict[str, EncodeProfile] = {p.name: p for p in (
+    EncodeProfile("draft-x264", "draft", "libx264", 28, "ultrafast"),
+    EncodeProfile("preview-x264", "preview", "libx264", 23, "veryfast"),
+    EncodeProfile("final-x264", "final", "libx264", 18, "slow"),
+    EncodeProfile("draft-x265", "draft", "libx265", 30, "ultrafast"),
+    EncodeProfile("preview-x265", "preview", "libx265", 26, "faster"),
+    EncodeProfile("final-x265", "final", "libx265", 20, "slow"),
+    EncodeProfile("draft-av1", "draft", "libsvtav1", 40, "12"),
+    EncodeProfile("preview-av1", "preview", "libsvtav1", 35, "10"),
+    EncodeProfile("final-av1", "final", "libsvtav1", 28, "6"),
+    EncodeProfile("draft-vaapi", "draft", "h264_vaapi", 28, "", pix_fmt="", hw="vaapi"),
+    EncodeProfile("preview-vaapi", "preview", "h264_vaapi", 24, "", pix_fmt="", hw="vaapi"),
+    EncodeProfile("final-vaapi", "final", "h264_vaapi", 19, "", pix_fmt="", hw="vaapi"),
+    EncodeProfile("draft-qsv", "draft", "h264_qsv", 28, "veryfast", pix_fmt="nv12", hw="qsv"),
+    EncodeProfile("preview-qsv", "preview", "h264_qsv", 24, "faster", pix_fmt="nv12", hw="qsv"),
+    EncodeProfile("final-qsv", "final", "h264_qsv", 19, "slower", pix_fmt="nv12", hw="qsv"),
+)}
+
+DEFAULT_PROFILES = {"draft": "draft-x264", "preview": "preview-x264", "final": "final-x264"}
+
+
+# ---------------------------------------------------------------------------
+# ffmpeg args
+# ---------------------------------------------------------------------------
+
+
+def vaapi_device() -> str:
+    return os.environ.get("RAYVAULT_VAAPI_DEVICE", "").strip() or DEFAULT_VAAPI_DEVICE
+
+
+def hw_args(output_settings: Dict[str, Any]) -> Tuple[List[str], str]:
+    """(global args before the first -i, filter suffix before the encoder)."""
+    if output_settings.get("hw") == "vaapi":
+        return (
+            ["-init_hw_device", f"vaapi=va:{vaapi_device()}", "-filter_hw_device", "va"],
+            "format=nv12,hwupload",
+        )
+    return [], ""
+
+
+def encode_args(output_settings: Dict[str, Any], threads: Optional[int] = None) -> List[str]:
+    """Video encoder args (-c:v ... -pix_fmt ...) for output_settings."""
+    vcodec = output_settings.get("vcodec", "libx264")
+    crf = output_settings.get("crf", 18)
+    preset = output_settings.get("preset", "slow")
+    pix_fmt = output_settings.get("pix_fmt", "yuv420p")
+
+    if vcodec.endswith("_vaapi"):
+        args = ["-c:v", vcodec, "-qp", str(crf)]
+    elif vcodec.endswith("_qsv"):
+        args = ["-c:v", vcodec, "-global_quality", str(crf)]
+        if preset:
+            args.extend(["-preset", preset])
+    else:
+        args = ["-c:v", vcodec, "-crf", str(crf)]
+        if preset:
+            args.extend(["-preset", str(preset)])
+    if pix_fmt:
+        args.extend(["-pix_fmt", pix_fmt])
+    if threads:
+        args.extend(["-threads", str(threads)])
+    return args
+
+
+# ---------------------------------------------------------------------------
+# Encoder detection
+# ---------------------------------------------------------------------------
+
+
+@lru_cache(maxsize=1)
+def available_encoders() -> FrozenSet[str]:
+    """Video encoders this ffmpeg build lists (empty if ffmpeg is missing)."""
+    try:
+        proc = subprocess.run(
+            ["ffmpeg", "-hide_banner", "-encoders"],
+            capture_output=True, text=True, timeout=10,
+        )
+    except Exception:
+        return frozenset()
+    names = set()
+    # Skip the flag legend ("V..... = Video") above the "------" rule
+    _, _, listing = (proc.stdout or "").partition(" ------")
+    for line in listing.splitlines():
+        parts = line.split()
+        if len(parts) >= 2 and parts[0].startswith("V") and len(parts[0]) == 6:
+            names.add(parts[1])
+    return frozenset(names)
+
+
+def profile_available(profile: EncodeProfile, encoders: Optional[FrozenSet[str]] = None) -> bool:
+    encoders = available_encoders() if encoders is None else encoders
+    if profile.vcodec not in encoders:
+        return False
+    if profile.hw == "vaapi":
+        return Path(vaapi_device()).exists()
+    if profile.hw == "qsv":
+        return sys.platform == "win32" or Path("/dev/dri").exists()
+    return True
+
+
+# ---------------------------------------------------------------------------
+# Profile table + selection
+# ---------------------------------------------------------------------------
+
+
+def default_profile_table() -> Path:
+    env = os.environ.get("RAYVAULT_ENCODE_PROFILES", "").strip()
+    return Path(env).expanduser() if env else DEFAULT_PROFILE_TABLE
+
+
+def load_profile_table(path: Optional[Path] = None) -> Dict[str, Any]:
+    """Bench table for this host, or {} if missing, unreadable or from another host."""
+    path = path or default_profile_table()
+    try:
+        table = read_json(path)
+    except Exception:
+        return {}
+    if table.get("host") != platform.node():
+        return {}
+    return table
+
+
+def select_profile(
+    name: str,
+    table: Optional[Dict[str, Any]] = None,
+    quality_floor: Optional[float] = None,
+    encoders: Optional[FrozenSet[str]] = None,
+) -> EncodeProfile:
+    """Resolve a profile name or tier to an EncodeProfile.
+
+    A tier resolves to the fastest benched profile of that tier whose SSIM
+    meets quality_floor (default QUALITY_FLOORS[tier]) and whose encoder is
+    still available; without bench data, to the tier's libx264 profile.
+    Raises KeyError for unknown names.
+    """
+    if name in PROFILES:
+        return PROFILES[name]
+    if name not in TIERS:
+        raise KeyError(name)
+    floor = QUALITY_FLOORS[name] if quality_floor is None else quality_floor
+    best: Optional[Tuple[float, EncodeProfile]] = None
+    for row in (table or {}).get("results", []):
+        profile = PROFILES.get(row.get("profile", ""))
+        if profile is None or profile.tier != name or not row.get("ok"):
+            continue
+        if float(row.get("ssim") or 0.0) < floor:
+            continue
+        if encoders is not None and not profile_available(profile, encoders):
+            continue
+        fps = float(row.get("fps") or 0.0)
+        if best is None or fps > best[0]:
+            best = (fps, profile)
+    return best[1] if best else PROFILES[DEFAULT_PROFILES[name]]
+
+
+def apply_profile(output_settings: Dict[str, Any], profile: EncodeProfile) -> Dict[str, Any]:
+    """Copy of output_settings with the profile's encoder settings."""
+    merged = {k: v for k, v in output_settings.items() if k not in PROFILE_KEYS}
+    merged.update(profile.output_settings())
+    merged["profile"] = profile.name
+    return merged
+
+
+# ---------------------------------------------------------------------------
+# Bench
+# ---------------------------------------------------------------------------
+
+
+def _run(cmd: List[str], timeout: int = 600) -> subprocess.CompletedProcess:
+    return subprocess.run(cmd, capture_output=True, text=True, timeout=timeout)
+
+
+def measure_ssim(encoded: Path, reference: Path) -> Optional[float]:
+    """Mean SSIM (All) of encoded vs reference, or None."""
+    try:
+        proc = _run([
+            "ffmpeg", "-hide_banner", "-nostats",
+            "-i", str(encoded), "-i", str(reference),
+            "-lavfi", "[0:v][1:v]ssim", "-f", "null", "-",
+        ])
+    except Exception:
+        return None
+    m = re.findall(r"All:([0-9.]+)", proc.stderr or "")
+    return float(m[-1]) if m else None
+
+
+def bench_profile(
+    profile: EncodeProfile, reference: Path, frames: int, seconds: float, work_dir: Path,
+) -> Dict[str, Any]:
+    """Encode the reference clip under one profile; returns a table row."""
+    out = work_dir / f"{profile.name}.mp4"
+    settings = profile.output_settings()
+    global_args, vf_suffix = hw_args(settings)
+    cmd = ["ffmpeg", "-y", *global_args, "-i", str(reference)]
+    if vf_suffix:
+        cmd.extend(["-vf", vf_suffix])
+    cmd.extend([*encode_args(settings), "-an", str(out)])
+    row: Dict[str, Any] = {**asdict(profile), "profile": profile.name, "ok": False}
+    t0 = time.monotonic()
+    try:
+        proc = _run(cmd)
+    except Exception as e:
+        row["error"] = type(e).__name__
+        return row
+    elapsed = time.monotonic() - t0
+    if proc.returncode != 0 or not out.exists():
+        row["error"] = (proc.stderr or "")[-300:]
+        return row
+    row.update({
+        "ok": True,
+        "elapsed_sec": round(elapsed, 3),
+        "fps": round(frames / elapsed, 2) if elapsed > 0 else 0.0,
+        "bitrate_bps": int(out.stat().st_size * 8 / seconds),
+        "ssim": measure_ssim(out, reference),
+    })
+    return row
+
+
+def bench_profiles(
+    table_path: Optional[Path] = None,
+    source: Optional[Path] = None,
+    seconds: float = BENCH_SECONDS,
+    w: int = 1920,
+    h: int = 1080,
+    fps: int = 30,
+    names: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    """Bench every available profile (or `names`) and write the profile table.
+
+    The reference is `seconds` of source (default: ffmpeg testsrc2) scaled
+    to WxH@fps and stored losslessly (FFV1), so SSIM measures only the
+    profile's own loss.
+    """
+    table_path = table_path or default_profile_table()
+    encoders = available_encoders()
+    profiles = [PROFILES[n] for n in names] if names else list(PROFILES.values())
+    frames = int(round(seconds * fps))
+    work_dir = Path(tempfile.mkdtemp(prefix="rayvault_bench_"))
+    try:
+        reference = work_dir / "reference.mkv"
+        if source is None:
+            src_args = ["-f", "lavfi", "-i", f"testsrc2=size={w}x{h}:rate={fps}"]
+        else:
+            src_args = ["-stream_loop", "-1", "-i", str(source)]
+        vf = (
+            f"scale={w}:{h}:force_original_aspect_ratio=decrease,"
+            f"pad={w}:{h}:(ow-iw)/2:(oh-ih)/2,setsar=1,fps={fps},format=yuv420p"
+        )
+        proc = _run(
+            ["ffmpeg", "-y", *src_args, "-t", str(seconds), "-vf", vf,
+             "-c:v", "ffv1", "-an", str(reference)],
+        )
+        if proc.returncode != 0 or not reference.exists():
+            raise RuntimeError(f"bench reference failed: {(proc.stderr or '')[-300:]}")
+
+        results = []
+        for profile in profiles:
+            if not profile_available(profile, encoders):
+                results.append({**asdict(profile), "profile": profile.name,
+                                "ok": False, "error": "encoder_unavailable"})
+                continue
+            results.append(bench_profile(profile, reference, frames, seconds, work_dir))
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    table = {
+        "host": platform.node(),
+        "benched_at_utc": utc_now_iso(),
+        "reference": {
+            "source": str(source) if source else "testsrc2",
+            "seconds": seconds, "w": w, "h": h, "fps": fps,
+        },
+        "quality_floors": QUALITY_FLOORS,
+        "results": results,
+        "selected": {
+            tier: select_profile(tier, {"results": results}, encoders=encoders).name
+            for tier in TIERS
+        },
+    }
+    table_path.parent.mkdir(parents=True, exist_ok=True)
+    atomic_write_json(table_path, table)
+    return table
@@ -6,11 +6,31 @@ publish/video_final.mp4 via deterministic segment-by-segment rendering.
 
 Strategy:
   1. Validate all inputs (gates)
-  2. Render each segment to publish/render_cache/seg_XXX.mp4 (cached by inputs_hash)
+  2. Render each segment to publish/render_cache/seg_XXX.mp4 (cached by inputs_hash),
+     cache misses in parallel on a bounded worker pool (--jobs); segments
+     already rendered by another run are hardlinked from the blob store
   3. Concat segments via FFmpeg demuxer
   4. Apply audio track with optional loudnorm
   5. Write receipts (per-segment + global)
 
+Each render is planned as a graph — segment (config, output settings,
+source file, overlays) -> concat -> audio mux — diffed against the node
+hashes in the last render_receipt.json, and only invalidated nodes run:
+a lower-third fix re-encodes one segment, stream-copies the concat and
+re-muxes audio; an audio-only edit re-muxes against the cached concat.
+--explain prints the plan with reasons and an estimated cost.
+
+--mode single-pass replaces steps 2-4 with one ffmpeg process: a single
+filter_complex graph builds every segment (same visual modes and overlay
+chain), concats them and muxes the audio, so the final video is encoded
+exactly once. Loudness uses two-pass loudnorm (measured on the audio track
+first). Suited to first renders; the segment cache is not populated, so
+incremental edits should use the default segment mode.
+
+--profile swaps the encoder settings for a named encode profile or tier
+(draft/preview/final); --bench measures every encoder available on this box
+and records which profile each tier should use (rayvault.encode_profiles).
+
 Golden rules:
   1. NEVER decide visual content. Follow render_config.json visual.mode exactly.
   2. Fail fast: validate everything before touching FFmpeg.
@@ -21,6 +41,11 @@ Usage:
     python3 -m rayvault.ffmpeg_render --run-dir state/runs/RUN_2026_02_14_A --apply
     python3 -m rayvault.ffmpeg_render --run-dir state/runs/RUN_2026_02_14_A --apply --debug
     python3 -m rayvault.ffmpeg_render --run-dir state/runs/RUN_2026_02_14_A --apply --force-all
+    python3 -m rayvault.ffmpeg_render --run-dir state/runs/RUN_2026_02_14_A --apply --jobs 4
+    python3 -m rayvault.ffmpeg_render --run-dir state/runs/RUN_2026_02_14_A --explain
+    python3 -m rayvault.ffmpeg_render --run-dir state/runs/RUN_2026_02_14_A --apply --mode single-pass
+    python3 -m rayvault.ffmpeg_render --run-dir state/runs/RUN_2026_02_14_A --apply --profile preview
+    python3 -m rayvault.ffmpeg_render --bench
 
 Exit codes:
     0: success (or dry-run validation passed)
@@ -37,14 +62,29 @@ import shutil
 import subprocess
 import sys
 import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple
-
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from rayvault.blob_store import BlobStore, default_blob_root
+from rayvault.encode_profiles import (
+    QUALITY_FLOORS,
+    TIERS,
+    apply_profile,
+    available_encoders,
+    bench_profiles,
+    default_profile_table,
+    encode_args as video_encode_args,
+    hw_args,
+    load_profile_table,
+    select_profile,
+)
 from rayvault.io import (
     atomic_write_json, read_json, sha1_file, sha1_text, utc_now_iso,
     wav_duration_seconds,
 )
+from rayvault.probe_cache import probe_duration, probe_many
 
 
 # ---------------------------------------------------------------------------
@@ -56,6 +96,15 @@ KENBURNS_UPSCALE_W = 4000  # scale source to this before zoompan
 DURATION_TOLERANCE_SEC = 0.1
 FRAME_TOLERANCE = 2  # allow +-2 frames for rounding
 MIN_STABILITY_SCORE = 0  # disabled by default; set to 50 to gate on stability
+FFMPEG_THREADS_PER_JOB = 4  # encoder threads per parallel segment render
+LOUDNORM_LRA = 7
+SINGLE_PASS_TIMEOUT_PER_SEC = 10  # single-pass ffmpeg timeout per second of output (min 600s)
+
+SEGMENT_DEPENDENCY_KEYS = ("config", "output", "source", "overlays")
+
+RENDER_MODE_SEGMENTS = "segments"
+RENDER_MODE_SINGLE_PASS = "single-pass"
+RENDER_MODES = (RENDER_MODE_SEGMENTS, RENDER_MODE_SINGLE_PASS)
 
 
 # ---------------------------------------------------------------------------
@@ -64,18 +113,8 @@ MIN_STABILITY_SCORE = 0  # disabled by default; set to 50 to gate on stability
 
 
 def ffprobe_duration(path: Path) -> Optional[float]:
-    """Probe media duration via ffprobe."""
-    try:
-        proc = subprocess.run(
-            ["ffprobe", "-v", "error", "-show_entries", "format=duration",
-             "-of", "default=noprint_wrappers=1:nokey=1", str(path)],
-            capture_output=True, text=True, timeout=30,
-        )
-        if proc.returncode == 0 and proc.stdout.strip():
-            return float(proc.stdout.strip())
-    except Exception:
-        pass
-    return None
+    """Probe media duration via the shared probe cache."""
+    return probe_duration(path)
 
 
 def ffmpeg_version() -> str:
@@ -90,6 +129,12 @@ def ffmpeg_version() -> str:
         return "unknown"
 
 
+def default_render_jobs(threads_per_job: int = FFMPEG_THREADS_PER_JOB) -> int:
+    """Default parallel segment renders: CPU cores / ffmpeg threads per job."""
+    cores = os.cpu_count() or 1
+    return max(1, cores // max(1, threads_per_job))
+
+
 def file_stat_sig(path: Path) -> str:
     """Quick file signature: size + mtime (for hash computation without full SHA1)."""
     try:
@@ -310,17 +355,24 @@ def validate_run_inputs(
 # ---------------------------------------------------------------------------
 
 
-def compute_segment_inputs_hash(
+def segment_dependencies(
     seg: Dict[str, Any],
     run_dir: Path,
     overlays_index: Dict[str, Any],
     output_settings: Dict[str, Any],
-) -> str:
-    """Compute deterministic hash for a single segment's inputs."""
-    parts = [
-        json.dumps(seg, sort_keys=True),
-        json.dumps(output_settings, sort_keys=True),
-    ]
+) -> Dict[str, str]:
+    """Input signatures of one segment node, by dependency.
+
+    config: the segment's render_config entry; output: encoder/canvas
+    settings; source: visual source file; overlays: this rank's
+    overlays_index item (coords, display mode) and its PNG files.
+    """
+    deps = {
+        "config": json.dumps(seg, sort_keys=True),
+        "output": json.dumps(output_settings, sort_keys=True),
+        "source": "",
+        "overlays": "",
+    }
 
     # Visual source signature
     visual = seg.get("visual", {})
@@ -329,21 +381,34 @@ def compute_segment_inputs_hash(
         source_path = Path(source)
         if not source_path.is_absolute():
             source_path = run_dir / source
-        parts.append(file_stat_sig(source_path))
+        deps["source"] = file_stat_sig(source_path)
 
-    # Overlay PNGs for this segment's rank
+    # Overlay item + PNGs for this segment's rank
     rank = seg.get("rank")
     if rank is not None:
         for item in overlays_index.get("items", []):
             if item.get("rank") == rank:
+                parts = [json.dumps(item, sort_keys=True)]
                 for key in ("lowerthird_path", "qr_path"):
                     rel = item.get(key)
                     if rel:
                         p = run_dir / rel
                         parts.append(f"{key}:{file_stat_sig(p)}")
+                deps["overlays"] = "|".join(parts)
                 break
 
-    return sha1_text("|".join(parts))
+    return deps
+
+
+def compute_segment_inputs_hash(
+    seg: Dict[str, Any],
+    run_dir: Path,
+    overlays_index: Dict[str, Any],
+    output_settings: Dict[str, Any],
+) -> str:
+    """Compute deterministic hash for a single segment's inputs."""
+    deps = segment_dependencies(seg, run_dir, overlays_index, output_settings)
+    return sha1_text("|".join(deps[k] for k in SEGMENT_DEPENDENCY_KEYS if deps[k]))
 
 
 def compute_global_inputs_hash(
@@ -381,10 +446,14 @@ def _overlay_filters(
     rank: Optional[int],
     overlays_index: Dict[str, Any],
     input_idx: int,
+    base_label: str = "base",
+    scale: float = 1.0,
 ) -> Tuple[List[str], str, int]:
     """Build overlay filter chain and return (input_args, filter_chain, next_input_idx).
 
     Returns overlay -i args, filter segments to append, and the next input index.
+    The chain starts from [base_label]. scale resizes overlay PNGs and their
+    canvas coords for renders below canvas size (proxy previews).
     """
     if rank is None:
         return [], "", input_idx
@@ -400,7 +469,7 @@ def _overlay_filters(
 
     input_args: List[str] = []
     filter_parts: List[str] = []
-    prev_label = "base"
+    prev_label = base_label
 
     # Lower-third
     lt_path = overlay_item.get("lowerthird_path")
@@ -410,7 +479,7 @@ def _overlay_filters(
         x = coords.get("x", 0)
         y = coords.get("y", 0)
         out_label = f"ov{input_idx}"
-        filter_parts.append(f"[{prev_label}][{input_idx}:v]overlay={x}:{y}[{out_label}]")
+        filter_parts.append(_overlay_step(prev_label, input_idx, x, y, out_label, scale))
         prev_label = out_label
         input_idx += 1
 
@@ -422,7 +491,7 @@ def _overlay_filters(
         x = coords.get("x", 0)
         y = coords.get("y", 0)
         out_label = f"ov{input_idx}"
-        filter_parts.append(f"[{prev_label}][{input_idx}:v]overlay={x}:{y}[{out_label}]")
+        filter_parts.append(_overlay_step(prev_label, input_idx, x, y, out_label, scale))
         prev_label = out_label
         input_idx += 1
 
@@ -430,39 +499,87 @@ def _overlay_filters(
     return input_args, filter_chain, input_idx
 
 
+def _overlay_step(
+    prev_label: str, input_idx: int, x: int, y: int, out_label: str, scale: float,
+) -> str:
+    if scale == 1.0:
+        return f"[{prev_label}][{input_idx}:v]overlay={x}:{y}[{out_label}]"
+    return (
+        f"[{input_idx}:v]scale=iw*{scale:.4f}:-1[ovs{input_idx}];"
+        f"[{prev_label}][ovs{input_idx}]overlay={round(x * scale)}:{round(y * scale)}[{out_label}]"
+    )
+
+
+def _with_hw_upload(cmd: List[str], output_settings: Dict[str, Any]) -> List[str]:
+    """Add hardware-encoder device init and upload filter to an ffmpeg cmd.
+
+    No-op for software encoders. The upload filter is appended to -vf, or
+    after the first -map'd label of a -filter_complex graph, or added as
+    -vf when the command has no video filter.
+    """
+    global_args, suffix = hw_args(output_settings)
+    if not global_args and not suffix:
+        return cmd
+    cmd = cmd[:2] + global_args + cmd[2:]
+    if "-filter_complex" in cmd:
+        fc_i = cmd.index("-filter_complex") + 1
+        map_i = cmd.index("-map") + 1
+        cmd[fc_i] += f";{cmd[map_i]}{suffix}[venc]"
+        cmd[map_i] = "[venc]"
+    elif "-vf" in cmd:
+        cmd[cmd.index("-vf") + 1] += f",{suffix}"
+    else:
+        cv = cmd.index("-c:v")
+        cmd[cv:cv] = ["-vf", suffix]
+    return cmd
+
+
 def build_segment_cmd(
     seg: Dict[str, Any],
     run_dir: Path,
     output_settings: Dict[str, Any],
     overlays_index: Dict[str, Any],
     out_path: Path,
+    threads: Optional[int] = None,
+) -> List[str]:
+    """Build FFmpeg command for a single segment.
+
+    threads caps the encoder thread count; used by the parallel scheduler so
+    concurrent ffmpeg processes don't oversubscribe the CPU. Not part of the
+    segment inputs_hash. Encoder args come from encode_args(output_settings).
+    """
+    cmd = _segment_cmd(seg, run_dir, output_settings, overlays_index, out_path, threads)
+    return _with_hw_upload(cmd, output_settings)
+
+
+def _segment_cmd(
+    seg: Dict[str, Any],
+    run_dir: Path,
+    output_settings: Dict[str, Any],
+    overlays_index: Dict[str, Any],
+    out_path: Path,
+    threads: Optional[int],
 ) -> List[str]:
-    """Build FFmpeg command for a single segment."""
     w = output_settings["w"]
     h = output_settings["h"]
     fps = output_settings["fps"]
-    crf = output_settings.get("crf", 18)
-    preset = output_settings.get("preset", "slow")
-    pix_fmt = output_settings.get("pix_fmt", "yuv420p")
-    vcodec = output_settings.get("vcodec", "libx264")
     duration = round(seg["t1"] - seg["t0"], 3)
     seg_type = seg.get("type", "")
     visual = seg.get("visual", {})
     mode = visual.get("mode", "")
     rank = seg.get("rank")
+    # Canvas -> output scale for proxy renders (overlay geometry, zoompan source)
+    proxy_scale = float(output_settings.get("proxy_scale", 1.0))
 
     # Common encoding args
-    encode_args = [
-        "-c:v", vcodec, "-crf", str(crf), "-preset", preset,
-        "-pix_fmt", pix_fmt, "-an",
-    ]
+    encode_args = video_encode_args(output_settings, threads) + ["-an"]
 
     # --- Intro / Outro: static frame ---
     if seg_type in ("intro", "outro"):
         frame_path = run_dir / "03_frame.png"
         # Build overlay chain
         overlay_inputs, overlay_filter, _ = _overlay_filters(
-            run_dir, rank, overlays_index, 1,
+            run_dir, rank, overlays_index, 1, scale=proxy_scale,
         )
         scale_filter = _scale_pad_filter(w, h)
         if overlay_filter:
@@ -504,7 +621,7 @@ def build_segment_cmd(
 
     if mode == "BROLL_VIDEO":
         overlay_inputs, overlay_filter, _ = _overlay_filters(
-            run_dir, rank, overlays_index, 1,
+            run_dir, rank, overlays_index, 1, scale=proxy_scale,
         )
         scale_filter = _scale_pad_filter(w, h)
         if overlay_filter:
@@ -539,14 +656,14 @@ def build_segment_cmd(
 
         # Upscale source, then zoompan for smooth zoom
         zp_filter = (
-            f"scale={KENBURNS_UPSCALE_W}:-1,"
+            f"scale={round(KENBURNS_UPSCALE_W * proxy_scale)}:-1,"
             f"zoompan=z='min(zoom+{zoom_inc:.6f},{zoom})':"
             f"x='iw/2-(iw/zoom/2)':y='ih/2-(ih/zoom/2)':"
             f"d={frames}:s={w}x{h}:fps={fps}"
         )
 
         overlay_inputs, overlay_filter, _ = _overlay_filters(
-            run_dir, rank, overlays_index, 1,
+            run_dir, rank, overlays_index, 1, scale=proxy_scale,
         )
         if overlay_filter:
             fc = f"[0:v]{zp_filter}[base];{overlay_filter}"
@@ -571,7 +688,7 @@ def build_segment_cmd(
     # --- Product: STILL_ONLY (static image, no zoom) ---
     if mode == "STILL_ONLY":
         overlay_inputs, overlay_filter, _ = _overlay_filters(
-            run_dir, rank, overlays_index, 1,
+            run_dir, rank, overlays_index, 1, scale=proxy_scale,
         )
         scale_filter = _scale_pad_filter(w, h)
         if overlay_filter:
@@ -633,8 +750,14 @@ def render_segment(
     receipts_dir: Path,
     debug_dir: Optional[Path],
     force: bool = False,
+    threads: Optional[int] = None,
+    blob_store: Optional[BlobStore] = None,
 ) -> SegmentResult:
-    """Render a single segment with caching."""
+    """Render a single segment with caching.
+
+    With a blob_store, a segment already rendered by any run with the same
+    inputs_hash is linked into place instead of re-encoded.
+    """
     seg_id = seg.get("id", f"seg_{seg.get('rank', 0):03d}")
     out_path = cache_dir / f"{seg_id}.mp4"
     receipt_path = receipts_dir / f"{seg_id}.json"
@@ -659,12 +782,24 @@ def render_segment(
         except Exception:
             pass
 
+    if blob_store is not None and not force:
+        blob_sha = blob_store.get_key("render_segments", inputs_hash)
+        if blob_sha:
+            blob_store.materialize(blob_sha, out_path)
+            return _write_segment_receipt(
+                seg_id, inputs_hash, run_dir, out_path, receipt_path,
+                cmdline="blob_store", blob_sha256=blob_sha, cached=True,
+            )
+
     # Build command
-    cmd = build_segment_cmd(seg, run_dir, output_settings, overlays_index, out_path)
+    cmd = build_segment_cmd(
+        seg, run_dir, output_settings, overlays_index, out_path, threads=threads,
+    )
     cmdline = " ".join(cmd)
 
-    # Execute
+    # Execute (out_path may be a link into the blob store: never overwrite in place)
     cache_dir.mkdir(parents=True, exist_ok=True)
+    out_path.unlink(missing_ok=True)
     try:
         proc = subprocess.run(
             cmd, capture_output=True, text=True, timeout=600,
@@ -701,10 +836,33 @@ def render_segment(
             error_code="OUTPUT_MISSING", cmdline=cmdline,
         )
 
+    blob_sha = ""
+    if blob_store is not None:
+        blob_sha = blob_store.put_file(out_path)
+        blob_store.set_key("render_segments", inputs_hash, blob_sha)
+        # Re-renders unlink out_path first, so it can share the blob's inode
+        blob_store.materialize(blob_sha, out_path)
+
+    return _write_segment_receipt(
+        seg_id, inputs_hash, run_dir, out_path, receipt_path,
+        cmdline=cmdline, blob_sha256=blob_sha, cached=False,
+    )
+
+
+def _write_segment_receipt(
+    seg_id: str,
+    inputs_hash: str,
+    run_dir: Path,
+    out_path: Path,
+    receipt_path: Path,
+    cmdline: str,
+    blob_sha256: str = "",
+    cached: bool = False,
+) -> SegmentResult:
+    """Write the per-run segment receipt for a file now at out_path."""
     output_sha1 = sha1_file(out_path)
     duration = ffprobe_duration(out_path) or 0.0
 
-    # Write segment receipt
     seg_receipt = {
         "segment_id": seg_id,
         "inputs_hash": inputs_hash,
@@ -716,11 +874,13 @@ def render_segment(
         "duration_sec": round(duration, 3),
         "warnings": [],
     }
-    receipts_dir.mkdir(parents=True, exist_ok=True)
+    if blob_sha256:
+        seg_receipt["blob_sha256"] = blob_sha256
+    receipt_path.parent.mkdir(parents=True, exist_ok=True)
     atomic_write_json(receipt_path, seg_receipt)
 
     return SegmentResult(
-        seg_id=seg_id, ok=True, cached=False,
+        seg_id=seg_id, ok=True, cached=cached,
         inputs_hash=inputs_hash,
         output_path=str(out_path),
         output_sha1=output_sha1,
@@ -745,6 +905,72 @@ def _write_debug(
         pass
 
 
+def render_segments(
+    segments: List[Dict[str, Any]],
+    run_dir: Path,
+    output_settings: Dict[str, Any],
+    overlays_index: Dict[str, Any],
+    cache_dir: Path,
+    receipts_dir: Path,
+    debug_dir: Optional[Path],
+    force_all: bool = False,
+    force_segments: Optional[Set[str]] = None,
+    jobs: int = 1,
+    blob_store: Optional[BlobStore] = None,
+) -> List[Optional[SegmentResult]]:
+    """Render segments on a bounded worker pool, preserving timeline order.
+
+    Cache hits resolve immediately inside render_segment(); only misses
+    occupy an ffmpeg slot. On the first failure, segments that have not
+    started yet are cancelled (left as None) while in-flight renders are
+    allowed to finish so their receipts stay consistent.
+
+    Returns one entry per input segment, in the same order.
+    """
+    results: List[Optional[SegmentResult]] = [None] * len(segments)
+    jobs = max(1, jobs)
+    threads = max(1, (os.cpu_count() or 1) // jobs) if jobs > 1 else None
+
+    def _force(seg: Dict[str, Any]) -> bool:
+        return force_all or (
+            force_segments is not None and seg.get("id", "?") in force_segments
+        )
+
+    if jobs == 1:
+        for i, seg in enumerate(segments):
+            results[i] = render_segment(
+                seg, run_dir, output_settings, overlays_index,
+                cache_dir, receipts_dir, debug_dir,
+                force=_force(seg), blob_store=blob_store,
+            )
+            if not results[i].ok:
+                break
+        return results
+
+    with ThreadPoolExecutor(max_workers=jobs, thread_name_prefix="seg") as pool:
+        pending = {
+            pool.submit(
+                render_segment, seg, run_dir, output_settings, overlays_index,
+                cache_dir, receipts_dir, debug_dir,
+                force=_force(seg), threads=threads, blob_store=blob_store,
+            ): i
+            for i, seg in enumerate(segments)
+        }
+        failed = False
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for fut in done:
+                i = pending.pop(fut)
+                if fut.cancelled():
+                    continue
+                results[i] = fut.result()
+                if not results[i].ok and not failed:
+                    failed = True
+                    for other in pending:
+                        other.cancel()
+    return results
+
+
 # ---------------------------------------------------------------------------
 # Assembly (concat + audio)
 # ---------------------------------------------------------------------------
@@ -754,8 +980,13 @@ def concat_segments(
     seg_paths: List[Path],
     out_path: Path,
     output_settings: Dict[str, Any],
+    allow_reencode: bool = True,
 ) -> Tuple[bool, str, str]:
-    """Concat segment videos via FFmpeg demuxer. Returns (ok, cmdline, error)."""
+    """Concat segment videos via FFmpeg demuxer. Returns (ok, cmdline, error).
+
+    Stream copy first; if that fails and allow_reencode, the whole timeline
+    is re-encoded (error "reencode_concat" on success).
+    """
     concat_list = out_path.parent / "concat_list.txt"
     lines = [f"file '{p}'\n" for p in seg_paths]
     concat_list.write_text("".join(lines), encoding="utf-8")
@@ -773,19 +1004,16 @@ def concat_segments(
         proc = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
         if proc.returncode == 0 and out_path.exists():
             return True, cmdline, ""
+        if not allow_reencode:
+            return False, cmdline, proc.stderr[-500:] if proc.stderr else "concat_copy_failed"
 
         # Stream copy failed — fallback to reencode
-        vcodec = output_settings.get("vcodec", "libx264")
-        crf = output_settings.get("crf", 18)
-        preset = output_settings.get("preset", "slow")
-        pix_fmt = output_settings.get("pix_fmt", "yuv420p")
-        cmd = [
+        cmd = _with_hw_upload([
             "ffmpeg", "-y", "-f", "concat", "-safe", "0",
             "-i", str(concat_list),
-            "-c:v", vcodec, "-crf", str(crf), "-preset", preset,
-            "-pix_fmt", pix_fmt, "-an",
+            *video_encode_args(output_settings), "-an",
             str(out_path),
-        ]
+        ], output_settings)
         cmdline = " ".join(cmd)
         proc = subprocess.run(cmd, capture_output=True, text=True, timeout=600)
         if proc.returncode == 0 and out_path.exists():
@@ -843,6 +1071,489 @@ def apply_audio(
         return False, cmdline, str(e)
 
 
+# ---------------------------------------------------------------------------
+# Render graph (segment -> sources/overlays -> concat -> audio mux)
+# ---------------------------------------------------------------------------
+
+# Planning estimates: wall seconds per second of output at the default
+# (slow) preset, by segment visual mode
+ENCODE_COST_PER_SEC = {
+    "KEN_BURNS": 1.2,
+    "BROLL_VIDEO": 0.6,
+    "STILL_ONLY": 0.25,
+    "STATIC": 0.25,  # intro / outro frame
+    "SKIP": 0.05,
+}
+CONCAT_COPY_COST_SEC = 1.0
+AUDIO_MUX_COST_PER_SEC = 0.05
+
+NODE_RENDER = "render"
+NODE_LINK = "link"  # segment available in the blob store
+NODE_REUSE = "reuse"
+
+
+@dataclass
+class RenderNode:
+    node_id: str
+    kind: str  # "segment", "concat" or "audio_mux"
+    hash: str
+    deps: Dict[str, str] = field(default_factory=dict)
+    action: str = NODE_REUSE
+    reasons: List[str] = field(default_factory=list)
+    est_sec: float = 0.0
+
+
+@dataclass
+class RenderPlan:
+    segments: List[RenderNode]
+    concat: RenderNode
+    audio_mux: RenderNode
+    jobs: int = 1
+
+    def to_render(self) -> List[RenderNode]:
+        return [
+            n for n in self.segments + [self.concat, self.audio_mux]
+            if n.action != NODE_REUSE
+        ]
+
+    @property
+    def up_to_date(self) -> bool:
+        return self.audio_mux.action == NODE_REUSE
+
+    @property
+    def est_sec(self) -> float:
+        """Wall-clock estimate: segment encodes spread over jobs, then concat + mux."""
+        encode = sum(n.est_sec for n in self.segments if n.action == NODE_RENDER)
+        tail = sum(n.est_sec for n in (self.concat, self.audio_mux) if n.action != NODE_REUSE)
+        return round(encode / max(1, self.jobs) + tail, 1)
+
+    def graph_receipt(self) -> Dict[str, Any]:
+        """Node hashes for render_receipt.json (diffed by the next plan)."""
+        return {
+            "segments": {n.node_id: {"hash": n.hash, "deps": n.deps} for n in self.segments},
+            "concat": self.concat.hash,
+            "audio_mux": self.audio_mux.hash,
+        }
+
+    def explain(self) -> List[str]:
+        encode = [n for n in self.segments if n.action == NODE_RENDER]
+        linked = [n for n in self.segments if n.action == NODE_LINK]
+        lines = [
+            f"{len(encode)} of {len(self.segments)} segments to encode"
+            f" ({len(linked)} linked from blob store), concat={self.concat.action},"
+            f" audio_mux={self.audio_mux.action}, est ~{self.est_sec:.0f}s"
+            f" at jobs={self.jobs}",
+        ]
+        for n in self.to_render():
+            lines.append(
+                f"  {n.node_id:<12} {n.action:<7} ~{n.est_sec:>6.1f}s  {', '.join(n.reasons)}"
+            )
+        reused = len(self.segments) - len(encode) - len(linked)
+        if reused:
+            lines.append(f"  ({reused} segments reused from render_cache)")
+        return lines
+
+
+def _segment_mode(seg: Dict[str, Any]) -> str:
+    if seg.get("type") in ("intro", "outro"):
+        return "STATIC"
+    visual = seg.get("visual", {})
+    if not visual.get("source"):
+        return "SKIP"
+    return visual.get("mode", "SKIP")
+
+
+def _segment_cache_valid(receipts_dir: Path, cache_dir: Path, seg_id: str, inputs_hash: str) -> bool:
+    try:
+        receipt = read_json(receipts_dir / f"{seg_id}.json")
+    except Exception:
+        return False
+    return receipt.get("inputs_hash") == inputs_hash and (cache_dir / f"{seg_id}.mp4").exists()
+
+
+def _changed(deps: Dict[str, str], previous: Optional[Dict[str, Any]]) -> List[str]:
+    if not previous:
+        return ["new"]
+    old = previous.get("deps") or {}
+    changed = [f"{k} changed" for k in SEGMENT_DEPENDENCY_KEYS if deps.get(k) != old.get(k)]
+    return changed or ["cache missing"]
+
+
+def plan_render(
+    run_dir: Path,
+    segments: List[Dict[str, Any]],
+    overlays_index: Dict[str, Any],
+    output_settings: Dict[str, Any],
+    audio_path: Path,
+    audio_config: Dict[str, Any],
+    previous_receipt: Optional[Dict[str, Any]] = None,
+    force_all: bool = False,
+    force_segments: Optional[Set[str]] = None,
+    blob_store: Optional[BlobStore] = None,
+    jobs: int = 1,
+) -> RenderPlan:
+    """Diff the render graph against the last receipt and the caches.
+
+    A segment node is rebuilt when forced or when its render_cache entry
+    does not match its inputs_hash (linked instead when the blob store has
+    it); concat when any segment changes or its output is gone; audio mux
+    when concat, the audio file or audio settings change. Reasons name the
+    dependencies that differ from the previous receipt's graph.
+    """
+    publish = run_dir / "publish"
+    cache_dir = publish / "render_cache"
+    receipts_dir = publish / "seg_receipts"
+    prev_graph = (previous_receipt or {}).get("graph") or {}
+    prev_segments = prev_graph.get("segments") or {}
+    forced_any = force_all or bool(force_segments)
+
+    nodes: List[RenderNode] = []
+    for seg in segments:
+        seg_id = seg.get("id", f"seg_{seg.get('rank', 0):03d}")
+        deps = segment_dependencies(seg, run_dir, overlays_index, output_settings)
+        nodes.append(RenderNode(
+            node_id=seg_id, kind="segment",
+            hash=sha1_text("|".join(deps[k] for k in SEGMENT_DEPENDENCY_KEYS if deps[k])),
+            deps={k: sha1_text(v) for k, v in deps.items()},
+        ))
+    concat = RenderNode(
+        node_id="concat", kind="concat",
+        hash=sha1_text("|".join(n.hash for n in nodes)),
+    )
+    audio_duration = wav_duration_seconds(audio_path) or 0.0
+    audio_mux = RenderNode(
+        node_id="audio_mux", kind="audio_mux",
+        hash=sha1_text("|".join([
+            concat.hash, file_stat_sig(audio_path), json.dumps(audio_config, sort_keys=True),
+        ])),
+    )
+    plan = RenderPlan(segments=nodes, concat=concat, audio_mux=audio_mux, jobs=max(1, jobs))
+
+    # Final output already built from exactly this graph: nothing to do
+    if (
+        not forced_any
+        and audio_mux.hash == prev_graph.get("audio_mux")
+        and (publish / "video_final.mp4").exists()
+    ):
+        return plan
+
+    for seg, node in zip(segments, nodes):
+        forced = force_all or (force_segments is not None and node.node_id in force_segments)
+        if forced:
+            node.action, node.reasons = NODE_RENDER, ["forced"]
+        elif not _segment_cache_valid(receipts_dir, cache_dir, node.node_id, node.hash):
+            node.reasons = _changed(node.deps, prev_segments.get(node.node_id))
+            if blob_store is not None and blob_store.get_key("render_segments", node.hash):
+                node.action = NODE_LINK
+            else:
+                node.action = NODE_RENDER
+                duration = float(seg.get("t1", 0)) - float(seg.get("t0", 0))
+                node.est_sec = round(
+                    max(0.0, duration) * ENCODE_COST_PER_SEC.get(_segment_mode(seg), 1.0), 1,
+                )
+
+    dirty = [n.node_id for n in nodes if n.action != NODE_REUSE]
+    if dirty:
+        concat.reasons.append(
+            f"segments changed ({', '.join(dirty[:3])}{', ...' if len(dirty) > 3 else ''})"
+        )
+    elif concat_cache_hash(cache_dir) != concat.hash:
+        if concat.hash != prev_graph.get("concat"):
+            concat.reasons.append("segment order changed" if prev_graph else "new")
+        else:
+            concat.reasons.append("output missing")
+    if concat.reasons:
+        concat.action, concat.est_sec = NODE_RENDER, CONCAT_COPY_COST_SEC
+
+    if concat.hash != prev_graph.get("concat"):
+        audio_mux.reasons.append("concat changed" if prev_graph else "new")
+    elif audio_mux.hash != prev_graph.get("audio_mux"):
+        audio_mux.reasons.append("audio changed")
+    else:
+        audio_mux.reasons.append("forced" if forced_any else "output missing")
+    audio_mux.action = NODE_RENDER
+    audio_mux.est_sec = round(1.0 + audio_duration * AUDIO_MUX_COST_PER_SEC, 1)
+
+    return plan
+
+
+def concat_cache_hash(cache_dir: Path) -> Optional[str]:
+    """Concat-node hash of render_cache/video_noaudio.mp4, if present."""
+    if not (cache_dir / "video_noaudio.mp4").exists():
+        return None
+    try:
+        return read_json(cache_dir / "video_noaudio.json").get("hash")
+    except Exception:
+        return None
+
+
+def _concat_outliers(seg_paths: List[Path]) -> List[int]:
+    """Indices of segments whose video stream parameters differ from the majority.
+
+    These are what breaks a stream-copy concat (e.g. a segment linked from
+    a run with another ffmpeg build); re-encoding just them is cheaper than
+    re-encoding the whole timeline.
+    """
+    infos = probe_many(seg_paths)
+    sigs: List[Optional[Tuple[Any, ...]]] = []
+    for p in seg_paths:
+        info = infos.get(p) or {}
+        video = next(
+            (st for st in info.get("streams", []) if st.get("codec_type") == "video"), None,
+        )
+        sigs.append(None if video is None else tuple(
+            video.get(k) for k in (
+                "codec_name", "profile", "width", "height", "pix_fmt",
+                "r_frame_rate", "time_base",
+            )
+        ))
+    counts: Dict[Any, int] = {}
+    for sig in sigs:
+        if sig is not None:
+            counts[sig] = counts.get(sig, 0) + 1
+    if not counts:
+        return []
+    majority = max(counts, key=counts.get)
+    return [i for i, sig in enumerate(sigs) if sig != majority]
+
+
+def concat_repairing_outliers(
+    seg_ids: List[str],
+    seg_paths: List[Path],
+    out_path: Path,
+    output_settings: Dict[str, Any],
+    rerender: Callable[[Set[str]], bool],
+) -> Tuple[bool, str, str, List[str]]:
+    """Stream-copy concat; on failure re-encode only the mismatched segments.
+
+    rerender(seg_ids) force-renders those segments in place. The whole
+    timeline is re-encoded only as a last resort. Returns (ok, cmdline,
+    error, repaired_seg_ids).
+    """
+    ok, cmdline, err = concat_segments(seg_paths, out_path, output_settings, allow_reencode=False)
+    if ok:
+        return ok, cmdline, err, []
+    outliers = _concat_outliers(seg_paths)
+    repaired: List[str] = []
+    if outliers and len(outliers) < len(seg_paths):
+        ids = {seg_ids[i] for i in outliers}
+        if rerender(ids):
+            repaired = sorted(ids)
+            ok, cmdline, err = concat_segments(
+                seg_paths, out_path, output_settings, allow_reencode=False,
+            )
+            if ok:
+                return ok, cmdline, err, repaired
+    ok, cmdline, err = concat_segments(seg_paths, out_path, output_settings)
+    return ok, cmdline, err, repaired
+
+
+# ---------------------------------------------------------------------------
+# Single-pass render (one filter graph)
+# ---------------------------------------------------------------------------
+
+
+def _segment_graph_inputs(
+    seg: Dict[str, Any],
+    run_dir: Path,
+    output_settings: Dict[str, Any],
+) -> Tuple[List[str], str, bool]:
+    """Input args, base filter and overlay flag for one single-pass segment.
+
+    Mirrors build_segment_cmd()'s visual modes, including which ones get the
+    overlay chain: black frames (SKIP, no source, unknown mode) never do.
+    Inputs are bounded with an input-side -t; the caller trims the filtered
+    stream to the exact duration.
+    """
+    w = output_settings["w"]
+    h = output_settings["h"]
+    fps = output_settings["fps"]
+    duration = round(seg["t1"] - seg["t0"], 3)
+    dur = str(duration)
+    visual = seg.get("visual", {})
+    mode = visual.get("mode", "")
+    scale = f"{_scale_pad_filter(w, h)},fps={fps}"
+
+    if seg.get("type", "") in ("intro", "outro"):
+        return ["-loop", "1", "-t", dur, "-i", str(run_dir / "03_frame.png")], scale, True
+
+    black = (
+        ["-f", "lavfi", "-t", dur, "-i", f"color=c=black:s={w}x{h}:d={duration}:r={fps}"],
+        "setsar=1",
+        False,
+    )
+    if mode == "SKIP" or not visual.get("source"):
+        return black
+
+    source_path = Path(visual.get("source", ""))
+    if not source_path.is_absolute():
+        source_path = run_dir / source_path
+
+    if mode == "BROLL_VIDEO":
+        return ["-stream_loop", "-1", "-t", dur, "-i", str(source_path)], scale, True
+    if mode == "KEN_BURNS":
+        frames = seg.get("frames") or round(duration * fps)
+        zoom = visual.get("kenburns", {}).get("zoom", KENBURNS_ZOOM_FACTOR)
+        zoom_inc = (zoom - 1.0) / max(1, frames)
+        zp_filter = (
+            f"scale={KENBURNS_UPSCALE_W}:-1,"
+            f"zoompan=z='min(zoom+{zoom_inc:.6f},{zoom})':"
+            f"x='iw/2-(iw/zoom/2)':y='ih/2-(ih/zoom/2)':"
+            f"d={frames}:s={w}x{h}:fps={fps},setsar=1"
+        )
+        # One input frame -> d output frames (no -loop, unlike the segment cmd)
+        return ["-i", str(source_path)], zp_filter, True
+    if mode == "STILL_ONLY":
+        return ["-loop", "1", "-t", dur, "-i", str(source_path)], scale, True
+    return black
+
+
+def build_single_pass_cmd(
+    segments: List[Dict[str, Any]],
+    run_dir: Path,
+    output_settings: Dict[str, Any],
+    overlays_index: Dict[str, Any],
+    audio_path: Path,
+    audio_filter: str,
+    out_path: Path,
+) -> List[str]:
+    """One FFmpeg command: every segment, overlays, concat and the audio mux.
+
+    Each segment becomes a trimmed [bN] branch (with the same overlay
+    chain build_segment_cmd() uses, i.e. none on black-frame segments),
+    the branches are joined with the concat filter and the audio track
+    is filtered by audio_filter (empty = copy as-is). The video is
+    encoded exactly once.
+    """
+    pix_fmt = output_settings.get("pix_fmt", "yuv420p") or "yuv420p"
+
+    input_args: List[str] = []
+    graph: List[str] = []
+    labels: List[str] = []
+    idx = 0
+    for n, seg in enumerate(segments):
+        seg_inputs, base_filter, overlays = _segment_graph_inputs(seg, run_dir, output_settings)
+        duration = round(seg["t1"] - seg["t0"], 3)
+        input_args.extend(seg_inputs)
+        base = f"b{n}"
+        graph.append(
+            f"[{idx}:v]{base_filter},trim=duration={duration},setpts=PTS-STARTPTS[{base}]"
+        )
+        idx += 1
+        ov_inputs, ov_filter = [], ""
+        if overlays:
+            ov_inputs, ov_filter, idx = _overlay_filters(
+                run_dir, seg.get("rank"), overlays_index, idx, base_label=base,
+            )
+        input_args.extend(ov_inputs)
+        if ov_filter:
+            graph.append(ov_filter)
+            labels.append(ov_filter.rsplit("[", 1)[-1].rstrip("]"))
+        else:
+            labels.append(base)
+
+    graph.append(
+        "".join(f"[{lb}]" for lb in labels)
+        + f"concat=n={len(labels)}:v=1:a=0,format={pix_fmt}[vout]"
+    )
+    audio_idx = idx
+    input_args.extend(["-i", str(audio_path)])
+    audio_map = f"{audio_idx}:a"
+    if audio_filter:
+        graph.append(f"[{audio_idx}:a]{audio_filter}[aout]")
+        audio_map = "[aout]"
+
+    return _with_hw_upload(
+        ["ffmpeg", "-y"]
+        + input_args
+        + ["-filter_complex", ";".join(graph)]
+        + ["-map", "[vout]", "-map", audio_map]
+        + video_encode_args(output_settings)
+        + ["-c:a", "aac", "-b:a", "192k", "-shortest"]
+        + [str(out_path)],
+        output_settings,
+    )
+
+
+def measure_loudnorm(
+    audio_path: Path, lufs: float, tp: float, lra: float = LOUDNORM_LRA,
+) -> Optional[Dict[str, str]]:
+    """First loudnorm pass over the audio track only. Returns measured values or None."""
+    cmd = [
+        "ffmpeg", "-hide_banner", "-nostats",
+        "-i", str(audio_path),
+        "-af", f"loudnorm=I={lufs}:LRA={lra}:TP={tp}:print_format=json",
+        "-f", "null", "-",
+    ]
+    try:
+        proc = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
+        stderr = proc.stderr or ""
+        start = stderr.rfind("{")
+        end = stderr.rfind("}") + 1
+        if proc.returncode != 0 or start < 0 or end <= start:
+            return None
+        data = json.loads(stderr[start:end])
+        return {k: str(data[k]) for k in (
+            "input_i", "input_lra", "input_tp", "input_thresh", "target_offset",
+        )}
+    except Exception:
+        return None
+
+
+def loudnorm_filter(
+    lufs: float, tp: float, measured: Optional[Dict[str, str]], lra: float = LOUDNORM_LRA,
+) -> str:
+    """loudnorm with measured values (second pass), or single-pass if unmeasured."""
+    base = f"loudnorm=I={lufs}:LRA={lra}:TP={tp}"
+    if not measured:
+        return f"{base}:print_format=none"
+    return (
+        f"{base}:measured_I={measured['input_i']}:measured_LRA={measured['input_lra']}:"
+        f"measured_TP={measured['input_tp']}:measured_thresh={measured['input_thresh']}:"
+        f"offset={measured['target_offset']}:linear=true:print_format=none"
+    )
+
+
+def render_single_pass(
+    segments: List[Dict[str, Any]],
+    run_dir: Path,
+    output_settings: Dict[str, Any],
+    overlays_index: Dict[str, Any],
+    audio_path: Path,
+    audio_config: Dict[str, Any],
+    out_path: Path,
+    timeout: int,
+    debug_dir: Optional[Path] = None,
+) -> Tuple[bool, str, str, Optional[Dict[str, str]]]:
+    """Render the final video in one encode. Returns (ok, cmdline, error, loudnorm_measured)."""
+    lufs = audio_config.get("normalize_lufs")
+    tp = audio_config.get("true_peak")
+    measured = None
+    audio_filter = ""
+    if lufs is not None and tp is not None:
+        measured = measure_loudnorm(audio_path, lufs, tp)
+        audio_filter = loudnorm_filter(lufs, tp, measured)
+
+    cmd = build_single_pass_cmd(
+        segments, run_dir, output_settings, overlays_index,
+        audio_path, audio_filter, out_path,
+    )
+    cmdline = " ".join(cmd)
+    out_path.unlink(missing_ok=True)
+    try:
+        proc = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout)
+    except subprocess.TimeoutExpired:
+        return False, cmdline, "TIMEOUT", measured
+    except Exception as e:
+        return False, cmdline, str(type(e).__name__), measured
+    if proc.returncode != 0 or not out_path.exists():
+        if debug_dir:
+            debug_dir.mkdir(parents=True, exist_ok=True)
+            _write_debug(debug_dir, "single_pass", proc.stderr, cmdline, {"segments": segments})
+        return False, cmdline, classify_ffmpeg_error(proc.stderr or ""), measured
+    return True, cmdline, "", measured
+
+
 # ---------------------------------------------------------------------------
 # Core render orchestrator
 # ---------------------------------------------------------------------------
@@ -866,6 +1577,22 @@ class RenderResult:
     errors: List[str] = field(default_factory=list)
     warnings: List[str] = field(default_factory=list)
     patient_zero: Optional[Dict[str, str]] = None
+    plan: Optional[RenderPlan] = None
+
+
+def output_settings_from_config(render_config: Dict[str, Any]) -> Dict[str, Any]:
+    """Output settings with encoding defaults (v1.3 output section, fallback canvas)."""
+    output_settings = render_config.get(
+        "output",
+        render_config.get("canvas", {"w": 1920, "h": 1080, "fps": 30}),
+    )
+    # Ensure encoding defaults
+    output_settings.setdefault("vcodec", "libx264")
+    output_settings.setdefault("acodec", "aac")
+    output_settings.setdefault("crf", 18)
+    output_settings.setdefault("preset", "slow")
+    output_settings.setdefault("pix_fmt", "yuv420p")
+    return output_settings
 
 
 def render(
@@ -874,11 +1601,34 @@ def render(
     debug: bool = False,
     force_all: bool = False,
     force_segments: Optional[Set[str]] = None,
+    jobs: Optional[int] = None,
+    blob_store: Optional[BlobStore] = None,
+    mode: str = RENDER_MODE_SEGMENTS,
+    profile: Optional[str] = None,
+    quality_floor: Optional[float] = None,
+    profile_table: Optional[Path] = None,
 ) -> RenderResult:
-    """Orchestrate full segmented render pipeline."""
+    """Orchestrate full segmented render pipeline.
+
+    jobs bounds concurrent segment encodes (None = default_render_jobs()).
+    blob_store shares rendered segments across runs by inputs_hash.
+    mode "single-pass" renders the whole timeline, overlays and audio in one
+    ffmpeg process (one video encode, two-pass loudnorm) and leaves the
+    segment cache untouched; "segments" (default) is the cached,
+    incremental path.
+    profile (a tier — draft/preview/final — or a profile name) replaces the
+    render_config encoder settings; a tier picks the fastest benched profile
+    meeting quality_floor (see rayvault.encode_profiles).
+    """
     run_dir = run_dir.resolve()
     t_start = time.monotonic()
 
+    if mode not in RENDER_MODES:
+        return RenderResult(
+            ok=False, status="BLOCKED",
+            errors=[f"UNKNOWN_RENDER_MODE: {mode}"],
+        )
+
     # Load essential files
     files_gate = gate_essential_files(run_dir)
     if not files_gate.ok:
@@ -899,17 +1649,18 @@ def render(
             errors=["UNREADABLE_AUDIO: cannot parse 02_audio.wav"],
         )
 
-    # Output settings (v1.3 uses output section, fallback to canvas)
-    output_settings = render_config.get(
-        "output",
-        render_config.get("canvas", {"w": 1920, "h": 1080, "fps": 30}),
-    )
-    # Ensure encoding defaults
-    output_settings.setdefault("vcodec", "libx264")
-    output_settings.setdefault("acodec", "aac")
-    output_settings.setdefault("crf", 18)
-    output_settings.setdefault("preset", "slow")
-    output_settings.setdefault("pix_fmt", "yuv420p")
+    output_settings = output_settings_from_config(render_config)
+    if profile:
+        try:
+            chosen = select_profile(
+                profile, load_profile_table(profile_table), quality_floor, available_encoders(),
+            )
+        except KeyError:
+            return RenderResult(
+                ok=False, status="BLOCKED",
+                errors=[f"UNKNOWN_ENCODE_PROFILE: {profile}"],
+            )
+        output_settings = apply_profile(output_settings, chosen)
 
     # Run all gates
     gate = validate_run_inputs(
@@ -935,32 +1686,37 @@ def render(
         seg_hashes,
     )
 
-    # Check global idempotency
+    # Plan against the last receipt: only invalidated graph nodes run
     receipt_path = run_dir / "publish" / "render_receipt.json"
     final_path = run_dir / "publish" / "video_final.mp4"
-    if (
-        not force_all
-        and not force_segments
-        and receipt_path.exists()
-        and final_path.exists()
-    ):
+    previous_receipt: Optional[Dict[str, Any]] = None
+    if receipt_path.exists():
         try:
-            existing = read_json(receipt_path)
-            if existing.get("inputs_hash") == global_hash:
-                return RenderResult(
-                    ok=True, status="RENDERED_CACHED",
-                    inputs_hash=global_hash,
-                    segments_total=len(segments),
-                    segments_cached=len(segments),
-                    output_path=str(final_path),
-                    output_sha1=existing.get("output_sha1"),
-                    output_bytes=existing.get("output_bytes", 0),
-                    duration_sec=existing.get("duration_sec", 0.0),
-                    elapsed_sec=0.0,
-                    warnings=gate.warnings,
-                )
+            previous_receipt = read_json(receipt_path)
         except Exception:
             pass
+    audio_config = render_config.get("audio", {})
+    jobs = jobs if jobs is not None else default_render_jobs()
+    plan = plan_render(
+        run_dir, segments, overlays_index, output_settings, audio_path, audio_config,
+        previous_receipt, force_all=force_all, force_segments=force_segments,
+        blob_store=blob_store, jobs=jobs,
+    )
+    if plan.up_to_date:
+        existing = previous_receipt or {}
+        return RenderResult(
+            ok=True, status="RENDERED_CACHED",
+            inputs_hash=global_hash,
+            segments_total=len(segments),
+            segments_cached=len(segments),
+            output_path=str(final_path),
+            output_sha1=existing.get("output_sha1"),
+            output_bytes=existing.get("output_bytes", 0),
+            duration_sec=existing.get("duration_sec", 0.0),
+            elapsed_sec=0.0,
+            warnings=gate.warnings,
+            plan=plan,
+        )
 
     # Dry-run: just report plan
     if not apply:
@@ -984,33 +1740,109 @@ def render(
             duration_sec=audio_duration,
             elapsed_sec=round(elapsed, 2),
             warnings=gate.warnings,
+            plan=plan,
         )
 
-    # --- APPLY: render segments ---
-    cache_dir = run_dir / "publish" / "render_cache"
-    receipts_dir = run_dir / "publish" / "seg_receipts"
     debug_dir = (run_dir / "publish" / "render_debug") if debug else None
 
-    seg_results: List[SegmentResult] = []
-    seg_paths: List[Path] = []
-    rendered = 0
-    cached = 0
-
-    for seg in segments:
-        seg_id = seg.get("id", "?")
-        force_this = force_all or (
-            force_segments is not None and seg_id in force_segments
+    if mode == RENDER_MODE_SINGLE_PASS:
+        # --- APPLY: one ffmpeg pass for video, overlays, concat and audio ---
+        timeout = max(600, int(audio_duration * SINGLE_PASS_TIMEOUT_PER_SEC))
+        sp_ok, sp_cmd, sp_err, measured = render_single_pass(
+            segments, run_dir, output_settings, overlays_index,
+            audio_path, audio_config, final_path, timeout, debug_dir,
         )
+        if not sp_ok:
+            elapsed = time.monotonic() - t_start
+            return RenderResult(
+                ok=False, status="FAILED",
+                inputs_hash=global_hash,
+                segments_total=len(segments),
+                elapsed_sec=round(elapsed, 2),
+                errors=[f"SINGLE_PASS_FAIL: {sp_err}"],
+                warnings=gate.warnings,
+                patient_zero={"code": sp_err or "UNKNOWN", "detail": "single_pass"},
+            )
+        rendered, cached = len(segments), 0
+        mode_receipt: Dict[str, Any] = {
+            "render_cmd": sp_cmd,
+            "loudnorm_measured": measured,
+        }
+    else:
+        # --- APPLY: render segments ---
+        cache_dir = run_dir / "publish" / "render_cache"
+        receipts_dir = run_dir / "publish" / "seg_receipts"
 
-        sr = render_segment(
-            seg, run_dir, output_settings, overlays_index,
+        seg_results = render_segments(
+            segments, run_dir, output_settings, overlays_index,
             cache_dir, receipts_dir, debug_dir,
-            force=force_this,
+            force_all=force_all, force_segments=force_segments,
+            jobs=jobs, blob_store=blob_store,
+        )
+        seg_paths: List[Path] = []
+        rendered = sum(1 for sr in seg_results if sr and sr.ok and not sr.cached)
+        cached = sum(1 for sr in seg_results if sr and sr.ok and sr.cached)
+
+        for sr in seg_results:
+            if sr is None:
+                continue
+            if not sr.ok:
+                # Fail fast: first failure in timeline order is patient zero
+                elapsed = time.monotonic() - t_start
+                return RenderResult(
+                    ok=False, status="FAILED",
+                    inputs_hash=global_hash,
+                    segments_rendered=rendered,
+                    segments_cached=cached,
+                    segments_total=len(segments),
+                    elapsed_sec=round(elapsed, 2),
+                    errors=[f"SEGMENT_FAIL: {sr.seg_id} code={sr.error_code}"],
+                    warnings=gate.warnings + sr.warnings,
+                    patient_zero={"code": sr.error_code or "UNKNOWN", "detail": sr.seg_id},
+                )
+
+            seg_paths.append(Path(sr.output_path))
+
+        # --- Concat segments (kept in render_cache for audio-only edits) ---
+        video_noaudio = cache_dir / "video_noaudio.mp4"
+        concat_marker = cache_dir / "video_noaudio.json"
+        concat_cmd, concat_err, repaired = "render_cache", "", []
+        if plan.concat.action != NODE_REUSE or concat_cache_hash(cache_dir) != plan.concat.hash:
+            concat_marker.unlink(missing_ok=True)
+
+            def _rerender(ids: Set[str]) -> bool:
+                again = render_segments(
+                    segments, run_dir, output_settings, overlays_index,
+                    cache_dir, receipts_dir, debug_dir,
+                    force_segments=ids, jobs=jobs, blob_store=blob_store,
+                )
+                return all(sr is not None and sr.ok for sr in again)
+
+            concat_ok, concat_cmd, concat_err, repaired = concat_repairing_outliers(
+                [sr.seg_id for sr in seg_results if sr], seg_paths, video_noaudio,
+                output_settings, _rerender,
+            )
+            if not concat_ok:
+                elapsed = time.monotonic() - t_start
+                return RenderResult(
+                    ok=False, status="FAILED",
+                    inputs_hash=global_hash,
+                    segments_rendered=rendered,
+                    segments_cached=cached,
+                    segments_total=len(segments),
+                    elapsed_sec=round(elapsed, 2),
+                    errors=[f"CONCAT_FAIL: {concat_err}"],
+                    warnings=gate.warnings,
+                    patient_zero={"code": "CONCAT_FAIL", "detail": concat_err[:200]},
+                )
+            atomic_write_json(concat_marker, {"hash": plan.concat.hash, "at_utc": utc_now_iso()})
+
+        # --- Apply audio ---
+        audio_ok, audio_cmd, audio_err = apply_audio(
+            video_noaudio, audio_path, final_path, audio_config,
         )
-        seg_results.append(sr)
 
-        if not sr.ok:
-            # Fail fast
+        if not audio_ok:
             elapsed = time.monotonic() - t_start
             return RenderResult(
                 ok=False, status="FAILED",
@@ -1019,61 +1851,17 @@ def render(
                 segments_cached=cached,
                 segments_total=len(segments),
                 elapsed_sec=round(elapsed, 2),
-                errors=[f"SEGMENT_FAIL: {sr.seg_id} code={sr.error_code}"],
-                warnings=gate.warnings + sr.warnings,
-                patient_zero={"code": sr.error_code or "UNKNOWN", "detail": sr.seg_id},
+                errors=[f"AUDIO_MUX_FAIL: {audio_err}"],
+                warnings=gate.warnings,
+                patient_zero={"code": "AUDIO_MUX_FAIL", "detail": audio_err[:200]},
             )
 
-        seg_paths.append(Path(sr.output_path))
-        if sr.cached:
-            cached += 1
-        else:
-            rendered += 1
-
-    # --- Concat segments ---
-    video_noaudio = run_dir / "publish" / "video_noaudio.mp4"
-    concat_ok, concat_cmd, concat_err = concat_segments(
-        seg_paths, video_noaudio, output_settings,
-    )
-    if not concat_ok:
-        elapsed = time.monotonic() - t_start
-        return RenderResult(
-            ok=False, status="FAILED",
-            inputs_hash=global_hash,
-            segments_rendered=rendered,
-            segments_cached=cached,
-            segments_total=len(segments),
-            elapsed_sec=round(elapsed, 2),
-            errors=[f"CONCAT_FAIL: {concat_err}"],
-            warnings=gate.warnings,
-            patient_zero={"code": "CONCAT_FAIL", "detail": concat_err[:200]},
-        )
-
-    # --- Apply audio ---
-    audio_config = render_config.get("audio", {})
-    audio_ok, audio_cmd, audio_err = apply_audio(
-        video_noaudio, audio_path, final_path, audio_config,
-    )
-
-    # Clean up intermediate
-    try:
-        video_noaudio.unlink(missing_ok=True)
-    except OSError:
-        pass
-
-    if not audio_ok:
-        elapsed = time.monotonic() - t_start
-        return RenderResult(
-            ok=False, status="FAILED",
-            inputs_hash=global_hash,
-            segments_rendered=rendered,
-            segments_cached=cached,
-            segments_total=len(segments),
-            elapsed_sec=round(elapsed, 2),
-            errors=[f"AUDIO_MUX_FAIL: {audio_err}"],
-            warnings=gate.warnings,
-            patient_zero={"code": "AUDIO_MUX_FAIL", "detail": audio_err[:200]},
-        )
+        mode_receipt = {
+            "concat_cmd": concat_cmd,
+            "audio_cmd": audio_cmd,
+            "reencode_concat": "reencode" in concat_err,
+            "concat_repaired_segments": repaired,
+        }
 
     # --- Compute output stats ---
     output_sha1 = sha1_file(final_path)
@@ -1105,9 +1893,14 @@ def render(
         "segments_total": len(segments),
         "overlays_applied": ov_applied,
         "overlays_suppressed": ov_suppressed,
-        "concat_cmd": concat_cmd,
-        "audio_cmd": audio_cmd,
-        "reencode_concat": "reencode" in concat_err,
+        "mode": mode,
+        "encode_profile": output_settings.get("profile"),
+        **mode_receipt,
+        "graph": plan.graph_receipt(),
+        "plan": {
+            "nodes_run": [n.node_id for n in plan.to_render()],
+            "est_sec": plan.est_sec,
+        },
         "elapsed_sec": round(elapsed, 2),
         "warnings": gate.warnings,
     }
@@ -1127,6 +1920,7 @@ def render(
         r["rendered_at_utc"] = utc_now_iso()
         r["segments_rendered"] = rendered
         r["segments_cached"] = cached
+        r["mode"] = mode
         atomic_write_json(manifest_path, m)
 
     return RenderResult(
@@ -1155,11 +1949,15 @@ def main(argv: Optional[list] = None) -> int:
     ap = argparse.ArgumentParser(
         description="RayVault FFmpeg Render — segmented video assembler",
     )
-    ap.add_argument("--run-dir", required=True)
+    ap.add_argument("--run-dir")
     ap.add_argument(
         "--apply", action="store_true",
         help="Render video (default: dry-run validation only)",
     )
+    ap.add_argument(
+        "--explain", action="store_true",
+        help="Print the incremental render plan (invalidated nodes, reasons, est. cost) and exit",
+    )
     ap.add_argument(
         "--debug", action="store_true",
         help="Save intermediate artifacts on failure",
@@ -1173,8 +1971,51 @@ def main(argv: Optional[list] = None) -> int:
         default="",
         help="Re-render specific segments (comma-separated IDs, e.g. seg_001,seg_003)",
     )
+    ap.add_argument(
+        "--jobs", type=int, default=0,
+        help="Parallel segment renders (default: CPU cores / "
+             f"{FFMPEG_THREADS_PER_JOB} ffmpeg threads)",
+    )
+    ap.add_argument(
+        "--mode", choices=RENDER_MODES, default=RENDER_MODE_SEGMENTS,
+        help="segments: cached per-segment encodes + concat + audio mux (incremental); "
+             "single-pass: one filter graph, one encode (first renders)",
+    )
+    ap.add_argument(
+        "--profile", default="",
+        help=f"Encode profile: a tier ({'/'.join(TIERS)}) or a profile name "
+             "(default: render_config output settings)",
+    )
+    ap.add_argument(
+        "--quality-floor", type=float, default=None,
+        help="Minimum benched SSIM when --profile is a tier "
+             f"(default per tier: {QUALITY_FLOORS})",
+    )
+    ap.add_argument(
+        "--bench", action="store_true",
+        help="Benchmark encode profiles on this box and write the profile table",
+    )
+    ap.add_argument("--bench-source", default="", help="Reference clip for --bench (default: testsrc2)")
+    ap.add_argument("--bench-seconds", type=float, default=5.0)
+    ap.add_argument(
+        "--profile-table", default=str(default_profile_table()),
+        help="Bench results table (default: $RAYVAULT_ENCODE_PROFILES or state/encode_profiles.json)",
+    )
+    ap.add_argument(
+        "--blob-store", default=str(default_blob_root()),
+        help="Shared content-addressed segment store (default: $RAYVAULT_BLOB_ROOT or state/blobs)",
+    )
+    ap.add_argument(
+        "--no-blob-store", action="store_true",
+        help="Keep segments in the run's render_cache only",
+    )
     args = ap.parse_args(argv)
 
+    if args.bench:
+        return _bench_main(args)
+    if not args.run_dir:
+        ap.error("--run-dir is required (unless --bench)")
+
     run_dir = Path(args.run_dir).expanduser().resolve()
     if not run_dir.exists():
         print(f"Run dir not found: {run_dir}", file=sys.stderr)
@@ -1186,12 +2027,24 @@ def main(argv: Optional[list] = None) -> int:
 
     result = render(
         run_dir,
-        apply=args.apply,
+        apply=args.apply and not args.explain,
         debug=args.debug,
         force_all=args.force_all,
         force_segments=force_segments,
+        jobs=args.jobs or None,
+        blob_store=None if args.no_blob_store else BlobStore(Path(args.blob_store).expanduser()),
+        mode=args.mode,
+        profile=args.profile or None,
+        quality_floor=args.quality_floor,
+        profile_table=Path(args.profile_table).expanduser(),
     )
 
+    if args.explain and result.plan is not None:
+        print(f"ffmpeg_render [EXPLAIN]: {result.status}")
+        for line in result.plan.explain():
+            print(f"  {line}")
+        return 0
+
     mode = "APPLY" if args.apply else "DRY-RUN"
 
     if result.ok:
@@ -1239,5 +2092,41 @@ def main(argv: Optional[list] = None) -> int:
     return 0 if result.ok else (2 if result.status == "BLOCKED" else 1)
 
 
+def _bench_main(args: argparse.Namespace) -> int:
+    w, h, fps = 1920, 1080, 30
+    if args.run_dir:
+        try:
+            rc = read_json(Path(args.run_dir).expanduser() / "05_render_config.json")
+            out = rc.get("output", rc.get("canvas", {}))
+            w, h, fps = out.get("w", w), out.get("h", h), out.get("fps", fps)
+        except Exception:
+            pass
+    try:
+        table = bench_profiles(
+            Path(args.profile_table).expanduser(),
+            source=Path(args.bench_source).expanduser() if args.bench_source else None,
+            seconds=args.bench_seconds, w=w, h=h, fps=fps,
+        )
+    except Exception as e:
+        print(f"ffmpeg_render [BENCH]: FAILED {e}", file=sys.stderr)
+        return 1
+
+    print(f"ffmpeg_render [BENCH]: {w}x{h} {fps}fps, {args.bench_seconds:g}s reference")
+    for row in table["results"]:
+        if row.get("ok"):
+            ssim = row.get("ssim")
+            print(
+                f"  {row['profile']:<14} {row['fps']:>8.1f} fps  "
+                f"{row['bitrate_bps'] / 1e6:>7.2f} Mbps  "
+                f"ssim={ssim if ssim is None else round(ssim, 4)}"
+            )
+        else:
+            print(f"  {row['profile']:<14} skipped ({str(row.get('error', ''))[:60]})")
+    for tier, name in table["selected"].items():
+        print(f"  {tier}: {name}")
+    print(f"  Table: {args.profile_table}")
+    return 0
+
+
 if __name__ == "__main__":
     raise SystemExit(main())
@@ -0,0 +1,134 @@
+"""RayVault Frame Sampler — batched per-frame channel means in one ffmpeg pass.
+
+Pulls every requested timestamp through a single ffmpeg invocation:
+a `select` filter keeps the first frame at/after each timestamp, the frame
+is area-scaled to a thumbnail (channel means are preserved by area
+averaging), and a rawvideo rgb24 stream comes back on stdout. `showinfo`
+reports each selected frame's pts so results map back to the requested
+timestamps even when two timestamps land on the same frame.
+
+Used by:
+  - davinci_assembler.detect_black_frames (media-offline red detection)
+  - agent FRAME_SAMPLING job (payload.timestamps)
+
+Usage:
+    from rayvault.frame_sampler import sample_frame_means, red_ratio
+    means = sample_frame_means(video_path, [0.1, 5.0, 10.1])
+    ratios = [red_ratio(m) for m in means]
+"""
+
+from __future__ import annotations
+
+import re
+import subprocess
+from pathlib import Path
+from typing import List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+    _HAS_NUMPY = True
+except ImportError:
+    _HAS_NUMPY = False
+
+
+THUMB_W = 64
+THUMB_H = 36
+_PTS_TIME_RE = re.compile(r"\bpts_time:\s*([0-9.eE+-]+)")
+_PTS_EPS = 1e-3
+
+RGBMeans = Tuple[float, float, float]
+
+
+def _select_expr(timestamps: Sequence[float]) -> str:
+    """First frame at/after each timestamp (prev_t is NAN on frame 0)."""
+    terms = [f"gte(t,{t:.3f})*not(gte(prev_t,{t:.3f}))" for t in timestamps]
+    return "+".join(terms)
+
+
+def build_sampler_cmd(
+    video_path: Path,
+    timestamps: Sequence[float],
+    size: Tuple[int, int] = (THUMB_W, THUMB_H),
+) -> List[str]:
+    """Build the single-pass ffmpeg command for the given sorted timestamps."""
+    w, h = size
+    vf = (
+        f"select='{_select_expr(timestamps)}',"
+        f"scale={w}:{h}:flags=area,showinfo"
+    )
+    return [
+        "ffmpeg", "-hide_banner", "-nostdin",
+        "-i", str(video_path),
+        "-an", "-sn",
+        "-vf", vf,
+        "-vsync", "0",
+        "-f", "rawvideo", "-pix_fmt", "rgb24",
+        "-",
+    ]
+
+
+def _frame_means(data: bytes, n_frames: int, frame_bytes: int) -> List[RGBMeans]:
+    if _HAS_NUMPY:
+        arr = np.frombuffer(data[:n_frames * frame_bytes], dtype=np.uint8)
+        means = arr.reshape(n_frames, -1, 3).mean(axis=1)
+        return [tuple(float(v) for v in row) for row in means]
+    out: List[RGBMeans] = []
+    n_pixels = frame_bytes // 3
+    for i in range(n_frames):
+        frame = data[i * frame_bytes:(i + 1) * frame_bytes]
+        out.append((
+            sum(frame[0::3]) / n_pixels,
+            sum(frame[1::3]) / n_pixels,
+            sum(frame[2::3]) / n_pixels,
+        ))
+    return out
+
+
+def sample_frame_means(
+    video_path: Path,
+    timestamps: Sequence[float],
+    size: Tuple[int, int] = (THUMB_W, THUMB_H),
+    timeout: int = 600,
+) -> List[Optional[RGBMeans]]:
+    """Mean (R, G, B) of the frame at each timestamp, in input order.
+
+    One ffmpeg process for all timestamps. Entries are None for timestamps
+    past the end of the video or when ffmpeg fails.
+    """
+    if not timestamps:
+        return []
+    ordered = sorted(set(round(max(0.0, float(t)), 3) for t in timestamps))
+    try:
+        proc = subprocess.run(
+            build_sampler_cmd(video_path, ordered, size),
+            capture_output=True, timeout=timeout,
+        )
+    except Exception:
+        return [None] * len(timestamps)
+    if proc.returncode != 0:
+        return [None] * len(timestamps)
+
+    w, h = size
+    frame_bytes = w * h * 3
+    n_frames = len(proc.stdout) // frame_bytes
+    stderr = proc.stderr.decode("utf-8", errors="replace")
+    pts = [float(m.group(1)) for m in _PTS_TIME_RE.finditer(stderr)][:n_frames]
+    means = _frame_means(proc.stdout, len(pts), frame_bytes)
+
+    by_ts = {}
+    j = 0
+    for t in ordered:
+        while j < len(pts) and pts[j] < t - _PTS_EPS:
+            j += 1
+        by_ts[t] = means[j] if j < len(pts) else None
+    return [by_ts[round(max(0.0, float(t)), 3)] for t in timestamps]
+
+
+def red_ratio(means: Optional[RGBMeans]) -> Optional[float]:
+    """R / (R + G + B) for a frame's channel means (None passes through)."""
+    if means is None:
+        return None
+    total = sum(means)
+    if total == 0:
+        return 0.0
+    return means[0] / total
@@ -50,6 +50,15 @@ def sha1_file(path: Path) -> str:
     return h.hexdigest()
 
 
+def sha256_file(path: Path) -> str:
+    """Compute SHA-256 hex digest of a file (1 MB chunks)."""
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
 def sha1_text(s: str) -> str:
     """Compute SHA-1 hex digest of a UTF-8 string."""
     return hashlib.sha1(s.encode("utf-8")).hexdigest()
@@ -1,7 +1,8 @@
 """Global Learning Event Registry — cross-video queries and pattern detection.
 
 Provides the read-only query layer over learning events. Events are written
-by tools/learning_event.py; this module only reads.
+by tools/learning_event.py into its event store; this module only reads,
+and filters/groups through the store's indexes instead of scanning.
 
 Stdlib only.
 """
@@ -13,23 +14,19 @@ from collections import defaultdict
 from pathlib import Path
 
 from tools.lib.common import project_root
+from tools.learning_event import events_store
 
 
 EVENTS_PATH: Path = project_root() / "data" / "learning_events.json"
 REPORTS_DIR: Path = project_root() / "data" / "learning_reports"
 
 
+def _store(path: Path | None = None):
+    return events_store(path or EVENTS_PATH)
+
+
 def _load_all_events(path: Path | None = None) -> list[dict]:
-    p = path or EVENTS_PATH
-    if not p.is_file():
-        return []
-    try:
-        data = json.loads(p.read_text(encoding="utf-8"))
-        if isinstance(data, list):
-            return data
-    except (json.JSONDecodeError, OSError):
-        pass
-    return []
+    return _store(path).query()
 
 
 # ---------------------------------------------------------------------------
@@ -47,39 +44,22 @@ def query_events(
     _path: Path | None = None,
 ) -> list[dict]:
     """Cross-video event search with flexible filters."""
-    events = _load_all_events(_path)
-    result = []
-    for e in events:
-        if component and e.get("component") != component:
-            continue
-        if severity and e.get("severity") != severity:
-            continue
-        if video_id and e.get("video_id") != video_id:
-            continue
-        if status and e.get("status") != status:
-            continue
-        ts = e.get("timestamp", "")
-        if date_from and ts < date_from:
-            continue
-        if date_to and ts > date_to:
-            continue
-        result.append(e)
-    return result
+    return _store(_path).query(
+        component=component or None,
+        severity=severity or None,
+        video_id=video_id or None,
+        status=status or None,
+        since=date_from,
+        until=date_to,
+    )
 
 
 def get_patterns(*, min_count: int = 2, _path: Path | None = None) -> list[dict]:
     """Group events by component+root_cause and return recurring patterns."""
-    events = _load_all_events(_path)
-    groups: dict[tuple[str, str], list[dict]] = defaultdict(list)
-
-    for e in events:
-        key = (e.get("component", ""), e.get("root_cause", "")[:80])
-        groups[key].append(e)
-
+    store = _store(_path)
     patterns = []
-    for (component, root_cause), items in sorted(groups.items()):
-        if len(items) < min_count:
-            continue
+    for component, root_cause, _ in store.groups(min_count=min_count):
+        items = store.query(component=component, group_key=root_cause)
         patterns.append({
             "component": component,
             "root_cause": root_cause,
@@ -109,12 +89,7 @@ def get_agent_learnings(agent: str, *, _path: Path | None = None) -> list[dict]:
     }
 
     components = agent_components.get(agent, [agent])
-    events = _load_all_events(_path)
-
-    return [
-        e for e in events
-        if e.get("component", "") in components
-    ]
+    return _store(_path).query(component=components)
 
 
 def get_promotion_candidates(
@@ -126,8 +101,7 @@ def get_promotion_candidates(
 
     Groups events by root_cause and returns those exceeding threshold.
     """
-    events = _load_all_events(_path)
-    applied = [e for e in events if e.get("status") in ("applied", "verified")]
+    applied = _store(_path).query(status=("applied", "verified"))
 
     groups: dict[str, list[dict]] = defaultdict(list)
     for e in applied:
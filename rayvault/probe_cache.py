@@ -0,0 +1,242 @@
+"""RayVault Probe Cache — one ffprobe per media file version.
+
+Full ffprobe JSON (-show_format -show_streams) keyed on (path, size,
+mtime_ns). Results are held in memory for the process and persisted to a
+small SQLite table so later gates, and later processes, reuse them: a
+validation pass (final_validator, verify_output, check_duration,
+video_index_refresh) launches each file's ffprobe at most once. A file
+that is rewritten gets a new key and is probed again.
+
+Only successful probes are cached, and files modified within the last
+PROBE_RACY_SEC are not: a same-size rewrite inside one mtime tick would
+otherwise keep serving the old result.
+
+Disk cache: $RAYVAULT_PROBE_CACHE, else state/probe_cache.db. Set
+RAYVAULT_PROBE_CACHE=off for memory-only.
+
+Usage:
+    from rayvault.probe_cache import probe, probe_many, probe_duration
+    info = probe(Path("out.mp4"))               # ffprobe JSON or None
+    dur = probe_duration(Path("out.mp4"))       # seconds or None
+    infos = probe_many(paths, jobs=8)           # {path: JSON or None}
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+DEFAULT_PROBE_DB = Path("state/probe_cache.db")
+PROBE_TIMEOUT_SEC = 30
+PROBE_RACY_SEC = 1.0
+PROBE_JOBS = 4
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS probes (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    probe_json TEXT NOT NULL,
+    probed_at REAL NOT NULL
+);
+"""
+
+_Key = Tuple[str, int, int]
+
+
+def default_probe_db() -> Optional[Path]:
+    """RAYVAULT_PROBE_CACHE (None when "off"), else state/probe_cache.db."""
+    env = os.environ.get("RAYVAULT_PROBE_CACHE", "").strip()
+    if env.lower() in ("off", "0", "none"):
+        return None
+    if env:
+        return Path(env).expanduser()
+    return DEFAULT_PROBE_DB
+
+
+def run_ffprobe(path: Path, timeout: int = PROBE_TIMEOUT_SEC) -> Dict[str, Any]:
+    """Spawn ffprobe once, uncached.
+
+    Raises FileNotFoundError if ffprobe is not installed and
+    subprocess.CalledProcessError if it fails on the file.
+    """
+    cmd = [
+        "ffprobe", "-v", "error",
+        "-print_format", "json",
+        "-show_format", "-show_streams",
+        str(path),
+    ]
+    proc = subprocess.run(
+        cmd, capture_output=True, text=True, check=True, timeout=timeout,
+    )
+    return json.loads(proc.stdout or "{}")
+
+
+def format_duration(info: Optional[Dict[str, Any]]) -> Optional[float]:
+    """format.duration from ffprobe JSON, or None."""
+    try:
+        return float(info["format"]["duration"])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def format_bitrate(info: Optional[Dict[str, Any]]) -> int:
+    """format.bit_rate (bps) from ffprobe JSON, or 0."""
+    try:
+        return int(float(info["format"]["bit_rate"]))
+    except (KeyError, TypeError, ValueError):
+        return 0
+
+
+class ProbeCache:
+    """In-memory + SQLite cache of ffprobe JSON keyed on (path, size, mtime_ns)."""
+
+    def __init__(self, db_path: Optional[Path] = None):
+        self.db_path = db_path
+        self._mem: Dict[_Key, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        self.hits = 0
+        self.probes = 0
+
+    # --- Disk ---
+
+    def _conn(self, create: bool) -> Optional[sqlite3.Connection]:
+        """Open the disk cache lazily; never create it just to read."""
+        if self._db is not None or self.db_path is None:
+            return self._db
+        if not create and not self.db_path.exists():
+            return None
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        db = sqlite3.connect(str(self.db_path), timeout=30, check_same_thread=False)
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+        db.executescript(_SCHEMA)
+        db.commit()
+        self._db = db
+        return db
+
+    def _disk_get(self, key: _Key) -> Optional[Dict[str, Any]]:
+        try:
+            with self._lock:
+                db = self._conn(create=False)
+                if db is None:
+                    return None
+                row = db.execute(
+                    "SELECT probe_json FROM probes WHERE path = ? AND size = ? AND mtime_ns = ?",
+                    key,
+                ).fetchone()
+            return json.loads(row[0]) if row else None
+        except (sqlite3.Error, ValueError):
+            return None
+
+    def _disk_put(self, key: _Key, info: Dict[str, Any]) -> None:
+        try:
+            with self._lock:
+                db = self._conn(create=True)
+                if db is None:
+                    return
+                db.execute(
+                    "INSERT OR REPLACE INTO probes (path, size, mtime_ns, probe_json, probed_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (*key, json.dumps(info, separators=(",", ":")), time.time()),
+                )
+                db.commit()
+        except (sqlite3.Error, OSError):
+            pass
+
+    # --- Probe ---
+
+    @staticmethod
+    def _key(path: Path) -> Tuple[Optional[_Key], float]:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None, 0.0
+        return (str(Path(path).resolve()), st.st_size, st.st_mtime_ns), st.st_mtime
+
+    def probe(self, path: Path, check: bool = False) -> Optional[Dict[str, Any]]:
+        """ffprobe JSON for path, spawning ffprobe only on a cache miss.
+
+        Returns None when ffprobe fails; with check=True the error from
+        run_ffprobe (FileNotFoundError, CalledProcessError, ...) is raised
+        instead.
+        """
+        key, mtime = self._key(path)
+        if key is not None:
+            with self._lock:
+                info = self._mem.get(key)
+            if info is None:
+                info = self._disk_get(key)
+                if info is not None:
+                    with self._lock:
+                        self._mem[key] = info
+            if info is not None:
+                self.hits += 1
+                return info
+
+        self.probes += 1
+        try:
+            info = run_ffprobe(path)
+        except Exception:
+            if check:
+                raise
+            return None
+
+        if key is not None and time.time() - mtime > PROBE_RACY_SEC:
+            with self._lock:
+                self._mem[key] = info
+            self._disk_put(key, info)
+        return info
+
+    def probe_many(
+        self,
+        paths: Iterable[Path],
+        jobs: int = PROBE_JOBS,
+    ) -> Dict[Path, Optional[Dict[str, Any]]]:
+        """probe() a batch of files, cache misses on up to `jobs` threads."""
+        unique: List[Path] = list(dict.fromkeys(Path(p) for p in paths))
+        if len(unique) <= 1 or jobs <= 1:
+            return {p: self.probe(p) for p in unique}
+        with ThreadPoolExecutor(max_workers=jobs, thread_name_prefix="probe") as pool:
+            return dict(zip(unique, pool.map(self.probe, unique)))
+
+    def clear(self) -> None:
+        """Drop the in-memory layer (the disk cache is kept)."""
+        with self._lock:
+            self._mem.clear()
+
+
+_shared: Optional[ProbeCache] = None
+_shared_lock = threading.Lock()
+
+
+def shared_probe_cache() -> ProbeCache:
+    """Process-wide ProbeCache on default_probe_db()."""
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = ProbeCache(default_probe_db())
+        return _shared
+
+
+def probe(path: Path, check: bool = False) -> Optional[Dict[str, Any]]:
+    return shared_probe_cache().probe(path, check=check)
+
+
+def probe_many(
+    paths: Iterable[Path],
+    jobs: int = PROBE_JOBS,
+) -> Dict[Path, Optional[Dict[str, Any]]]:
+    return shared_probe_cache().probe_many(paths, jobs=jobs)
+
+
+def probe_duration(path: Path) -> Optional[float]:
+    return format_duration(probe(path))
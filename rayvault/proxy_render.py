@@ -0,0 +1,448 @@
+#!/usr/bin/env python3
+"""RayVault Proxy Render — fast low-res preview of the assembled cut.
+
+Gate reviews (Gate 2, Telegram asset review) need to see the cut, not the
+publish-quality encode. This renders the same timeline as ffmpeg_render —
+same visual modes, overlays burned in at scaled coords — at 540p with the
+draft encode profile (libx264 ultrafast), segments in parallel, plus one
+contact-sheet JPEG per segment.
+
+Proxy segments live in their own cache (publish/proxy/, blob store
+namespace "proxy_segments") keyed by the segment's final-render
+inputs_hash mixed with the proxy settings (size, profile, encode args), so
+a proxy is reused for exactly as long as the final segment it previews
+would be, at the same preview size. Audio is muxed without loudnorm.
+
+Outputs (publish/proxy/):
+    seg_XXX.mp4 / seg_XXX.json   proxy segment + receipt
+    sheets/seg_XXX.jpg           contact sheet (SHEET_FRAMES frames across)
+    video_proxy.mp4              concat + audio
+    proxy_receipt.json
+
+Usage:
+    python3 -m rayvault.proxy_render --run-dir state/runs/RUN_2026_02_14_A
+    python3 -m rayvault.proxy_render --run-dir state/runs/RUN_2026_02_14_A --jobs 8 --force
+
+Exit codes:
+    0: preview rendered (or cached)
+    1: runtime error (FFmpeg failure)
+    2: gate failure (missing inputs, temporal drift, etc.)
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from rayvault.blob_store import BlobStore, default_blob_root
+from rayvault.encode_profiles import PROFILES, apply_profile
+from rayvault.ffmpeg_render import (
+    apply_audio,
+    build_segment_cmd,
+    classify_ffmpeg_error,
+    compute_global_inputs_hash,
+    compute_segment_inputs_hash,
+    concat_segments,
+    default_render_jobs,
+    ffprobe_duration,
+    gate_essential_files,
+    output_settings_from_config,
+    validate_run_inputs,
+)
+from rayvault.io import atomic_write_json, read_json, sha1_text, utc_now_iso, wav_duration_seconds
+
+PROXY_HEIGHT = 540
+PROXY_PROFILE = "draft-x264"
+PROXY_THREADS_PER_JOB = 2
+PROXY_BLOB_NAMESPACE = "proxy_segments"
+SHEET_FRAMES = 4
+SHEET_THUMB_W = 320
+
+
+def proxy_output_settings(
+    output_settings: Dict[str, Any], height: int = PROXY_HEIGHT,
+) -> Dict[str, Any]:
+    """Output settings scaled to `height` (never up) with the draft profile."""
+    w, h = int(output_settings["w"]), int(output_settings["h"])
+    scale = min(1.0, height / h)
+    proxy = apply_profile(output_settings, PROFILES[PROXY_PROFILE])
+    proxy["w"] = max(2, round(w * scale / 2) * 2)
+    proxy["h"] = max(2, round(h * scale / 2) * 2)
+    proxy["proxy_scale"] = round(scale, 4)
+    return proxy
+
+
+def proxy_cache_key(final_hash: str, proxy_settings: Dict[str, Any]) -> str:
+    """Cache key for a proxy: the final-render hash plus the proxy settings."""
+    return sha1_text(f"{final_hash}|{json.dumps(proxy_settings, sort_keys=True)}")
+
+
+def build_contact_sheet_cmd(
+    video_path: Path,
+    out_path: Path,
+    duration: float,
+    frames: int = SHEET_FRAMES,
+    thumb_w: int = SHEET_THUMB_W,
+) -> List[str]:
+    """One JPEG of `frames` evenly spaced thumbnails side by side."""
+    rate = frames / max(duration, 0.1)
+    return [
+        "ffmpeg", "-y", "-hide_banner", "-nostdin",
+        "-i", str(video_path),
+        "-vf", f"fps={rate:.6f},scale={thumb_w}:-2,tile={frames}x1",
+        "-frames:v", "1", "-q:v", "4",
+        str(out_path),
+    ]
+
+
+# ---------------------------------------------------------------------------
+# Segments
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class ProxySegmentResult:
+    seg_id: str
+    ok: bool
+    cached: bool = False
+    inputs_hash: str = ""
+    video_path: Optional[str] = None
+    sheet_path: Optional[str] = None
+    duration_sec: float = 0.0
+    error_code: Optional[str] = None
+    cmdline: str = ""
+
+
+def _contact_sheet(video_path: Path, sheet_path: Path, duration: float) -> bool:
+    sheet_path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        proc = subprocess.run(
+            build_contact_sheet_cmd(video_path, sheet_path, duration),
+            capture_output=True, text=True, timeout=60,
+        )
+    except Exception:
+        return False
+    return proc.returncode == 0 and sheet_path.exists()
+
+
+def render_proxy_segment(
+    seg: Dict[str, Any],
+    run_dir: Path,
+    output_settings: Dict[str, Any],
+    proxy_settings: Dict[str, Any],
+    overlays_index: Dict[str, Any],
+    proxy_dir: Path,
+    force: bool = False,
+    threads: Optional[int] = None,
+    blob_store: Optional[BlobStore] = None,
+) -> ProxySegmentResult:
+    """Render (or reuse) one proxy segment and its contact sheet.
+
+    The cache key (inputs_hash) is the final-render inputs_hash (from
+    output_settings) mixed with proxy_settings via proxy_cache_key().
+    """
+    seg_id = seg.get("id", f"seg_{seg.get('rank', 0):03d}")
+    out_path = proxy_dir / f"{seg_id}.mp4"
+    receipt_path = proxy_dir / f"{seg_id}.json"
+    sheet_path = proxy_dir / "sheets" / f"{seg_id}.jpg"
+    inputs_hash = proxy_cache_key(
+        compute_segment_inputs_hash(seg, run_dir, overlays_index, output_settings),
+        proxy_settings,
+    )
+    expected = round(seg.get("t1", 0) - seg.get("t0", 0), 3)
+
+    if not force and out_path.exists() and receipt_path.exists():
+        try:
+            receipt = read_json(receipt_path)
+            if receipt.get("inputs_hash") == inputs_hash:
+                duration = receipt.get("duration_sec", expected)
+                if not sheet_path.exists():
+                    _contact_sheet(out_path, sheet_path, duration)
+                return ProxySegmentResult(
+                    seg_id=seg_id, ok=True, cached=True, inputs_hash=inputs_hash,
+                    video_path=str(out_path),
+                    sheet_path=str(sheet_path) if sheet_path.exists() else None,
+                    duration_sec=duration,
+                )
+        except Exception:
+            pass
+
+    cached = False
+    cmdline = "blob_store"
+    blob_sha = blob_store.get_key(PROXY_BLOB_NAMESPACE, inputs_hash) if blob_store and not force else None
+    proxy_dir.mkdir(parents=True, exist_ok=True)
+    out_path.unlink(missing_ok=True)
+    if blob_sha:
+        blob_store.materialize(blob_sha, out_path)
+        cached = True
+    else:
+        cmd = build_segment_cmd(
+            seg, run_dir, proxy_settings, overlays_index, out_path, threads=threads,
+        )
+        cmdline = " ".join(cmd)
+        try:
+            proc = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
+        except subprocess.TimeoutExpired:
+            return ProxySegmentResult(
+                seg_id=seg_id, ok=False, inputs_hash=inputs_hash,
+                error_code="TIMEOUT", cmdline=cmdline,
+            )
+        except Exception as e:
+            return ProxySegmentResult(
+                seg_id=seg_id, ok=False, inputs_hash=inputs_hash,
+                error_code=type(e).__name__, cmdline=cmdline,
+            )
+        if proc.returncode != 0 or not out_path.exists():
+            return ProxySegmentResult(
+                seg_id=seg_id, ok=False, inputs_hash=inputs_hash,
+                error_code=classify_ffmpeg_error(proc.stderr) if proc.returncode else "OUTPUT_MISSING",
+                cmdline=cmdline,
+            )
+        if blob_store is not None:
+            blob_sha = blob_store.put_file(out_path)
+            blob_store.set_key(PROXY_BLOB_NAMESPACE, inputs_hash, blob_sha)
+            blob_store.materialize(blob_sha, out_path)
+
+    duration = ffprobe_duration(out_path) or expected
+    sheet_ok = _contact_sheet(out_path, sheet_path, duration)
+    atomic_write_json(receipt_path, {
+        "segment_id": seg_id,
+        "inputs_hash": inputs_hash,
+        "created_at_utc": utc_now_iso(),
+        "cmdline": cmdline,
+        "duration_sec": round(duration, 3),
+        "sheet": sheet_path.name if sheet_ok else None,
+    })
+    return ProxySegmentResult(
+        seg_id=seg_id, ok=True, cached=cached, inputs_hash=inputs_hash,
+        video_path=str(out_path),
+        sheet_path=str(sheet_path) if sheet_ok else None,
+        duration_sec=duration, cmdline=cmdline,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Orchestration
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class ProxyResult:
+    ok: bool
+    status: str = "UNKNOWN"
+    inputs_hash: str = ""
+    segments_rendered: int = 0
+    segments_cached: int = 0
+    segments_total: int = 0
+    output_path: Optional[str] = None
+    sheets: List[str] = field(default_factory=list)
+    w: int = 0
+    h: int = 0
+    duration_sec: float = 0.0
+    elapsed_sec: float = 0.0
+    errors: List[str] = field(default_factory=list)
+    warnings: List[str] = field(default_factory=list)
+
+
+def render_proxy(
+    run_dir: Path,
+    jobs: Optional[int] = None,
+    force: bool = False,
+    blob_store: Optional[BlobStore] = None,
+    height: int = PROXY_HEIGHT,
+) -> ProxyResult:
+    """Render the proxy preview of a RayVault run dir.
+
+    Same input gates as ffmpeg_render.render(); a failing gate blocks the
+    preview just as it would block the final render.
+    """
+    run_dir = run_dir.resolve()
+    t_start = time.monotonic()
+
+    files_gate = gate_essential_files(run_dir)
+    if not files_gate.ok:
+        return ProxyResult(ok=False, status="BLOCKED", errors=files_gate.errors)
+
+    manifest = read_json(run_dir / "00_manifest.json")
+    render_config = read_json(run_dir / "05_render_config.json")
+    overlays_index_path = run_dir / "publish" / "overlays" / "overlays_index.json"
+    overlays_index = read_json(overlays_index_path)
+    audio_path = run_dir / "02_audio.wav"
+    audio_duration = wav_duration_seconds(audio_path)
+    if audio_duration is None:
+        return ProxyResult(
+            ok=False, status="BLOCKED",
+            errors=["UNREADABLE_AUDIO: cannot parse 02_audio.wav"],
+        )
+
+    output_settings = output_settings_from_config(render_config)
+    proxy_settings = proxy_output_settings(output_settings, height)
+    gate = validate_run_inputs(
+        run_dir, render_config, overlays_index, audio_duration, manifest,
+    )
+    if not gate.ok:
+        return ProxyResult(
+            ok=False, status="BLOCKED", errors=gate.errors, warnings=gate.warnings,
+        )
+
+    segments = render_config.get("segments", [])
+    proxy_dir = run_dir / "publish" / "proxy"
+    receipt_path = proxy_dir / "proxy_receipt.json"
+    final_path = proxy_dir / "video_proxy.mp4"
+    seg_hashes = [
+        proxy_cache_key(
+            compute_segment_inputs_hash(seg, run_dir, overlays_index, output_settings),
+            proxy_settings,
+        )
+        for seg in segments
+    ]
+    global_hash = compute_global_inputs_hash(
+        run_dir / "05_render_config.json", audio_path, overlays_index_path, seg_hashes,
+    )
+    base = dict(
+        inputs_hash=global_hash, segments_total=len(segments),
+        w=proxy_settings["w"], h=proxy_settings["h"], warnings=gate.warnings,
+    )
+
+    if not force and receipt_path.exists() and final_path.exists():
+        try:
+            existing = read_json(receipt_path)
+            if existing.get("inputs_hash") == global_hash:
+                return ProxyResult(
+                    ok=True, status="PROXY_CACHED", **base,
+                    segments_cached=len(segments),
+                    output_path=str(final_path),
+                    sheets=[str(proxy_dir / "sheets" / s) for s in existing.get("sheets", [])],
+                    duration_sec=existing.get("duration_sec", 0.0),
+                )
+        except Exception:
+            pass
+
+    jobs = max(1, jobs if jobs is not None else default_render_jobs(PROXY_THREADS_PER_JOB))
+    with ThreadPoolExecutor(max_workers=jobs, thread_name_prefix="proxy") as pool:
+        results = list(pool.map(
+            lambda seg: render_proxy_segment(
+                seg, run_dir, output_settings, proxy_settings, overlays_index,
+                proxy_dir, force=force, threads=PROXY_THREADS_PER_JOB,
+                blob_store=blob_store,
+            ),
+            segments,
+        ))
+
+    rendered = sum(1 for r in results if r.ok and not r.cached)
+    cached = sum(1 for r in results if r.ok and r.cached)
+    failed = next((r for r in results if not r.ok), None)
+    if failed is not None:
+        return ProxyResult(
+            ok=False, status="FAILED", **base,
+            segments_rendered=rendered, segments_cached=cached,
+            elapsed_sec=round(time.monotonic() - t_start, 2),
+            errors=[f"SEGMENT_FAIL: {failed.seg_id} code={failed.error_code}"],
+        )
+
+    video_noaudio = proxy_dir / "video_noaudio.mp4"
+    concat_ok, _, concat_err = concat_segments(
+        [Path(r.video_path) for r in results], video_noaudio, proxy_settings,
+    )
+    if not concat_ok:
+        return ProxyResult(
+            ok=False, status="FAILED", **base,
+            segments_rendered=rendered, segments_cached=cached,
+            elapsed_sec=round(time.monotonic() - t_start, 2),
+            errors=[f"CONCAT_FAIL: {concat_err}"],
+        )
+    audio_ok, _, audio_err = apply_audio(video_noaudio, audio_path, final_path, {})
+    video_noaudio.unlink(missing_ok=True)
+    if not audio_ok:
+        return ProxyResult(
+            ok=False, status="FAILED", **base,
+            segments_rendered=rendered, segments_cached=cached,
+            elapsed_sec=round(time.monotonic() - t_start, 2),
+            errors=[f"AUDIO_MUX_FAIL: {audio_err}"],
+        )
+
+    sheets = [r.sheet_path for r in results if r.sheet_path]
+    duration = ffprobe_duration(final_path) or audio_duration
+    elapsed = round(time.monotonic() - t_start, 2)
+    atomic_write_json(receipt_path, {
+        "at_utc": utc_now_iso(),
+        "inputs_hash": global_hash,
+        "profile": PROXY_PROFILE,
+        "w": proxy_settings["w"],
+        "h": proxy_settings["h"],
+        "duration_sec": round(duration, 3),
+        "output_bytes": final_path.stat().st_size,
+        "segments_rendered": rendered,
+        "segments_cached": cached,
+        "segments_total": len(segments),
+        "sheets": [Path(s).name for s in sheets],
+        "elapsed_sec": elapsed,
+    })
+    return ProxyResult(
+        ok=True, status="PROXY_RENDERED", **base,
+        segments_rendered=rendered, segments_cached=cached,
+        output_path=str(final_path), sheets=sheets,
+        duration_sec=duration, elapsed_sec=elapsed,
+    )
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+
+def main(argv: Optional[list] = None) -> int:
+    ap = argparse.ArgumentParser(
+        description="RayVault Proxy Render — low-res preview for gate reviews",
+    )
+    ap.add_argument("--run-dir", required=True)
+    ap.add_argument("--jobs", type=int, default=0, help="Parallel proxy segment encodes (default: auto)")
+    ap.add_argument("--height", type=int, default=PROXY_HEIGHT)
+    ap.add_argument("--force", action="store_true", help="Ignore the proxy cache")
+    ap.add_argument(
+        "--blob-store", default=str(default_blob_root()),
+        help="Shared content-addressed store (default: $RAYVAULT_BLOB_ROOT or state/blobs)",
+    )
+    ap.add_argument("--no-blob-store", action="store_true")
+    args = ap.parse_args(argv)
+
+    run_dir = Path(args.run_dir).expanduser().resolve()
+    if not run_dir.exists():
+        print(f"Run dir not found: {run_dir}", file=sys.stderr)
+        return 2
+
+    result = render_proxy(
+        run_dir,
+        jobs=args.jobs or None,
+        force=args.force,
+        blob_store=None if args.no_blob_store else BlobStore(Path(args.blob_store).expanduser()),
+        height=args.height,
+    )
+    if result.ok:
+        print(f"proxy_render: {result.status}")
+        print(
+            f"  Segments: {result.segments_total} "
+            f"(rendered={result.segments_rendered} cached={result.segments_cached})"
+        )
+        print(f"  Output: {result.w}x{result.h} {PROXY_PROFILE}, {result.duration_sec:.1f}s")
+        print(f"  File: {result.output_path}")
+        print(f"  Contact sheets: {len(result.sheets)}")
+        print(f"  Time: {result.elapsed_sec:.1f}s")
+    else:
+        print(f"proxy_render: {result.status}", file=sys.stderr)
+        for err in result.errors:
+            print(f"  ERROR: {err}", file=sys.stderr)
+    for w in result.warnings:
+        print(f"  WARN: {w}")
+    return 0 if result.ok else (2 if result.status == "BLOCKED" else 1)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
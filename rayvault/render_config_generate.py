@@ -21,10 +21,12 @@ from __future__ import annotations
 import argparse
 import json
 import os
+import re
 import sys
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
+from rayvault.alignment import AlignmentIndex, alignment_path_for, ensure_alignment, script_words
 from rayvault.io import atomic_write_json, read_json, sha1_file, utc_now_iso, wav_duration_seconds
 
 # ---------------------------------------------------------------------------
@@ -164,41 +166,74 @@ def resolve_visual_mode(
 # ---------------------------------------------------------------------------
 
 
+def aligned_section_cuts(
+    alignment: AlignmentIndex,
+    script_text: str,
+    n_products: int,
+) -> Optional[List[float]]:
+    """Cut points intro | products | outro from the alignment index.
+
+    Applies when 01_script.txt has one paragraph per section (intro, each
+    product, outro), which is how the script is exported. Returns None
+    otherwise.
+    """
+    paragraphs = [p for p in re.split(r"\n\s*\n", script_text) if p.strip()]
+    if n_products <= 0 or len(paragraphs) != n_products + 2:
+        return None
+    return alignment.boundaries_for_word_counts(
+        [len(script_words(p)) for p in paragraphs]
+    )
+
+
 def generate_timeline(
     product_visuals: List[Dict[str, Any]],
     audio_duration: float,
+    *,
+    alignment: Optional[AlignmentIndex] = None,
+    script_text: str = "",
 ) -> List[Dict[str, Any]]:
-    """Build normalized timeline segments."""
+    """Build normalized timeline segments.
+
+    With an alignment index, section boundaries come from where each
+    script paragraph is actually spoken; if the script cannot be split by
+    section, the fixed-duration cuts are snapped onto the nearest pause.
+    """
     total = len(product_visuals)
-    remaining = max(6.0, audio_duration - T_INTRO - T_OUTRO)
-    per_product = clamp(
-        remaining / max(1, total),
-        T_PER_PRODUCT_MIN,
-        T_PER_PRODUCT_MAX,
-    ) if total > 0 else T_PER_PRODUCT_DEFAULT
+    cuts = aligned_section_cuts(alignment, script_text, total) if alignment else None
+    if cuts is None:
+        remaining = max(6.0, audio_duration - T_INTRO - T_OUTRO)
+        per_product = clamp(
+            remaining / max(1, total),
+            T_PER_PRODUCT_MIN,
+            T_PER_PRODUCT_MAX,
+        ) if total > 0 else T_PER_PRODUCT_DEFAULT
+        cuts = [0.0, T_INTRO]
+        for _ in product_visuals:
+            cuts.append(cuts[-1] + per_product)
+        cuts.append(cuts[-1] + T_OUTRO)
+        if alignment is not None:
+            for i in range(1, len(cuts) - 1):
+                cuts[i] = max(cuts[i - 1], alignment.snap(cuts[i]))
 
     fps = CANVAS_DEFAULTS["fps"]
     segments: List[Dict[str, Any]] = []
-    seg_idx = 0
-    t = 0.0
+
+    def _span(i: int) -> Tuple[float, float]:
+        return round(cuts[i], 3), round(cuts[i + 1], 3)
 
     # Intro
-    t0 = round(t, 3)
-    t1 = round(t + T_INTRO, 3)
+    t0, t1 = _span(0)
     segments.append({
-        "id": f"seg_{seg_idx:03d}",
+        "id": "seg_000",
         "type": "intro",
         "t0": t0,
         "t1": t1,
         "frames": round((t1 - t0) * fps),
     })
-    t += T_INTRO
-    seg_idx += 1
 
     # Product segments
-    for p in product_visuals:
-        t0 = round(t, 3)
-        t1 = round(t + per_product, 3)
+    for seg_idx, p in enumerate(product_visuals, 1):
+        t0, t1 = _span(seg_idx)
         seg: Dict[str, Any] = {
             "id": f"seg_{seg_idx:03d}",
             "type": "product",
@@ -212,12 +247,10 @@ def generate_timeline(
         if p.get("title"):
             seg["title"] = p["title"][:60]
         segments.append(seg)
-        t += per_product
-        seg_idx += 1
 
     # Outro
-    t0 = round(t, 3)
-    t1 = round(t + T_OUTRO, 3)
+    seg_idx = total + 1
+    t0, t1 = _span(seg_idx)
     segments.append({
         "id": f"seg_{seg_idx:03d}",
         "type": "outro",
@@ -335,8 +368,16 @@ def generate_render_config(
         raise FileNotFoundError(
             f"Audio required but missing/unreadable: {audio_path}"
         )
+    alignment: Optional[AlignmentIndex] = None
+    timing_source = "wav"
     if audio_duration is None:
         audio_duration = estimate_duration_from_words(script_path)
+        timing_source = "estimate"
+    else:
+        # Word timings from the real track (built once, cached next to it)
+        alignment = ensure_alignment(audio_path, script_path.read_text(encoding="utf-8"))
+        if alignment is not None:
+            timing_source = f"alignment:{alignment.source}"
 
     # Load products
     items: List[Dict[str, Any]] = []
@@ -395,7 +436,12 @@ def generate_render_config(
     needs_manual_review = truth_count < min_truth_products
 
     # Build timeline
-    segments = generate_timeline(product_visuals, audio_duration)
+    segments = generate_timeline(
+        product_visuals,
+        audio_duration,
+        alignment=alignment,
+        script_text=script_path.read_text(encoding="utf-8") if alignment else "",
+    )
 
     # Validate pacing
     pacing = validate_pacing(segments)
@@ -409,6 +455,11 @@ def generate_render_config(
         "audio": {
             "path": "02_audio.wav",
             "duration_sec": round(audio_duration, 3),
+            "timing_source": timing_source,
+            **(
+                {"alignment_path": alignment_path_for(audio_path).name}
+                if alignment else {}
+            ),
             **AUDIO_DEFAULTS,
         },
         "ray": RAY_DEFAULTS.copy(),
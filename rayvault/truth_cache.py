@@ -12,7 +12,21 @@ Layout:
         source_images/
             01_main.jpg|png|webp
             02_alt.jpg ...
-        hashes.json              (sha1 per image, sha256 for metadata)
+        hashes.json              (sha1 + sha256 per image, sha256 for metadata)
+    state/library/index.db       (per-ASIN freshness, meta, image listing)
+
+Images are stored once in the content-addressed blob store
+(<library>/blobs, or $RAYVAULT_BLOB_ROOT) and hardlinked into the
+library and into runs, so the same picture across ASINs or runs costs
+no extra disk.
+
+The index (SQLite) mirrors each ASIN's cache_info, verified metadata and
+image listing, keyed by a stat signature of those files. Reads use the
+index row when the signature still matches, so hot paths skip re-reading
+JSON, re-hashing metadata and listing source_images/; anything edited
+outside TruthCache changes the signature and is re-read and re-verified.
+needs_refresh_batch() fetches its rows in one query and applies the same
+signature check per ASIN; stats() answers from the index alone.
 
 Cache status:
     VALID    — all data present and within TTL
@@ -34,12 +48,15 @@ import hashlib
 import json
 import os
 import shutil
+import sqlite3
+import threading
 import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
+from rayvault.blob_store import BlobStore, default_blob_root
 from rayvault.io import atomic_write_json, read_json, sha1_file, utc_now_iso
 
 
@@ -94,6 +111,121 @@ class CachePolicy:
     ttl_jitter_sec: int = 2 * 3600  # +/- 2h jitter to avoid sync spikes
 
 
+# ---------------------------------------------------------------------------
+# Library index
+# ---------------------------------------------------------------------------
+
+# Rows recorded less than this long after their files were written are not
+# trusted: a same-size edit within one mtime tick would keep the signature.
+# Rows for files this TruthCache wrote itself are exempt while the signature
+# still matches what it recorded.
+INDEX_RACY_SEC = 1.0
+
+_INDEX_SCHEMA = """
+CREATE TABLE IF NOT EXISTS asins (
+    asin TEXT PRIMARY KEY,
+    sig TEXT NOT NULL,
+    recorded_at REAL NOT NULL,
+    status TEXT NOT NULL DEFAULT '',
+    meta_fetched_at TEXT NOT NULL DEFAULT '',
+    images_fetched_at TEXT NOT NULL DEFAULT '',
+    last_used TEXT NOT NULL DEFAULT '',
+    has_meta INTEGER NOT NULL DEFAULT 0,
+    has_images INTEGER NOT NULL DEFAULT 0,
+    disk_bytes INTEGER NOT NULL DEFAULT 0,
+    info_json TEXT NOT NULL,
+    meta_json TEXT,
+    images_json TEXT
+);
+CREATE INDEX IF NOT EXISTS ix_asins_last_used ON asins(last_used);
+"""
+
+_BATCH_COLUMNS = (
+    "asin", "sig", "recorded_at",
+    "status", "meta_fetched_at", "images_fetched_at", "has_meta", "has_images",
+)
+
+_USAGE_COLUMNS = (
+    "status", "last_used", "meta_fetched_at", "images_fetched_at", "disk_bytes",
+)
+
+
+class LibraryIndex:
+    """SQLite (WAL) table of per-ASIN cache state at <library>/index.db."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.existed = path.exists()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(str(path), timeout=30, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(_INDEX_SCHEMA)
+        self._db.commit()
+
+    def get(self, asin: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            cur = self._db.execute("SELECT * FROM asins WHERE asin = ?", (asin,))
+            row = cur.fetchone()
+            if row is None:
+                return None
+            return dict(zip([c[0] for c in cur.description], row))
+
+    def get_many(self, asins: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """Freshness columns for many ASINs (no JSON decoding)."""
+        keys = list(dict.fromkeys(asins))
+        out: Dict[str, Dict[str, Any]] = {}
+        cols = ", ".join(_BATCH_COLUMNS)
+        with self._lock:
+            for i in range(0, len(keys), 500):
+                chunk = keys[i:i + 500]
+                rows = self._db.execute(
+                    f"SELECT {cols} FROM asins WHERE asin IN ({', '.join('?' * len(chunk))})",
+                    chunk,
+                ).fetchall()
+                for row in rows:
+                    out[row[0]] = dict(zip(_BATCH_COLUMNS, row))
+        return out
+
+    def put(self, asin: str, row: Dict[str, Any]) -> None:
+        cols = ["asin", *row]
+        with self._lock:
+            self._db.execute(
+                f"INSERT OR REPLACE INTO asins ({', '.join(cols)}) "
+                f"VALUES ({', '.join('?' * len(cols))})",
+                [asin, *row.values()],
+            )
+            self._db.commit()
+
+    def delete(self, asin: str) -> None:
+        with self._lock:
+            self._db.execute("DELETE FROM asins WHERE asin = ?", (asin,))
+            self._db.commit()
+
+    def usage(self) -> Dict[str, Dict[str, Any]]:
+        """Signature, activity and size columns for every indexed ASIN."""
+        cols = ("asin", "sig", "recorded_at", *_USAGE_COLUMNS)
+        with self._lock:
+            rows = self._db.execute(f"SELECT {', '.join(cols)} FROM asins").fetchall()
+        return {r[0]: dict(zip(cols, r)) for r in rows}
+
+    def asins(self) -> List[str]:
+        with self._lock:
+            return [r[0] for r in self._db.execute("SELECT asin FROM asins ORDER BY asin")]
+
+    def totals(self) -> Tuple[int, int]:
+        with self._lock:
+            n, size = self._db.execute(
+                "SELECT COUNT(*), COALESCE(SUM(disk_bytes), 0) FROM asins"
+            ).fetchone()
+        return int(n), int(size)
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+
 # ---------------------------------------------------------------------------
 # Truth Cache
 # ---------------------------------------------------------------------------
@@ -106,9 +238,16 @@ class TruthCache:
         self,
         library_root: Path,
         policy: Optional[CachePolicy] = None,
+        blob_store: Optional[BlobStore] = None,
     ):
         self.root = library_root.resolve()
         self.policy = policy or CachePolicy()
+        self.blobs = blob_store or BlobStore(default_blob_root(self.root / "blobs"))
+        self.index = LibraryIndex(self.root / "index.db")
+        self._written: Dict[str, str] = {}  # asin -> sig of our own last write
+        if not self.index.existed:
+            # First open of an existing library: index what is already there
+            self.reindex()
 
     def asin_dir(self, asin: str) -> Path:
         return self.root / "products" / asin
@@ -139,11 +278,7 @@ class TruthCache:
             return False
         return (time.time() - t) <= ttl
 
-    def needs_refresh(self, asin: str) -> Dict[str, Any]:
-        """Check if cached data for an ASIN needs refreshing."""
-        cached = self.get_cached(asin)
-        info = cached.get("cache_info", {})
-
+    def _need(self, info: Dict[str, Any], has_meta: bool, has_images: bool) -> Dict[str, Any]:
         # Broken cache always needs full refresh
         if info.get("status") == CACHE_BROKEN:
             return {
@@ -164,8 +299,6 @@ class TruthCache:
         )
 
         # Derive status
-        has_meta = bool(cached.get("meta"))
-        has_images = bool(cached.get("images"))
         if has_meta and meta_fresh and has_images and imgs_fresh:
             status = CACHE_VALID
         elif has_meta or has_images:
@@ -183,14 +316,214 @@ class TruthCache:
             "status": status,
         }
 
+    def needs_refresh(self, asin: str) -> Dict[str, Any]:
+        """Check if cached data for an ASIN needs refreshing."""
+        cached = self.get_cached(asin)
+        return self._need(
+            cached.get("cache_info", {}),
+            bool(cached.get("meta")),
+            bool(cached.get("images")),
+        )
+
+    def needs_refresh_batch(self, asins: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """needs_refresh() for many ASINs, answered from the library index.
+
+        Rows come from one index query and are trusted only while their
+        stat signature matches, as in get_cached(); unseen or changed
+        ASINs fall back to needs_refresh(), which re-reads and re-indexes.
+        """
+        asins = list(dict.fromkeys(asins))
+        rows = self.index.get_many(asins)
+        out: Dict[str, Dict[str, Any]] = {}
+        for asin in asins:
+            row = self._fresh_row(asin, rows.get(asin))
+            if row is None:
+                out[asin] = self.needs_refresh(asin)
+                continue
+            info = {
+                "status": row["status"],
+                "meta_fetched_at_utc": row["meta_fetched_at"],
+                "images_fetched_at_utc": row["images_fetched_at"],
+            }
+            out[asin] = self._need(info, bool(row["has_meta"]), bool(row["has_images"]))
+        return out
+
+    # --- Index ---
+
+    def _sig(self, asin: str) -> Tuple[str, float]:
+        """Stat signature of cache_info, metadata and the image dir, plus newest mtime."""
+        parts = []
+        newest = 0.0
+        for p in (self.cache_info_path(asin), self.meta_path(asin), self.images_dir(asin)):
+            try:
+                st = os.stat(p)
+            except OSError:
+                parts.append("-")
+                continue
+            parts.append(f"{st.st_ino}:{st.st_size}:{st.st_mtime_ns}")
+            newest = max(newest, st.st_mtime)
+        return "|".join(parts), newest
+
+    def _trusted(self, asin: str, row: Dict[str, Any], sig: str, newest: float) -> bool:
+        if row["sig"] != sig:
+            return False
+        return newest < row["recorded_at"] - INDEX_RACY_SEC or self._written.get(asin) == sig
+
+    def _fresh_row(
+        self, asin: str, row: Optional[Dict[str, Any]] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Index row for asin (or the given row) if it still describes the files on disk."""
+        if row is None:
+            row = self.index.get(asin)
+        if row is None:
+            return None
+        sig, newest = self._sig(asin)
+        return row if self._trusted(asin, row, sig, newest) else None
+
+    def _record(self, asin: str, cached: Dict[str, Any], *, own_write: bool = False) -> None:
+        """Store a get_cached()-shaped result as the index row for asin.
+
+        own_write: the files were just written by this TruthCache, so the
+        row is trusted inside the INDEX_RACY_SEC window.
+        """
+        info = cached.get("cache_info", {})
+        imgs_d = self.images_dir(asin)
+        if "images" in cached:
+            images: Optional[List[str]] = [p.name for p in cached["images"]]
+        elif imgs_d.is_dir():
+            images = sorted(f.name for f in imgs_d.iterdir() if f.is_file())
+        else:
+            images = None
+        disk = info.get("disk_bytes")
+        if not isinstance(disk, int):
+            disk = du_bytes(self.asin_dir(asin))
+        elif self.has_approved_broll(asin):
+            disk += self.approved_broll_path(asin).stat().st_size
+        sig, _ = self._sig(asin)
+        if own_write:
+            self._written[asin] = sig
+        else:
+            self._written.pop(asin, None)
+        broken = info.get("status") == CACHE_BROKEN
+        meta = None if broken else cached.get("meta")
+        self.index.put(asin, {
+            "sig": sig,
+            "recorded_at": time.time(),
+            "status": str(info.get("status", "")),
+            "meta_fetched_at": str(info.get("meta_fetched_at_utc") or ""),
+            "images_fetched_at": str(info.get("images_fetched_at_utc") or ""),
+            "last_used": str(info.get("last_used_utc") or ""),
+            "has_meta": int(bool(meta)),
+            "has_images": int(bool(images) and not broken),
+            "disk_bytes": disk,
+            "info_json": json.dumps(info, ensure_ascii=False),
+            "meta_json": json.dumps(meta, ensure_ascii=False) if meta is not None else None,
+            "images_json": json.dumps(images) if images is not None else None,
+        })
+
+    def _refresh_index(self, asin: str, *, own_write: bool = False) -> None:
+        if self.asin_dir(asin).exists():
+            self._record(asin, self._read_cached(asin), own_write=own_write)
+        else:
+            self._written.pop(asin, None)
+            self.index.delete(asin)
+
+    def usage(self) -> List[Dict[str, Any]]:
+        """Per-ASIN status, activity timestamps and disk_bytes for the library.
+
+        One directory listing plus a stat signature per ASIN: rows whose
+        files are unchanged come straight from the index (disk_bytes is not
+        recomputed), changed or unseen ASINs are re-read and re-indexed, and
+        rows for vanished ASINs are dropped. ASINs whose files cannot be
+        read are left out.
+        """
+        rows = self.index.usage()
+        products_dir = self.root / "products"
+        out: List[Dict[str, Any]] = []
+        seen = set()
+        if products_dir.is_dir():
+            for d in sorted(products_dir.iterdir()):
+                if not d.is_dir() or d.name.startswith("."):
+                    continue
+                asin = d.name
+                seen.add(asin)
+                row = rows.get(asin)
+                sig, newest = self._sig(asin)
+                if row is None or not self._trusted(asin, row, sig, newest):
+                    try:
+                        self._refresh_index(asin)
+                    except Exception:
+                        continue
+                    row = self.index.get(asin)
+                    if row is None:
+                        continue
+                out.append({"asin": asin, **{k: row[k] for k in _USAGE_COLUMNS}})
+        for asin in rows:
+            if asin not in seen:
+                self.index.delete(asin)
+        return out
+
+    def evict(self, asin: str) -> int:
+        """Delete an ASIN from the library and the index. Returns bytes freed.
+
+        Image blobs lose their library reference and are reclaimed by the
+        blob store's gc() once no other holder remains (cache_prune runs
+        it after applying evictions).
+        """
+        row = self.index.get(asin)
+        freed = int(row["disk_bytes"]) if row else du_bytes(self.asin_dir(asin))
+        shutil.rmtree(self.asin_dir(asin), ignore_errors=True)
+        self.index.delete(asin)
+        return freed
+
+    def reindex(self) -> int:
+        """Rebuild index rows from the library tree. Returns ASINs indexed."""
+        products_dir = self.root / "products"
+        seen = set()
+        if products_dir.is_dir():
+            for d in sorted(products_dir.iterdir()):
+                if not d.is_dir() or d.name.startswith("."):
+                    continue
+                try:
+                    self._refresh_index(d.name)
+                except Exception:
+                    continue
+                seen.add(d.name)
+        for asin in self.index.asins():
+            if asin not in seen:
+                self.index.delete(asin)
+        return len(seen)
+
     # --- Read ---
 
     def get_cached(self, asin: str) -> Dict[str, Any]:
         """Get cached data for an ASIN. Returns empty dict on miss.
 
         Verifies metadata SHA256 integrity if stored. On mismatch,
-        marks cache as broken and excludes meta from result.
+        marks cache as broken and excludes meta from result. Served from
+        the library index while the files are unchanged since last check.
         """
+        if not self.asin_dir(asin).exists():
+            if self.index.get(asin) is not None:
+                self.index.delete(asin)
+            return {}
+        row = self._fresh_row(asin)
+        if row is not None:
+            out: Dict[str, Any] = {"cache_info": json.loads(row["info_json"])}
+            if row["status"] == CACHE_BROKEN:
+                return out
+            if row["meta_json"] is not None:
+                out["meta"] = json.loads(row["meta_json"])
+            if row["images_json"] is not None:
+                imgs_d = self.images_dir(asin)
+                out["images"] = [imgs_d / n for n in json.loads(row["images_json"])]
+            return out
+        out = self._read_cached(asin)
+        self._record(asin, out)
+        return out
+
+    def _read_cached(self, asin: str) -> Dict[str, Any]:
+        """get_cached() straight from the files (no index)."""
         d = self.asin_dir(asin)
         if not d.exists():
             return {}
@@ -231,6 +564,9 @@ class TruthCache:
 
     def has_main_image(self, asin: str) -> bool:
         """Check if 01_main.* exists in cache."""
+        row = self._fresh_row(asin)
+        if row is not None and row["images_json"] is not None:
+            return any(n.startswith("01_main") for n in json.loads(row["images_json"]))
         imgs = self.images_dir(asin)
         if not imgs.is_dir():
             return False
@@ -256,6 +592,7 @@ class TruthCache:
         info["broken_reason"] = reason
         info["broken_at_utc"] = utc_now_iso()
         atomic_write_json(self.cache_info_path(asin), info)
+        self._record(asin, {"cache_info": info}, own_write=True)
 
     def verify_integrity(self, asin: str) -> Dict[str, Any]:
         """Check integrity of cached data for an ASIN.
@@ -356,8 +693,12 @@ class TruthCache:
             if not dest.exists():
                 shutil.copy2(str(p), str(dest))
             h = sha1_file(dest)
+            sha = self.blobs.put_file(dest)
+            # Library images are never edited in place: share the blob
+            self.blobs.materialize(sha, dest)
             images_hashes[dest.name] = {
                 "sha1": h,
+                "sha256": sha,
                 "bytes": dest.stat().st_size,
             }
             stored.append(dest)
@@ -388,6 +729,7 @@ class TruthCache:
             info["http_status_last"] = http_status
         info["disk_bytes"] = du_bytes(d)
         atomic_write_json(self.cache_info_path(asin), info)
+        self._refresh_index(asin, own_write=True)
 
         return {
             "ok": True,
@@ -403,7 +745,10 @@ class TruthCache:
         run_product_dir: Path,
         mode: Optional[str] = None,
     ) -> Dict[str, Any]:
-        """Copy or symlink cached assets into a run's product directory.
+        """Link, copy or symlink cached assets into a run's product directory.
+
+        "copy" materializes from the blob store: a hardlink (reflink or real
+        copy across filesystems), so runs share the library's bytes.
 
         Args:
             asin: Amazon ASIN
@@ -425,6 +770,12 @@ class TruthCache:
 
         copied = 0
         if cached.get("images"):
+            known: Dict[str, Any] = {}
+            if self.hashes_path(asin).exists():
+                try:
+                    known = read_json(self.hashes_path(asin)).get("images", {})
+                except Exception:
+                    pass
             for img in cached["images"]:
                 dest = run_imgs / img.name
                 if dest.exists():
@@ -432,7 +783,12 @@ class TruthCache:
                 if mode == "symlink":
                     dest.symlink_to(img.resolve())
                 else:
-                    shutil.copy2(str(img), str(dest))
+                    sha = (known.get(img.name) or {}).get("sha256", "")
+                    if not self.blobs.has(sha) or not os.path.samefile(img, self.blobs.path(sha)):
+                        # Library entry from before the blob store (or edited): adopt it
+                        sha = self.blobs.put_file(img)
+                        self.blobs.materialize(sha, img)
+                    self.blobs.materialize(sha, dest)
                 copied += 1
 
         if cached.get("meta"):
@@ -448,6 +804,7 @@ class TruthCache:
                 info = read_json(info_p)
                 info["last_used_utc"] = utc_now_iso()
                 atomic_write_json(info_p, info)
+                self._record(asin, {**cached, "cache_info": info}, own_write=True)
             except Exception:
                 pass
 
@@ -486,6 +843,7 @@ class TruthCache:
         except Exception:
             tmp.unlink(missing_ok=True)
             raise
+        self._refresh_index(asin, own_write=True)
         return True
 
     # --- Survival mode ---
@@ -548,17 +906,12 @@ class TruthCache:
     # --- Stats ---
 
     def stats(self) -> Dict[str, Any]:
-        """Get cache statistics."""
-        products_dir = self.root / "products"
-        if not products_dir.exists():
+        """Get cache statistics (from the library index; see reindex())."""
+        total_asins, total_bytes = self.index.totals()
+        if not total_asins:
             return {"total_asins": 0, "total_bytes": 0}
-        asins = [
-            d.name for d in products_dir.iterdir()
-            if d.is_dir() and not d.name.startswith(".")
-        ]
-        total_bytes = du_bytes(products_dir)
         return {
-            "total_asins": len(asins),
+            "total_asins": total_asins,
             "total_bytes": total_bytes,
             "total_mb": round(total_bytes / (1024 * 1024), 2),
         }
@@ -27,9 +27,17 @@ import json
 import logging
 import os
 import struct
+import threading
+import time
 import wave
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Protocol, runtime_checkable
+from typing import (
+    Any, Callable, Dict, Iterator, List, Optional, Protocol, Sequence, Tuple,
+    runtime_checkable,
+)
 from urllib.request import Request, urlopen
 
 logger = logging.getLogger(__name__)
@@ -544,3 +552,214 @@ def synthesize_with_fallback(
         result["fallback_used"] = True
         result["primary_error"] = str(e)
         return result
+
+
+# ---------------------------------------------------------------------------
+# Concurrent synthesis (rate-limit-aware scheduling)
+# ---------------------------------------------------------------------------
+
+# Per-provider quotas: (max concurrent requests, characters per minute).
+# 0 chars/min means no character quota. ElevenLabs rejects requests above
+# the plan's concurrency with HTTP 429 "too_many_concurrent_requests".
+# Override with TTS_MAX_CONCURRENCY / TTS_CHARS_PER_MINUTE.
+PROVIDER_QUOTAS: Dict[str, Tuple[int, int]] = {
+    "elevenlabs": (4, 100_000),
+    "moss": (2, 0),
+    "moss_tts": (2, 0),
+    "mock": (8, 0),
+}
+_DEFAULT_QUOTA = (2, 0)
+
+SYNTH_RETRIES = 3
+SYNTH_BACKOFF_SEC = 2.0
+_RATE_LIMIT_MARKERS = (
+    "429", "too_many_concurrent_requests", "rate_limit", "rate limit", "system_busy",
+)
+
+
+class TokenBucket:
+    """Thread-safe token bucket refilled at ``rate_per_sec`` up to ``capacity``.
+
+    acquire() reserves tokens immediately (the balance may go negative) and
+    sleeps until the reservation is covered, so concurrent callers are
+    served in arrival order without holding the lock while waiting.
+    """
+
+    def __init__(self, rate_per_sec: float, capacity: float):
+        if rate_per_sec <= 0 or capacity <= 0:
+            raise ValueError("rate_per_sec and capacity must be positive")
+        self.rate_per_sec = float(rate_per_sec)
+        self.capacity = float(capacity)
+        self._tokens = float(capacity)
+        self._stamp = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: float) -> float:
+        """Take ``tokens`` (clamped to capacity); returns seconds waited."""
+        tokens = min(float(tokens), self.capacity)
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._stamp) * self.rate_per_sec,
+            )
+            self._stamp = now
+            self._tokens -= tokens
+            wait = -self._tokens / self.rate_per_sec if self._tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+class ProviderLimiter:
+    """Concurrency slots + characters-per-minute quota for one provider."""
+
+    def __init__(self, name: str, max_concurrency: int, chars_per_minute: int = 0):
+        self.name = name
+        self.max_concurrency = max(1, int(max_concurrency))
+        self.chars_per_minute = max(0, int(chars_per_minute))
+        self._slots = threading.BoundedSemaphore(self.max_concurrency)
+        self._chars = (
+            TokenBucket(self.chars_per_minute / 60.0, self.chars_per_minute)
+            if self.chars_per_minute else None
+        )
+
+    @contextmanager
+    def slot(self, chars: int = 0) -> Iterator[None]:
+        """Hold one request slot after paying ``chars`` from the quota."""
+        if self._chars is not None and chars > 0:
+            self._chars.acquire(chars)
+        with self._slots:
+            yield
+
+
+_LIMITERS: Dict[str, ProviderLimiter] = {}
+_LIMITERS_LOCK = threading.Lock()
+
+
+def _env_int(name: str) -> Optional[int]:
+    raw = os.environ.get(name, "").strip()
+    try:
+        return int(raw) if raw else None
+    except ValueError:
+        return None
+
+
+def provider_limiter(name: str) -> ProviderLimiter:
+    """Process-wide limiter for a provider, so parallel jobs share one quota."""
+    key = name.lower().strip()
+    with _LIMITERS_LOCK:
+        limiter = _LIMITERS.get(key)
+        if limiter is None:
+            concurrency, cpm = PROVIDER_QUOTAS.get(key, _DEFAULT_QUOTA)
+            env_conc = _env_int("TTS_MAX_CONCURRENCY")
+            env_cpm = _env_int("TTS_CHARS_PER_MINUTE")
+            limiter = ProviderLimiter(
+                key,
+                env_conc if env_conc is not None else concurrency,
+                env_cpm if env_cpm is not None else cpm,
+            )
+            _LIMITERS[key] = limiter
+        return limiter
+
+
+def is_rate_limited(exc: BaseException) -> bool:
+    """True if a provider error is a quota/concurrency rejection worth retrying."""
+    msg = str(exc).lower()
+    return any(marker in msg for marker in _RATE_LIMIT_MARKERS)
+
+
+@dataclass
+class SynthesisTask:
+    """One unit of work for run_synthesis().
+
+    ``synthesize`` performs the provider request; its return value is passed
+    to ``post`` (e.g. mp3→wav conversion), which runs off the request pool.
+    """
+    key: str
+    text: str
+    synthesize: Callable[[], Any]
+    post: Optional[Callable[[Any], Any]] = None
+
+
+@dataclass
+class SynthesisOutcome:
+    key: str
+    result: Any = None
+    error: Optional[BaseException] = None
+    attempts: int = 0
+    wait_sec: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def _request(
+    task: SynthesisTask,
+    limiter: ProviderLimiter,
+    outcome: SynthesisOutcome,
+    retries: int,
+    backoff_sec: float,
+) -> Any:
+    while True:
+        outcome.attempts += 1
+        t0 = time.monotonic()
+        with limiter.slot(len(task.text)):
+            outcome.wait_sec += time.monotonic() - t0
+            try:
+                return task.synthesize()
+            except Exception as e:
+                if outcome.attempts > retries or not is_rate_limited(e):
+                    raise
+                delay = backoff_sec * (2 ** (outcome.attempts - 1))
+        logger.warning(
+            f"{limiter.name} rate limited on {task.key} "
+            f"(attempt {outcome.attempts}), retrying in {delay:.1f}s"
+        )
+        time.sleep(delay)
+
+
+def run_synthesis(
+    tasks: Sequence[SynthesisTask],
+    limiter: ProviderLimiter,
+    *,
+    max_workers: Optional[int] = None,
+    post_workers: int = 2,
+    retries: int = SYNTH_RETRIES,
+    backoff_sec: float = SYNTH_BACKOFF_SEC,
+) -> List[SynthesisOutcome]:
+    """Run synthesis tasks concurrently; outcomes are returned in task order.
+
+    Requests run on a pool sized to the limiter (optionally capped by
+    ``max_workers``); each finished request hands its result to a separate
+    post-processing pool, so conversions overlap requests still in flight.
+    Rate-limit rejections are retried with exponential backoff. Failures
+    are reported per task rather than raised.
+    """
+    outcomes = [SynthesisOutcome(key=t.key) for t in tasks]
+    if not tasks:
+        return outcomes
+    workers = min(limiter.max_concurrency, max_workers or limiter.max_concurrency, len(tasks))
+
+    with ThreadPoolExecutor(max_workers=max(1, post_workers)) as post_pool, \
+            ThreadPoolExecutor(max_workers=max(1, workers)) as request_pool:
+
+        def _run(task: SynthesisTask, outcome: SynthesisOutcome) -> Optional[Future]:
+            result = _request(task, limiter, outcome, retries, backoff_sec)
+            if task.post is None:
+                outcome.result = result
+                return None
+            return post_pool.submit(task.post, result)
+
+        request_futures = [
+            request_pool.submit(_run, task, outcome)
+            for task, outcome in zip(tasks, outcomes)
+        ]
+        for outcome, fut in zip(outcomes, request_futures):
+            try:
+                post_fut = fut.result()
+                if post_fut is not None:
+                    outcome.result = post_fut.result()
+            except Exception as e:
+                outcome.error = e
+    return outcomes
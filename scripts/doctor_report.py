@@ -36,13 +36,18 @@ import csv
 import json
 import os
 import shutil
-import subprocess
 import sys
 from dataclasses import dataclass
 from io import StringIO
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from rayvault.probe_cache import format_bitrate, format_duration, probe, probe_many
+
 
 # ---------------------------------------------------------------------------
 # Defaults
@@ -79,38 +84,13 @@ def _read_json(path: Path, default: Any = None) -> Any:
 # ---------------------------------------------------------------------------
 
 def ffprobe_bitrate_bps(video_path: Path) -> int:
-    """Get video bitrate via ffprobe. Returns 0 on failure."""
-    cmd = [
-        "ffprobe", "-v", "error",
-        "-show_entries", "format=bit_rate",
-        "-of", "default=noprint_wrappers=1:nokey=1",
-        str(video_path),
-    ]
-    try:
-        r = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
-        if r.returncode != 0:
-            return 0
-        s = (r.stdout or "").strip()
-        return int(float(s)) if s else 0
-    except Exception:
-        return 0
+    """Get video bitrate via ffprobe (shared probe cache). Returns 0 on failure."""
+    return format_bitrate(probe(video_path))
 
 
 def _ffprobe_duration_sec(video_path: Path) -> float:
-    """Get video duration via ffprobe. Returns 0.0 on failure."""
-    cmd = [
-        "ffprobe", "-v", "error",
-        "-show_entries", "format=duration",
-        "-of", "default=noprint_wrappers=1:nokey=1",
-        str(video_path),
-    ]
-    try:
-        r = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
-        if r.returncode != 0:
-            return 0.0
-        return float((r.stdout or "").strip() or "0")
-    except Exception:
-        return 0.0
+    """Get video duration via ffprobe (shared probe cache). Returns 0.0 on failure."""
+    return format_duration(probe(video_path)) or 0.0
 
 
 # ---------------------------------------------------------------------------
@@ -245,6 +225,10 @@ def compute_report(
     for r in all_refs:
         by_run.setdefault(r.run_id, []).append(r)
 
+    if enable_bitrate_gate:
+        # Warm the probe cache concurrently; the loop below then hits it
+        probe_many(r.expected_video_path for r in all_refs if r.expected_video_path.exists())
+
     summaries: List[JobSummary] = []
     total_needed = 0
     total_saved = 0
@@ -354,6 +338,8 @@ def build_timeline(
     cum_drift = 0.0
 
     sorted_refs = sorted(refs, key=lambda r: r.order)
+    if include_probe:
+        probe_many(r.expected_video_path for r in sorted_refs if r.expected_video_path.exists())
 
     for r in sorted_refs:
         start = cursor
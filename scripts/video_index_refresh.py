@@ -46,6 +46,12 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from rayvault.probe_cache import probe
+
 
 # ---------------------------------------------------------------------------
 # Defaults
@@ -127,22 +133,8 @@ def _index_lock(index_path: Path, timeout: float = 10.0):
 # ---------------------------------------------------------------------------
 
 def _ffprobe_json(path: Path) -> Optional[dict]:
-    """Full ffprobe JSON output."""
-    import subprocess
-    cmd = [
-        "ffprobe", "-v", "error",
-        "-print_format", "json",
-        "-show_format",
-        "-show_streams",
-        str(path),
-    ]
-    try:
-        r = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
-        if r.returncode != 0:
-            return None
-        return json.loads(r.stdout or "{}")
-    except Exception:
-        return None
+    """Full ffprobe JSON output (shared probe cache)."""
+    return probe(path)
 
 
 def _extract_probe_data(meta: dict) -> Dict[str, Any]:
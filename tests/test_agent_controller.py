@@ -4,6 +4,7 @@
 from __future__ import annotations
 
 import unittest
+from unittest import mock
 
 from rayvault.agent.controller import (
     ClusterNode,
@@ -36,6 +37,7 @@ class TestClusterNode(unittest.TestCase):
         self.assertEqual(n.role, "worker")
         self.assertEqual(n.tags, [])
         self.assertEqual(n.timeout_sec, 15)
+        self.assertEqual(n.max_parallel_downloads, 4)
 
 
 # ---------------------------------------------------------------
@@ -245,5 +247,64 @@ class TestRequirementMatching(unittest.TestCase):
         self.assertIn("min_ram_gb", reason)
 
 
+class TestRemoteStatusEvents(unittest.TestCase):
+    def _make_ctrl(self):
+        ctrl = RayVaultController.__new__(RayVaultController)
+        ctrl.cluster_secret = "s" * 32
+        ctrl.secret_candidates = [ctrl.cluster_secret]
+        ctrl.remote_events_wait_sec = 25
+        ctrl.remote_poll_interval_sec = 0.01
+        ctrl._write_remote_artifacts_snapshot = mock.Mock(return_value=("receipt", {"status": "succeeded"}))
+        return ctrl
+
+    def _poll(self, ctrl):
+        return ctrl._poll_remote_status(
+            node=ClusterNode(node_id="w1", host="127.0.0.1", port=8787),
+            run_id="R", job_id="J", inputs_hash="a" * 64, timeout_sec=30,
+        )
+
+    def test_long_poll_until_done(self):
+        ctrl = self._make_ctrl()
+        replies = [
+            {"ok": True, "events": [{"seq": 3}], "cursor": 3, "done": False, "job": {"status": "running"}},
+            {"ok": True, "events": [{"seq": 5}], "cursor": 5, "done": True, "job": {"status": "succeeded"}},
+        ]
+        with mock.patch("rayvault.agent.controller._http_json", side_effect=replies) as http:
+            self._poll(ctrl)
+        self.assertEqual(http.call_count, 2)
+        self.assertIn("/job/J/events?", http.call_args_list[0][0][1])
+        self.assertIn("since=3", http.call_args_list[1][0][1])
+        payload = ctrl._write_remote_artifacts_snapshot.call_args[1]["status_payload"]
+        self.assertEqual(payload["job"]["status"], "succeeded")
+
+    def test_falls_back_to_polling_without_events_endpoint(self):
+        ctrl = self._make_ctrl()
+        ctrl._http_json_with_auth_fallback = mock.Mock(side_effect=[
+            {"job": {"status": "running"}},
+            {"job": {"status": "failed"}},
+        ])
+        with mock.patch("rayvault.agent.controller._http_json",
+                        side_effect=ControllerError("HTTP 404 Not Found")):
+            self._poll(ctrl)
+        self.assertEqual(ctrl._http_json_with_auth_fallback.call_count, 2)
+        ctrl._write_remote_artifacts_snapshot.assert_called_once()
+
+    def test_watch_remote_jobs_single_stream(self):
+        ctrl = self._make_ctrl()
+        ctrl.remote_poll_timeout_sec = 30
+        reply = {
+            "ok": True, "cursor": 9, "done": True,
+            "jobs": {"A": {"status": "succeeded"}, "B": {"status": "failed"}},
+        }
+        with mock.patch("rayvault.agent.controller._http_json", return_value=reply) as http:
+            done = ctrl.watch_remote_jobs(
+                node=ClusterNode(node_id="w1", host="127.0.0.1", port=8787),
+                run_id="R", job_ids=["B", "A"],
+            )
+        http.assert_called_once()
+        self.assertIn("jobs=A%2CB", http.call_args[0][1])
+        self.assertEqual(set(done), {"A", "B"})
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -6,6 +6,7 @@ from __future__ import annotations
 import os
 import sys
 import tempfile
+import time
 import unittest
 from pathlib import Path
 from unittest.mock import patch
@@ -19,7 +20,10 @@ from rayvault.agent.jobs import (
     _safe_output_dir,
     _sha256_file,
     detect_capabilities,
+    execute_job,
 )
+from rayvault.agent.protocol import Envelope
+from rayvault.tts_provider import MockTTSProvider
 
 
 # ---------------------------------------------------------------
@@ -328,5 +332,127 @@ class TestSafeOutputDirEdgeCases(unittest.TestCase):
         self.assertEqual(out, self.workspace)
 
 
+
+# ---------------------------------------------------------------
+# FRAME_SAMPLING with timestamps (batched channel means)
+# ---------------------------------------------------------------
+
+class TestFrameSamplingTimestamps(unittest.TestCase):
+
+    def setUp(self):
+        self._tmpdir = tempfile.mkdtemp()
+        self.workspace = Path(self._tmpdir).resolve()
+        self.video = self.workspace / "v.mp4"
+        self.video.write_bytes(b"\x00")
+
+    def tearDown(self):
+        import shutil
+        shutil.rmtree(self._tmpdir, ignore_errors=True)
+
+    def _env(self):
+        return Envelope(
+            run_id="run-1", job_id="job-1", step_name="FRAME_SAMPLING",
+            inputs_hash="h", timestamp="2026-01-01T00:00:00Z",
+        )
+
+    @patch("rayvault.agent.jobs._ffmpeg_exists", return_value=True)
+    def test_writes_frame_means(self, _which):
+        import json
+        payload = {"video_path": str(self.video), "timestamps": [0.1, 2.0]}
+        with patch("rayvault.agent.jobs.sample_frame_means",
+                   return_value=[(200.0, 20.0, 20.0), None]) as sampler:
+            out = execute_job(self._env(), payload, workspace_root=self.workspace)
+        sampler.assert_called_once_with(self.video, [0.1, 2.0])
+        self.assertEqual(out["metrics"]["frames"], 1)
+        data = json.loads(Path(out["artifacts"][0]["path"]).read_text())
+        self.assertAlmostEqual(data["frames"][0]["red_ratio"], 0.8333, places=3)
+        self.assertIsNone(data["frames"][1]["rgb_mean"])
+
+    @patch("rayvault.agent.jobs._ffmpeg_exists", return_value=True)
+    def test_nothing_sampled_raises(self, _which):
+        payload = {"video_path": str(self.video), "timestamps": [99.0]}
+        with patch("rayvault.agent.jobs.sample_frame_means", return_value=[None]):
+            with self.assertRaises(JobExecutionError) as cm:
+                execute_job(self._env(), payload, workspace_root=self.workspace)
+        self.assertEqual(cm.exception.code, "FRAME_SAMPLING_EMPTY")
+
+
+# ---------------------------------------------------------------
+# TTS_RENDER_CHUNKS
+# ---------------------------------------------------------------
+
+class _SlowMockProvider(MockTTSProvider):
+    """Mock provider with a fixed network round trip per request."""
+
+    latency_sec = 0.05
+
+    def __init__(self):
+        self.calls = 0
+
+    def synthesize(self, text, voice_id, output_path, **kwargs):
+        self.calls += 1
+        time.sleep(self.latency_sec)
+        return super().synthesize(text, voice_id, output_path, **kwargs)
+
+
+class TestTtsRenderChunks(unittest.TestCase):
+
+    def setUp(self):
+        self._tmpdir = tempfile.mkdtemp()
+        self.workspace = Path(self._tmpdir)
+
+    def tearDown(self):
+        import shutil
+        shutil.rmtree(self._tmpdir, ignore_errors=True)
+
+    def _env(self, job_id="job-1"):
+        return Envelope(
+            run_id="run-1", job_id=job_id, step_name="TTS_RENDER_CHUNKS",
+            inputs_hash="h", timestamp="2026-01-01T00:00:00Z",
+        )
+
+    def _run(self, provider, chunks, workspace=None, **payload):
+        payload = {"provider": "mock", "chunks": chunks, **payload}
+        with patch("rayvault.agent.jobs.get_provider", return_value=provider):
+            return execute_job(self._env(), payload, workspace_root=workspace or self.workspace)
+
+    def _manifest(self, out):
+        import json
+        return json.loads(Path(out["artifacts"][-1]["path"]).read_text())
+
+    def test_duplicates_synthesized_once_and_cached_across_runs(self):
+        chunks = [{"chunk_id": "a", "text": "one two"}, {"chunk_id": "b", "text": "three"},
+                  {"chunk_id": "c", "text": "one two"}]
+        provider = _SlowMockProvider()
+        out = self._run(provider, chunks)
+        self.assertEqual(provider.calls, 2)
+        self.assertEqual(out["metrics"]["synthesized"], 2)
+        meta = self._manifest(out)["chunks"]
+        self.assertEqual([m["chunk_id"] for m in meta], ["a", "b", "c"])
+        self.assertEqual([m["cache_hit"] for m in meta], [False, False, True])
+        self.assertEqual(meta[0]["sha256"], meta[2]["sha256"])
+
+        again = _SlowMockProvider()
+        out = self._run(again, chunks)
+        self.assertEqual(again.calls, 0)
+        self.assertTrue(all(m["cache_hit"] for m in self._manifest(out)["chunks"]))
+
+    def test_provider_error_fails_job(self):
+        provider = MockTTSProvider()
+        with patch.object(provider, "synthesize", side_effect=RuntimeError("voice gone")):
+            with self.assertRaises(RuntimeError):
+                self._run(provider, [{"chunk_id": "a", "text": "hello"}])
+
+    def test_thirty_chunk_script_speedup(self):
+        chunks = [{"chunk_id": f"c{i:02d}", "text": f"line number {i}"} for i in range(30)]
+        t0 = time.monotonic()
+        self._run(_SlowMockProvider(), chunks, self.workspace / "seq", concurrency=1)
+        sequential = time.monotonic() - t0
+        t0 = time.monotonic()
+        self._run(_SlowMockProvider(), chunks, self.workspace / "par", concurrency=6)
+        concurrent = time.monotonic() - t0
+        self.assertGreaterEqual(sequential / concurrent, 4.0)
+
+
 if __name__ == "__main__":
     unittest.main()
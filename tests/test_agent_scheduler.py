@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""Tests for rayvault/agent/scheduler.py — load-aware node ranking."""
+
+from __future__ import annotations
+
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+
+from rayvault.agent.controller import ClusterNode, ControllerError, RayVaultController, SubmitResult
+from rayvault.agent.scheduler import NodeScheduler, receipt_duration_seconds
+
+
+def _node(node_id: str) -> ClusterNode:
+    return ClusterNode(node_id=node_id, host="127.0.0.1", port=8787)
+
+
+class TestNodeScheduler(unittest.TestCase):
+
+    def test_ewma_and_cross_node_default(self):
+        s = NodeScheduler(alpha=0.5)
+        s.observe("a", "TTS_RENDER_CHUNKS", 10.0)
+        s.observe("a", "TTS_RENDER_CHUNKS", 20.0)
+        self.assertAlmostEqual(s.expected_seconds("a", "TTS_RENDER_CHUNKS"), 15.0)
+        # Unseen node borrows the step mean
+        self.assertAlmostEqual(s.expected_seconds("b", "TTS_RENDER_CHUNKS"), 15.0)
+        self.assertEqual(s.expected_seconds("b", "FFMPEG_PROBE"), 2.0)
+
+    def test_rank_prefers_earliest_completion(self):
+        s = NodeScheduler()
+        s.observe("fast", "FFMPEG_PROBE", 1.0)
+        s.observe("slow", "FFMPEG_PROBE", 4.0)
+        nodes = [_node("slow"), _node("fast")]
+        self.assertEqual([n.node_id for n in s.rank(nodes, "FFMPEG_PROBE")], ["fast", "slow"])
+        # Backlog on the fast node flips the order: ceil(6/1)*1 > 4
+        s.update_health("fast", {"lanes": {"FFMPEG_PROBE": {"queued": 5, "running": 1, "slots": 1}}})
+        self.assertEqual([n.node_id for n in s.rank(nodes, "FFMPEG_PROBE")], ["slow", "fast"])
+
+    def test_inflight_counts_as_backlog(self):
+        s = NodeScheduler()
+        s.begin("a", "FFMPEG_PROBE")
+        s.begin("a", "FFMPEG_PROBE")
+        self.assertEqual(s.expected_completion("a", "FFMPEG_PROBE"), 3 * 2.0)
+        s.end("a", "FFMPEG_PROBE")
+        self.assertEqual(s.expected_completion("a", "FFMPEG_PROBE"), 2 * 2.0)
+
+    def test_affinity_routes_repeat_to_same_node(self):
+        s = NodeScheduler()
+        s.observe("b", "AUDIO_POSTCHECK", 15.0, inputs_hash="h1")
+        nodes = [_node("a"), _node("b")]
+        self.assertEqual(s.rank(nodes, "AUDIO_POSTCHECK", "h1")[0].node_id, "b")
+        self.assertEqual(s.rank(nodes, "AUDIO_POSTCHECK", "other")[0].node_id, "a")
+
+    def test_receipt_duration(self):
+        receipt = {"job_status": {
+            "started_at": "2026-01-01T00:00:00Z", "finished_at": "2026-01-01T00:00:12Z",
+        }}
+        self.assertEqual(receipt_duration_seconds(receipt), 12.0)
+        self.assertIsNone(receipt_duration_seconds({"job_status": {"started_at": ""}}))
+
+    def test_state_persists(self):
+        with tempfile.TemporaryDirectory() as td:
+            path = Path(td) / "scheduler.json"
+            s = NodeScheduler(path)
+            s.observe("a", "FRAME_SAMPLING", 7.0, inputs_hash="h")
+            s.save()
+            s2 = NodeScheduler(path)
+            self.assertEqual(s2.expected_seconds("a", "FRAME_SAMPLING"), 7.0)
+            self.assertEqual(s2.affinity("FRAME_SAMPLING", "h"), "a")
+
+    def test_concurrent_saves(self):
+        # submit_batch lanes save from several threads at once
+        with tempfile.TemporaryDirectory() as td:
+            path = Path(td) / "scheduler.json"
+            s = NodeScheduler(path)
+            errors = []
+
+            def lane(i):
+                try:
+                    for j in range(50):
+                        s.observe(f"n{i}", "FFMPEG_PROBE", 1.0 + j, inputs_hash=f"{i}-{j}")
+                        s.save()
+                except Exception as exc:
+                    errors.append(exc)
+
+            threads = [threading.Thread(target=lane, args=(i,)) for i in range(8)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            self.assertEqual(errors, [])
+            s2 = NodeScheduler(path)
+            self.assertEqual(s2.affinity("FFMPEG_PROBE", "7-49"), "n7")
+            self.assertEqual(list(Path(td).iterdir()), [path])
+
+
+class TestSubmitBatch(unittest.TestCase):
+
+    def _make_ctrl(self, nodes):
+        ctrl = RayVaultController.__new__(RayVaultController)
+        ctrl.scheduler = NodeScheduler()
+        ctrl.enabled_workers = lambda: nodes
+        ctrl._worker_meets_requirements = lambda node, reqs: (True, "")
+        ctrl._remote_step_supported = lambda node, step: (True, "")
+        ctrl._refresh_load = lambda node: None
+        return ctrl
+
+    def test_jobs_spread_across_nodes_in_order(self):
+        nodes = [_node("a"), _node("b"), _node("c")]
+        ctrl = self._make_ctrl(nodes)
+        seen = {}
+        lock = threading.Lock()
+
+        def dispatch(node, *, run_id, job_id, step, payload, hash_value):
+            time.sleep(0.02)
+            with lock:
+                seen.setdefault(node.node_id, []).append(job_id)
+            return SubmitResult(ok=True, mode="remote", run_id=run_id, job_id=job_id,
+                                step_name=step, status="succeeded", node_id=node.node_id)
+
+        ctrl._dispatch_remote = dispatch
+        jobs = [{"job_id": f"chunk{i:02d}", "payload": {"i": i}} for i in range(12)]
+        results = ctrl.submit_batch(run_id="R", step_name="tts_render_chunks", jobs=jobs)
+        self.assertEqual([r.job_id for r in results], [j["job_id"] for j in jobs])
+        self.assertEqual(set(seen), {"a", "b", "c"})
+        self.assertTrue(all(len(v) >= 2 for v in seen.values()))
+
+    def test_failing_node_stops_pulling_and_jobs_retry(self):
+        nodes = [_node("bad"), _node("good")]
+        ctrl = self._make_ctrl(nodes)
+
+        def dispatch(node, *, run_id, job_id, step, payload, hash_value):
+            if node.node_id == "bad":
+                raise RuntimeError("connection refused")
+            time.sleep(0.01)
+            return SubmitResult(ok=True, mode="remote", run_id=run_id, job_id=job_id,
+                                step_name=step, status="succeeded", node_id="good")
+
+        ctrl._dispatch_remote = dispatch
+        retried = []
+
+        def single(**kw):
+            retried.append(kw["job_id"])
+            return SubmitResult(ok=True, mode="local", run_id="R", job_id=kw["job_id"],
+                                step_name="FFMPEG_PROBE", status="succeeded")
+
+        ctrl.submit_job = single
+        jobs = [{"job_id": f"j{i}", "payload": {}} for i in range(6)]
+        results = ctrl.submit_batch(run_id="R", step_name="FFMPEG_PROBE", jobs=jobs)
+        self.assertEqual(len(results), 6)
+        self.assertTrue(all(r.ok for r in results))
+        self.assertEqual(len(retried), 1)
+
+
+    def test_per_job_requirements_route_to_matching_nodes(self):
+        nodes = [_node("cpu"), _node("gpu")]
+        ctrl = self._make_ctrl(nodes)
+        ctrl._worker_meets_requirements = lambda node, reqs: (
+            (node.node_id == "gpu" or not reqs.get("gpu_required"), "")
+        )
+        seen = {}
+        lock = threading.Lock()
+
+        def dispatch(node, *, run_id, job_id, step, payload, hash_value):
+            time.sleep(0.01)
+            with lock:
+                seen[job_id] = node.node_id
+            return SubmitResult(ok=True, mode="remote", run_id=run_id, job_id=job_id,
+                                step_name=step, status="succeeded", node_id=node.node_id)
+
+        ctrl._dispatch_remote = dispatch
+        jobs = [
+            {"job_id": f"j{i}", "payload": {"i": i, "requirements": {"gpu_required": i % 2 == 0}}}
+            for i in range(6)
+        ]
+        results = ctrl.submit_batch(run_id="R", step_name="FFMPEG_PROBE", jobs=jobs)
+        self.assertEqual([r.job_id for r in results], [j["job_id"] for j in jobs])
+        for i in range(0, 6, 2):
+            self.assertEqual(seen[f"j{i}"], "gpu")
+
+    def test_failed_jobs_keep_their_slot(self):
+        ctrl = self._make_ctrl([_node("a")])
+
+        def dispatch(node, *, run_id, job_id, step, payload, hash_value):
+            return SubmitResult(ok=job_id != "j1", mode="remote", run_id=run_id, job_id=job_id,
+                                step_name=step, status="succeeded", node_id="a")
+
+        def single(**kw):
+            raise ControllerError("Remote submit failed after retries: boom")
+
+        ctrl._dispatch_remote = dispatch
+        ctrl.submit_job = single
+        jobs = [{"job_id": f"j{i}", "payload": {}} for i in range(3)]
+        results = ctrl.submit_batch(
+            run_id="R", step_name="FFMPEG_PROBE", jobs=jobs, allow_local_fallback=False,
+        )
+        self.assertEqual([r.job_id for r in results], ["j0", "j1", "j2"])
+        self.assertEqual([r.ok for r in results], [True, False, True])
+        self.assertEqual(results[1].mode, "error")
+        self.assertIn("boom", results[1].message)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""Tests for rayvault/agent/transfer.py — streaming, resumable artifact transfer."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from rayvault.agent.transfer import (
+    RangeNotSatisfiable,
+    TransferError,
+    iter_file_range,
+    parse_range_header,
+    stream_download,
+)
+
+
+class TestParseRangeHeader(unittest.TestCase):
+
+    def test_no_header(self):
+        self.assertIsNone(parse_range_header(None, 100))
+        self.assertIsNone(parse_range_header("items=0-1", 100))
+        self.assertIsNone(parse_range_header("bytes=0-1,5-6", 100))
+
+    def test_open_ended_and_clamped(self):
+        self.assertEqual(parse_range_header("bytes=10-", 100), (10, 99))
+        self.assertEqual(parse_range_header("bytes=10-500", 100), (10, 99))
+        self.assertEqual(parse_range_header("bytes=0-0", 100), (0, 0))
+
+    def test_suffix(self):
+        self.assertEqual(parse_range_header("bytes=-20", 100), (80, 99))
+        self.assertEqual(parse_range_header("bytes=-500", 100), (0, 99))
+
+    def test_unsatisfiable(self):
+        with self.assertRaises(RangeNotSatisfiable):
+            parse_range_header("bytes=100-", 100)
+        with self.assertRaises(RangeNotSatisfiable):
+            parse_range_header("bytes=5-2", 100)
+
+
+class TestIterFileRange(unittest.TestCase):
+
+    def test_chunks(self):
+        with tempfile.TemporaryDirectory() as td:
+            p = Path(td) / "f.bin"
+            p.write_bytes(bytes(range(256)))
+            self.assertEqual(b"".join(iter_file_range(p, chunk_size=7)), bytes(range(256)))
+            chunks = list(iter_file_range(p, 10, 29, chunk_size=8))
+            self.assertEqual([len(c) for c in chunks], [8, 8, 4])
+            self.assertEqual(b"".join(chunks), bytes(range(10, 30)))
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Serves server.payload with Range; can drop the first connection early."""
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        srv = self.server
+        srv.requests.append(self.headers.get("Range"))
+        if self.path.startswith("/denied"):
+            self.send_error(401)
+            return
+        if self.path.startswith("/missing"):
+            self.send_error(404)
+            return
+        data = srv.payload
+        rng = None if srv.ignore_range else parse_range_header(self.headers.get("Range"), len(data))
+        start, end = rng if rng else (0, len(data) - 1)
+        body = data[start:end + 1]
+        self.send_response(206 if rng else 200)
+        if rng:
+            self.send_header("Content-Range", f"bytes {start}-{end}/{len(data)}")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if srv.drop_after is not None:
+            cut, srv.drop_after = srv.drop_after, None
+            self.wfile.write(body[:cut])
+            self.wfile.flush()
+            self.close_connection = True
+            return
+        self.wfile.write(body)
+
+
+class TestStreamDownload(unittest.TestCase):
+
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self.server.payload = os.urandom(300_000)
+        self.server.requests = []
+        self.server.drop_after = None
+        self.server.ignore_range = False
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        self.base = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.tmp = tempfile.TemporaryDirectory()
+        self.out = Path(self.tmp.name) / "a.wav"
+        self.sha = hashlib.sha256(self.server.payload).hexdigest()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.tmp.cleanup()
+
+    def _download(self, urls=None, **kw):
+        kw.setdefault("expected_sha256", self.sha)
+        kw.setdefault("expected_size", len(self.server.payload))
+        return stream_download(urls or [f"{self.base}/a"], self.out, chunk_size=4096, **kw)
+
+    def test_full_download_verified(self):
+        got = self._download()
+        self.assertEqual(self.out.read_bytes(), self.server.payload)
+        self.assertEqual(got["sha256"], self.sha)
+        self.assertEqual(got["resumed_bytes"], 0)
+        self.assertFalse(self.out.with_suffix(".wav.part").exists())
+
+    def test_resumes_after_dropped_connection(self):
+        self.server.drop_after = 100_000
+        got = self._download()
+        self.assertEqual(self.out.read_bytes(), self.server.payload)
+        self.assertEqual(got["attempts"], 2)
+        self.assertEqual(self.server.requests, [None, "bytes=100000-"])
+
+    def test_resumes_from_existing_part_file(self):
+        self.out.with_suffix(".wav.part").write_bytes(self.server.payload[:50_000])
+        got = self._download()
+        self.assertEqual(got["resumed_bytes"], 50_000)
+        self.assertEqual(self.server.requests, ["bytes=50000-"])
+        self.assertEqual(self.out.read_bytes(), self.server.payload)
+
+    def test_server_ignoring_range_restarts(self):
+        self.server.ignore_range = True
+        self.out.with_suffix(".wav.part").write_bytes(self.server.payload[:50_000])
+        got = self._download()
+        self.assertEqual(got["resumed_bytes"], 0)
+        self.assertEqual(self.out.read_bytes(), self.server.payload)
+
+    def test_checksum_mismatch_discards(self):
+        with self.assertRaises(TransferError):
+            self._download(expected_sha256="0" * 64)
+        self.assertFalse(self.out.exists())
+        self.assertFalse(self.out.with_suffix(".wav.part").exists())
+
+    def test_falls_back_to_next_url_on_auth_error(self):
+        self._download(urls=[f"{self.base}/denied", f"{self.base}/a"])
+        self.assertEqual(self.out.read_bytes(), self.server.payload)
+
+    def test_client_error_is_not_retried(self):
+        with self.assertRaises(TransferError):
+            self._download(urls=[f"{self.base}/missing"])
+        self.assertEqual(len(self.server.requests), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
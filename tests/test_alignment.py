@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""Tests for rayvault/alignment.py — word-level alignment index."""
+
+from __future__ import annotations
+
+import json
+import math
+import shutil
+import tempfile
+import unittest
+import wave
+from pathlib import Path
+
+from rayvault.alignment import (
+    AlignmentIndex,
+    alignment_path_for,
+    align_wav,
+    energy_align,
+    ensure_alignment,
+    load_alignment,
+    provider_alignment,
+    script_words,
+    speech_regions,
+)
+
+SR = 48000
+
+
+def _tone(sec: float) -> bytes:
+    return b"".join(
+        int(8000 * math.sin(2 * math.pi * 220 * i / SR)).to_bytes(2, "little", signed=True)
+        for i in range(int(sec * SR))
+    )
+
+
+def _silence(sec: float) -> bytes:
+    return b"\x00\x00" * int(sec * SR)
+
+
+def write_speech_wav(path: Path, pattern) -> None:
+    """pattern: [("speech"|"pause", seconds), ...]"""
+    with wave.open(str(path), "wb") as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(SR)
+        for kind, sec in pattern:
+            wf.writeframes(_tone(sec) if kind == "speech" else _silence(sec))
+
+
+class TestEnergyAligner(unittest.TestCase):
+
+    def setUp(self):
+        self._tmpdir = tempfile.mkdtemp()
+        self.wav = Path(self._tmpdir) / "02_audio.wav"
+        write_speech_wav(self.wav, [
+            ("pause", 0.3), ("speech", 2.0), ("pause", 0.6),
+            ("speech", 1.0), ("pause", 0.5), ("speech", 3.0), ("pause", 0.2),
+        ])
+        self.text = (
+            "Hello there my good friend.\n\nShort one.\n\n"
+            "And here is a much longer third sentence today."
+        )
+
+    def tearDown(self):
+        shutil.rmtree(self._tmpdir, ignore_errors=True)
+
+    def test_sentences_follow_pauses(self):
+        index = align_wav(self.wav, self.text)
+        spans = [(round(a, 2), round(b, 2)) for _, a, b in index.sentences()]
+        self.assertEqual(spans, [(0.3, 2.3), (2.9, 3.9), (4.4, 7.4)])
+        self.assertEqual(index.meta["anchored_sentences"], 2)
+
+    def test_section_durations_cover_track(self):
+        index = align_wav(self.wav, self.text)
+        durations = index.durations_for_word_counts([5, 2, 9])
+        self.assertAlmostEqual(sum(durations), 7.6, places=2)
+        self.assertAlmostEqual(durations[1], 1.55, places=2)
+
+    def test_word_count_mismatch_maps_proportionally(self):
+        index = align_wav(self.wav, self.text)
+        cuts = index.boundaries_for_word_counts([10, 4, 18])  # script counted twice as many
+        self.assertAlmostEqual(cuts[1], 2.6, places=2)
+        self.assertEqual(cuts[-1], index.duration_sec)
+
+    def test_silence_only_track(self):
+        regions = speech_regions([0.0] * 100, 0.01)
+        self.assertEqual(regions, [])
+        index = energy_align(["one", "two."], regions, 1.0)
+        self.assertEqual(len(index), 2)
+        self.assertLessEqual(index.ends[-1], 1.0)
+
+    def test_ensure_caches_and_invalidates(self):
+        first = ensure_alignment(self.wav, self.text)
+        path = alignment_path_for(self.wav)
+        self.assertEqual(path.name, "02_audio.align.json")
+        data = json.loads(path.read_text())
+        self.assertEqual(len(data["t_ms"]), 2 * len(data["words"]))
+        self.assertEqual(load_alignment(self.wav).starts, first.starts)
+
+        write_speech_wav(self.wav, [("speech", 1.0)])
+        self.assertIsNone(load_alignment(self.wav))
+        self.assertAlmostEqual(ensure_alignment(self.wav, "New take.").duration_sec, 1.0)
+
+    def test_unreadable_audio(self):
+        bad = Path(self._tmpdir) / "bad.wav"
+        bad.write_bytes(b"nope")
+        self.assertIsNone(ensure_alignment(bad, "text"))
+
+
+class TestProviderAlignment(unittest.TestCase):
+
+    def test_characters_to_words(self):
+        chars = list("Hi you.")
+        starts = [0.0, 0.1, 0.2, 0.3, 0.4, 0.5, 0.6]
+        ends = [s + 0.1 for s in starts]
+        index = AlignmentIndex.from_characters(chars, starts, ends, offset_sec=1.0)
+        self.assertEqual(index.words, ["Hi", "you."])
+        self.assertEqual(index.starts, [1.0, 1.3])
+        self.assertAlmostEqual(index.ends[1], 1.7)
+
+    def test_chunks_offset_by_timing_manifest(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            wav = Path(tmp) / "02_audio.wav"
+            write_speech_wav(wav, [("speech", 0.5)])
+            chunks = [
+                {"chunk_id": "c1", "alignment": {
+                    "characters": list("a b"),
+                    "character_start_times_seconds": [0.0, 0.1, 0.2],
+                    "character_end_times_seconds": [0.1, 0.2, 0.3]}},
+                {"chunk_id": "c2", "alignment": {
+                    "characters": list("c"),
+                    "character_start_times_seconds": [0.0],
+                    "character_end_times_seconds": [0.2]}},
+            ]
+            timing = {"chunks": [{"chunk_id": "c1", "start_sec": 0.0},
+                                 {"chunk_id": "c2", "start_sec": 2.5}]}
+            index = provider_alignment(chunks, wav, timing)
+        self.assertEqual(index.words, ["a", "b", "c"])
+        self.assertEqual(index.starts[2], 2.5)
+        self.assertEqual(index.source, "provider")
+        self.assertAlmostEqual(index.duration_sec, 0.5)
+
+    def test_roundtrip_compact_arrays(self):
+        index = AlignmentIndex(["a", "b"], [0.0, 0.5], [0.4, 0.9], 1.0, source="provider")
+        again = AlignmentIndex.from_dict(index.to_dict())
+        self.assertEqual(again.to_dict(), index.to_dict())
+
+    def test_script_words_skip_directions(self):
+        self.assertEqual(script_words("Hi [pause=300ms] there (smiles) now"), ["Hi", "there", "now"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -7,10 +7,13 @@ serialization. No browser/API calls.
 from __future__ import annotations
 
 import json
+import shutil
 import sys
 import tempfile
+import time
 import unittest
 from pathlib import Path
+from unittest import mock
 
 _repo = Path(__file__).resolve().parent.parent
 if str(_repo) not in sys.path:
@@ -191,5 +194,158 @@ class TestFindFirstVisible(unittest.TestCase):
         self.assertIsNone(result)
 
 
+
+class TestAdaptiveThrottle(unittest.TestCase):
+    """AIMD rate control replaces the fixed sleeps."""
+
+    def test_block_halves_and_success_recovers(self):
+        from tools.amazon_verify import AdaptiveThrottle
+        t = AdaptiveThrottle(1.0, min_rate=0.1, max_rate=2.0, increase=0.25)
+        t.on_block()
+        self.assertAlmostEqual(t.rate, 0.5)
+        for _ in range(3):
+            t.on_block()
+        self.assertAlmostEqual(t.rate, 0.1)  # floor
+        for _ in range(20):
+            t.on_success()
+        self.assertAlmostEqual(t.rate, 2.0)  # ceiling
+
+    def test_acquire_spaces_requests_after_block(self):
+        from tools.amazon_verify import AdaptiveThrottle
+        t = AdaptiveThrottle(0.4, min_rate=1 / 30, max_rate=1.0, increase=0.02)
+        with mock.patch("tools.amazon_verify.time.sleep") as sleep:
+            self.assertEqual(t.acquire(), 0.0)  # first request goes straight out
+            t.on_block()
+            waited = t.acquire()
+        self.assertAlmostEqual(waited, 1 / 0.2, delta=0.05)
+        sleep.assert_called_once()
+
+
+def _shortlist(n: int) -> list[dict]:
+    return [{"product_name": f"Acme Buds {i}", "brand": "Acme", "sources": [{"name": "RTINGS"}]}
+            for i in range(n)]
+
+
+def _item(asin: str, title: str) -> dict:
+    return {"ASIN": asin, "ItemInfo": {"Title": {"DisplayValue": title}},
+            "Offers": {"Listings": [{"Price": {"DisplayAmount": "$49.99"}}]}}
+
+
+class TestVerifyProductsPaapi(unittest.TestCase):
+    """PA-API path: batching, concurrency, caching. _post is faked."""
+
+    def setUp(self):
+        self._tmpdir = tempfile.mkdtemp()
+        self.calls: list[tuple[str, dict]] = []
+        self.block_next = 0
+        patches = [
+            mock.patch.dict("os.environ", {
+                "AMAZON_PAAPI_ACCESS_KEY": "AK", "AMAZON_PAAPI_SECRET_KEY": "SK",
+                "AMAZON_PAAPI_TPS": "200",
+            }),
+            mock.patch("tools.amazon_verify.load_env_file"),
+            mock.patch("tools.amazon_verify._PaapiClient._post", autospec=True,
+                       side_effect=self._fake_post),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+
+    def tearDown(self):
+        shutil.rmtree(self._tmpdir, ignore_errors=True)
+
+    def _fake_post(self, client, operation, payload):
+        from tools.amazon_verify import _AmazonBlockError
+        self.calls.append((operation, payload))
+        if self.block_next:
+            self.block_next -= 1
+            raise _AmazonBlockError("PA-API SearchItems: TooManyRequests")
+        time.sleep(0.2)
+        if operation == "SearchItems":
+            n = payload["Keywords"].rsplit(" ", 1)[-1]
+            return {"SearchResult": {"Items": [_item(f"B0ACME000{n}", f"Acme Buds {n} Wireless")]}}
+        return {"ItemsResult": {"Items": [
+            _item(a, f"Acme Buds {a[-1]} Wireless") for a in payload["ItemIds"]
+        ]}}
+
+    def _cache(self, **kw):
+        from tools.amazon_verify import VerifyCache
+        return VerifyCache(Path(self._tmpdir) / "verify.json", **kw)
+
+    def test_searches_overlap_and_keep_order(self):
+        from tools.amazon_verify import verify_products
+        start = time.monotonic()
+        verified = verify_products(_shortlist(8), associate_tag="tag-20", use_cache=False)
+        elapsed = time.monotonic() - start
+        self.assertEqual([v.asin for v in verified], [f"B0ACME000{i}" for i in range(8)])
+        self.assertEqual(verified[3].affiliate_url, "https://www.amazon.com/dp/B0ACME0003?tag=tag-20")
+        self.assertEqual(verified[0].evidence, [{"name": "RTINGS"}])
+        self.assertLess(elapsed, 8 * 0.2 / 2)
+
+    def test_second_run_served_from_cache(self):
+        from tools.amazon_verify import verify_products
+        first = verify_products(_shortlist(3), associate_tag="tag-20", cache=self._cache())
+        self.calls.clear()
+        again = verify_products(_shortlist(3), associate_tag="other-20", cache=self._cache())
+        self.assertEqual(self.calls, [])
+        self.assertEqual([v.asin for v in again], [v.asin for v in first])
+        self.assertEqual(again[0].affiliate_url, "https://www.amazon.com/dp/B0ACME0000?tag=other-20")
+
+    def test_expired_entries_refreshed_with_batched_getitems(self):
+        from tools.amazon_verify import verify_products
+        verify_products(_shortlist(12), associate_tag="tag-20", cache=self._cache())
+        self.calls.clear()
+        verified = verify_products(_shortlist(12), associate_tag="tag-20",
+                                   cache=self._cache(ttl_hours=0))
+        ops = [op for op, _ in self.calls]
+        self.assertEqual(ops, ["GetItems", "GetItems"])
+        self.assertEqual(sorted(len(p["ItemIds"]) for _, p in self.calls), [2, 10])
+        self.assertEqual(len(verified), 12)
+
+    def test_throttled_request_retried(self):
+        from tools.amazon_verify import verify_products
+        self.block_next = 1
+        verified = verify_products(_shortlist(1), use_cache=False)
+        self.assertEqual(len(verified), 1)
+        self.assertEqual(len(self.calls), 2)
+
+    def test_low_confidence_not_cached(self):
+        from tools.amazon_verify import VerifiedProduct
+        cache = self._cache()
+        item = _shortlist(1)[0]
+        cache.put(item, VerifiedProduct(product_name="x", asin="B0LOW", match_confidence="low"), "")
+        self.assertEqual(cache.known_asin(item), "")
+        cache.put(item, VerifiedProduct(product_name="x", asin="B0HI", match_confidence="high"), "")
+        cache.save()
+        self.assertEqual(self._cache().lookup(item)["asin"], "B0HI")
+
+
+class TestVerifyProductsBrowser(unittest.TestCase):
+    """Browser path: blocks widen the gap instead of fixed 2.5 s / 30 s sleeps."""
+
+    def test_block_backs_off_then_continues(self):
+        from tools import amazon_verify
+        from tools.amazon_verify import VerifiedProduct, _AmazonBlockError
+
+        outcomes = [_AmazonBlockError("Amazon CAPTCHA / bot-detection block")]
+
+        def fake_pdp(name, brand, tag, **kw):
+            out = outcomes.pop(0) if outcomes else None
+            if isinstance(out, Exception):
+                raise out
+            return VerifiedProduct(product_name=name, asin="B0X", match_confidence="high")
+
+        waits: list[float] = []
+        with mock.patch.dict("os.environ", {"AMAZON_PAAPI_ACCESS_KEY": ""}), \
+                mock.patch.object(amazon_verify, "load_env_file"), \
+                mock.patch.object(amazon_verify, "_browser_verify_product_pdp", side_effect=fake_pdp), \
+                mock.patch("tools.amazon_verify.time.sleep", side_effect=waits.append):
+            verified = amazon_verify.verify_products(_shortlist(3), use_cache=False)
+
+        self.assertEqual(len(verified), 2)
+        # First search immediate, then the block pushes the next one out to 5 s
+        self.assertAlmostEqual(waits[0], 5.0, delta=0.1)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""Tests for rayvault/audio_analysis.py — decode-once postcheck engine."""
+
+from __future__ import annotations
+
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from rayvault.audio_analysis import AudioAnalysis, has_numpy
+
+if has_numpy():
+    import numpy as np
+
+FS = 48000
+
+
+def _sine(freq: float, seconds: float, amp: float = 1.0) -> "np.ndarray":
+    t = np.arange(int(FS * seconds)) / FS
+    return amp * np.sin(2 * np.pi * freq * t)
+
+
+@unittest.skipUnless(has_numpy(), "numpy not installed")
+class TestLoudness(unittest.TestCase):
+
+    def test_full_scale_997hz_mono_is_minus_3_lufs(self):
+        a = AudioAnalysis.from_array(_sine(997, 5))
+        self.assertAlmostEqual(a.integrated_lufs(), -3.01, delta=0.05)
+
+    def test_stereo_sums_channels(self):
+        x = _sine(997, 5, amp=0.5)
+        a = AudioAnalysis.from_array(np.stack([x, x], axis=1))
+        self.assertAlmostEqual(a.integrated_lufs(), -6.02, delta=0.05)
+
+    def test_silence_below_gate(self):
+        a = AudioAnalysis.from_array(np.zeros(FS * 2))
+        self.assertIsNone(a.integrated_lufs())
+        self.assertIsNone(a.loudness())
+
+    def test_window_lufs(self):
+        x = np.concatenate([_sine(997, 2, amp=0.1), _sine(997, 2)])
+        a = AudioAnalysis.from_array(x)
+        self.assertAlmostEqual(a.window_lufs(2.0, 4.0), -3.01, delta=0.05)
+        self.assertAlmostEqual(a.window_lufs(0.0, 2.0), -23.01, delta=0.05)
+        self.assertIsNone(a.window_lufs(0.0, 0.2))
+
+    def test_steady_tone_has_no_range(self):
+        a = AudioAnalysis.from_array(_sine(997, 10, amp=0.3))
+        self.assertLess(a.loudness_range(), 0.1)
+
+    def test_true_peak_close_to_sample_peak_for_low_freq(self):
+        a = AudioAnalysis.from_array(_sine(997, 2, amp=0.5))
+        self.assertAlmostEqual(a.true_peak_db(), -6.02, delta=0.1)
+
+    def test_true_peak_catches_inter_sample_overs(self):
+        # fs/4 tone sampled 45° off its crest: samples top out at ~-3 dB
+        t = np.arange(FS) / FS
+        x = np.sin(2 * np.pi * (FS / 4) * t + np.pi / 4)
+        a = AudioAnalysis.from_array(x)
+        self.assertLess(20 * np.log10(np.abs(x).max()), -2.9)
+        self.assertGreater(a.true_peak_db(), -0.5)
+
+
+@unittest.skipUnless(has_numpy(), "numpy not installed")
+class TestBandRms(unittest.TestCase):
+
+    def test_in_band_tone(self):
+        a = AudioAnalysis.from_array(_sine(1000, 1))
+        self.assertAlmostEqual(a.band_rms_db(0.2, 0.4, (300, 3000)), -3.01, delta=0.1)
+
+    def test_out_of_band_tone_is_quiet(self):
+        a = AudioAnalysis.from_array(_sine(1000, 1))
+        rms = a.band_rms_db(0.2, 0.4, (2000, 5000))
+        self.assertTrue(rms is None or rms < -60)
+
+    def test_empty_window(self):
+        a = AudioAnalysis.from_array(_sine(1000, 1))
+        self.assertIsNone(a.band_rms_db(2.0, 3.0, (300, 3000)))
+
+
+@unittest.skipUnless(has_numpy(), "numpy not installed")
+class TestSilenceAndClipping(unittest.TestCase):
+
+    def test_silence_gap_reported(self):
+        x = _sine(440, 4)
+        x[FS:2 * FS] = 0.0
+        x[3 * FS:int(3.2 * FS)] = 0.0  # 200 ms: below the 300 ms threshold
+        gaps = AudioAnalysis.from_array(x).silence_gaps(300)
+        self.assertEqual(len(gaps), 1)
+        self.assertAlmostEqual(gaps[0]["start"], 1.0, places=2)
+        self.assertAlmostEqual(gaps[0]["end"], 2.0, places=2)
+        self.assertAlmostEqual(gaps[0]["duration_ms"], 1000.0, delta=1.0)
+
+    def test_trailing_silence(self):
+        x = _sine(440, 2)
+        x[FS:] = 0.0
+        gaps = AudioAnalysis.from_array(x).silence_gaps(300)
+        self.assertEqual(len(gaps), 1)
+        self.assertAlmostEqual(gaps[0]["end"], 2.0, places=2)
+
+    def test_clipped_windows(self):
+        x = _sine(440, 1, amp=0.5)
+        x[int(0.55 * FS)] = 1.0
+        regions = AudioAnalysis.from_array(x).clipped_windows(-0.1)
+        self.assertEqual([r["window"] for r in regions], [5])
+
+
+@unittest.skipUnless(has_numpy(), "numpy not installed")
+class TestPostcheckUsesSharedBuffer(unittest.TestCase):
+
+    def test_gates_do_not_spawn_ffmpeg(self):
+        from rayvault.audio_postcheck import run_audio_postcheck
+
+        x = _sine(997, 20, amp=0.2)
+        analysis = AudioAnalysis.from_array(np.stack([x, x], axis=1))
+        rc = {"segments": [
+            {"type": "product", "t0": 0, "t1": 10},
+            {"type": "filler", "t0": 10, "t1": 20},
+        ]}
+        with mock.patch("rayvault.audio_postcheck.AudioAnalysis.decode",
+                        return_value=analysis), \
+             mock.patch("rayvault.audio_postcheck.check_duration",
+                        return_value=(True, 20.0)), \
+             mock.patch("rayvault.audio_postcheck.subprocess.run") as run, \
+             mock.patch.object(Path, "exists", return_value=True):
+            result = run_audio_postcheck(Path("/fake.mp4"), rc, 20.0)
+        run.assert_not_called()
+        self.assertIn("integrated_lufs", result.metrics)
+        self.assertIn("vad", result.metrics)
+        self.assertIn("vo_dominant_lufs", result.metrics)
+        self.assertIsNone(analysis.samples)  # closed after postcheck
+
+    def test_decode_without_ffprobe_returns_none(self):
+        with mock.patch("rayvault.audio_analysis.subprocess.run",
+                        side_effect=FileNotFoundError):
+            self.assertIsNone(AudioAnalysis.decode(Path("/fake.mp4")))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""Tests for rayvault/blob_store.py — content-addressed dedupe and gc."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from rayvault.blob_store import BlobStore, default_blob_root
+
+
+class TestBlobStore(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        self.store = BlobStore(self.root / "blobs")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _file(self, name: str, data: bytes) -> Path:
+        p = self.root / name
+        p.parent.mkdir(parents=True, exist_ok=True)
+        p.write_bytes(data)
+        return p
+
+    def test_identical_files_store_one_blob(self):
+        a = self._file("run1/a.wav", b"same bytes")
+        b = self._file("run2/b.wav", b"same bytes")
+        sha_a = self.store.put_file(a)
+        sha_b = self.store.put_file(b)
+        self.assertEqual(sha_a, hashlib.sha256(b"same bytes").hexdigest())
+        self.assertEqual(sha_a, sha_b)
+        self.assertEqual(self.store.stats(), {"blobs": 1, "bytes": 10})
+        self.assertEqual(self.store.refcount(sha_a), 2)
+        self.store.materialize(sha_a, a)
+        self.store.materialize(sha_b, b)
+        self.assertEqual(a.stat().st_ino, b.stat().st_ino)
+
+    def test_put_file_leaves_src_writable(self):
+        src = self._file("run/seg.mp4", b"first render")
+        mode = src.stat().st_mode
+        sha = self.store.put_file(src)
+        self.assertEqual(src.stat().st_mode, mode)
+        self.assertFalse(os.path.samefile(src, self.store.path(sha)))
+        # An in-place rewrite (ffmpeg -y) must not reach the blob
+        with open(src, "r+b") as f:
+            f.write(b"second")
+        self.assertEqual(self.store.path(sha).read_bytes(), b"first render")
+
+    def test_materialize_links_blob(self):
+        sha = self.store.put_bytes(b"payload")
+        dest = self.root / "run" / "seg.mp4"
+        mode = self.store.materialize(sha, dest)
+        self.assertEqual(mode, "link")
+        self.assertEqual(dest.read_bytes(), b"payload")
+        self.assertTrue(os.path.samefile(dest, self.store.path(sha)))
+        self.assertEqual(self.store.refcount(sha), 1)
+
+    def test_materialize_missing_blob(self):
+        with self.assertRaises(FileNotFoundError):
+            self.store.materialize("0" * 64, self.root / "x")
+
+    def test_keys(self):
+        sha = self.store.put_bytes(b"chunk")
+        self.assertIsNone(self.store.get_key("tts_chunks", "abc"))
+        self.store.set_key("tts_chunks", "abc", sha)
+        self.assertEqual(self.store.get_key("tts_chunks", "abc"), sha)
+        other = self.store.put_bytes(b"chunk2")
+        self.store.set_key("tts_chunks", "abc", other)
+        self.assertEqual(self.store.refcount(sha), 0)
+        self.store.drop_key("tts_chunks", "abc")
+        self.assertIsNone(self.store.get_key("tts_chunks", "abc"))
+
+    def test_gc_deletes_unheld_blobs(self):
+        held = self._file("run1/a.bin", b"kept by path")
+        gone = self._file("run2/b.bin", b"holder deleted")
+        keyed = self.store.put_bytes(b"kept by key")
+        self.store.set_key("render_segments", "h1", keyed)
+        sha_held = self.store.put_file(held)
+        sha_gone = self.store.put_file(gone)
+        gone.unlink()
+
+        dry = self.store.gc(grace_sec=0, dry_run=True)
+        self.assertEqual(dry["deleted"], 1)
+        self.assertTrue(self.store.has(sha_gone))
+
+        got = self.store.gc(grace_sec=0)
+        self.assertEqual(got, {"stale_refs": 1, "deleted": 1, "freed_bytes": 14})
+        self.assertFalse(self.store.has(sha_gone))
+        self.assertTrue(self.store.has(sha_held))
+        self.assertTrue(self.store.has(keyed))
+
+    def test_gc_respects_grace_period(self):
+        sha = self.store.put_bytes(b"fresh, unreferenced")
+        self.assertEqual(self.store.gc()["deleted"], 0)
+        self.assertTrue(self.store.has(sha))
+
+    def test_replaced_holder_is_stale(self):
+        p = self._file("run/a.bin", b"v1")
+        sha = self.store.put_file(p)
+        p.unlink()
+        p.write_bytes(b"v2")
+        self.store.gc(grace_sec=0)
+        self.assertFalse(self.store.has(sha))
+
+
+class TestDefaultBlobRoot(unittest.TestCase):
+
+    def test_env_overrides_fallback(self):
+        with mock.patch.dict(os.environ, {"RAYVAULT_BLOB_ROOT": "/srv/blobs"}):
+            self.assertEqual(default_blob_root(Path("/x")), Path("/srv/blobs"))
+        with mock.patch.dict(os.environ, {"RAYVAULT_BLOB_ROOT": ""}):
+            self.assertEqual(default_blob_root(Path("/x")), Path("/x"))
+            self.assertEqual(default_blob_root(), Path("state/blobs"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,7 +3,9 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
+import os
 import tempfile
 import time
 import unittest
@@ -235,6 +237,141 @@ class TestPruneEdgeCases(unittest.TestCase):
         self.assertEqual(result["kept_count"], 1)
 
 
+# ---------------------------------------------------------------
+# prune — size budget
+# ---------------------------------------------------------------
+
+class TestPruneBudget(unittest.TestCase):
+
+    def setUp(self):
+        self._tmpdir = tempfile.mkdtemp()
+        self.root = Path(self._tmpdir)
+
+    def tearDown(self):
+        import shutil
+        shutil.rmtree(self._tmpdir, ignore_errors=True)
+
+    def _make_asin(self, asin: str, last_used_days_ago: int, status: str = "VALID"):
+        d = self.root / asin
+        d.mkdir(parents=True)
+        info = {
+            "last_used_utc": _days_ago_iso(last_used_days_ago),
+            "status": status,
+            "disk_bytes": 1000,
+        }
+        (d / "cache_info.json").write_text(json.dumps(info), encoding="utf-8")
+
+    def test_evicts_lru_until_under_budget(self):
+        self._make_asin("B0NEW", 1)
+        self._make_asin("B0MID", 5)
+        self._make_asin("B0OLD", 10)
+        result = prune(self.root, max_unused_days=30, max_bytes=1500, apply=True)
+        self.assertEqual(result["deleted"], ["B0OLD", "B0MID"])
+        self.assertEqual(result["evicted_for_budget"], 2)
+        self.assertEqual(result["remaining_bytes"], 1000)
+        self.assertFalse(result["over_budget"])
+        self.assertTrue((self.root / "B0NEW").exists())
+        self.assertFalse((self.root / "B0OLD").exists())
+
+    def test_never_evicts_broken_or_broll(self):
+        self._make_asin("B0BROKEN", 20, status="BROKEN")
+        self._make_asin("B0BROLL", 10)
+        broll = self.root / "B0BROLL" / "approved_broll"
+        broll.mkdir()
+        (broll / "approved.mp4").write_bytes(b"\x00" * 10)
+        self._make_asin("B0PLAIN", 1)
+        result = prune(self.root, max_unused_days=30, max_bytes=0)
+        self.assertEqual(result["deleted"], ["B0PLAIN"])
+        self.assertTrue(result["over_budget"])
+
+    def test_no_budget_keys_without_max_bytes(self):
+        self._make_asin("B0A", 1)
+        result = prune(self.root, max_unused_days=30)
+        self.assertNotIn("over_budget", result)
+
+
+class TestPruneIndexed(unittest.TestCase):
+
+    def setUp(self):
+        from rayvault.truth_cache import TruthCache
+        self._tmpdir = tempfile.mkdtemp()
+        self.library = Path(self._tmpdir)
+        self.cache = TruthCache(self.library)
+        self.root = self.library / "products"
+
+    def tearDown(self):
+        import shutil
+        self.cache.index.close()
+        shutil.rmtree(self._tmpdir, ignore_errors=True)
+
+    def _put(self, asin: str, last_used_days_ago: int) -> None:
+        self.cache.put_from_fetch(asin, {"title": asin}, [])
+        info_p = self.cache.cache_info_path(asin)
+        info = json.loads(info_p.read_text(encoding="utf-8"))
+        info["last_used_utc"] = _days_ago_iso(last_used_days_ago)
+        info_p.write_text(json.dumps(info), encoding="utf-8")
+
+    def test_uses_index_and_drops_evicted_rows(self):
+        self._put("B0NEW", 1)
+        self._put("B0OLD", 60)
+        result = prune(self.root, max_unused_days=30, apply=True)
+        self.assertEqual(result["source"], "index")
+        self.assertEqual(result["deleted"], ["B0OLD"])
+        self.assertGreater(result["bytes_freed_est"], 0)
+        self.assertFalse((self.root / "B0OLD").exists())
+        self.assertIsNone(self.cache.index.get("B0OLD"))
+        self.assertEqual(self.cache.stats()["total_asins"], 1)
+
+    def _put_image(self, asin: str, last_used_days_ago: int, data: bytes) -> Path:
+        src = self.library / "downloads" / asin / "01_main.jpg"
+        src.parent.mkdir(parents=True)
+        src.write_bytes(data)
+        self.cache.put_from_fetch(asin, {"title": asin}, [src])
+        src.unlink()
+        info_p = self.cache.cache_info_path(asin)
+        info = json.loads(info_p.read_text(encoding="utf-8"))
+        info["last_used_utc"] = _days_ago_iso(last_used_days_ago)
+        info_p.write_text(json.dumps(info), encoding="utf-8")
+        sha = hashlib.sha256(data).hexdigest()
+        blob = self.cache.blobs.path(sha)
+        old = time.time() - 2 * 86400
+        os.utime(blob, (old, old))
+        return blob
+
+    def test_evicted_images_leave_the_blob_store(self):
+        blob = self._put_image("B0OLD", 60, b"\xff" * 4096)
+        self._put("B0NEW", 1)
+        result = prune(self.root, max_unused_days=30, apply=True)
+        self.assertEqual(result["deleted"], ["B0OLD"])
+        self.assertFalse(blob.exists())
+        self.assertEqual(result["blob_gc"]["deleted"], 1)
+        self.assertEqual(result["blob_gc"]["freed_bytes"], 4096)
+
+    def test_image_held_by_a_run_is_not_freed(self):
+        blob = self._put_image("B0OLD", 60, b"\xee" * 4096)
+        run_img = self.library / "runs" / "r1" / "01_main.jpg"
+        self.cache.blobs.materialize(blob.name, run_img)
+        self._put("B0NEW", 1)
+        dry = prune(self.root, max_unused_days=30, max_bytes=10**9)
+        self.assertEqual(dry["deleted"], ["B0OLD"])
+        disk = self.cache.index.get("B0OLD")["disk_bytes"]
+        self.assertEqual(dry["bytes_freed_est"], disk - 4096)
+        self.assertGreaterEqual(dry["remaining_bytes"], 4096)
+        result = prune(self.root, max_unused_days=30, apply=True)
+        self.assertEqual(result["bytes_freed_est"], dry["bytes_freed_est"])
+        self.assertEqual(result["blob_gc"]["deleted"], 0)
+        self.assertTrue(blob.exists())
+        self.assertEqual(run_img.read_bytes(), b"\xee" * 4096)
+
+    def test_budget_from_index(self):
+        self._put("B0A", 3)
+        self._put("B0B", 2)
+        self._put("B0C", 1)
+        result = prune(self.root, max_unused_days=30, max_bytes=1)
+        self.assertEqual(result["deleted"], ["B0A", "B0B", "B0C"])
+        self.assertTrue((self.root / "B0A").exists())
+
+
 # ---------------------------------------------------------------
 # _parse_utc edge cases
 # ---------------------------------------------------------------
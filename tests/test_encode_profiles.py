@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""Tests for rayvault/encode_profiles.py — encoder-aware encode profiles."""
+
+from __future__ import annotations
+
+import json
+import os
+import platform
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from rayvault.encode_profiles import (
+    DEFAULT_PROFILES,
+    PROFILES,
+    apply_profile,
+    available_encoders,
+    encode_args,
+    load_profile_table,
+    select_profile,
+)
+from rayvault.ffmpeg_render import _with_hw_upload
+
+_SW = frozenset({"libx264", "libx265", "libsvtav1"})
+
+
+def _row(name: str, fps: float, ssim: float, ok: bool = True) -> dict:
+    return {"profile": name, "ok": ok, "fps": fps, "ssim": ssim}
+
+
+class TestEncodeArgs(unittest.TestCase):
+
+    def test_x264_matches_historical_defaults(self):
+        args = encode_args(PROFILES["final-x264"].output_settings(), threads=2)
+        self.assertEqual(args, [
+            "-c:v", "libx264", "-crf", "18", "-preset", "slow",
+            "-pix_fmt", "yuv420p", "-threads", "2",
+        ])
+
+    def test_vaapi_uses_qp_and_no_pix_fmt(self):
+        args = encode_args(PROFILES["preview-vaapi"].output_settings())
+        self.assertEqual(args, ["-c:v", "h264_vaapi", "-qp", "24"])
+
+    def test_qsv_uses_global_quality(self):
+        args = encode_args(PROFILES["draft-qsv"].output_settings())
+        self.assertIn("-global_quality", args)
+        self.assertNotIn("-crf", args)
+
+    def test_av1_preset_is_numeric_string(self):
+        args = encode_args(PROFILES["draft-av1"].output_settings())
+        self.assertEqual(args[args.index("-preset") + 1], "12")
+
+
+class TestSelectProfile(unittest.TestCase):
+
+    def test_explicit_name(self):
+        self.assertEqual(select_profile("final-x265").vcodec, "libx265")
+
+    def test_unknown_raises(self):
+        with self.assertRaises(KeyError):
+            select_profile("ultra")
+
+    def test_tier_without_table_uses_default(self):
+        for tier, name in DEFAULT_PROFILES.items():
+            self.assertEqual(select_profile(tier, {}).name, name)
+
+    def test_fastest_above_floor_wins(self):
+        table = {"results": [
+            _row("preview-x264", 120, 0.97),
+            _row("preview-x265", 300, 0.90),   # below preview floor
+            _row("preview-av1", 200, 0.96),
+            _row("final-x264", 999, 0.99),     # other tier
+        ]}
+        self.assertEqual(select_profile("preview", table, encoders=_SW).name, "preview-av1")
+        self.assertEqual(
+            select_profile("preview", table, quality_floor=0.85, encoders=_SW).name,
+            "preview-x265",
+        )
+
+    def test_failed_or_unavailable_rows_skipped(self):
+        table = {"results": [
+            _row("draft-vaapi", 900, 0.95),
+            _row("draft-av1", 500, 0.95, ok=False),
+            _row("draft-x265", 100, 0.95),
+        ]}
+        self.assertEqual(select_profile("draft", table, encoders=_SW).name, "draft-x265")
+
+
+class TestApplyProfile(unittest.TestCase):
+
+    def test_keeps_geometry_replaces_encoder(self):
+        base = {"w": 1280, "h": 720, "fps": 30, "vcodec": "libx264", "crf": 18,
+                "preset": "slow", "pix_fmt": "yuv420p"}
+        merged = apply_profile(base, PROFILES["draft-vaapi"])
+        self.assertEqual((merged["w"], merged["h"], merged["fps"]), (1280, 720, 30))
+        self.assertEqual(merged["vcodec"], "h264_vaapi")
+        self.assertEqual(merged["pix_fmt"], "")
+        self.assertEqual(merged["profile"], "draft-vaapi")
+        self.assertEqual(base["vcodec"], "libx264")
+
+
+class TestHwUpload(unittest.TestCase):
+
+    VAAPI = PROFILES["final-vaapi"].output_settings()
+
+    def test_software_encoder_unchanged(self):
+        cmd = ["ffmpeg", "-y", "-i", "a.mp4", "-vf", "scale=1:1", "-c:v", "libx264", "o.mp4"]
+        self.assertEqual(_with_hw_upload(list(cmd), {"vcodec": "libx264"}), cmd)
+
+    def test_vf_appended(self):
+        cmd = ["ffmpeg", "-y", "-i", "a.mp4", "-vf", "scale=1:1", "-c:v", "h264_vaapi", "o.mp4"]
+        out = _with_hw_upload(cmd, self.VAAPI)
+        self.assertEqual(out[2], "-init_hw_device")
+        self.assertEqual(out[out.index("-vf") + 1], "scale=1:1,format=nv12,hwupload")
+
+    def test_vf_added_when_missing(self):
+        cmd = ["ffmpeg", "-y", "-i", "a.mp4", "-c:v", "h264_vaapi", "o.mp4"]
+        out = _with_hw_upload(cmd, self.VAAPI)
+        self.assertEqual(out[out.index("-vf") + 1], "format=nv12,hwupload")
+        self.assertLess(out.index("-vf"), out.index("-c:v"))
+
+    def test_filter_complex_relabelled(self):
+        cmd = ["ffmpeg", "-y", "-i", "a.mp4", "-filter_complex", "[0:v]null[vout]",
+               "-map", "[vout]", "-map", "1:a", "-c:v", "h264_vaapi", "o.mp4"]
+        out = _with_hw_upload(cmd, self.VAAPI)
+        fc = out[out.index("-filter_complex") + 1]
+        self.assertTrue(fc.endswith(";[vout]format=nv12,hwupload[venc]"))
+        self.assertEqual(out[out.index("-map") + 1], "[venc]")
+
+
+class TestProfileTable(unittest.TestCase):
+
+    def setUp(self):
+        self._tmpdir = tempfile.mkdtemp()
+        self.path = Path(self._tmpdir) / "encode_profiles.json"
+
+    def tearDown(self):
+        import shutil
+        shutil.rmtree(self._tmpdir, ignore_errors=True)
+
+    def test_missing_table(self):
+        self.assertEqual(load_profile_table(self.path), {})
+
+    def test_other_host_ignored(self):
+        self.path.write_text(json.dumps({"host": "not-" + platform.node(), "results": []}))
+        self.assertEqual(load_profile_table(self.path), {})
+
+    def test_same_host_loaded(self):
+        self.path.write_text(json.dumps({"host": platform.node(), "results": [1]}))
+        self.assertEqual(load_profile_table(self.path)["results"], [1])
+
+    def test_env_override(self):
+        from rayvault.encode_profiles import default_profile_table
+        with mock.patch.dict(os.environ, {"RAYVAULT_ENCODE_PROFILES": str(self.path)}):
+            self.assertEqual(default_profile_table(), self.path)
+
+
+class TestAvailableEncoders(unittest.TestCase):
+
+    def tearDown(self):
+        available_encoders.cache_clear()
+
+    def test_parses_video_encoders(self):
+        proc = mock.MagicMock()
+        proc.stdout = (
+            "Encoders:\n"
+            " V..... = Video\n"
+            " ------\n"
+            " V....D libx264              libx264 H.264\n"
+            " V....D h264_vaapi           H.264 (VAAPI)\n"
+            " A....D aac                  AAC\n"
+        )
+        available_encoders.cache_clear()
+        with mock.patch("rayvault.encode_profiles.subprocess.run", return_value=proc):
+            self.assertEqual(available_encoders(), frozenset({"libx264", "h264_vaapi"}))
+
+    def test_missing_ffmpeg(self):
+        available_encoders.cache_clear()
+        with mock.patch("rayvault.encode_profiles.subprocess.run", side_effect=FileNotFoundError):
+            self.assertEqual(available_encoders(), frozenset())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -29,7 +29,9 @@ from tools.lib.error_log import (
     get_unresolved,
     log_error,
     resolve_error,
+    _read_log,
 )
+from tools.lib.event_store import store_path
 
 
 class TestLogError(unittest.TestCase):
@@ -41,8 +43,8 @@ class TestLogError(unittest.TestCase):
 
     def test_log_error_creates_file(self):
         entry = log_error("v001", "research", "Test error", _path=self.log_path)
-        self.assertTrue(self.log_path.is_file())
-        data = json.loads(self.log_path.read_text())
+        self.assertTrue(store_path(self.log_path).is_file())
+        data = _read_log(self.log_path)
         self.assertEqual(len(data), 1)
         self.assertEqual(data[0]["video_id"], "v001")
         self.assertEqual(data[0]["stage"], "research")
@@ -54,7 +56,7 @@ class TestLogError(unittest.TestCase):
     def test_log_error_appends(self):
         log_error("v001", "research", "Error 1", _path=self.log_path)
         log_error("v002", "script", "Error 2", _path=self.log_path)
-        data = json.loads(self.log_path.read_text())
+        data = _read_log(self.log_path)
         self.assertEqual(len(data), 2)
         self.assertEqual(data[0]["video_id"], "v001")
         self.assertEqual(data[1]["video_id"], "v002")
@@ -69,14 +71,14 @@ class TestLogError(unittest.TestCase):
         entry = log_error("v001", "research", "Fail", context=ctx,
                           _path=self.log_path)
         self.assertEqual(entry["context"], ctx)
-        data = json.loads(self.log_path.read_text())
+        data = _read_log(self.log_path)
         self.assertEqual(data[0]["context"]["command"], "research")
 
     def test_log_error_exit_code(self):
         entry = log_error("v001", "research", "Action needed", exit_code=2,
                           _path=self.log_path)
         self.assertEqual(entry["exit_code"], 2)
-        data = json.loads(self.log_path.read_text())
+        data = _read_log(self.log_path)
         self.assertEqual(data[0]["exit_code"], 2)
 
     def test_log_error_default_exit_code(self):
@@ -101,7 +103,7 @@ class TestResolveError(unittest.TestCase):
         self.assertEqual(result["resolution"]["fix"], "Added fallback")
         self.assertIn("resolved_at", result["resolution"])
         # Verify persisted
-        data = json.loads(self.log_path.read_text())
+        data = _read_log(self.log_path)
         self.assertTrue(data[0]["resolved"])
 
     def test_resolve_unknown_id(self):
@@ -180,6 +182,14 @@ class TestGetPatterns(unittest.TestCase):
         # Pattern should be truncated to 80 chars
         self.assertEqual(len(patterns[0]["pattern"]), 80)
 
+    def test_get_patterns_empty_error_counts_only_its_group(self):
+        log_error("v001", "research", "", _path=self.log_path)
+        log_error("v002", "research", "", _path=self.log_path)
+        for vid in ("v003", "v004", "v005"):
+            log_error(vid, "research", "Timeout", _path=self.log_path)
+        counts = {p["pattern"]: p["count"] for p in get_patterns(_path=self.log_path)}
+        self.assertEqual(counts, {"": 2, "Timeout": 3})
+
 
 class TestFormatLogText(unittest.TestCase):
     """Tests for format_log_text()."""
@@ -236,14 +246,14 @@ class TestCorruptAndMissing(unittest.TestCase):
         entry = log_error("v001", "research", "After corrupt",
                           _path=self.log_path)
         self.assertEqual(entry["video_id"], "v001")
-        data = json.loads(self.log_path.read_text())
+        data = _read_log(self.log_path)
         self.assertEqual(len(data), 1)
 
     def test_missing_dir_created(self):
         deep_path = Path(self.tmpdir) / "a" / "b" / "error_log.json"
         entry = log_error("v001", "research", "Deep path",
                           _path=deep_path)
-        self.assertTrue(deep_path.is_file())
+        self.assertTrue(store_path(deep_path).is_file())
         self.assertEqual(entry["video_id"], "v001")
 
 
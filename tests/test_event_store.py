@@ -0,0 +1,137 @@
+"""Tests for tools/lib/event_store.py — indexed append-only ledgers."""
+
+from __future__ import annotations
+
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+_repo = Path(__file__).resolve().parent.parent
+if str(_repo) not in sys.path:
+    sys.path.insert(0, str(_repo))
+
+from tools.lib.event_store import EventStore, store_path
+
+
+def _index(entry: dict) -> dict:
+    return {
+        "video_id": entry.get("video_id", ""),
+        "component": entry.get("component", ""),
+        "severity": entry.get("severity", ""),
+        "status": entry.get("status", ""),
+        "ts": entry.get("timestamp", ""),
+        "group_key": entry.get("root_cause", "")[:80],
+    }
+
+
+def _event(i: int, **kw) -> dict:
+    e = {
+        "event_id": f"le-{i}",
+        "video_id": f"v{i % 3:03d}",
+        "component": "research" if i % 2 else "tts",
+        "severity": "FAIL" if i % 4 == 0 else "WARN",
+        "status": "open",
+        "timestamp": f"2026-02-{10 + i:02d}T00:00:00Z",
+        "root_cause": "timeout" if i % 2 else "bad voice",
+    }
+    e.update(kw)
+    return e
+
+
+class TestEventStore(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / "events.json"
+        self.store = EventStore(self.path, "event_id", _index)
+
+    def tearDown(self):
+        self.store.close()
+        self.tmp.cleanup()
+
+    def test_reads_do_not_create_database(self):
+        self.assertEqual(self.store.query(), [])
+        self.assertIsNone(self.store.get("le-1"))
+        self.assertEqual(self.store.count(), 0)
+        self.assertFalse(store_path(self.path).exists())
+
+    def test_append_and_filters(self):
+        for i in range(10):
+            self.store.append(_event(i))
+        self.assertTrue(store_path(self.path).is_file())
+        self.assertEqual(self.store.count(), 10)
+        self.assertEqual(
+            [e["event_id"] for e in self.store.query(video_id="v001")],
+            ["le-1", "le-4", "le-7"],
+        )
+        self.assertEqual(len(self.store.query(component="tts", severity="FAIL")), 3)
+        self.assertEqual(len(self.store.query(component=["tts", "research"])), 10)
+        got = self.store.query(since="2026-02-12", until="2026-02-14T23:59:59Z")
+        self.assertEqual([e["event_id"] for e in got], ["le-2", "le-3", "le-4"])
+
+    def test_limit_keeps_newest(self):
+        for i in range(5):
+            self.store.append(_event(i))
+        self.assertEqual([e["event_id"] for e in self.store.query(limit=2)], ["le-3", "le-4"])
+        self.assertEqual(
+            [e["event_id"] for e in self.store.query(limit=2, newest_first=True)],
+            ["le-4", "le-3"],
+        )
+
+    def test_update_reindexes(self):
+        self.store.append(_event(1))
+        entry = self.store.get("le-1")
+        entry["status"] = "applied"
+        self.assertTrue(self.store.update("le-1", entry))
+        self.assertFalse(self.store.update("le-missing", entry))
+        self.assertEqual(self.store.query(status="open"), [])
+        self.assertEqual(self.store.query(status="applied")[0]["event_id"], "le-1")
+
+    def test_groups(self):
+        for i in range(5):
+            self.store.append(_event(i))
+        self.assertEqual(
+            self.store.groups(min_count=2),
+            [("research", "timeout", 2), ("tts", "bad voice", 3)],
+        )
+        self.assertEqual(self.store.groups(min_count=3), [("tts", "bad voice", 3)])
+
+    def test_migrates_legacy_json_once(self):
+        legacy = [_event(1), _event(2)]
+        self.path.write_text(json.dumps(legacy), encoding="utf-8")
+        self.assertEqual(self.store.query(), legacy)
+        self.assertTrue(self.path.is_file())  # tracked ledgers stay in place
+        self.store.append(_event(3))
+        self.assertEqual(self.store.count(), 3)
+
+        self.store.close()
+        reopened = EventStore(self.path, "event_id", _index)
+        self.assertEqual(reopened.count(), 3)
+        reopened.close()
+
+    def test_corrupt_legacy_json_imported_as_empty(self):
+        self.path.write_text("not json {{{", encoding="utf-8")
+        self.assertEqual(self.store.query(), [])
+        self.store.append(_event(1))
+        self.assertEqual(self.store.count(), 1)
+
+    def test_empty_group_key_is_a_filter(self):
+        for i in range(5):
+            self.store.append(_event(i))
+        self.store.append(_event(6, root_cause=""))
+        self.store.append(_event(8, root_cause=""))
+        self.assertIn(("tts", "", 2), self.store.groups())
+        self.assertEqual(len(self.store.query(component="tts", group_key="")), 2)
+        self.assertEqual(len(self.store.query(component="tts", group_key=None)), 5)
+
+    def test_recreated_database_is_reopened(self):
+        self.store.append(_event(1))
+        for suffix in ("", "-wal", "-shm"):
+            Path(str(store_path(self.path)) + suffix).unlink(missing_ok=True)
+        self.assertEqual(self.store.query(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -8,35 +8,51 @@ import json
 import struct
 import tempfile
 import unittest
+import threading
+import time
 import wave
 from pathlib import Path
+from unittest import mock
 
 from rayvault.ffmpeg_render import (
     DURATION_TOLERANCE_SEC,
+    FFMPEG_THREADS_PER_JOB,
     FRAME_TOLERANCE,
     KENBURNS_UPSCALE_W,
     KENBURNS_ZOOM_FACTOR,
     MIN_STABILITY_SCORE,
+    NODE_LINK,
+    NODE_RENDER,
+    NODE_REUSE,
     GateResult,
     RenderResult,
     SegmentResult,
     _scale_pad_filter,
     build_segment_cmd,
+    build_single_pass_cmd,
     classify_ffmpeg_error,
     compute_global_inputs_hash,
     compute_segment_inputs_hash,
+    concat_repairing_outliers,
+    default_render_jobs,
     file_stat_sig,
     gate_essential_files,
     gate_frames_consistency,
     gate_overlay_refs,
     gate_segment_sources,
     gate_temporal_consistency,
+    loudnorm_filter,
+    measure_loudnorm,
+    plan_render,
     read_json,
+    render,
+    render_segments,
     sha1_file,
     sha1_text,
     utc_now_iso,
     validate_run_inputs,
     wav_duration_seconds,
+    _concat_outliers,
 )
 
 
@@ -963,5 +979,409 @@ class TestBuildSegmentCmdWithOverlays(unittest.TestCase):
         self.assertIn("zoompan", cmd_str)
 
 
+
+# ---------------------------------------------------------------
+# Parallel segment scheduler
+# ---------------------------------------------------------------
+
+class TestDefaultRenderJobs(unittest.TestCase):
+
+    def test_cores_divided_by_threads(self):
+        with mock.patch("rayvault.ffmpeg_render.os.cpu_count", return_value=16):
+            self.assertEqual(default_render_jobs(), 16 // FFMPEG_THREADS_PER_JOB)
+            self.assertEqual(default_render_jobs(2), 8)
+
+    def test_never_below_one(self):
+        with mock.patch("rayvault.ffmpeg_render.os.cpu_count", return_value=None):
+            self.assertEqual(default_render_jobs(), 1)
+
+    def test_threads_flag_in_cmd(self):
+        seg = {"type": "product", "t0": 0, "t1": 5.0,
+               "visual": {"mode": "SKIP"}, "id": "p1"}
+        settings = {"w": 1920, "h": 1080, "fps": 30}
+        out = Path("/tmp/out.mp4")
+        cmd = build_segment_cmd(seg, Path("/tmp"), settings, {"items": []}, out, threads=3)
+        self.assertEqual(cmd[cmd.index("-threads") + 1], "3")
+        cmd = build_segment_cmd(seg, Path("/tmp"), settings, {"items": []}, out)
+        self.assertNotIn("-threads", cmd)
+
+
+class TestRenderSegments(unittest.TestCase):
+
+    def _segments(self, n):
+        return [{"id": f"seg_{i:03d}", "t0": i, "t1": i + 1} for i in range(n)]
+
+    def _run(self, segments, fake, jobs, **kw):
+        with mock.patch("rayvault.ffmpeg_render.render_segment", side_effect=fake):
+            return render_segments(
+                segments, Path("/tmp"), {}, {"items": []},
+                Path("/tmp/cache"), Path("/tmp/receipts"), None,
+                jobs=jobs, **kw,
+            )
+
+    def test_preserves_order_when_completion_is_shuffled(self):
+        segs = self._segments(8)
+
+        def fake(seg, *a, **k):
+            # Earlier segments finish last
+            time.sleep(0.005 * (8 - seg["t0"]))
+            return SegmentResult(seg_id=seg["id"], ok=True, output_path=seg["id"])
+
+        results = self._run(segs, fake, jobs=4)
+        self.assertEqual([r.seg_id for r in results], [s["id"] for s in segs])
+
+    def test_runs_concurrently_up_to_jobs(self):
+        active = [0]
+        peak = [0]
+        lock = threading.Lock()
+
+        def fake(seg, *a, **k):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.02)
+            with lock:
+                active[0] -= 1
+            return SegmentResult(seg_id=seg["id"], ok=True)
+
+        self._run(self._segments(9), fake, jobs=3)
+        self.assertEqual(peak[0], 3)
+
+    def test_threads_passed_only_when_parallel(self):
+        seen = []
+
+        def fake(seg, *a, **k):
+            seen.append(k.get("threads"))
+            return SegmentResult(seg_id=seg["id"], ok=True)
+
+        self._run(self._segments(2), fake, jobs=1)
+        self.assertEqual(seen, [None, None])
+        seen.clear()
+        self._run(self._segments(2), fake, jobs=2)
+        self.assertTrue(all(t and t >= 1 for t in seen))
+
+    def test_force_segments_forwarded(self):
+        forced = {}
+
+        def fake(seg, *a, **k):
+            forced[seg["id"]] = k["force"]
+            return SegmentResult(seg_id=seg["id"], ok=True)
+
+        self._run(self._segments(3), fake, jobs=2, force_segments={"seg_001"})
+        self.assertEqual(forced, {"seg_000": False, "seg_001": True, "seg_002": False})
+
+    def test_serial_stops_at_first_failure(self):
+        def fake(seg, *a, **k):
+            return SegmentResult(seg_id=seg["id"], ok=seg["t0"] != 1, error_code="OOM")
+
+        results = self._run(self._segments(4), fake, jobs=1)
+        self.assertTrue(results[0].ok)
+        self.assertFalse(results[1].ok)
+        self.assertEqual(results[2:], [None, None])
+
+    def test_parallel_failure_cancels_unstarted(self):
+        def fake(seg, *a, **k):
+            if seg["t0"] == 0:
+                return SegmentResult(seg_id=seg["id"], ok=False, error_code="OOM")
+            time.sleep(0.05)
+            return SegmentResult(seg_id=seg["id"], ok=True)
+
+        results = self._run(self._segments(10), fake, jobs=2)
+        self.assertFalse(results[0].ok)
+        self.assertIn(None, results)
+
+
+# ---------------------------------------------------------------
+# Single-pass render
+# ---------------------------------------------------------------
+
+class TestBuildSinglePassCmd(unittest.TestCase):
+
+    def setUp(self):
+        self._tmpdir = tempfile.mkdtemp()
+        self.run_dir = Path(self._tmpdir) / "run"
+        self.run_dir.mkdir()
+        (self.run_dir / "03_frame.png").write_bytes(b"\x89PNG")
+        (self.run_dir / "img.jpg").write_bytes(b"\xff\xd8\xff")
+        ov_dir = self.run_dir / "publish" / "overlays"
+        ov_dir.mkdir(parents=True)
+        (ov_dir / "lt_001.png").write_bytes(b"\x89PNG")
+        self._settings = {"w": 1920, "h": 1080, "fps": 30, "vcodec": "libx264"}
+        self._segments = [
+            {"type": "intro", "t0": 0, "t1": 2.0, "id": "intro"},
+            {"type": "product", "t0": 2.0, "t1": 7.0, "frames": 150, "rank": 1,
+             "visual": {"mode": "KEN_BURNS", "source": "img.jpg"}, "id": "p1"},
+            {"type": "product", "t0": 7.0, "t1": 9.0,
+             "visual": {"mode": "SKIP"}, "id": "p2"},
+        ]
+        self._overlays = {"items": [{
+            "rank": 1,
+            "lowerthird_path": "publish/overlays/lt_001.png",
+            "coords": {"lowerthird": {"x": 100, "y": 800}},
+        }]}
+
+    def tearDown(self):
+        import shutil
+        shutil.rmtree(self._tmpdir, ignore_errors=True)
+
+    def _cmd(self, audio_filter: str = "") -> list:
+        return build_single_pass_cmd(
+            self._segments, self.run_dir, self._settings, self._overlays,
+            self.run_dir / "02_audio.wav", audio_filter, self.run_dir / "out.mp4",
+        )
+
+    def test_one_graph_one_encode(self):
+        cmd = self._cmd()
+        self.assertEqual(cmd.count("-filter_complex"), 1)
+        self.assertEqual(cmd.count("-c:v"), 1)
+        fc = cmd[cmd.index("-filter_complex") + 1]
+        self.assertIn("concat=n=3:v=1:a=0", fc)
+        self.assertIn("zoompan", fc)
+        self.assertIn("[b1][2:v]overlay=100:800[ov2]", fc)
+        self.assertIn("[b0][ov2][b2]concat", fc)
+
+    def test_inputs_indexed_in_order(self):
+        cmd = self._cmd()
+        inputs = [cmd[i + 1] for i, a in enumerate(cmd) if a == "-i"]
+        self.assertEqual(len(inputs), 5)  # frame, image, lower-third, black, audio
+        self.assertTrue(inputs[0].endswith("03_frame.png"))
+        self.assertTrue(inputs[2].endswith("lt_001.png"))
+        self.assertTrue(inputs[-1].endswith("02_audio.wav"))
+        self.assertEqual(cmd[cmd.index("-map", cmd.index("[vout]")) + 1], "4:a")
+
+    def test_audio_filter_mapped(self):
+        cmd = self._cmd("loudnorm=I=-14:LRA=7:TP=-1")
+        fc = cmd[cmd.index("-filter_complex") + 1]
+        self.assertIn("[4:a]loudnorm=I=-14:LRA=7:TP=-1[aout]", fc)
+        self.assertIn("[aout]", cmd)
+
+    def test_black_segments_get_no_overlays_like_segment_mode(self):
+        (self.run_dir / "publish" / "overlays" / "lt_002.png").write_bytes(b"\x89PNG")
+        self._overlays["items"].append({
+            "rank": 2,
+            "lowerthird_path": "publish/overlays/lt_002.png",
+            "coords": {"lowerthird": {"x": 100, "y": 800}},
+        })
+        self._segments = [
+            self._segments[1],
+            {"type": "product", "t0": 7.0, "t1": 9.0, "rank": 2,
+             "visual": {"mode": "SKIP", "source": "img.jpg"}, "id": "p2"},
+            {"type": "product", "t0": 9.0, "t1": 10.0, "rank": 2,
+             "visual": {"mode": "SKIP"}, "id": "p2b"},
+            {"type": "product", "t0": 10.0, "t1": 11.0, "rank": 2,
+             "visual": {"mode": "MYSTERY", "source": "img.jpg"}, "id": "p2c"},
+        ]
+
+        def overlay_inputs(cmd):
+            return [cmd[i + 1] for i, a in enumerate(cmd)
+                    if a == "-i" and "/overlays/" in cmd[i + 1]]
+
+        per_segment = []
+        for seg in self._segments:
+            seg_cmd = build_segment_cmd(
+                seg, self.run_dir, self._settings, self._overlays, self.run_dir / "s.mp4",
+            )
+            per_segment.extend(overlay_inputs(seg_cmd))
+        cmd = self._cmd()
+        self.assertEqual(overlay_inputs(cmd), per_segment)
+        self.assertEqual(len(per_segment), 1)
+        fc = cmd[cmd.index("-filter_complex") + 1]
+        self.assertIn("[ov1][b1][b2][b3]concat=n=4", fc)
+
+
+class TestLoudnorm(unittest.TestCase):
+
+    _MEASURED = {
+        "input_i": "-20.1", "input_lra": "5.0", "input_tp": "-3.2",
+        "input_thresh": "-30.4", "target_offset": "0.3",
+    }
+
+    def test_second_pass_uses_measured(self):
+        f = loudnorm_filter(-14, -1, self._MEASURED)
+        self.assertIn("measured_I=-20.1", f)
+        self.assertIn("offset=0.3", f)
+        self.assertIn("linear=true", f)
+
+    def test_unmeasured_falls_back_to_single_pass(self):
+        f = loudnorm_filter(-14, -1, None)
+        self.assertNotIn("measured_I", f)
+
+    def test_measure_parses_json(self):
+        proc = mock.MagicMock(returncode=0)
+        proc.stderr = "[Parsed_loudnorm_0 @ 0x1]\n" + json.dumps(
+            {**self._MEASURED, "output_i": "-14.0"}
+        )
+        with mock.patch("rayvault.ffmpeg_render.subprocess.run", return_value=proc):
+            self.assertEqual(measure_loudnorm(Path("/a.wav"), -14, -1), self._MEASURED)
+
+    def test_measure_failure(self):
+        proc = mock.MagicMock(returncode=1, stderr="boom")
+        with mock.patch("rayvault.ffmpeg_render.subprocess.run", return_value=proc):
+            self.assertIsNone(measure_loudnorm(Path("/a.wav"), -14, -1))
+
+
+class TestRenderMode(unittest.TestCase):
+
+    def test_unknown_mode_blocked(self):
+        result = render(Path("/nonexistent"), mode="bogus")
+        self.assertFalse(result.ok)
+        self.assertEqual(result.status, "BLOCKED")
+
+
+# ---------------------------------------------------------------
+# Render graph / incremental plan
+# ---------------------------------------------------------------
+
+class TestRenderPlan(unittest.TestCase):
+
+    SETTINGS = {"w": 1920, "h": 1080, "fps": 30, "vcodec": "libx264", "crf": 18}
+
+    def setUp(self):
+        self._tmpdir = tempfile.mkdtemp()
+        self.run_dir = Path(self._tmpdir)
+        self.publish = self.run_dir / "publish"
+        (self.publish / "overlays").mkdir(parents=True)
+        self.audio = _make_wav(self.run_dir / "02_audio.wav", 4.0)
+        self.lt = self.publish / "overlays" / "lt_01.png"
+        self.lt.write_bytes(b"png-v1")
+        self.overlays = {"items": [{
+            "rank": 1, "lowerthird_path": "publish/overlays/lt_01.png",
+            "coords": {"lowerthird": {"x": 10, "y": 20}},
+        }]}
+        self.segments = [
+            {"id": f"seg_{i:03d}", "rank": i, "type": "product", "t0": 2 * i, "t1": 2 * i + 2,
+             "visual": {"mode": "SKIP"}}
+            for i in range(2)
+        ]
+        self.audio_config = {"normalize_lufs": -14, "true_peak": -1}
+
+    def tearDown(self):
+        import shutil
+        shutil.rmtree(self._tmpdir, ignore_errors=True)
+
+    def _plan(self, previous=None, **kw):
+        return plan_render(
+            self.run_dir, self.segments, self.overlays, self.SETTINGS,
+            self.audio, self.audio_config, previous, **kw,
+        )
+
+    def _render_all(self):
+        """Simulate a completed segment render: caches, concat, final, receipt."""
+        plan = self._plan()
+        cache_dir = self.publish / "render_cache"
+        receipts_dir = self.publish / "seg_receipts"
+        cache_dir.mkdir(exist_ok=True)
+        receipts_dir.mkdir(exist_ok=True)
+        for node in plan.segments:
+            (cache_dir / f"{node.node_id}.mp4").write_bytes(b"v")
+            (receipts_dir / f"{node.node_id}.json").write_text(
+                json.dumps({"inputs_hash": node.hash}))
+        (cache_dir / "video_noaudio.mp4").write_bytes(b"v")
+        (cache_dir / "video_noaudio.json").write_text(json.dumps({"hash": plan.concat.hash}))
+        (self.publish / "video_final.mp4").write_bytes(b"v")
+        return {"graph": plan.graph_receipt()}
+
+    def test_segment_hash_matches_inputs_hash(self):
+        plan = self._plan()
+        for seg, node in zip(self.segments, plan.segments):
+            self.assertEqual(
+                node.hash,
+                compute_segment_inputs_hash(seg, self.run_dir, self.overlays, self.SETTINGS),
+            )
+
+    def test_first_render_runs_everything(self):
+        plan = self._plan()
+        self.assertEqual([n.action for n in plan.segments], [NODE_RENDER, NODE_RENDER])
+        self.assertEqual(plan.segments[0].reasons, ["new"])
+        self.assertFalse(plan.up_to_date)
+        self.assertGreater(plan.est_sec, 0)
+
+    def test_unchanged_is_up_to_date(self):
+        previous = self._render_all()
+        plan = self._plan(previous)
+        self.assertTrue(plan.up_to_date)
+        self.assertEqual(plan.to_render(), [])
+
+    def test_unrelated_config_edit_is_up_to_date(self):
+        previous = self._render_all()
+        (self.run_dir / "05_render_config.json").write_text('{"notes": "typo fixed"}')
+        self.assertTrue(self._plan(previous).up_to_date)
+
+    def test_lowerthird_edit_rerenders_one_segment(self):
+        previous = self._render_all()
+        self.overlays["items"][0]["coords"]["lowerthird"]["x"] = 12
+        plan = self._plan(previous)
+        actions = {n.node_id: n.action for n in plan.segments}
+        self.assertEqual(actions, {"seg_000": NODE_REUSE, "seg_001": NODE_RENDER})
+        self.assertEqual(plan.segments[1].reasons, ["overlays changed"])
+        self.assertEqual(
+            [n.node_id for n in plan.to_render()], ["seg_001", "concat", "audio_mux"],
+        )
+
+    def test_audio_only_edit_reuses_concat(self):
+        previous = self._render_all()
+        self.audio_config["normalize_lufs"] = -16
+        plan = self._plan(previous)
+        self.assertEqual(plan.concat.action, NODE_REUSE)
+        self.assertEqual(plan.audio_mux.action, NODE_RENDER)
+        self.assertEqual(plan.audio_mux.reasons, ["audio changed"])
+
+    def test_forced_segment(self):
+        previous = self._render_all()
+        plan = self._plan(previous, force_segments={"seg_000"})
+        self.assertEqual(plan.segments[0].reasons, ["forced"])
+        self.assertEqual(plan.segments[1].action, NODE_REUSE)
+        self.assertFalse(plan.up_to_date)
+
+    def test_blob_store_hit_links(self):
+        store = mock.MagicMock()
+        store.get_key.return_value = "sha"
+        plan = self._plan(blob_store=store)
+        self.assertEqual({n.action for n in plan.segments}, {NODE_LINK})
+        self.assertEqual(sum(n.est_sec for n in plan.segments), 0)
+
+    def test_explain_lists_invalidated_nodes(self):
+        previous = self._render_all()
+        self.lt.write_bytes(b"png-v2-longer")
+        lines = self._plan(previous).explain()
+        self.assertIn("1 of 2 segments to encode", lines[0])
+        self.assertTrue(any("seg_001" in l and "overlays changed" in l for l in lines))
+        self.assertIn("(1 segments reused from render_cache)", lines[-1])
+
+
+class TestConcatRepair(unittest.TestCase):
+
+    @staticmethod
+    def _info(codec="h264"):
+        return {"streams": [{"codec_type": "video", "codec_name": codec, "width": 1920,
+                             "height": 1080, "pix_fmt": "yuv420p", "r_frame_rate": "30/1"}]}
+
+    def test_outliers_by_stream_params(self):
+        paths = [Path(f"/tmp/s{i}.mp4") for i in range(3)]
+        infos = {paths[0]: self._info(), paths[1]: self._info("hevc"), paths[2]: self._info()}
+        with mock.patch("rayvault.ffmpeg_render.probe_many", return_value=infos):
+            self.assertEqual(_concat_outliers(paths), [1])
+
+    def test_rerenders_outliers_before_full_reencode(self):
+        paths = [Path(f"/tmp/s{i}.mp4") for i in range(3)]
+        calls = []
+
+        def fake_concat(seg_paths, out_path, settings, allow_reencode=True):
+            calls.append(allow_reencode)
+            ok = len(calls) == 2
+            return ok, "cmd", "" if ok else "mismatch"
+
+        rerender = mock.MagicMock(return_value=True)
+        with mock.patch("rayvault.ffmpeg_render.concat_segments", side_effect=fake_concat), \
+                mock.patch("rayvault.ffmpeg_render._concat_outliers", return_value=[2]):
+            ok, _, _, repaired = concat_repairing_outliers(
+                ["a", "b", "c"], paths, Path("/tmp/o.mp4"), {}, rerender,
+            )
+        self.assertTrue(ok)
+        self.assertEqual(repaired, ["c"])
+        rerender.assert_called_once_with({"c"})
+        self.assertEqual(calls, [False, False])
+
+
 if __name__ == "__main__":
     unittest.main()
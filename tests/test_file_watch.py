@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""Tests for tools/lib/file_watch.py — event-driven file readiness waits."""
+
+from __future__ import annotations
+
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+
+from tools.lib.file_watch import wait_until_ready
+
+HAS_INOTIFY = sys.platform.startswith("linux")
+
+
+def _write_later(path: Path, delay: float, data: bytes = b"done\n") -> threading.Thread:
+    def run():
+        time.sleep(delay)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+
+    t = threading.Thread(target=run, daemon=True)
+    t.start()
+    return t
+
+
+class TestWaitUntilReady(unittest.TestCase):
+
+    def setUp(self):
+        self._tmpdir = tempfile.mkdtemp()
+        self.root = Path(self._tmpdir)
+
+    def tearDown(self):
+        shutil.rmtree(self._tmpdir, ignore_errors=True)
+
+    def test_existing_file_ready_immediately(self):
+        path = self.root / "script.md"
+        path.write_text("x")
+        result = wait_until_ready([str(path)], 5)
+        self.assertTrue(result.ok)
+        self.assertEqual(result.ready[str(path)], 0.0)
+
+    def test_empty_and_stale_files_not_ready(self):
+        empty = self.root / "empty.md"
+        empty.write_text("")
+        stale = self.root / "stale.md"
+        stale.write_text("old")
+        os.utime(stale, (1000, 1000))
+        result = wait_until_ready([str(empty), str(stale)], 0.3, min_mtime=2000, poll_sec=0.05)
+        self.assertFalse(result.ok)
+        self.assertEqual(sorted(result.missing), sorted([str(empty), str(stale)]))
+
+    @unittest.skipUnless(HAS_INOTIFY, "inotify is Linux-only")
+    def test_inotify_wakes_on_close_write(self):
+        path = self.root / "review.md"
+        _write_later(path, 0.2)
+        result = wait_until_ready([str(path)], 10, settle_sec=5)
+        self.assertEqual(result.backend, "inotify")
+        self.assertTrue(result.ok)
+        # Woken by the event, not by the 5s settle window or a poll step.
+        self.assertLess(result.ready[str(path)], 2.0)
+
+    @unittest.skipUnless(HAS_INOTIFY, "inotify is Linux-only")
+    def test_inotify_follows_new_directories(self):
+        path = self.root / "ep" / "assets" / "manifest.json"
+        _write_later(path, 0.2)
+        result = wait_until_ready([str(path)], 10, settle_sec=0.2)
+        self.assertTrue(result.ok)
+        self.assertLess(result.ready[str(path)], 2.0)
+
+    def test_poll_fallback_waits_for_stable_size(self):
+        path = self.root / "pack.json"
+        _write_later(path, 0.1)
+        result = wait_until_ready([str(path)], 5, settle_sec=0.2, poll_sec=0.05, use_inotify=False)
+        self.assertEqual(result.backend, "poll")
+        self.assertTrue(result.ok)
+        self.assertGreaterEqual(result.ready[str(path)], 0.3)
+        self.assertLess(result.ready[str(path)], 1.5)
+
+    def test_many_paths_report_per_file_latency(self):
+        paths = [self.root / f"out_{i}.json" for i in range(4)]
+        threads = [_write_later(p, 0.1 * (i + 1)) for i, p in enumerate(paths)]
+        result = wait_until_ready([str(p) for p in paths], 10, settle_sec=0.1, poll_sec=0.05)
+        for t in threads:
+            t.join()
+        self.assertTrue(result.ok)
+        latencies = [result.ready[str(p)] for p in paths]
+        self.assertEqual(latencies, sorted(latencies))
+        self.assertLess(result.elapsed_sec, 3.0)
+
+    def test_timeout_reports_missing(self):
+        present = self.root / "a.md"
+        present.write_text("a")
+        absent = self.root / "b.md"
+        t0 = time.monotonic()
+        result = wait_until_ready([str(present), str(absent)], 0.3)
+        self.assertLess(time.monotonic() - t0, 2.0)
+        self.assertEqual(result.missing, [str(absent)])
+        self.assertIn(str(present), result.ready)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""Tests for rayvault/frame_sampler.py — batched frame channel means."""
+
+from __future__ import annotations
+
+import subprocess
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from rayvault.frame_sampler import (
+    THUMB_H,
+    THUMB_W,
+    build_sampler_cmd,
+    red_ratio,
+    sample_frame_means,
+)
+
+FRAME_BYTES = THUMB_W * THUMB_H * 3
+
+
+def _frame(r: int, g: int, b: int) -> bytes:
+    return bytes([r, g, b]) * (THUMB_W * THUMB_H)
+
+
+def _proc(frames, pts):
+    stderr = "".join(
+        f"[Parsed_showinfo_2 @ 0x1] n:{i} pts:{int(t * 1000)} pts_time:{t} duration:1\n"
+        for i, t in enumerate(pts)
+    )
+    return subprocess.CompletedProcess(
+        args=[], returncode=0, stdout=b"".join(frames), stderr=stderr.encode(),
+    )
+
+
+class TestBuildSamplerCmd(unittest.TestCase):
+
+    def test_single_invocation_with_all_timestamps(self):
+        cmd = build_sampler_cmd(Path("/v.mp4"), [0.1, 5.0, 12.25])
+        vf = cmd[cmd.index("-vf") + 1]
+        self.assertEqual(vf.count("gte(t,"), 3)
+        self.assertIn("gte(t,12.250)", vf)
+        self.assertIn(f"scale={THUMB_W}:{THUMB_H}:flags=area", vf)
+        self.assertIn("showinfo", vf)
+        self.assertEqual(cmd[cmd.index("-pix_fmt") + 1], "rgb24")
+        self.assertEqual(cmd.count("-i"), 1)
+
+
+class TestSampleFrameMeans(unittest.TestCase):
+
+    def test_maps_frames_back_to_input_order(self):
+        proc = _proc([_frame(200, 10, 10), _frame(10, 10, 200)], [0.1, 5.0])
+        with mock.patch("rayvault.frame_sampler.subprocess.run", return_value=proc) as run:
+            means = sample_frame_means(Path("/v.mp4"), [5.0, 0.1])
+        run.assert_called_once()
+        self.assertEqual(means[0], (10.0, 10.0, 200.0))
+        self.assertEqual(means[1], (200.0, 10.0, 10.0))
+
+    def test_two_timestamps_on_same_frame(self):
+        # Both timestamps fall before the next frame at 0.2 -> one output frame
+        proc = _proc([_frame(100, 50, 50)], [0.2])
+        with mock.patch("rayvault.frame_sampler.subprocess.run", return_value=proc):
+            means = sample_frame_means(Path("/v.mp4"), [0.15, 0.18])
+        self.assertEqual(means, [(100.0, 50.0, 50.0), (100.0, 50.0, 50.0)])
+
+    def test_timestamp_past_end_is_none(self):
+        proc = _proc([_frame(1, 2, 3)], [1.0])
+        with mock.patch("rayvault.frame_sampler.subprocess.run", return_value=proc):
+            means = sample_frame_means(Path("/v.mp4"), [1.0, 99.0])
+        self.assertIsNotNone(means[0])
+        self.assertIsNone(means[1])
+
+    def test_ffmpeg_failure(self):
+        proc = subprocess.CompletedProcess(args=[], returncode=1, stdout=b"", stderr=b"boom")
+        with mock.patch("rayvault.frame_sampler.subprocess.run", return_value=proc):
+            self.assertEqual(sample_frame_means(Path("/v.mp4"), [1.0, 2.0]), [None, None])
+
+    def test_empty(self):
+        self.assertEqual(sample_frame_means(Path("/v.mp4"), []), [])
+
+    def test_pure_python_fallback_matches(self):
+        proc = _proc([_frame(30, 60, 90)], [0.0])
+        with mock.patch("rayvault.frame_sampler.subprocess.run", return_value=proc), \
+             mock.patch("rayvault.frame_sampler._HAS_NUMPY", False):
+            means = sample_frame_means(Path("/v.mp4"), [0.0])
+        self.assertEqual(means, [(30.0, 60.0, 90.0)])
+
+
+class TestRedRatio(unittest.TestCase):
+
+    def test_ratio(self):
+        self.assertAlmostEqual(red_ratio((200.0, 0.0, 0.0)), 1.0)
+        self.assertAlmostEqual(red_ratio((10.0, 10.0, 10.0)), 1 / 3)
+
+    def test_black_and_none(self):
+        self.assertEqual(red_ratio((0.0, 0.0, 0.0)), 0.0)
+        self.assertIsNone(red_ratio(None))
+
+
+class TestDetectBlackFramesUsesBatch(unittest.TestCase):
+
+    def test_offline_suspects_from_one_sampler_call(self):
+        from rayvault.davinci_assembler import detect_black_frames
+
+        with tempfile.TemporaryDirectory() as td:
+            video = Path(td) / "v.mp4"
+            video.write_bytes(b"\x00")
+            segs = [
+                {"id": "seg_000", "t0": 0.0, "t1": 4.0},
+                {"id": "seg_001", "t0": 4.0, "t1": 8.0},
+            ]
+            means = [(10.0, 10.0, 10.0), (10.0, 10.0, 10.0),
+                     (250.0, 5.0, 5.0), (10.0, 10.0, 10.0)]
+            blank = subprocess.CompletedProcess(args=[], returncode=0, stdout="", stderr="")
+            with mock.patch("rayvault.davinci_assembler.subprocess.run", return_value=blank), \
+                 mock.patch("rayvault.davinci_assembler.sample_frame_means",
+                            return_value=means) as sampler:
+                result = detect_black_frames(video, segs)
+        sampler.assert_called_once()
+        self.assertEqual(sampler.call_args[0][1], [0.1, 2.0, 4.1, 6.0])
+        self.assertEqual(result["sampled_count"], 4)
+        self.assertFalse(result["ok"])
+        self.assertEqual(len(result["offline_suspects"]), 1)
+        suspect = result["offline_suspects"][0]
+        self.assertEqual(suspect["segment_id"], "seg_001")
+        self.assertEqual(suspect["timestamp"], 4.1)
+
+
+if __name__ == "__main__":
+    unittest.main()
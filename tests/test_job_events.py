@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""Tests for rayvault/agent/job_events.py — worker long-poll event log."""
+
+from __future__ import annotations
+
+import threading
+import time
+import unittest
+
+from rayvault.agent.job_events import JobEventLog
+
+
+class TestJobEventLog(unittest.TestCase):
+
+    def test_cursor_across_jobs(self):
+        log = JobEventLog()
+        log.emit("a", "status", status="queued")
+        log.emit("b", "status", status="queued")
+        log.emit("a", "log", message="started")
+        events, cursor, done = log.wait(["a", "b"], since=1, timeout=0)
+        self.assertEqual([e["seq"] for e in events], [2, 3])
+        self.assertEqual(cursor, 3)
+        self.assertFalse(done)
+        events, cursor, _ = log.wait(["a"], since=cursor, timeout=0)
+        self.assertEqual((events, cursor), ([], 3))
+
+    def test_waiter_wakes_on_terminal_status(self):
+        log = JobEventLog()
+        log.emit("a", "status", status="running")
+        cursor = log.cursor()
+
+        def finish():
+            time.sleep(0.05)
+            log.emit("a", "status", status="succeeded", job={"status": "succeeded"})
+
+        threading.Thread(target=finish).start()
+        t0 = time.monotonic()
+        events, _, done = log.wait(["a"], since=cursor, timeout=10)
+        self.assertLess(time.monotonic() - t0, 2.0)
+        self.assertTrue(done)
+        self.assertEqual(events[-1]["job"]["status"], "succeeded")
+
+    def test_terminal_jobs_return_immediately(self):
+        log = JobEventLog()
+        log.emit("a", "status", status="failed")
+        events, cursor, done = log.wait(["a"], since=log.cursor(), timeout=10)
+        self.assertEqual(events, [])
+        self.assertTrue(done)
+        self.assertTrue(log.is_terminal("a"))
+
+    def test_timeout_without_events(self):
+        log = JobEventLog()
+        log.emit("a", "status", status="running")
+        events, cursor, done = log.wait(["a"], since=log.cursor(), timeout=0.05)
+        self.assertEqual((events, done), ([], False))
+
+    def test_per_job_cap_keeps_tail(self):
+        log = JobEventLog(max_events_per_job=3)
+        for i in range(5):
+            log.emit("a", "log", message=str(i))
+        events, cursor, _ = log.wait(["a"], since=0, timeout=0)
+        self.assertEqual([e["message"] for e in events], ["2", "3", "4"])
+        self.assertEqual(cursor, 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -8,7 +8,6 @@ Stdlib only.
 
 from __future__ import annotations
 
-import json
 import sys
 import tempfile
 import unittest
@@ -33,6 +32,7 @@ from tools.learning_event import (
     sync_to_skill_graph,
     _read_events,
 )
+from tools.lib.event_store import store_path
 
 
 class TestMakeEventId(unittest.TestCase):
@@ -80,7 +80,7 @@ class TestCreateEvent(unittest.TestCase):
         self.assertEqual(evt.severity, "FAIL")
         self.assertEqual(evt.component, "research")
         self.assertEqual(evt.status, "open")
-        self.assertTrue(self.events_path.is_file())
+        self.assertTrue(store_path(self.events_path).is_file())
 
     def test_create_persists_to_file(self):
         create_event(
@@ -92,7 +92,7 @@ class TestCreateEvent(unittest.TestCase):
             fix_applied="Used drawbox to blank phone area",
             _path=self.events_path,
         )
-        data = json.loads(self.events_path.read_text())
+        data = _read_events(self.events_path)
         self.assertEqual(len(data), 1)
         self.assertEqual(data[0]["severity"], "WARN")
 
@@ -107,7 +107,7 @@ class TestCreateEvent(unittest.TestCase):
                 fix_applied="fix",
                 _path=self.events_path,
             )
-        data = json.loads(self.events_path.read_text())
+        data = _read_events(self.events_path)
         self.assertEqual(len(data), 3)
 
     def test_create_invalid_severity_raises(self):
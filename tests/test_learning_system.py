@@ -105,14 +105,15 @@ class TestLearningEventCRUD(unittest.TestCase):
 
     @patch("tools.learning_event.sync_to_skill_graph")
     def test_create_persists_to_file(self, mock_sync):
-        from tools.learning_event import create_event
+        from tools.learning_event import _read_events, create_event
+        from tools.lib.event_store import store_path
         create_event(
             run_id="v001", severity="WARN", component="assets",
             symptom="Phone ghost", root_cause="BG Remove incomplete",
             fix_applied="drawbox white", _path=self.events_path,
         )
-        self.assertTrue(self.events_path.is_file())
-        data = json.loads(self.events_path.read_text())
+        self.assertTrue(store_path(self.events_path).is_file())
+        data = _read_events(self.events_path)
         self.assertEqual(len(data), 1)
         self.assertEqual(data[0]["severity"], "WARN")
 
@@ -1267,9 +1268,9 @@ class TestPipelineLearningWiring(unittest.TestCase):
                         "v042", "discover-products", "ASIN B0X is accessories"
                     )
 
-            if events_path.is_file():
-                import json
-                data = json.loads(events_path.read_text())
+            from tools.learning_event import _read_events
+            data = _read_events(events_path)
+            if data:
                 self.assertEqual(len(data), 1)
                 self.assertEqual(data[0]["severity"], "FAIL")
                 self.assertEqual(data[0]["component"], "research")
@@ -3,8 +3,11 @@
 
 from __future__ import annotations
 
+import shutil
 import sys
+import tempfile
 import unittest
+import wave
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tools"))
@@ -18,6 +21,7 @@ from markdown_to_render_config import (
     build_rayvault_segments,
     build_render_config,
     build_segment_map,
+    build_voice_track,
     extract_script_text,
 )
 
@@ -301,6 +305,36 @@ class TestBuildManifest(unittest.TestCase):
         self.assertTrue(m["render"]["davinci_required"])
 
 
+# ---------------------------------------------------------------
+# build_voice_track
+# ---------------------------------------------------------------
+
+class TestBuildVoiceTrack(unittest.TestCase):
+
+    def setUp(self):
+        self._tmpdir = tempfile.mkdtemp()
+        self.root = Path(self._tmpdir)
+
+    def tearDown(self):
+        shutil.rmtree(self._tmpdir, ignore_errors=True)
+
+    def test_wav_voiceover_streamed_with_timing(self):
+        source = self.root / "voice" / "voiceover.wav"
+        source.parent.mkdir()
+        with wave.open(str(source), "wb") as wf:
+            wf.setnchannels(1)
+            wf.setsampwidth(2)
+            wf.setframerate(48000)
+            wf.writeframes(b"\x01\x00" * 72000)
+        out = self.root / "rayvault" / "02_audio.wav"
+
+        self.assertEqual(build_voice_track(source, out), 1.5)
+        with wave.open(str(out), "rb") as wf:
+            self.assertEqual((wf.getframerate(), wf.getnchannels()), (48000, 1))
+            self.assertEqual(wf.getnframes(), 72000)
+        self.assertTrue((self.root / "rayvault" / "02_audio.timing.json").exists())
+
+
 # ---------------------------------------------------------------
 # extract_script_text
 # ---------------------------------------------------------------
@@ -1,9 +1,13 @@
 #!/usr/bin/env python3
 """Comprehensive tests for pure functions in tools/market_auto_dispatch.py."""
 
+import json
 import sys
+import tempfile
+import threading
 import unittest
 from pathlib import Path
+from unittest import mock
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tools"))
 
@@ -17,6 +21,7 @@ from market_auto_dispatch import (
     product_key_for_item,
     slugify,
     split_products_by_novelty,
+    wait_for_files,
 )
 
 
@@ -554,5 +559,46 @@ class TestInferCategoryEdgeCases(unittest.TestCase):
         self.assertEqual(cat, "Tablets")
 
 
+
+# ---------------------------------------------------------------------------
+# wait_for_files
+# ---------------------------------------------------------------------------
+class TestWaitForFiles(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        self.events = self.root / "events.jsonl"
+        self.patches = [
+            mock.patch("market_auto_dispatch.OPS_EVENTS", str(self.events)),
+            mock.patch("market_auto_dispatch.OPS_EVENTS_BG", str(self.root / "bg.jsonl")),
+        ]
+        for p in self.patches:
+            p.start()
+
+    def tearDown(self):
+        for p in self.patches:
+            p.stop()
+        self.tmp.cleanup()
+
+    def test_wakes_on_handoff_and_logs_latency(self):
+        ready = self.root / "script.md"
+        timer = threading.Timer(0.2, ready.write_text, args=("draft",))
+        timer.start()
+        ok, missing = wait_for_files([str(ready)], 30)
+        timer.join()
+        self.assertTrue(ok)
+        self.assertEqual(missing, [])
+        event = json.loads(self.events.read_text().splitlines()[-1])
+        self.assertEqual(event["type"], "market_dispatch_file_wait")
+        self.assertLess(event["data"]["ready_latency_sec"][str(ready)], 5)
+
+    def test_missing_paths_keep_caller_spelling(self):
+        present = self.root / "a.md"
+        present.write_text("a")
+        ok, missing = wait_for_files([str(present), str(self.root / "b.md")], 0.2)
+        self.assertFalse(ok)
+        self.assertEqual(missing, [str(self.root / "b.md")])
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""Tests for rayvault/probe_cache.py — shared ffprobe result cache."""
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from rayvault.probe_cache import (
+    ProbeCache,
+    default_probe_db,
+    format_bitrate,
+    format_duration,
+)
+
+_INFO = {"format": {"duration": "12.5", "bit_rate": "2000000"}, "streams": []}
+
+
+def _ok(stdout: str = json.dumps(_INFO)) -> mock.MagicMock:
+    proc = mock.MagicMock()
+    proc.returncode = 0
+    proc.stdout = stdout
+    return proc
+
+
+class TestProbeCache(unittest.TestCase):
+
+    def setUp(self):
+        self._tmpdir = tempfile.mkdtemp()
+        self.tmp = Path(self._tmpdir)
+        self.db = self.tmp / "probe.db"
+        self.media = self.tmp / "a.mp4"
+        self.media.write_bytes(b"\x00" * 64)
+        old = time.time() - 60
+        os.utime(self.media, (old, old))
+
+    def tearDown(self):
+        import shutil
+        shutil.rmtree(self._tmpdir, ignore_errors=True)
+
+    def test_probes_once_per_file_version(self):
+        cache = ProbeCache(self.db)
+        with mock.patch("rayvault.probe_cache.subprocess.run", return_value=_ok()) as run:
+            self.assertEqual(cache.probe(self.media), _INFO)
+            self.assertEqual(cache.probe(self.media), _INFO)
+        self.assertEqual(run.call_count, 1)
+        self.assertEqual(cache.hits, 1)
+
+    def test_disk_cache_shared_across_instances(self):
+        with mock.patch("rayvault.probe_cache.subprocess.run", return_value=_ok()):
+            ProbeCache(self.db).probe(self.media)
+        with mock.patch("rayvault.probe_cache.subprocess.run") as run:
+            self.assertEqual(ProbeCache(self.db).probe(self.media), _INFO)
+        run.assert_not_called()
+
+    def test_changed_file_is_reprobed(self):
+        cache = ProbeCache(self.db)
+        with mock.patch("rayvault.probe_cache.subprocess.run", return_value=_ok()) as run:
+            cache.probe(self.media)
+            self.media.write_bytes(b"\x00" * 128)
+            old = time.time() - 30
+            os.utime(self.media, (old, old))
+            cache.probe(self.media)
+        self.assertEqual(run.call_count, 2)
+
+    def test_recently_modified_file_not_cached(self):
+        os.utime(self.media, None)
+        cache = ProbeCache(self.db)
+        with mock.patch("rayvault.probe_cache.subprocess.run", return_value=_ok()) as run:
+            cache.probe(self.media)
+            cache.probe(self.media)
+        self.assertEqual(run.call_count, 2)
+        self.assertFalse(self.db.exists())
+
+    def test_failure_not_cached(self):
+        cache = ProbeCache(self.db)
+        err = subprocess.CalledProcessError(1, "ffprobe", stderr="moov atom not found")
+        with mock.patch("rayvault.probe_cache.subprocess.run", side_effect=err):
+            self.assertIsNone(cache.probe(self.media))
+            with self.assertRaises(subprocess.CalledProcessError):
+                cache.probe(self.media, check=True)
+        with mock.patch("rayvault.probe_cache.subprocess.run", return_value=_ok()):
+            self.assertEqual(cache.probe(self.media), _INFO)
+
+    def test_probe_many(self):
+        paths = []
+        for i in range(5):
+            p = self.tmp / f"m{i}.mp4"
+            p.write_bytes(b"\x00" * (i + 1))
+            old = time.time() - 60
+            os.utime(p, (old, old))
+            paths.append(p)
+        cache = ProbeCache(None)
+        with mock.patch("rayvault.probe_cache.subprocess.run", return_value=_ok()) as run:
+            out = cache.probe_many(paths + paths, jobs=3)
+            cache.probe_many(paths, jobs=3)
+        self.assertEqual(set(out), set(paths))
+        self.assertEqual(run.call_count, 5)
+
+
+class TestProbeHelpers(unittest.TestCase):
+
+    def test_format_duration(self):
+        self.assertEqual(format_duration(_INFO), 12.5)
+        self.assertIsNone(format_duration(None))
+        self.assertIsNone(format_duration({"format": {}}))
+
+    def test_format_bitrate(self):
+        self.assertEqual(format_bitrate(_INFO), 2_000_000)
+        self.assertEqual(format_bitrate({}), 0)
+
+    def test_default_probe_db_env(self):
+        with mock.patch.dict(os.environ, {"RAYVAULT_PROBE_CACHE": "off"}):
+            self.assertIsNone(default_probe_db())
+        with mock.patch.dict(os.environ, {"RAYVAULT_PROBE_CACHE": "/tmp/p.db"}):
+            self.assertEqual(default_probe_db(), Path("/tmp/p.db"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""Tests for rayvault/proxy_render.py — low-res preview renders for gate reviews."""
+
+from __future__ import annotations
+
+import json
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from rayvault.ffmpeg_render import build_segment_cmd, compute_segment_inputs_hash
+from rayvault.proxy_render import (
+    PROXY_PROFILE,
+    build_contact_sheet_cmd,
+    proxy_cache_key,
+    proxy_output_settings,
+    render_proxy,
+    render_proxy_segment,
+)
+
+_OUT = {"w": 1920, "h": 1080, "fps": 30, "vcodec": "libx264", "crf": 18,
+        "preset": "slow", "pix_fmt": "yuv420p"}
+
+
+class TestProxyOutputSettings(unittest.TestCase):
+
+    def test_scaled_to_540p_with_draft_profile(self):
+        proxy = proxy_output_settings(_OUT)
+        self.assertEqual((proxy["w"], proxy["h"], proxy["fps"]), (960, 540, 30))
+        self.assertEqual(proxy["proxy_scale"], 0.5)
+        self.assertEqual(proxy["profile"], PROXY_PROFILE)
+        self.assertEqual(proxy["preset"], "ultrafast")
+        self.assertEqual(_OUT["w"], 1920)
+
+    def test_even_dimensions(self):
+        proxy = proxy_output_settings({**_OUT, "w": 1080, "h": 1920})
+        self.assertEqual(proxy["h"], 540)
+        self.assertEqual(proxy["w"] % 2, 0)
+
+    def test_never_upscales(self):
+        proxy = proxy_output_settings({**_OUT, "w": 640, "h": 360})
+        self.assertEqual((proxy["w"], proxy["h"], proxy["proxy_scale"]), (640, 360, 1.0))
+
+
+class TestProxySegmentCmd(unittest.TestCase):
+
+    def setUp(self):
+        self._tmpdir = tempfile.mkdtemp()
+        self.run_dir = Path(self._tmpdir)
+        (self.run_dir / "lt.png").write_bytes(b"png")
+        self.overlays = {"items": [{
+            "rank": 1, "lowerthird_path": "lt.png",
+            "coords": {"lowerthird": {"x": 100, "y": 900}},
+        }]}
+
+    def tearDown(self):
+        shutil.rmtree(self._tmpdir, ignore_errors=True)
+
+    def test_overlays_scaled(self):
+        seg = {"id": "seg_001", "rank": 1, "type": "product", "t0": 0, "t1": 2,
+               "visual": {"mode": "STILL_ONLY", "source": "img.png"}}
+        cmd = build_segment_cmd(
+            seg, self.run_dir, proxy_output_settings(_OUT), self.overlays, Path("o.mp4"),
+        )
+        fc = cmd[cmd.index("-filter_complex") + 1]
+        self.assertIn("scale=960:540", fc)
+        self.assertIn("[1:v]scale=iw*0.5000:-1[ovs1]", fc)
+        self.assertIn("overlay=50:450", fc)
+        self.assertIn("ultrafast", cmd)
+
+    def test_full_res_cmd_unchanged(self):
+        seg = {"id": "seg_001", "rank": 1, "type": "product", "t0": 0, "t1": 2,
+               "visual": {"mode": "STILL_ONLY", "source": "img.png"}}
+        cmd = build_segment_cmd(seg, self.run_dir, dict(_OUT), self.overlays, Path("o.mp4"))
+        fc = cmd[cmd.index("-filter_complex") + 1]
+        self.assertIn("[base][1:v]overlay=100:900", fc)
+        self.assertNotIn("ovs", fc)
+
+    def test_kenburns_upscale_scaled(self):
+        seg = {"id": "seg_002", "type": "product", "t0": 0, "t1": 2,
+               "visual": {"mode": "KEN_BURNS", "source": "img.png"}}
+        cmd = build_segment_cmd(
+            seg, self.run_dir, proxy_output_settings(_OUT), {}, Path("o.mp4"),
+        )
+        self.assertIn("scale=2000:-1", cmd[cmd.index("-vf") + 1])
+
+    def test_contact_sheet_cmd(self):
+        cmd = build_contact_sheet_cmd(Path("s.mp4"), Path("s.jpg"), 8.0, frames=4, thumb_w=320)
+        vf = cmd[cmd.index("-vf") + 1]
+        self.assertEqual(vf, "fps=0.500000,scale=320:-2,tile=4x1")
+        self.assertEqual(cmd[-1], "s.jpg")
+
+
+class TestRenderProxySegment(unittest.TestCase):
+
+    def setUp(self):
+        self._tmpdir = tempfile.mkdtemp()
+        self.run_dir = Path(self._tmpdir)
+        self.proxy_dir = self.run_dir / "publish" / "proxy"
+        self.seg = {"id": "seg_000", "type": "product", "t0": 0, "t1": 2,
+                    "visual": {"mode": "SKIP"}}
+
+    def tearDown(self):
+        shutil.rmtree(self._tmpdir, ignore_errors=True)
+
+    def _fake_ffmpeg(self, cmd, **kwargs):
+        Path(cmd[-1]).parent.mkdir(parents=True, exist_ok=True)
+        Path(cmd[-1]).write_bytes(b"out")
+        proc = mock.MagicMock()
+        proc.returncode = 0
+        proc.stderr = ""
+        return proc
+
+    def _render(self, height: int = 540):
+        return render_proxy_segment(
+            self.seg, self.run_dir, dict(_OUT), proxy_output_settings(_OUT, height), {},
+            self.proxy_dir,
+        )
+
+    def test_keyed_by_final_inputs_hash_and_proxy_settings(self):
+        with mock.patch("rayvault.proxy_render.subprocess.run", side_effect=self._fake_ffmpeg) as run, \
+                mock.patch("rayvault.proxy_render.ffprobe_duration", return_value=2.0):
+            first = self._render()
+            second = self._render()
+        self.assertTrue(first.ok)
+        self.assertFalse(first.cached)
+        self.assertEqual(
+            first.inputs_hash,
+            proxy_cache_key(
+                compute_segment_inputs_hash(self.seg, self.run_dir, {}, dict(_OUT)),
+                proxy_output_settings(_OUT),
+            ),
+        )
+        self.assertTrue(first.sheet_path.endswith("sheets/seg_000.jpg"))
+        self.assertTrue(second.cached)
+        self.assertEqual(run.call_count, 2)  # one encode + one contact sheet
+        receipt = json.loads((self.proxy_dir / "seg_000.json").read_text())
+        self.assertEqual(receipt["sheet"], "seg_000.jpg")
+
+    def test_changed_segment_rerenders(self):
+        with mock.patch("rayvault.proxy_render.subprocess.run", side_effect=self._fake_ffmpeg), \
+                mock.patch("rayvault.proxy_render.ffprobe_duration", return_value=2.0):
+            self._render()
+            self.seg["t1"] = 3
+            result = self._render()
+        self.assertFalse(result.cached)
+
+    def test_changed_height_rerenders(self):
+        with mock.patch("rayvault.proxy_render.subprocess.run", side_effect=self._fake_ffmpeg) as run, \
+                mock.patch("rayvault.proxy_render.ffprobe_duration", return_value=2.0):
+            self._render(540)
+            result = self._render(360)
+        self.assertFalse(result.cached)
+        encodes = [c for c in run.call_args_list if "-an" in c.args[0]]
+        self.assertEqual(len(encodes), 2)
+        self.assertIn("color=c=black:s=640x360", " ".join(encodes[-1].args[0]))
+
+    def test_changed_height_misses_blob_store(self):
+        from rayvault.blob_store import BlobStore
+        store = BlobStore(self.run_dir / "blobs")
+        with mock.patch("rayvault.proxy_render.subprocess.run", side_effect=self._fake_ffmpeg) as run, \
+                mock.patch("rayvault.proxy_render.ffprobe_duration", return_value=2.0):
+            render_proxy_segment(
+                self.seg, self.run_dir, dict(_OUT), proxy_output_settings(_OUT), {},
+                self.proxy_dir, blob_store=store,
+            )
+            result = render_proxy_segment(
+                self.seg, self.run_dir, dict(_OUT), proxy_output_settings(_OUT, 360), {},
+                self.run_dir / "other_proxy", blob_store=store,
+            )
+        self.assertFalse(result.cached)
+        self.assertEqual(sum(1 for c in run.call_args_list if "-an" in c.args[0]), 2)
+
+    def test_ffmpeg_failure(self):
+        proc = mock.MagicMock()
+        proc.returncode = 1
+        proc.stderr = "Unknown encoder 'libx264'"
+        with mock.patch("rayvault.proxy_render.subprocess.run", return_value=proc):
+            result = self._render()
+        self.assertFalse(result.ok)
+        self.assertFalse((self.proxy_dir / "seg_000.json").exists())
+
+
+class TestRenderProxy(unittest.TestCase):
+
+    def test_missing_inputs_blocked(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            result = render_proxy(Path(tmp))
+        self.assertFalse(result.ok)
+        self.assertEqual(result.status, "BLOCKED")
+        self.assertTrue(result.errors)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -8,6 +8,7 @@ import unittest
 import wave
 from pathlib import Path
 
+from rayvault.alignment import AlignmentIndex
 from rayvault.policies import MAX_STATIC_SECONDS, MIN_SEGMENT_TYPE_VARIETY
 from rayvault.render_config_generate import (
     CANVAS_DEFAULTS,
@@ -190,6 +191,35 @@ class TestGenerateTimeline(unittest.TestCase):
         product = [s for s in segs if s["type"] == "product"][0]
         self.assertEqual(product["rank"], 1)
 
+    def _alignment(self, spans):
+        """One two-word paragraph per (start, end) span."""
+        words, starts, ends = [], [], []
+        for i, (a, b) in enumerate(spans):
+            mid = (a + b) / 2
+            words += [f"w{i}", f"end{i}."]
+            starts += [a, mid]
+            ends += [mid, b]
+        return AlignmentIndex(words, starts, ends, duration_sec=spans[-1][1] + 0.5)
+
+    def test_alignment_sets_section_boundaries(self):
+        spans = [(0.2, 3.0), (3.4, 9.0), (9.2, 12.0), (12.6, 15.0)]
+        script = "\n\n".join("w end." for _ in spans)
+        segs = generate_timeline(
+            self._make_visuals(2), 15.5,
+            alignment=self._alignment(spans), script_text=script,
+        )
+        self.assertEqual([s["t0"] for s in segs], [0.0, 3.2, 9.1, 12.3])
+        self.assertEqual(segs[-1]["t1"], 15.5)
+        self.assertEqual(segs[1]["frames"], round((9.1 - 3.2) * 30))
+
+    def test_alignment_snaps_fixed_cuts_to_pauses(self):
+        spans = [(0.0, 1.8), (2.4, 5.0), (5.2, 20.0)]
+        segs = generate_timeline(
+            self._make_visuals(1), 20.5,
+            alignment=self._alignment(spans), script_text="unsplittable",
+        )
+        self.assertEqual(segs[1]["t0"], 2.1)  # T_INTRO=2.0 moved into the pause
+
 
 # ---------------------------------------------------------------
 # validate_pacing (render_config_generate version)
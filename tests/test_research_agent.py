@@ -5,10 +5,16 @@ No browser/API calls — all pure logic or mocked.
 
 from __future__ import annotations
 
+import shutil
 import sys
+import tempfile
+import threading
+import time
 import unittest
 from dataclasses import field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
+from unittest import mock
 
 _repo = Path(__file__).resolve().parent.parent
 if str(_repo) not in sys.path:
@@ -758,5 +764,153 @@ class TestStrategy2Tightened(unittest.TestCase):
         self.assertEqual(len(products), 0)
 
 
+
+_PAGE_DELAY = 0.4
+
+
+def _review_html(n: int) -> str:
+    picks = [
+        ("Our pick", "Sony WF-1000XM5"), ("Also great", "Apple AirPods Pro 3"),
+        ("Best budget", "EarFun Free 2S"), ("Best for calls", "Jabra Elite 10"),
+    ]
+    body = "".join(
+        f"<h2>{label}: {name}</h2><p>The {name} has excellent noise cancellation "
+        f"and solid battery life in review {n}. Sound quality is great.</p>"
+        for label, name in picks[n % 2:]
+    )
+    return f"<html><head><title>Best earbuds {n}</title></head><body>{body}</body></html>"
+
+
+class _ReviewHandler(BaseHTTPRequestHandler):
+    pages: dict[str, str] = {}
+    hits: list[str] = []
+
+    def do_GET(self):
+        type(self).hits.append(self.path)
+        time.sleep(_PAGE_DELAY)
+        html = self.pages.get(self.path)
+        if html is None:
+            self.send_error(404)
+            return
+        data = html.encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestConcurrentCrawl(unittest.TestCase):
+    """Step 2 crawl against a local stand-in serving canned review pages."""
+
+    @classmethod
+    def setUpClass(cls):
+        _ReviewHandler.pages = {
+            f"/{domain}/best-earbuds-{i}": _review_html(i)
+            for i, domain in enumerate(["nytimes.com/wirecutter", "rtings.com", "pcmag.com", "rtings.com"])
+        }
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), _ReviewHandler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        base = f"http://127.0.0.1:{cls.server.server_address[1]}"
+        cls.articles = [
+            (["Wirecutter", "RTINGS", "PCMag", "RTINGS"][i], base + path, f"Best earbuds {i}")
+            for i, path in enumerate(_ReviewHandler.pages)
+        ]
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        _ReviewHandler.hits = []
+        self._tmpdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self._tmpdir, ignore_errors=True)
+
+    def _caches(self):
+        from tools.lib.evidence_cache import EvidenceCache
+        from tools.lib.fetch_cache import FetchCache
+        return (FetchCache(cache_dir=Path(self._tmpdir) / "pages"),
+                EvidenceCache(cache_dir=Path(self._tmpdir) / "evidence"))
+
+    def test_matches_serial_and_overlaps_pages(self):
+        from tools.research_agent import _crawl_articles, _open_and_extract
+
+        with mock.patch("tools.research_agent.time.sleep"):
+            serial = [_open_and_extract(*a) for a in self.articles]
+
+        start = time.monotonic()
+        crawled = _crawl_articles(self.articles, per_domain=4, delay_sec=0)
+        elapsed = time.monotonic() - start
+
+        self.assertEqual(crawled, serial)
+        self.assertTrue(all(len(r.products_found) >= 2 for r in crawled))
+        self.assertLess(elapsed, 2 * _PAGE_DELAY)
+
+    def test_per_domain_limit_serializes_same_host(self):
+        from tools.research_agent import _crawl_articles
+
+        start = time.monotonic()
+        _crawl_articles(self.articles, per_domain=1, delay_sec=0)
+        self.assertGreaterEqual(time.monotonic() - start, len(self.articles) * _PAGE_DELAY)
+
+    def test_second_run_served_from_cache(self):
+        from tools.research_agent import _crawl_articles
+
+        fetch_cache, evidence_cache = self._caches()
+        first = _crawl_articles(self.articles, fetch_cache=fetch_cache,
+                                evidence_cache=evidence_cache, per_domain=4, delay_sec=0)
+        self.assertEqual(len(_ReviewHandler.hits), len(self.articles))
+
+        with mock.patch("tools.research_agent._extract_report") as extract:
+            again = _crawl_articles(self.articles, fetch_cache=fetch_cache,
+                                    evidence_cache=evidence_cache, per_domain=4, delay_sec=0)
+        extract.assert_not_called()
+        self.assertEqual(len(_ReviewHandler.hits), len(self.articles))
+        self.assertEqual(again, first)
+
+        _crawl_articles(self.articles[:1], fetch_cache=fetch_cache,
+                        evidence_cache=evidence_cache, force=True)
+        self.assertEqual(len(_ReviewHandler.hits), len(self.articles) + 1)
+        fetch_cache.close()
+
+    def test_domain_violation_keeps_earlier_reports(self):
+        from tools import research_agent
+
+        bad = ("PCMag", "https://example.com/best-earbuds", "Best earbuds")
+        articles = [self.articles[0], self.articles[1], bad, self.articles[2]]
+        with mock.patch.object(research_agent, "_find_review_articles", return_value=articles), \
+                mock.patch.object(research_agent, "_open_caches", return_value=(None, None)):
+            report = research_agent.run_reviews_research(
+                "vid", "earbuds", output_dir=Path(self._tmpdir),
+            )
+        self.assertEqual([r.url for r in report.sources_reviewed],
+                         [self.articles[0][1], self.articles[1][1]])
+        self.assertIn("example.com", report.validation_errors[0])
+
+
+class TestFindReviewArticles(unittest.TestCase):
+
+    def test_searches_run_concurrently_in_source_order(self):
+        from tools import research_agent
+        from tools.lib.web_search import SearchResult
+
+        def fake_search(query, count=3):
+            domain = query.split("site:")[1]
+            time.sleep(0.3 if "nytimes" in domain else 0.05)
+            return [SearchResult(title="Best earbuds", url=f"https://{domain}/best-earbuds")]
+
+        start = time.monotonic()
+        with mock.patch.object(research_agent, "web_search", side_effect=fake_search):
+            articles = research_agent._find_review_articles("earbuds")
+        self.assertLess(time.monotonic() - start, 0.5)
+        self.assertEqual([a[0] for a in articles], list(research_agent.TRUSTED_SOURCES))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -259,6 +259,31 @@ class TestManifestGeneration(unittest.TestCase):
         m = generate_manifest("test-001", SAMPLE_SCRIPT, self.vdir)
         self.assertGreater(m.total_duration_s, 0)
 
+    def test_alignment_drives_section_timing(self):
+        from rayvault.alignment import AlignmentIndex
+        from tools.lib.resolve_schema import VOICEOVER_SECTION_ORDER
+        sections = parse_script_sections(SAMPLE_SCRIPT)
+        words = []
+        for key in VOICEOVER_SECTION_ORDER:
+            words += sections[key].split()
+        # Every word takes 0.5s: far slower than SPEAKING_WPM
+        n = len(words)
+        index = AlignmentIndex(
+            words, [i * 0.5 for i in range(n)], [i * 0.5 + 0.4 for i in range(n)],
+            duration_sec=n * 0.5,
+        )
+        m = generate_manifest("test-001", SAMPLE_SCRIPT, self.vdir, alignment=index)
+        hook_words = count_words(sections["hook"])
+        self.assertAlmostEqual(m.hook_end_s, hook_words * 0.5 - 0.05, places=1)
+        self.assertAlmostEqual(
+            m.total_duration_s, n * 0.5 + AVATAR_INTRO_DURATION_S, places=0,
+        )
+
+    def test_empty_voiceover_falls_back_to_wpm(self):
+        m = generate_manifest("test-001", SAMPLE_SCRIPT, self.vdir)
+        hook_words = count_words(parse_script_sections(SAMPLE_SCRIPT)["hook"])
+        self.assertAlmostEqual(m.hook_end_s, round(hook_words / SPEAKING_WPM * 60, 1))
+
     def test_total_duration_reasonable(self):
         """8-12 min script should produce 200-900s manifest."""
         m = generate_manifest("test-001", SAMPLE_SCRIPT, self.vdir)
@@ -6,7 +6,6 @@ No external deps -- stdlib only.
 
 from __future__ import annotations
 
-import json
 import sys
 import tempfile
 import unittest
@@ -24,7 +23,9 @@ from tools.lib.run_log import (
     get_daily_summary,
     get_runs,
     log_run,
+    _read_log,
 )
+from tools.lib.event_store import store_path
 
 
 class TestLogRun(unittest.TestCase):
@@ -36,15 +37,15 @@ class TestLogRun(unittest.TestCase):
 
     def test_log_run_creates_file(self):
         entry = log_run("v001", "research", 0, 142.3, _path=self.log_path)
-        self.assertTrue(self.log_path.is_file())
-        data = json.loads(self.log_path.read_text())
+        self.assertTrue(store_path(self.log_path).is_file())
+        data = _read_log(self.log_path)
         self.assertEqual(len(data), 1)
         self.assertEqual(data[0]["video_id"], "v001")
 
     def test_log_run_appends(self):
         log_run("v001", "research", 0, 100.0, _path=self.log_path)
         log_run("v002", "script", 0, 50.0, _path=self.log_path)
-        data = json.loads(self.log_path.read_text())
+        data = _read_log(self.log_path)
         self.assertEqual(len(data), 2)
         self.assertEqual(data[0]["video_id"], "v001")
         self.assertEqual(data[1]["video_id"], "v002")
@@ -166,7 +167,7 @@ class TestCorruptFile(unittest.TestCase):
         self.log_path.write_text("not valid json{{{", encoding="utf-8")
         entry = log_run("v001", "research", 0, 10.0, _path=self.log_path)
         self.assertEqual(entry["video_id"], "v001")
-        data = json.loads(self.log_path.read_text())
+        data = _read_log(self.log_path)
         self.assertEqual(len(data), 1)
 
 
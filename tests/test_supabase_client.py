@@ -1,6 +1,7 @@
 """Tests for tools/lib/supabase_client.py.
 
-Mock-based — no real HTTP calls. Uses _mock_urlopen() pattern.
+Mock-based — no real HTTP calls. Uses _mock_urlopen() pattern. The pooled
+transport and write-behind queue run against a local PostgREST stand-in.
 """
 
 from __future__ import annotations
@@ -8,9 +9,13 @@ from __future__ import annotations
 import hashlib
 import io
 import json
+import os
+import socket
 import sys
 import tempfile
+import threading
 import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
@@ -26,6 +31,8 @@ from tools.lib.supabase_client import (
     query,
     upload_file,
     file_sha256,
+    flush,
+    _WriteBehind,
 )
 
 MOCK_ENV = {
@@ -68,7 +75,7 @@ class TestInsert(unittest.TestCase):
     """Test insert()."""
 
     @patch.dict("os.environ", MOCK_ENV)
-    @patch("tools.lib.supabase_client.urllib.request.urlopen")
+    @patch("tools.lib.supabase_client._urlopen")
     def test_insert_basic(self, mock_urlopen):
         mock_urlopen.return_value = _mock_response()
         result = insert("my_table", {"name": "test"})
@@ -81,7 +88,7 @@ class TestInsert(unittest.TestCase):
         self.assertEqual(body["name"], "test")
 
     @patch.dict("os.environ", MOCK_ENV)
-    @patch("tools.lib.supabase_client.urllib.request.urlopen")
+    @patch("tools.lib.supabase_client._urlopen")
     def test_insert_return_row(self, mock_urlopen):
         row = {"id": "abc-123", "name": "test"}
         mock_urlopen.return_value = _mock_response(json.dumps([row]).encode())
@@ -96,7 +103,7 @@ class TestInsert(unittest.TestCase):
         self.assertIsNone(result)
 
     @patch.dict("os.environ", MOCK_ENV)
-    @patch("tools.lib.supabase_client.urllib.request.urlopen")
+    @patch("tools.lib.supabase_client._urlopen")
     def test_insert_handles_http_error(self, mock_urlopen):
         import urllib.error
         err = urllib.error.HTTPError(
@@ -111,7 +118,7 @@ class TestUpsert(unittest.TestCase):
     """Test upsert()."""
 
     @patch.dict("os.environ", MOCK_ENV)
-    @patch("tools.lib.supabase_client.urllib.request.urlopen")
+    @patch("tools.lib.supabase_client._urlopen")
     def test_upsert_merge_header(self, mock_urlopen):
         row = {"id": "abc", "val": 1}
         mock_urlopen.return_value = _mock_response(json.dumps([row]).encode())
@@ -131,7 +138,7 @@ class TestUpdate(unittest.TestCase):
     """Test update()."""
 
     @patch.dict("os.environ", MOCK_ENV)
-    @patch("tools.lib.supabase_client.urllib.request.urlopen")
+    @patch("tools.lib.supabase_client._urlopen")
     def test_update_sends_patch(self, mock_urlopen):
         mock_urlopen.return_value = _mock_response()
         result = update("runs", {"id": "abc"}, {"status": "complete"})
@@ -147,7 +154,7 @@ class TestQuery(unittest.TestCase):
     """Test query()."""
 
     @patch.dict("os.environ", MOCK_ENV)
-    @patch("tools.lib.supabase_client.urllib.request.urlopen")
+    @patch("tools.lib.supabase_client._urlopen")
     def test_query_basic(self, mock_urlopen):
         rows = [{"id": 1, "name": "a"}, {"id": 2, "name": "b"}]
         mock_urlopen.return_value = _mock_response(json.dumps(rows).encode())
@@ -158,7 +165,7 @@ class TestQuery(unittest.TestCase):
         self.assertIn("select=*", req.full_url)
 
     @patch.dict("os.environ", MOCK_ENV)
-    @patch("tools.lib.supabase_client.urllib.request.urlopen")
+    @patch("tools.lib.supabase_client._urlopen")
     def test_query_with_filters(self, mock_urlopen):
         mock_urlopen.return_value = _mock_response(json.dumps([]).encode())
         query("my_table", filters={"status": "active"})
@@ -175,7 +182,7 @@ class TestUpload(unittest.TestCase):
     """Test upload_file()."""
 
     @patch.dict("os.environ", MOCK_ENV)
-    @patch("tools.lib.supabase_client.urllib.request.urlopen")
+    @patch("tools.lib.supabase_client._urlopen")
     def test_upload_post(self, mock_urlopen):
         mock_urlopen.return_value = _mock_response()
         with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as f:
@@ -189,7 +196,7 @@ class TestUpload(unittest.TestCase):
         Path(f.name).unlink()
 
     @patch.dict("os.environ", MOCK_ENV)
-    @patch("tools.lib.supabase_client.urllib.request.urlopen")
+    @patch("tools.lib.supabase_client._urlopen")
     def test_upload_upsert_on_409(self, mock_urlopen):
         import urllib.error
         err = urllib.error.HTTPError(
@@ -206,7 +213,7 @@ class TestUpload(unittest.TestCase):
         Path(f.name).unlink()
 
     @patch.dict("os.environ", MOCK_ENV)
-    @patch("tools.lib.supabase_client.urllib.request.urlopen")
+    @patch("tools.lib.supabase_client._urlopen")
     def test_upload_returns_public_url(self, mock_urlopen):
         mock_urlopen.return_value = _mock_response()
         with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as f:
@@ -242,7 +249,7 @@ class TestLegacyShim(unittest.TestCase):
     """Test supabase_storage.py shim delegates to supabase_client."""
 
     @patch.dict("os.environ", MOCK_ENV)
-    @patch("tools.lib.supabase_client.urllib.request.urlopen")
+    @patch("tools.lib.supabase_client._urlopen")
     def test_legacy_log_generation(self, mock_urlopen):
         mock_urlopen.return_value = _mock_response()
         from tools.lib.supabase_storage import log_generation
@@ -260,5 +267,183 @@ class TestLegacyShim(unittest.TestCase):
         self.assertEqual(body["product_name"], "Test Product")
 
 
+class _PostgrestStub:
+    """Local HTTP/1.1 PostgREST stand-in. Rejects rows with "bad": true."""
+
+    def __init__(self):
+        self.requests: list[dict] = []
+        self.rows: dict[str, list[dict]] = {}
+        self.arrived = threading.Event()
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                rows = body if isinstance(body, list) else [body]
+                table = self.path.split("?")[0].rsplit("/", 1)[-1]
+                stub.requests.append({
+                    "path": self.path, "body": body, "peer": self.client_address,
+                    "prefer": self.headers.get("Prefer", ""),
+                })
+                if any(row.get("bad") for row in rows):
+                    self._reply(400, b'{"message":"bad row"}')
+                else:
+                    stub.rows.setdefault(table, []).extend(rows)
+                    self._reply(201, b"")
+                stub.arrived.set()
+
+            def do_GET(self):
+                table = self.path.split("?")[0].rsplit("/", 1)[-1]
+                stub.requests.append({"path": self.path, "peer": self.client_address})
+                self._reply(200, json.dumps(stub.rows.get(table, [])).encode())
+
+            def _reply(self, status, payload):
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        threading.Thread(target=self.server.serve_forever, args=(0.05,), daemon=True).start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def _dead_url() -> str:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return f"http://127.0.0.1:{s.getsockname()[1]}"
+
+
+class TestPooledTransport(unittest.TestCase):
+
+    def setUp(self):
+        self.stub = _PostgrestStub()
+        self.env = patch.dict("os.environ", {
+            "SUPABASE_URL": self.stub.url, "SUPABASE_SERVICE_ROLE_KEY": "k",
+        })
+        self.env.start()
+
+    def tearDown(self):
+        self.env.stop()
+        self.stub.close()
+
+    def test_requests_share_one_keepalive_connection(self):
+        for i in range(3):
+            insert("events", {"n": i})
+        self.assertEqual(len(query("events")), 3)
+        peers = {r["peer"] for r in self.stub.requests}
+        self.assertEqual(len(self.stub.requests), 4)
+        self.assertEqual(len(peers), 1)
+
+    def test_http_error_still_swallowed(self):
+        self.assertIsNone(insert("events", {"bad": True}, return_row=True))
+
+    def test_proxy_env_uses_urlopen(self):
+        proxy = {"HTTP_PROXY": "http://proxy.invalid:3128", "NO_PROXY": "", "no_proxy": ""}
+        with patch.dict("os.environ", proxy), \
+             patch("urllib.request.urlopen", return_value=_mock_response(b"[]")) as opener:
+            insert("events", {"n": 1})
+        opener.assert_called_once()
+        self.assertEqual(self.stub.requests, [])
+
+    def test_no_proxy_host_stays_on_pool(self):
+        proxy = {"HTTP_PROXY": "http://proxy.invalid:3128", "NO_PROXY": "127.0.0.1", "no_proxy": "127.0.0.1"}
+        with patch.dict("os.environ", proxy):
+            insert("events", {"n": 1})
+        self.assertEqual(len(self.stub.requests), 1)
+
+
+class TestWriteBehind(unittest.TestCase):
+
+    def setUp(self):
+        self.stub = _PostgrestStub()
+        self.env = patch.dict("os.environ", {
+            "SUPABASE_URL": self.stub.url, "SUPABASE_SERVICE_ROLE_KEY": "k",
+        })
+        self.env.start()
+        self.writer = _WriteBehind(max_rows=100, flush_sec=60)
+        self.swap = patch("tools.lib.supabase_client._WRITER", self.writer)
+        self.swap.start()
+
+    def tearDown(self):
+        self.writer.flush(timeout=5)
+        self.swap.stop()
+        self.env.stop()
+        self.stub.close()
+
+    def test_rows_coalesce_into_bulk_inserts(self):
+        for i in range(5):
+            self.assertIsNone(insert("tts_audio", {"run_id": "r1", "chunk_index": i}, defer=True))
+        insert("assets", {"run_id": "r1", "label": "thumb"}, defer=True)
+        self.assertEqual(self.stub.requests, [])
+        self.assertTrue(flush(timeout=5))
+        self.assertEqual(len(self.stub.requests), 2)
+        bulk = next(r for r in self.stub.requests if "tts_audio" in r["path"])
+        self.assertEqual([row["chunk_index"] for row in bulk["body"]], list(range(5)))
+        self.assertIn("return=minimal", bulk["prefer"])
+        single = next(r for r in self.stub.requests if "assets" in r["path"])
+        self.assertEqual(single["body"]["label"], "thumb")
+
+    def test_full_batch_sent_without_flush(self):
+        self.writer.max_rows = 3
+        for i in range(3):
+            insert("agent_events", {"n": i}, defer=True)
+        self.assertTrue(self.stub.arrived.wait(5))
+        self.assertEqual(len(self.stub.requests[0]["body"]), 3)
+
+    def test_deferred_upsert_merges_on_conflict(self):
+        upsert("channel_memory", {"key": "a", "value": {}}, on_conflict="key", defer=True)
+        upsert("channel_memory", {"key": "b", "value": {}}, on_conflict="key", defer=True)
+        flush(timeout=5)
+        (req,) = self.stub.requests
+        self.assertIn("on_conflict=key", req["path"])
+        self.assertIn("resolution=merge-duplicates", req["prefer"])
+        self.assertEqual(len(req["body"]), 2)
+
+    def test_rejected_batch_retried_row_by_row(self):
+        for row in ({"n": 1}, {"n": 2, "bad": True}, {"n": 3}):
+            insert("scripts", {"bad": False, **row}, defer=True)
+        flush(timeout=5)
+        self.assertEqual(len(self.stub.requests), 4)
+        self.assertEqual([r["n"] for r in self.stub.rows["scripts"]], [1, 3])
+
+    def test_query_sees_pending_writes(self):
+        insert("niches", {"run_id": "r1"}, defer=True)
+        self.assertEqual(len(query("niches")), 1)
+
+    def test_offline_rows_spill_and_replay(self):
+        from tools.lib import worker_ops
+        with tempfile.TemporaryDirectory() as tmp, \
+                patch.object(worker_ops, "SPOOL_DIR", tmp):
+            with patch.dict("os.environ", {"SUPABASE_URL": _dead_url()}):
+                insert("tts_audio", {"run_id": "r9", "chunk_index": 0}, defer=True)
+                insert("tts_audio", {"run_id": "r9", "chunk_index": 1}, defer=True)
+                self.assertTrue(flush(timeout=10))
+            (name,) = os.listdir(tmp)
+            self.assertTrue(name.startswith("r9_"))
+            record = json.loads(Path(tmp, name).read_text())
+            self.assertEqual(record["event_type"], "supabase_write")
+            self.assertEqual(len(record["payload"]["rows"]), 2)
+
+            summary = worker_ops.replay_spool()
+        self.assertEqual(summary["sent"], 1)
+        self.assertEqual(len(self.stub.rows["tts_audio"]), 2)
+
+    @patch.dict("os.environ", {}, clear=True)
+    def test_disabled_is_noop(self):
+        self.assertIsNone(insert("events", {"n": 1}, defer=True))
+        self.assertEqual(self.writer.pending(), 0)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -15,6 +15,8 @@ _repo = Path(__file__).resolve().parent.parent
 if str(_repo) not in sys.path:
     sys.path.insert(0, str(_repo))
 
+from tools.lib.supabase_client import flush
+
 MOCK_ENV = {
     "SUPABASE_URL": "https://test.supabase.co",
     "SUPABASE_SERVICE_ROLE_KEY": "test-key-123",
@@ -34,7 +36,7 @@ class TestCreateRun(unittest.TestCase):
     """Test create_run()."""
 
     @patch.dict("os.environ", MOCK_ENV)
-    @patch("tools.lib.supabase_client.urllib.request.urlopen")
+    @patch("tools.lib.supabase_client._urlopen")
     def test_create_run(self, mock_urlopen):
         row = [{"id": "uuid-abc-123", "video_id": "v1"}]
         mock_urlopen.return_value = _mock_response(json.dumps(row).encode())
@@ -58,7 +60,7 @@ class TestCompleteRun(unittest.TestCase):
     """Test complete_run()."""
 
     @patch.dict("os.environ", MOCK_ENV)
-    @patch("tools.lib.supabase_client.urllib.request.urlopen")
+    @patch("tools.lib.supabase_client._urlopen")
     def test_complete_run(self, mock_urlopen):
         mock_urlopen.return_value = _mock_response()
         from tools.lib.supabase_pipeline import complete_run
@@ -73,11 +75,12 @@ class TestSaveNiche(unittest.TestCase):
     """Test save_niche()."""
 
     @patch.dict("os.environ", MOCK_ENV)
-    @patch("tools.lib.supabase_client.urllib.request.urlopen")
+    @patch("tools.lib.supabase_client._urlopen")
     def test_save_niche(self, mock_urlopen):
         mock_urlopen.return_value = _mock_response()
         from tools.lib.supabase_pipeline import save_niche
         save_niche("uuid-run", "v1", cluster="audio", subcategory="earbuds")
+        flush()
         req = mock_urlopen.call_args[0][0]
         self.assertIn("/rest/v1/niches", req.full_url)
         body = json.loads(req.data)
@@ -89,12 +92,13 @@ class TestSaveResearchSource(unittest.TestCase):
     """Test save_research_source()."""
 
     @patch.dict("os.environ", MOCK_ENV)
-    @patch("tools.lib.supabase_client.urllib.request.urlopen")
+    @patch("tools.lib.supabase_client._urlopen")
     def test_save_research_source(self, mock_urlopen):
         mock_urlopen.return_value = _mock_response()
         from tools.lib.supabase_pipeline import save_research_source
         save_research_source("uuid-run", source_domain="nytimes.com",
                              source_url="https://nytimes.com/wirecutter/test")
+        flush()
         req = mock_urlopen.call_args[0][0]
         self.assertIn("/rest/v1/research_sources", req.full_url)
         body = json.loads(req.data)
@@ -105,12 +109,13 @@ class TestSaveShortlistItem(unittest.TestCase):
     """Test save_shortlist_item()."""
 
     @patch.dict("os.environ", MOCK_ENV)
-    @patch("tools.lib.supabase_client.urllib.request.urlopen")
+    @patch("tools.lib.supabase_client._urlopen")
     def test_save_shortlist_item(self, mock_urlopen):
         mock_urlopen.return_value = _mock_response()
         from tools.lib.supabase_pipeline import save_shortlist_item
         save_shortlist_item("uuid-run", product_name_clean="Sony WF-1000XM5",
                             candidate_rank=1)
+        flush()
         req = mock_urlopen.call_args[0][0]
         self.assertIn("/rest/v1/shortlist_items", req.full_url)
         body = json.loads(req.data)
@@ -122,11 +127,12 @@ class TestSaveAmazonProduct(unittest.TestCase):
     """Test save_amazon_product()."""
 
     @patch.dict("os.environ", MOCK_ENV)
-    @patch("tools.lib.supabase_client.urllib.request.urlopen")
+    @patch("tools.lib.supabase_client._urlopen")
     def test_save_amazon_product(self, mock_urlopen):
         mock_urlopen.return_value = _mock_response()
         from tools.lib.supabase_pipeline import save_amazon_product
         save_amazon_product("uuid-run", asin="B0123", amazon_title="Test Product")
+        flush()
         req = mock_urlopen.call_args[0][0]
         self.assertIn("/rest/v1/amazon_products", req.full_url)
         body = json.loads(req.data)
@@ -137,12 +143,13 @@ class TestSaveTop5Product(unittest.TestCase):
     """Test save_top5_product()."""
 
     @patch.dict("os.environ", MOCK_ENV)
-    @patch("tools.lib.supabase_client.urllib.request.urlopen")
+    @patch("tools.lib.supabase_client._urlopen")
     def test_save_top5_product(self, mock_urlopen):
         mock_urlopen.return_value = _mock_response()
         from tools.lib.supabase_pipeline import save_top5_product
         save_top5_product("uuid-run", rank=1, asin="B0123",
                           role_label="Best Overall", benefits=["good", "great"])
+        flush()
         req = mock_urlopen.call_args[0][0]
         self.assertIn("/rest/v1/top5", req.full_url)
         body = json.loads(req.data)
@@ -154,7 +161,7 @@ class TestEnsureRunId(unittest.TestCase):
     """Test ensure_run_id()."""
 
     @patch.dict("os.environ", MOCK_ENV)
-    @patch("tools.lib.supabase_client.urllib.request.urlopen")
+    @patch("tools.lib.supabase_client._urlopen")
     def test_ensure_run_id(self, mock_urlopen):
         # First call: query returns existing row
         mock_urlopen.return_value = _mock_response(
@@ -175,11 +182,12 @@ class TestSaveScript(unittest.TestCase):
     """Test save_script()."""
 
     @patch.dict("os.environ", MOCK_ENV)
-    @patch("tools.lib.supabase_client.urllib.request.urlopen")
+    @patch("tools.lib.supabase_client._urlopen")
     def test_save_script(self, mock_urlopen):
         mock_urlopen.return_value = _mock_response()
         from tools.lib.supabase_pipeline import save_script
         save_script("uuid-run", "brief", text="Brief content here", word_count=150)
+        flush()
         req = mock_urlopen.call_args[0][0]
         self.assertIn("/rest/v1/scripts", req.full_url)
         body = json.loads(req.data)
@@ -191,12 +199,13 @@ class TestSaveAsset(unittest.TestCase):
     """Test save_asset()."""
 
     @patch.dict("os.environ", MOCK_ENV)
-    @patch("tools.lib.supabase_client.urllib.request.urlopen")
+    @patch("tools.lib.supabase_client._urlopen")
     def test_save_asset(self, mock_urlopen):
         mock_urlopen.return_value = _mock_response()
         from tools.lib.supabase_pipeline import save_asset
         save_asset("uuid-run", asset_type="thumbnail", label="thumb",
                    storage_url="https://x.co/thumb.png")
+        flush()
         req = mock_urlopen.call_args[0][0]
         self.assertIn("/rest/v1/assets", req.full_url)
         body = json.loads(req.data)
@@ -207,12 +216,13 @@ class TestSaveTTSChunk(unittest.TestCase):
     """Test save_tts_chunk()."""
 
     @patch.dict("os.environ", MOCK_ENV)
-    @patch("tools.lib.supabase_client.urllib.request.urlopen")
+    @patch("tools.lib.supabase_client._urlopen")
     def test_save_tts_chunk(self, mock_urlopen):
         mock_urlopen.return_value = _mock_response()
         from tools.lib.supabase_pipeline import save_tts_chunk
         save_tts_chunk("uuid-run", chunk_index=0, text="Hello world",
                        duration_seconds=5.5)
+        flush()
         req = mock_urlopen.call_args[0][0]
         self.assertIn("/rest/v1/tts_audio", req.full_url)
         body = json.loads(req.data)
@@ -224,7 +234,7 @@ class TestUploadVideoFile(unittest.TestCase):
     """Test upload_video_file()."""
 
     @patch.dict("os.environ", MOCK_ENV)
-    @patch("tools.lib.supabase_client.urllib.request.urlopen")
+    @patch("tools.lib.supabase_client._urlopen")
     def test_upload_video_file_path_convention(self, mock_urlopen):
         import tempfile
         mock_urlopen.return_value = _mock_response()
@@ -241,12 +251,13 @@ class TestSaveLesson(unittest.TestCase):
     """Test save_lesson()."""
 
     @patch.dict("os.environ", MOCK_ENV)
-    @patch("tools.lib.supabase_client.urllib.request.urlopen")
+    @patch("tools.lib.supabase_client._urlopen")
     def test_save_lesson(self, mock_urlopen):
         row = [{"scope": "research", "trigger": "empty shortlist"}]
         mock_urlopen.return_value = _mock_response(json.dumps(row).encode())
         from tools.lib.supabase_pipeline import save_lesson
         save_lesson("research", "empty shortlist", "Check sources first")
+        flush()
         req = mock_urlopen.call_args[0][0]
         self.assertIn("/rest/v1/lessons", req.full_url)
         body = json.loads(req.data)
@@ -258,7 +269,7 @@ class TestGetActiveLessons(unittest.TestCase):
     """Test get_active_lessons()."""
 
     @patch.dict("os.environ", MOCK_ENV)
-    @patch("tools.lib.supabase_client.urllib.request.urlopen")
+    @patch("tools.lib.supabase_client._urlopen")
     def test_get_active_lessons(self, mock_urlopen):
         lessons = [{"scope": "qa", "trigger": "drift", "rule": "reject"}]
         mock_urlopen.return_value = _mock_response(json.dumps(lessons).encode())
@@ -272,17 +283,18 @@ class TestChannelMemory(unittest.TestCase):
     """Test channel memory functions."""
 
     @patch.dict("os.environ", MOCK_ENV)
-    @patch("tools.lib.supabase_client.urllib.request.urlopen")
+    @patch("tools.lib.supabase_client._urlopen")
     def test_set_channel_memory(self, mock_urlopen):
         row = [{"key": "test_key", "value": {"data": 1}}]
         mock_urlopen.return_value = _mock_response(json.dumps(row).encode())
         from tools.lib.supabase_pipeline import set_channel_memory
         set_channel_memory("test_key", {"data": 1})
+        flush()
         req = mock_urlopen.call_args[0][0]
         self.assertIn("/rest/v1/channel_memory", req.full_url)
 
     @patch.dict("os.environ", MOCK_ENV)
-    @patch("tools.lib.supabase_client.urllib.request.urlopen")
+    @patch("tools.lib.supabase_client._urlopen")
     def test_get_channel_memory(self, mock_urlopen):
         rows = [{"key": "niche_scores", "value": {"earbuds": 85}}]
         mock_urlopen.return_value = _mock_response(json.dumps(rows).encode())
@@ -291,7 +303,7 @@ class TestChannelMemory(unittest.TestCase):
         self.assertEqual(result, {"earbuds": 85})
 
     @patch.dict("os.environ", MOCK_ENV)
-    @patch("tools.lib.supabase_client.urllib.request.urlopen")
+    @patch("tools.lib.supabase_client._urlopen")
     def test_get_channel_memory_missing(self, mock_urlopen):
         mock_urlopen.return_value = _mock_response(json.dumps([]).encode())
         from tools.lib.supabase_pipeline import get_channel_memory
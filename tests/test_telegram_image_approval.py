@@ -39,6 +39,7 @@ from tools.lib.telegram_image_approval import (
     _resize_for_telegram,
     _TELEGRAM_PHOTO_MAX_BYTES,
     request_image_approval,
+    send_review_preview,
 )
 
 
@@ -251,6 +252,39 @@ class TestSendMediaGroup(unittest.TestCase):
         self.assertIsNone(mid)
 
 
+# ---------------------------------------------------------------------------
+# Test: send_review_preview
+# ---------------------------------------------------------------------------
+
+class TestSendReviewPreview(unittest.TestCase):
+    def setUp(self):
+        self.video = _make_temp_image("preview.mp4")
+        self.sheets = [_make_temp_image(f"seg_{i:03d}.jpg") for i in range(12)]
+
+    def tearDown(self):
+        _cleanup_paths([self.video] + self.sheets)
+
+    @patch("tools.lib.telegram_image_approval._send_media_group", return_value=1)
+    @patch("tools.lib.telegram_image_approval.urllib.request.urlopen")
+    @patch.dict(os.environ, {"TELEGRAM_BOT_TOKEN": "tok", "TELEGRAM_CHAT_ID": "999"})
+    def test_video_then_sheet_albums(self, mock_urlopen, mock_group):
+        mock_resp = MagicMock()
+        mock_resp.read.return_value = json.dumps({"ok": True, "result": {"message_id": 7}}).encode()
+        mock_resp.__enter__ = lambda s: s
+        mock_resp.__exit__ = MagicMock(return_value=False)
+        mock_urlopen.return_value = mock_resp
+
+        self.assertTrue(send_review_preview(self.video, self.sheets, video_id="RUN_1"))
+        req = mock_urlopen.call_args[0][0]
+        self.assertIn("sendVideo", req.full_url)
+        self.assertEqual(mock_group.call_count, 2)  # 12 sheets -> 10 + 2
+
+    @patch("tools.lib.telegram_image_approval._openclaw_channel_ready", return_value=False)
+    @patch.dict(os.environ, {}, clear=True)
+    def test_not_configured(self, mock_channel):
+        self.assertFalse(send_review_preview(self.video, self.sheets))
+
+
 # ---------------------------------------------------------------------------
 # Test: _send_approval_buttons
 # ---------------------------------------------------------------------------
@@ -357,6 +357,91 @@ class TestTruthCacheNeedsRefresh(unittest.TestCase):
         shutil.rmtree(str(imgs), ignore_errors=True)
 
 
+# ---------------------------------------------------------------
+# TruthCache — library index
+# ---------------------------------------------------------------
+
+class TestTruthCacheIndex(unittest.TestCase):
+
+    def setUp(self):
+        self._tmpdir = tempfile.mkdtemp()
+        self.cache = TruthCache(Path(self._tmpdir), CachePolicy(ttl_meta_sec=3600))
+
+    def tearDown(self):
+        import shutil
+        self.cache.index.close()
+        shutil.rmtree(self._tmpdir, ignore_errors=True)
+
+    def _put(self, asin: str) -> None:
+        imgs = Path(tempfile.mkdtemp())
+        (imgs / "01_main.jpg").write_bytes(asin.encode())
+        self.cache.put_from_fetch(asin, {"title": asin}, [imgs / "01_main.jpg"])
+        import shutil
+        shutil.rmtree(str(imgs), ignore_errors=True)
+
+    def test_batch_matches_single(self):
+        self._put("B0ONE")
+        self._put("B0TWO")
+        self.cache.mark_cache_broken("B0TWO", "test")
+        batch = self.cache.needs_refresh_batch(["B0ONE", "B0TWO", "B0NONE"])
+        self.assertEqual(set(batch), {"B0ONE", "B0TWO", "B0NONE"})
+        for asin, need in batch.items():
+            self.assertEqual(need, self.cache.needs_refresh(asin))
+        self.assertEqual(batch["B0ONE"]["status"], CACHE_VALID)
+        self.assertEqual(batch["B0TWO"]["status"], CACHE_BROKEN)
+
+    def test_external_edit_invalidates_row(self):
+        asin = "B0EDIT"
+        self._put(asin)
+        self.cache.index.put(asin, {
+            **self.cache.index.get(asin), "recorded_at": time.time() + 10,
+        })
+        self.assertEqual(self.cache.get_cached(asin)["meta"]["title"], asin)
+        self.cache.meta_path(asin).write_text(
+            json.dumps({"title": "edited elsewhere"}), encoding="utf-8"
+        )
+        result = self.cache.get_cached(asin)
+        self.assertNotIn("meta", result)
+        self.assertEqual(result["cache_info"]["status"], CACHE_BROKEN)
+
+    def test_batch_rejects_externally_edited_row(self):
+        asin = "B0BATCH"
+        self._put(asin)
+        self.cache.index.put(asin, {
+            **self.cache.index.get(asin), "recorded_at": time.time() + 10,
+        })
+        info = json.loads(self.cache.cache_info_path(asin).read_text(encoding="utf-8"))
+        info["status"] = CACHE_BROKEN
+        self.cache.cache_info_path(asin).write_text(json.dumps(info), encoding="utf-8")
+        batch = self.cache.needs_refresh_batch([asin])
+        self.assertEqual(batch[asin]["status"], CACHE_BROKEN)
+        self.assertTrue(batch[asin]["refresh_meta"])
+
+    def test_own_writes_served_from_index_inside_racy_window(self):
+        asin = "B0HOT"
+        self._put(asin)
+        reads = []
+        read_cached = self.cache._read_cached
+        self.cache._read_cached = lambda a: reads.append(a) or read_cached(a)
+        self.assertEqual(self.cache.get_cached(asin)["meta"]["title"], asin)
+        self.assertEqual(self.cache.needs_refresh_batch([asin])[asin]["status"], CACHE_VALID)
+        self.assertEqual(reads, [])
+        # Another process's TruthCache did not write these files
+        other = TruthCache(Path(self._tmpdir), CachePolicy(ttl_meta_sec=3600))
+        other._read_cached = lambda a: reads.append(a) or read_cached(a)
+        other.get_cached(asin)
+        self.assertEqual(reads, [asin])
+        other.index.close()
+
+    def test_reindex_existing_library(self):
+        self._put("B0OLD")
+        self.cache.index.close()
+        (Path(self._tmpdir) / "index.db").unlink()
+        self.cache = TruthCache(Path(self._tmpdir))
+        self.assertEqual(self.cache.stats()["total_asins"], 1)
+        self.assertTrue(self.cache.has_main_image("B0OLD"))
+
+
 # ---------------------------------------------------------------
 # TruthCache — has_main_image
 # ---------------------------------------------------------------
@@ -3,16 +3,27 @@
 
 from __future__ import annotations
 
+import os
 import tempfile
+import threading
+import time
 import unittest
 import wave
 from pathlib import Path
+from unittest import mock
 
+from rayvault import tts_provider
 from rayvault.tts_provider import (
     MockTTSProvider,
+    ProviderLimiter,
+    SynthesisTask,
+    TokenBucket,
     TTSProvider,
     available_providers,
     get_provider,
+    is_rate_limited,
+    provider_limiter,
+    run_synthesis,
     tts_input_hash,
 )
 
@@ -322,5 +333,130 @@ class TestAvailableProvidersEdgeCases(unittest.TestCase):
         self.assertIn("moss_tts", available_providers())
 
 
+# ---------------------------------------------------------------
+# Concurrent synthesis
+# ---------------------------------------------------------------
+
+class TestTokenBucket(unittest.TestCase):
+
+    def test_burst_within_capacity_does_not_wait(self):
+        bucket = TokenBucket(rate_per_sec=10, capacity=100)
+        self.assertEqual(bucket.acquire(60), 0.0)
+        self.assertEqual(bucket.acquire(40), 0.0)
+
+    def test_overdraft_waits_for_refill(self):
+        bucket = TokenBucket(rate_per_sec=100, capacity=100)
+        bucket.acquire(100)
+        with mock.patch("rayvault.tts_provider.time.sleep") as sleep:
+            waited = bucket.acquire(50)
+        self.assertAlmostEqual(waited, 0.5, delta=0.05)
+        sleep.assert_called_once()
+
+    def test_request_larger_than_capacity_is_clamped(self):
+        bucket = TokenBucket(rate_per_sec=1, capacity=10)
+        self.assertEqual(bucket.acquire(500), 0.0)
+
+    def test_invalid_rate(self):
+        with self.assertRaises(ValueError):
+            TokenBucket(rate_per_sec=0, capacity=10)
+
+
+class TestProviderLimiter(unittest.TestCase):
+
+    def tearDown(self):
+        tts_provider._LIMITERS.clear()
+
+    def test_quota_defaults(self):
+        limiter = provider_limiter("elevenlabs")
+        self.assertEqual(limiter.max_concurrency, tts_provider.PROVIDER_QUOTAS["elevenlabs"][0])
+        self.assertIs(provider_limiter("ElevenLabs"), limiter)
+
+    def test_env_override(self):
+        env = {"TTS_MAX_CONCURRENCY": "7", "TTS_CHARS_PER_MINUTE": "0"}
+        with mock.patch.dict(os.environ, env):
+            limiter = provider_limiter("moss")
+        self.assertEqual((limiter.max_concurrency, limiter.chars_per_minute), (7, 0))
+
+    def test_rate_limit_detection(self):
+        self.assertTrue(is_rate_limited(RuntimeError(
+            'ElevenLabs TTS error: {"detail":{"status":"too_many_concurrent_requests"}}')))
+        self.assertTrue(is_rate_limited(RuntimeError("HTTP Error 429: Too Many Requests")))
+        self.assertFalse(is_rate_limited(RuntimeError("ELEVENLABS_API_KEY not configured")))
+
+
+class TestRunSynthesis(unittest.TestCase):
+
+    def test_results_in_task_order_with_post(self):
+        def task(i):
+            return SynthesisTask(
+                key=f"c{i}", text="x" * i,
+                synthesize=lambda: time.sleep(0.01 * (5 - i)) or i,
+                post=lambda r: r * 10,
+            )
+        outcomes = run_synthesis([task(i) for i in range(5)], ProviderLimiter("t", 5))
+        self.assertEqual([o.result for o in outcomes], [0, 10, 20, 30, 40])
+        self.assertTrue(all(o.ok for o in outcomes))
+
+    def test_concurrency_bounded_by_limiter(self):
+        active, peak, lock = [0], [0], threading.Lock()
+
+        def synth():
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.02)
+            with lock:
+                active[0] -= 1
+
+        tasks = [SynthesisTask(key=str(i), text="t", synthesize=synth) for i in range(12)]
+        run_synthesis(tasks, ProviderLimiter("t", 3), max_workers=8)
+        self.assertEqual(peak[0], 3)
+
+    def test_failures_reported_per_task(self):
+        def boom():
+            raise RuntimeError("bad voice")
+        outcomes = run_synthesis([
+            SynthesisTask(key="a", text="t", synthesize=lambda: "ok"),
+            SynthesisTask(key="b", text="t", synthesize=boom),
+        ], ProviderLimiter("t", 2))
+        self.assertTrue(outcomes[0].ok)
+        self.assertIn("bad voice", str(outcomes[1].error))
+        self.assertEqual(outcomes[1].attempts, 1)
+
+    def test_rate_limited_request_retried(self):
+        calls = []
+
+        def flaky():
+            calls.append(1)
+            if len(calls) < 3:
+                raise RuntimeError("HTTP Error 429: Too Many Requests")
+            return "audio"
+
+        with mock.patch("rayvault.tts_provider.time.sleep") as sleep:
+            outcomes = run_synthesis(
+                [SynthesisTask(key="a", text="t", synthesize=flaky)],
+                ProviderLimiter("t", 1), backoff_sec=1.0,
+            )
+        self.assertEqual(outcomes[0].result, "audio")
+        self.assertEqual(outcomes[0].attempts, 3)
+        self.assertEqual([c.args[0] for c in sleep.call_args_list], [1.0, 2.0])
+
+    def test_latency_bound_script_speedup(self):
+        """30 chunks against a 60ms-latency provider: >=4x over sequential."""
+        def tasks():
+            return [
+                SynthesisTask(key=f"c{i}", text="chunk", synthesize=lambda: time.sleep(0.06),
+                              post=lambda _: time.sleep(0.005))
+                for i in range(30)
+            ]
+        t0 = time.monotonic()
+        run_synthesis(tasks(), ProviderLimiter("t", 1), post_workers=1)
+        sequential = time.monotonic() - t0
+        t0 = time.monotonic()
+        run_synthesis(tasks(), ProviderLimiter("t", 6))
+        concurrent = time.monotonic() - t0
+        self.assertGreaterEqual(sequential / concurrent, 4.0)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -34,7 +34,7 @@ class TestRecordMetrics(unittest.TestCase):
     """Test record_metrics()."""
 
     @patch.dict("os.environ", MOCK_ENV)
-    @patch("tools.lib.supabase_client.urllib.request.urlopen")
+    @patch("tools.lib.supabase_client._urlopen")
     def test_record_metrics(self, mock_urlopen):
         mock_urlopen.return_value = _mock_response()
         from tools.lib.video_analytics import record_metrics
@@ -49,7 +49,7 @@ class TestRecordMetrics(unittest.TestCase):
         self.assertEqual(body["ctr"], 5.2)
 
     @patch.dict("os.environ", MOCK_ENV)
-    @patch("tools.lib.supabase_client.urllib.request.urlopen")
+    @patch("tools.lib.supabase_client._urlopen")
     def test_record_metrics_partial(self, mock_urlopen):
         """Only non-None fields are included."""
         mock_urlopen.return_value = _mock_response()
@@ -66,7 +66,7 @@ class TestGetNichePerformance(unittest.TestCase):
     """Test get_niche_performance()."""
 
     @patch.dict("os.environ", MOCK_ENV)
-    @patch("tools.lib.supabase_client.urllib.request.urlopen")
+    @patch("tools.lib.supabase_client._urlopen")
     def test_get_niche_performance(self, mock_urlopen):
         rows = [
             {"video_id": "v1", "niche": "earbuds", "views_7d": 5000, "ctr": 5.0},
@@ -85,7 +85,7 @@ class TestUpdateNicheScores(unittest.TestCase):
     """Test update_niche_scores()."""
 
     @patch.dict("os.environ", MOCK_ENV)
-    @patch("tools.lib.supabase_client.urllib.request.urlopen")
+    @patch("tools.lib.supabase_client._urlopen")
     def test_update_niche_scores(self, mock_urlopen):
         # First call: query video_metrics
         metrics = [
@@ -101,8 +101,10 @@ class TestUpdateNicheScores(unittest.TestCase):
             _mock_response(json.dumps(memory_row).encode()),  # upsert
         ]
 
+        from tools.lib.supabase_client import flush
         from tools.lib.video_analytics import update_niche_scores
         update_niche_scores()
+        flush()
 
         # Should have made 2 calls: query + upsert
         self.assertEqual(mock_urlopen.call_count, 2)
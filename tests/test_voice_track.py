@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""Tests for tools/lib/voice_track.py — streaming voice track assembly."""
+
+from __future__ import annotations
+
+import json
+import shutil
+import tempfile
+import unittest
+import wave
+from pathlib import Path
+from unittest import mock
+
+from tools.lib.voice_track import (
+    VoiceChunk,
+    assemble_voice_track,
+    default_timing_path,
+    extract_chunk,
+    load_voice_chunks,
+)
+
+SR = 48000
+
+
+def _write_wav(path: Path, seconds: float, value: int = 1000, rate: int = SR) -> None:
+    frames = int(round(seconds * rate))
+    with wave.open(str(path), "wb") as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(rate)
+        wf.writeframes(value.to_bytes(2, "little", signed=True) * frames)
+
+
+def _read_frames(path: Path) -> bytes:
+    with wave.open(str(path), "rb") as wf:
+        return wf.readframes(wf.getnframes())
+
+
+class TestAssembleVoiceTrack(unittest.TestCase):
+
+    def setUp(self):
+        self._tmpdir = tempfile.mkdtemp()
+        self.root = Path(self._tmpdir)
+        self.out = self.root / "run" / "02_audio.wav"
+
+    def tearDown(self):
+        shutil.rmtree(self._tmpdir, ignore_errors=True)
+
+    def _chunk(self, name: str, seconds: float, **kw) -> VoiceChunk:
+        path = self.root / f"{name}.wav"
+        _write_wav(path, seconds)
+        return VoiceChunk(chunk_id=name, path=path, **kw)
+
+    def test_concat_with_pause_and_sample_offsets(self):
+        chunks = [
+            self._chunk("a", 1.0, text="Hello [pause=250ms] there"),
+            self._chunk("b", 0.5),
+        ]
+        timing = assemble_voice_track(chunks, self.out)
+        a, b = timing["chunks"]
+        self.assertEqual((a["start_sample"], a["speech_samples"], a["pause_samples"]),
+                         (0, 48000, 12000))
+        self.assertEqual(b["start_sample"], 60000)
+        self.assertEqual(timing["total_samples"], 84000)
+        with wave.open(str(self.out), "rb") as wf:
+            self.assertEqual(wf.getnframes(), 84000)
+        frames = _read_frames(self.out)
+        self.assertEqual(frames[48000 * 2:60000 * 2], b"\x00" * 24000)
+        saved = json.loads(default_timing_path(self.out).read_text())
+        self.assertEqual(saved["total_samples"], 84000)
+        self.assertFalse(self.out.with_suffix(".wav.tmp").exists())
+
+    def test_short_chunk_padded_to_exact_target(self):
+        timing = assemble_voice_track([self._chunk("a", 4.0, target_sec=5.0)], self.out)
+        entry = timing["chunks"][0]
+        self.assertEqual(entry["action"], "pad_silence")
+        self.assertEqual(entry["end_sample"], 5 * SR)
+        self.assertEqual(entry["pad_samples"], SR)
+
+    def test_within_tolerance_untouched(self):
+        timing = assemble_voice_track(
+            [self._chunk("a", 4.95, target_sec=5.0, kind="product")], self.out,
+        )
+        self.assertEqual(timing["chunks"][0]["action"], "ok")
+        self.assertEqual(timing["chunks"][0]["pad_samples"], 0)
+
+    def test_way_over_flagged_not_truncated(self):
+        timing = assemble_voice_track([self._chunk("a", 8.0, target_sec=5.0)], self.out)
+        self.assertEqual(timing["needs_repair"], ["a"])
+        self.assertEqual(timing["total_samples"], 8 * SR)
+
+    def test_rate_tweak_without_ffmpeg_flags_repair(self):
+        chunk = self._chunk("a", 5.09, target_sec=5.0, kind="intro")
+        with mock.patch("tools.lib.voice_track.shutil.which", return_value=None):
+            timing = assemble_voice_track([chunk], self.out)
+        self.assertEqual(timing["chunks"][0]["action"], "needs_repair")
+        self.assertIn("ffmpeg not available", timing["chunks"][0]["reason"])
+
+    def test_window_size_does_not_change_output(self):
+        chunks = [self._chunk("a", 0.3), self._chunk("b", 0.2, text="[pause=100ms]")]
+        assemble_voice_track(chunks, self.out, window_frames=97)
+        small = _read_frames(self.out)
+        assemble_voice_track(chunks, self.out)
+        self.assertEqual(small, _read_frames(self.out))
+
+    def test_non_native_chunk_needs_ffmpeg(self):
+        path = self.root / "a.wav"
+        _write_wav(path, 1.0, rate=22050)
+        with mock.patch("tools.lib.voice_track.shutil.which", return_value=None):
+            with self.assertRaises(RuntimeError):
+                assemble_voice_track([VoiceChunk("a", path)], self.out)
+        self.assertFalse(self.out.exists())
+
+    def test_extract_chunk_is_finalized_slice(self):
+        chunks = [self._chunk("a", 1.0), self._chunk("b", 4.0, target_sec=5.0)]
+        timing = assemble_voice_track(chunks, self.out)
+        part = extract_chunk(self.out, timing["chunks"][1], self.root / "b.final.wav", window_frames=97)
+        frames = _read_frames(part)
+        self.assertEqual(len(frames), 5 * SR * 2)
+        self.assertEqual(frames, _read_frames(self.out)[SR * 2:])
+
+    def test_missing_chunk(self):
+        with self.assertRaises(FileNotFoundError):
+            assemble_voice_track([VoiceChunk("a", self.root / "nope.wav")], self.out)
+
+
+class TestLoadVoiceChunks(unittest.TestCase):
+
+    def test_tts_chunk_manifest(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "tts_chunks_manifest.json"
+            path.write_text(json.dumps({"chunks": [
+                {"chunk_id": "c1", "path": "c1.wav"},
+                {"chunk_id": "c2", "path": "/abs/c2.wav"},
+            ]}))
+            chunks = load_voice_chunks(path)
+        self.assertEqual(chunks[0].path, Path(tmp) / "c1.wav")
+        self.assertEqual(chunks[1].path, Path("/abs/c2.wav"))
+        self.assertEqual(chunks[0].target_sec, 0.0)
+
+    def test_media_manifest_segments(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "media_manifest.json"
+            path.write_text(json.dumps({"segments": [
+                {"segment_id": "intro", "kind": "intro", "audio_path": "/a/intro.mp3",
+                 "approx_duration_sec": 6.5},
+                {"segment_id": "skip", "audio_path": None},
+            ]}))
+            chunks = load_voice_chunks(path)
+        self.assertEqual(len(chunks), 1)
+        self.assertEqual((chunks[0].chunk_id, chunks[0].kind, chunks[0].target_sec),
+                         ("intro", "intro", 6.5))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""Tests for rayvault/agent/worker_pool.py — per-step executor lanes."""
+
+from __future__ import annotations
+
+import threading
+import time
+import unittest
+
+from rayvault.agent.protocol import JOB_STEPS
+from rayvault.agent.worker_pool import (
+    PRIORITY_HIGH,
+    PRIORITY_LOW,
+    PRIORITY_NORMAL,
+    StepExecutor,
+    default_step_concurrency,
+    parse_concurrency,
+    parse_priority,
+)
+
+
+class TestParsing(unittest.TestCase):
+
+    def test_parse_concurrency(self):
+        self.assertEqual(
+            parse_concurrency("ffmpeg_probe=8, TTS_RENDER_CHUNKS=1,bad,X=zero,Y=0"),
+            {"FFMPEG_PROBE": 8, "TTS_RENDER_CHUNKS": 1},
+        )
+        self.assertEqual(parse_concurrency(""), {})
+
+    def test_parse_priority(self):
+        self.assertEqual(parse_priority("high"), PRIORITY_HIGH)
+        self.assertEqual(parse_priority("LOW"), PRIORITY_LOW)
+        self.assertEqual(parse_priority(None), PRIORITY_NORMAL)
+        self.assertEqual(parse_priority("urgent"), PRIORITY_NORMAL)
+        self.assertEqual(parse_priority(9), PRIORITY_LOW)
+
+    def test_defaults_cover_every_step(self):
+        limits = default_step_concurrency()
+        for step in JOB_STEPS:
+            self.assertGreaterEqual(limits[step], 1)
+        self.assertEqual(limits["TTS_RENDER_CHUNKS"], 1)
+
+
+class TestStepExecutor(unittest.TestCase):
+
+    def setUp(self):
+        self.steps = {}
+        self.done = []
+        self.gates = {}
+
+        def run_job(job_id):
+            gate = self.gates.get(job_id)
+            if gate is not None:
+                gate.wait(5)
+            self.done.append(job_id)
+
+        self.executor = StepExecutor(run_job, JOB_STEPS, {
+            "TTS_RENDER_CHUNKS": 1, "FFMPEG_PROBE": 2,
+        })
+
+    def tearDown(self):
+        for gate in self.gates.values():
+            gate.set()
+        self.executor.stop()
+
+    def test_long_tts_does_not_block_probes(self):
+        self.gates["tts"] = threading.Event()
+        self.executor.start()
+        self.executor.submit("TTS_RENDER_CHUNKS", "tts")
+        for i in range(4):
+            self.executor.submit("FFMPEG_PROBE", f"probe{i}")
+        deadline = time.time() + 5
+        while len(self.done) < 4 and time.time() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(sorted(self.done), ["probe0", "probe1", "probe2", "probe3"])
+        self.gates["tts"].set()
+        self.executor.join()
+        self.assertIn("tts", self.done)
+
+    def test_priority_then_fifo_within_lane(self):
+        self.executor.submit("TTS_RENDER_CHUNKS", "low", PRIORITY_LOW)
+        self.executor.submit("TTS_RENDER_CHUNKS", "n1")
+        self.executor.submit("TTS_RENDER_CHUNKS", "high", PRIORITY_HIGH)
+        self.executor.submit("TTS_RENDER_CHUNKS", "n2")
+        self.executor.start()
+        self.executor.join()
+        self.assertEqual(self.done, ["high", "n1", "n2", "low"])
+
+    def test_slot_limit_and_stats(self):
+        self.gates["a"] = threading.Event()
+        self.gates["b"] = threading.Event()
+        self.executor.start()
+        for job in ("a", "b", "c"):
+            self.executor.submit("FFMPEG_PROBE", job)
+        deadline = time.time() + 5
+        while self.executor.stats()["running"] < 2 and time.time() < deadline:
+            time.sleep(0.01)
+        lane = self.executor.stats()["lanes"]["FFMPEG_PROBE"]
+        self.assertEqual(lane, {"queued": 1, "running": 2, "slots": 2})
+        self.gates["a"].set()
+        self.gates["b"].set()
+        self.executor.join()
+        stats = self.executor.stats()
+        self.assertEqual((stats["queue_depth"], stats["running"]), (0, 0))
+
+    def test_failing_job_keeps_slot_alive(self):
+        calls = []
+
+        def run_job(job_id):
+            calls.append(job_id)
+            if job_id == "boom":
+                raise RuntimeError("boom")
+
+        ex = StepExecutor(run_job, JOB_STEPS, {"FFMPEG_PROBE": 1})
+        ex.start()
+        ex.submit("FFMPEG_PROBE", "boom")
+        ex.submit("FFMPEG_PROBE", "ok")
+        ex.join()
+        ex.stop()
+        self.assertEqual(calls, ["boom", "ok"])
+
+    def test_unknown_step(self):
+        with self.assertRaises(KeyError):
+            self.executor.submit("NOPE", "x")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -7,6 +7,10 @@ extracts ASIN, price, and generates an affiliate link.
 Usage:
     python3 tools/amazon_verify.py --shortlist shortlist.json --video-id xyz
     python3 tools/amazon_verify.py --shortlist shortlist.json --output verified.json
+    python3 tools/amazon_verify.py --shortlist shortlist.json --no-cache
+
+Products verified within AMAZON_VERIFY_CACHE_TTL_HOURS (default 72) are
+reused from .cache/amazon_verify.json instead of being looked up again.
 
 Stdlib only (+ Playwright for browser fallback).
 """
@@ -16,14 +20,17 @@ from __future__ import annotations
 import argparse
 import hashlib
 import hmac
+import http.client
 import json
 import os
 import re
 import sys
+import threading
 import time
 import urllib.error
 import urllib.parse
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
@@ -140,93 +147,141 @@ def _paapi_available() -> bool:
     )
 
 
-def _paapi_search(keyword: str, tag: str) -> list[dict]:
-    """Search Amazon via PA-API v5 SearchItems.
+PAAPI_HOST = "webservices.amazon.com"
+PAAPI_REGION = "us-east-1"
+PAAPI_SERVICE = "ProductAdvertisingAPI"
+PAAPI_GETITEMS_MAX = 10  # GetItems accepts at most 10 ASINs per request
+PAAPI_RESOURCES = [
+    "ItemInfo.Title",
+    "Offers.Listings.Price",
+    "Images.Primary.Large",
+]
 
-    Returns list of {asin, title, price, image_url, url}.
-    Requires AMAZON_PAAPI_ACCESS_KEY, AMAZON_PAAPI_SECRET_KEY env vars.
-    """
-    access_key = os.environ["AMAZON_PAAPI_ACCESS_KEY"].strip()
-    secret_key = os.environ["AMAZON_PAAPI_SECRET_KEY"].strip()
-
-    host = "webservices.amazon.com"
-    path = "/paapi5/searchitems"
-    region = "us-east-1"
-    service = "ProductAdvertisingAPI"
-    target = "com.amazon.paapi5.v1.ProductAdvertisingAPIv1.SearchItems"
-
-    payload = json.dumps({
-        "Keywords": keyword,
-        "PartnerTag": tag,
-        "PartnerType": "Associates",
-        "Marketplace": "www.amazon.com",
-        "Resources": [
-            "ItemInfo.Title",
-            "Offers.Listings.Price",
-            "Images.Primary.Large",
-        ],
-        "SearchIndex": "All",
-        "ItemCount": 5,
-    })
-
-    # AWS Signature V4
-    now = datetime.now(timezone.utc)
-    amz_date = now.strftime("%Y%m%dT%H%M%SZ")
-    date_stamp = now.strftime("%Y%m%d")
-
-    # Canonical request
-    canonical_headers = (
-        f"content-encoding:amz-1.0\n"
-        f"content-type:application/json; charset=UTF-8\n"
-        f"host:{host}\n"
-        f"x-amz-date:{amz_date}\n"
-        f"x-amz-target:{target}\n"
-    )
-    signed_headers = "content-encoding;content-type;host;x-amz-date;x-amz-target"
-    payload_hash = hashlib.sha256(payload.encode()).hexdigest()
-    canonical = f"POST\n{path}\n\n{canonical_headers}\n{signed_headers}\n{payload_hash}"
-
-    # String to sign
-    scope = f"{date_stamp}/{region}/{service}/aws4_request"
-    string_to_sign = (
-        f"AWS4-HMAC-SHA256\n{amz_date}\n{scope}\n"
-        + hashlib.sha256(canonical.encode()).hexdigest()
-    )
-
-    # Signing key
-    def _sign(key: bytes, msg: str) -> bytes:
-        return hmac.new(key, msg.encode(), hashlib.sha256).digest()
 
-    k_date = _sign(f"AWS4{secret_key}".encode(), date_stamp)
-    k_region = _sign(k_date, region)
-    k_service = _sign(k_region, service)
-    k_signing = _sign(k_service, "aws4_request")
-    signature = hmac.new(k_signing, string_to_sign.encode(), hashlib.sha256).hexdigest()
+class _PaapiClient:
+    """Signed PA-API v5 session shared by all lookups in a run.
 
-    auth_header = (
-        f"AWS4-HMAC-SHA256 Credential={access_key}/{scope}, "
-        f"SignedHeaders={signed_headers}, Signature={signature}"
-    )
+    The AWS SigV4 signing key is derived once per day, and each thread keeps
+    one keep-alive HTTPS connection, so a batch of lookups pays neither the
+    key derivation nor a TLS handshake per request.
+    """
 
-    req = urllib.request.Request(
-        f"https://{host}{path}",
-        method="POST",
-        data=payload.encode(),
-        headers={
+    def __init__(self, access_key: str, secret_key: str, *, timeout: int = 15):
+        self._access_key = access_key
+        self._secret_key = secret_key
+        self._timeout = timeout
+        self._keys: dict[str, bytes] = {}
+        self._local = threading.local()
+
+    @classmethod
+    def from_env(cls) -> "_PaapiClient":
+        return cls(
+            os.environ["AMAZON_PAAPI_ACCESS_KEY"].strip(),
+            os.environ["AMAZON_PAAPI_SECRET_KEY"].strip(),
+        )
+
+    # -- signing -----------------------------------------------------------
+
+    def _signing_key(self, date_stamp: str) -> bytes:
+        key = self._keys.get(date_stamp)
+        if key is None:
+            def _sign(k: bytes, msg: str) -> bytes:
+                return hmac.new(k, msg.encode(), hashlib.sha256).digest()
+
+            k_date = _sign(f"AWS4{self._secret_key}".encode(), date_stamp)
+            k_region = _sign(k_date, PAAPI_REGION)
+            k_service = _sign(k_region, PAAPI_SERVICE)
+            key = self._keys[date_stamp] = _sign(k_service, "aws4_request")
+        return key
+
+    def _signed_headers(self, path: str, target: str, body: bytes) -> dict[str, str]:
+        """AWS Signature V4 headers for one POST."""
+        now = datetime.now(timezone.utc)
+        amz_date = now.strftime("%Y%m%dT%H%M%SZ")
+        date_stamp = now.strftime("%Y%m%d")
+
+        # Canonical request
+        canonical_headers = (
+            f"content-encoding:amz-1.0\n"
+            f"content-type:application/json; charset=UTF-8\n"
+            f"host:{PAAPI_HOST}\n"
+            f"x-amz-date:{amz_date}\n"
+            f"x-amz-target:{target}\n"
+        )
+        signed_headers = "content-encoding;content-type;host;x-amz-date;x-amz-target"
+        payload_hash = hashlib.sha256(body).hexdigest()
+        canonical = f"POST\n{path}\n\n{canonical_headers}\n{signed_headers}\n{payload_hash}"
+
+        # String to sign
+        scope = f"{date_stamp}/{PAAPI_REGION}/{PAAPI_SERVICE}/aws4_request"
+        string_to_sign = (
+            f"AWS4-HMAC-SHA256\n{amz_date}\n{scope}\n"
+            + hashlib.sha256(canonical.encode()).hexdigest()
+        )
+        signature = hmac.new(
+            self._signing_key(date_stamp), string_to_sign.encode(), hashlib.sha256,
+        ).hexdigest()
+
+        return {
             "Content-Type": "application/json; charset=UTF-8",
             "Content-Encoding": "amz-1.0",
-            "Host": host,
+            "Host": PAAPI_HOST,
             "X-Amz-Date": amz_date,
             "X-Amz-Target": target,
-            "Authorization": auth_header,
-        },
-    )
+            "Authorization": (
+                f"AWS4-HMAC-SHA256 Credential={self._access_key}/{scope}, "
+                f"SignedHeaders={signed_headers}, Signature={signature}"
+            ),
+        }
+
+    # -- transport ---------------------------------------------------------
+
+    def _connection(self) -> http.client.HTTPSConnection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = http.client.HTTPSConnection(
+                PAAPI_HOST, timeout=self._timeout,
+            )
+        return conn
+
+    def _drop_connection(self) -> None:
+        conn = getattr(self._local, "conn", None)
+        self._local.conn = None
+        if conn is not None:
+            conn.close()
 
-    with urllib.request.urlopen(req, timeout=15) as resp:
-        data = json.loads(resp.read())
+    def _post(self, operation: str, payload: dict) -> dict:
+        """POST one signed operation; raises _AmazonBlockError on throttling."""
+        path = f"/paapi5/{operation.lower()}"
+        target = f"com.amazon.paapi5.v1.ProductAdvertisingAPIv1.{operation}"
+        body = json.dumps(payload).encode()
 
-    results = []
-    for item in data.get("SearchResult", {}).get("Items", []):
+        for attempt in range(2):
+            try:
+                conn = self._connection()
+                conn.request("POST", path, body=body,
+                             headers=self._signed_headers(path, target, body))
+                resp = conn.getresponse()
+                data = resp.read()
+                break
+            except (http.client.HTTPException, OSError):
+                # Server closed the idle keep-alive connection — reconnect once
+                self._drop_connection()
+                if attempt:
+                    raise
+
+        if resp.status == 429:
+            raise _AmazonBlockError(f"PA-API {operation}: TooManyRequests")
+        if resp.status >= 400:
+            raise RuntimeError(
+                f"PA-API {operation} HTTP {resp.status}: {data[:200].decode(errors='replace')}"
+            )
+        return json.loads(data)
+
+    # -- operations --------------------------------------------------------
+
+    @staticmethod
+    def _parse_item(item: dict) -> dict:
         asin = item.get("ASIN", "")
         title = item.get("ItemInfo", {}).get("Title", {}).get("DisplayValue", "")
         price = ""
@@ -235,16 +290,210 @@ def _paapi_search(keyword: str, tag: str) -> list[dict]:
             price_obj = listings[0].get("Price", {})
             price = price_obj.get("DisplayAmount", "")
         image_url = item.get("Images", {}).get("Primary", {}).get("Large", {}).get("URL", "")
-
-        results.append({
+        return {
             "asin": asin,
             "title": title,
             "price": price,
             "image_url": image_url,
             "url": f"https://www.amazon.com/dp/{asin}",
+        }
+
+    def search_items(self, keyword: str, tag: str, *, item_count: int = 5) -> list[dict]:
+        """SearchItems for one keyword. Returns [{asin, title, price, image_url, url}]."""
+        data = self._post("SearchItems", {
+            "Keywords": keyword,
+            "PartnerTag": tag,
+            "PartnerType": "Associates",
+            "Marketplace": "www.amazon.com",
+            "Resources": PAAPI_RESOURCES,
+            "SearchIndex": "All",
+            "ItemCount": item_count,
+        })
+        return [self._parse_item(i) for i in data.get("SearchResult", {}).get("Items", [])]
+
+    def get_items(self, asins: list[str], tag: str) -> dict[str, dict]:
+        """GetItems for up to PAAPI_GETITEMS_MAX ASINs. Returns {asin: item}.
+
+        ASINs Amazon no longer lists are simply missing from the result.
+        """
+        if len(asins) > PAAPI_GETITEMS_MAX:
+            raise ValueError(f"GetItems takes at most {PAAPI_GETITEMS_MAX} ASINs")
+        data = self._post("GetItems", {
+            "ItemIds": list(asins),
+            "ItemIdType": "ASIN",
+            "PartnerTag": tag,
+            "PartnerType": "Associates",
+            "Marketplace": "www.amazon.com",
+            "Resources": PAAPI_RESOURCES,
         })
+        items = (self._parse_item(i) for i in data.get("ItemsResult", {}).get("Items", []))
+        return {i["asin"]: i for i in items if i["asin"]}
+
+
+def _paapi_search(keyword: str, tag: str) -> list[dict]:
+    """Search Amazon via PA-API v5 SearchItems.
+
+    Returns list of {asin, title, price, image_url, url}.
+    Requires AMAZON_PAAPI_ACCESS_KEY, AMAZON_PAAPI_SECRET_KEY env vars.
+    """
+    return _PaapiClient.from_env().search_items(keyword, tag)
 
-    return results
+
+# ---------------------------------------------------------------------------
+# Adaptive throttle
+# ---------------------------------------------------------------------------
+
+
+class AdaptiveThrottle:
+    """Token bucket whose refill rate adapts AIMD-style to blocks.
+
+    Every success adds ``increase`` req/s (up to ``max_rate``); every
+    CAPTCHA / TooManyRequests multiplies the rate by ``decrease`` (down to
+    ``min_rate``) and empties the bucket, so the next request waits at
+    least one full interval at the new rate.
+    """
+
+    def __init__(
+        self,
+        rate_per_sec: float,
+        *,
+        min_rate: float,
+        max_rate: float,
+        increase: float,
+        decrease: float = 0.5,
+        burst: float = 1.0,
+    ):
+        self.min_rate = min_rate
+        self.max_rate = max(max_rate, min_rate)
+        self.rate = min(max(rate_per_sec, self.min_rate), self.max_rate)
+        self.increase = increase
+        self.decrease = decrease
+        self.burst = max(1.0, burst)
+        self._tokens = self.burst
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+        self._last = now
+
+    def acquire(self) -> float:
+        """Take one token, sleeping until it is available. Returns seconds waited."""
+        with self._lock:
+            self._refill()
+            self._tokens -= 1.0
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def on_success(self) -> None:
+        with self._lock:
+            self._refill()
+            self.rate = min(self.max_rate, self.rate + self.increase)
+
+    def on_block(self) -> None:
+        with self._lock:
+            self._refill()
+            self.rate = max(self.min_rate, self.rate * self.decrease)
+            self._tokens = min(self._tokens, 0.0)
+
+
+def _paapi_throttle() -> AdaptiveThrottle:
+    """PA-API starts at 1 TPS (the default account quota).
+
+    AMAZON_PAAPI_TPS raises the ceiling for accounts with a higher quota.
+    """
+    ceiling = float(os.environ.get("AMAZON_PAAPI_TPS", "1") or 1)
+    return AdaptiveThrottle(
+        min(1.0, ceiling), min_rate=0.1, max_rate=ceiling,
+        increase=max(0.1, ceiling / 10), burst=ceiling,
+    )
+
+
+def _browser_throttle() -> AdaptiveThrottle:
+    """Browser searches: one per 2.5 s, backing off to one per 30 s when blocked."""
+    return AdaptiveThrottle(1 / 2.5, min_rate=1 / 30, max_rate=1 / 1.5, increase=0.02)
+
+
+# ---------------------------------------------------------------------------
+# Verification cache
+# ---------------------------------------------------------------------------
+
+
+_CACHED_FIELDS = (
+    "asin", "amazon_url", "affiliate_short_url", "amazon_title", "amazon_price",
+    "amazon_rating", "amazon_reviews", "amazon_image_url", "match_confidence",
+    "verification_method",
+)
+
+
+def _cache_key(item: dict) -> str:
+    return _normalize_search_query(item.get("brand", ""), item.get("product_name", "")).lower()
+
+
+class VerifyCache:
+    """Persistent product -> ASIN verification cache.
+
+    Layout (one JSON file):
+        {"queries": {normalized query: asin},
+         "asins": {asin: {<VerifiedProduct Amazon fields>, "tag", "cached_at"}}}
+
+    Entries younger than ``ttl_hours`` are reused as-is. Older entries still
+    remember the ASIN, so PA-API can refresh them with a batched GetItems
+    instead of a fresh search. Only medium/high-confidence matches are
+    stored — low-confidence ones are re-verified every run.
+    """
+
+    def __init__(self, path: Path | None = None, *, ttl_hours: float | None = None):
+        self.path = path or project_root() / ".cache" / "amazon_verify.json"
+        if ttl_hours is None:
+            ttl_hours = float(os.environ.get("AMAZON_VERIFY_CACHE_TTL_HOURS", "72"))
+        self.ttl_hours = ttl_hours
+        self._lock = threading.Lock()
+        self._data = self._load()
+
+    def _load(self) -> dict:
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return {"queries": {}, "asins": {}}
+        data.setdefault("queries", {})
+        data.setdefault("asins", {})
+        return data
+
+    def known_asin(self, item: dict) -> str:
+        """ASIN for a shortlist item — from the item itself or any cached run."""
+        return item.get("asin", "") or self._data["queries"].get(_cache_key(item), "")
+
+    def lookup(self, item: dict) -> dict | None:
+        """Fresh cached verification for the item, or None."""
+        entry = self._data["asins"].get(self.known_asin(item))
+        if not entry:
+            return None
+        try:
+            age = time.time() - datetime.fromisoformat(entry["cached_at"]).timestamp()
+        except (KeyError, ValueError):
+            return None
+        return entry if age <= self.ttl_hours * 3600 else None
+
+    def put(self, item: dict, vp: VerifiedProduct, tag: str) -> None:
+        if not vp.asin or vp.match_confidence == "low":
+            return
+        entry = {f: getattr(vp, f) for f in _CACHED_FIELDS}
+        entry["tag"] = tag
+        entry["cached_at"] = datetime.now(timezone.utc).isoformat()
+        with self._lock:
+            self._data["queries"][_cache_key(item)] = vp.asin
+            self._data["asins"][vp.asin] = entry
+
+    def save(self) -> None:
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(".json.tmp")
+            tmp.write_text(json.dumps(self._data, indent=2, ensure_ascii=False), encoding="utf-8")
+            os.replace(tmp, self.path)
 
 
 # ---------------------------------------------------------------------------
@@ -578,15 +827,202 @@ def _title_similarity(query: str, title: str) -> float:
 # ---------------------------------------------------------------------------
 
 
+PAAPI_WORKERS = int(os.environ.get("AMAZON_PAAPI_WORKERS", "4"))
+
+
+def _paapi_product(item: dict, best: dict, tag: str) -> VerifiedProduct:
+    """VerifiedProduct from a PA-API item matched to a shortlist entry."""
+    product_name = item.get("product_name", "")
+    score = _title_similarity(product_name, best["title"])
+    confidence = "high" if score > 0.6 else ("medium" if score > 0.35 else "low")
+    return VerifiedProduct(
+        product_name=product_name,
+        brand=item.get("brand", ""),
+        asin=best["asin"],
+        amazon_url=best["url"],
+        affiliate_url=_make_affiliate_url(best["asin"], tag) if tag else best["url"],
+        amazon_title=best["title"],
+        amazon_price=best["price"],
+        amazon_image_url=best.get("image_url", ""),
+        match_confidence=confidence,
+        verification_method="paapi",
+        evidence=item.get("sources", []),
+        key_claims=item.get("key_claims", []),
+    )
+
+
+def _cached_product(item: dict, entry: dict, tag: str) -> VerifiedProduct:
+    """VerifiedProduct rebuilt from a VerifyCache entry for this run's tag."""
+    vp = VerifiedProduct(
+        product_name=item.get("product_name", ""),
+        brand=item.get("brand", ""),
+        evidence=item.get("sources", []),
+        key_claims=item.get("key_claims", []),
+        **{f: entry.get(f, "") for f in _CACHED_FIELDS},
+    )
+    vp.affiliate_url = _make_affiliate_url(vp.asin, tag) if tag else vp.amazon_url
+    if entry.get("tag") != tag:
+        vp.affiliate_short_url = ""  # amzn.to links carry the tag they were made with
+    return vp
+
+
+def _verify_paapi(
+    shortlist: list[dict],
+    pending: list[int],
+    results: list[VerifiedProduct | None],
+    tag: str,
+    known_asins: dict[int, str],
+) -> None:
+    """Resolve pending items via PA-API, filling ``results`` in place.
+
+    Items with a known ASIN are refreshed with GetItems, up to
+    PAAPI_GETITEMS_MAX per request. Everything else (and any ASIN that is
+    no longer listed) goes through SearchItems, with PAAPI_WORKERS lookups
+    in flight under one adaptive throttle.
+    """
+    client = _PaapiClient.from_env()
+    throttle = _paapi_throttle()
+    errors: dict[int, str] = {}
+
+    def call(fn, *args):
+        for attempt in range(3):
+            throttle.acquire()
+            try:
+                out = fn(*args)
+            except _AmazonBlockError:
+                throttle.on_block()
+                if attempt == 2:
+                    raise
+                continue
+            throttle.on_success()
+            return out
+
+    def refresh(batch: list[int]) -> None:
+        try:
+            found = call(client.get_items, [known_asins[i] for i in batch], tag)
+        except Exception as exc:
+            print(f"    PA-API GetItems error: {exc}", file=sys.stderr)
+            return
+        for i in batch:
+            best = found.get(known_asins[i])
+            if best:
+                results[i] = _paapi_product(shortlist[i], best, tag)
+
+    def search(i: int) -> None:
+        item = shortlist[i]
+        query = _normalize_search_query(item.get("brand", ""), item.get("product_name", ""))
+        try:
+            found = call(client.search_items, query, tag)
+        except Exception as exc:
+            errors[i] = f"PA-API error: {exc}"
+            return
+        if found:
+            results[i] = _paapi_product(item, found[0], tag)
+
+    with_asin = [i for i in pending if known_asins.get(i)]
+    batches = [with_asin[k:k + PAAPI_GETITEMS_MAX]
+               for k in range(0, len(with_asin), PAAPI_GETITEMS_MAX)]
+    with ThreadPoolExecutor(max_workers=max(1, PAAPI_WORKERS)) as pool:
+        list(pool.map(refresh, batches))
+        list(pool.map(search, [i for i in pending if results[i] is None]))
+
+    for i in pending:
+        item = shortlist[i]
+        print(f"\n  [{i+1}/{len(shortlist)}] {item.get('product_name', '')}...", file=sys.stderr)
+        vp = results[i]
+        if vp:
+            print(f"    OK: {vp.asin} ({vp.match_confidence}) -- {vp.amazon_title[:60]}", file=sys.stderr)
+        elif i in errors:
+            print(f"    {errors[i]}", file=sys.stderr)
+        else:
+            print(f"    NOT FOUND on Amazon", file=sys.stderr)
+
+
+def _verify_browser(
+    shortlist: list[dict],
+    pending: list[int],
+    results: list[VerifiedProduct | None],
+    tag: str,
+    video_id: str,
+) -> None:
+    """Resolve pending items one at a time in the browser (PDP flow).
+
+    Searches share one Brave profile, so they stay sequential; the gap
+    between them comes from an adaptive throttle that widens on CAPTCHA
+    blocks and narrows again while searches succeed.
+    """
+    from tools.lib.retry import with_retry
+
+    throttle = _browser_throttle()
+    consecutive_failures = 0
+
+    for i in pending:
+        item = shortlist[i]
+        product_name = item.get("product_name", "")
+        brand = item.get("brand", "")
+        print(f"\n  [{i+1}/{len(shortlist)}] {product_name}...", file=sys.stderr)
+        print(f"    Query: {_normalize_search_query(brand, product_name)}", file=sys.stderr)
+
+        throttle.acquire()
+        vp = None
+        try:
+            vp = with_retry(
+                lambda pn=product_name, br=brand, t=tag, vid=video_id, idx=i:
+                    _browser_verify_product_pdp(pn, br, t, video_id=vid, product_index=idx),
+                max_retries=1,
+                base_delay_s=5.0,
+            )
+        except _AmazonBlockError:
+            consecutive_failures += 1
+            throttle.on_block()
+            print(f"    BLOCKED: Amazon CAPTCHA/bot detection "
+                  f"(next search in {1 / throttle.rate:.0f}s)", file=sys.stderr)
+        except Exception as exc:
+            consecutive_failures += 1
+            print(f"    Browser error: {exc}", file=sys.stderr)
+
+        if vp:
+            vp.evidence = item.get("sources", [])
+            vp.key_claims = item.get("key_claims", [])
+            results[i] = vp
+            consecutive_failures = 0
+            throttle.on_success()
+            short_info = f" | short={vp.affiliate_short_url[:30]}" if vp.affiliate_short_url else ""
+            print(f"    OK: {vp.asin} ({vp.match_confidence}) -- {vp.amazon_title[:60]}{short_info}", file=sys.stderr)
+            if vp.error:
+                print(f"    Note: {vp.error}", file=sys.stderr)
+        elif vp is None and consecutive_failures == 0:
+            print(f"    NO MATCH: {product_name}", file=sys.stderr)
+        else:
+            print(f"    NOT FOUND / verification failed", file=sys.stderr)
+
+        # Consecutive failures: likely rate-limited even without a CAPTCHA page
+        if consecutive_failures >= 3:
+            try:
+                from tools.lib.notify import notify_rate_limited
+                notify_rate_limited(video_id or "unknown", "verify", wait_minutes=1)
+            except Exception:
+                pass
+            throttle.on_block()
+            print(f"    3+ consecutive failures — slowing to one search per "
+                  f"{1 / throttle.rate:.0f}s", file=sys.stderr)
+            consecutive_failures = 0
+
+
 def verify_products(
     shortlist: list[dict],
     *,
     associate_tag: str = "",
     video_id: str = "",
+    cache: VerifyCache | None = None,
+    use_cache: bool = True,
 ) -> list[VerifiedProduct]:
     """Verify each shortlisted product exists on Amazon US.
 
-    Uses PA-API if configured, otherwise browser fallback with PDP navigation.
+    Products verified in a recent run are served from the VerifyCache.
+    The rest use PA-API if configured (batched GetItems for known ASINs,
+    concurrent SearchItems otherwise), else the browser PDP fallback.
+    Results keep shortlist order.
     """
     load_env_file()
     tag = associate_tag or os.environ.get("AMAZON_ASSOCIATE_TAG", "").strip()
@@ -599,96 +1035,40 @@ def verify_products(
     print(f"[verify] Method: {method}", file=sys.stderr)
     print(f"[verify] Products to verify: {len(shortlist)}", file=sys.stderr)
 
-    verified: list[VerifiedProduct] = []
-    consecutive_failures = 0
+    if cache is None and use_cache:
+        cache = VerifyCache()
 
+    results: list[VerifiedProduct | None] = [None] * len(shortlist)
+    pending: list[int] = []
+    known_asins: dict[int, str] = {}
     for i, item in enumerate(shortlist):
-        product_name = item.get("product_name", "")
-        brand = item.get("brand", "")
-        clean_query = _normalize_search_query(brand, product_name)
-        print(f"\n  [{i+1}/{len(shortlist)}] {product_name}...", file=sys.stderr)
-        print(f"    Query: {clean_query}", file=sys.stderr)
+        entry = cache.lookup(item) if cache else None
+        if entry:
+            results[i] = _cached_product(item, entry, tag)
+            continue
+        pending.append(i)
+        known_asins[i] = cache.known_asin(item) if cache else item.get("asin", "")
 
+    cached = len(shortlist) - len(pending)
+    if cached:
+        print(f"[verify] Cached (verified within {cache.ttl_hours:.0f}h): {cached}", file=sys.stderr)
+
+    if pending:
         if use_paapi:
-            # PA-API search
-            try:
-                results = _paapi_search(clean_query, tag)
-                if results:
-                    best = results[0]
-                    score = _title_similarity(product_name, best["title"])
-                    confidence = "high" if score > 0.6 else ("medium" if score > 0.35 else "low")
-                    vp = VerifiedProduct(
-                        product_name=product_name,
-                        brand=brand,
-                        asin=best["asin"],
-                        amazon_url=best["url"],
-                        affiliate_url=_make_affiliate_url(best["asin"], tag) if tag else best["url"],
-                        amazon_title=best["title"],
-                        amazon_price=best["price"],
-                        amazon_image_url=best.get("image_url", ""),
-                        match_confidence=confidence,
-                        verification_method="paapi",
-                        evidence=item.get("sources", []),
-                        key_claims=item.get("key_claims", []),
-                    )
-                    verified.append(vp)
-                    consecutive_failures = 0
-                    print(f"    OK: {vp.asin} ({confidence}) -- {vp.amazon_title[:60]}", file=sys.stderr)
-                else:
-                    consecutive_failures += 1
-                    print(f"    NOT FOUND on Amazon", file=sys.stderr)
-            except Exception as exc:
-                consecutive_failures += 1
-                print(f"    PA-API error: {exc}", file=sys.stderr)
+            _verify_paapi(shortlist, pending, results, tag, known_asins)
         else:
-            # Browser PDP flow with retry
-            from tools.lib.retry import with_retry
-
-            vp = None
-            try:
-                vp = with_retry(
-                    lambda pn=product_name, br=brand, t=tag, vid=video_id, idx=i:
-                        _browser_verify_product_pdp(pn, br, t, video_id=vid, product_index=idx),
-                    max_retries=1,
-                    base_delay_s=5.0,
-                )
-            except _AmazonBlockError:
-                consecutive_failures += 1
-                print(f"    BLOCKED: Amazon CAPTCHA/bot detection", file=sys.stderr)
-            except Exception as exc:
-                consecutive_failures += 1
-                print(f"    Browser error: {exc}", file=sys.stderr)
-
-            if vp:
-                vp.evidence = item.get("sources", [])
-                vp.key_claims = item.get("key_claims", [])
-                verified.append(vp)
-                consecutive_failures = 0
-                short_info = f" | short={vp.affiliate_short_url[:30]}" if vp.affiliate_short_url else ""
-                print(f"    OK: {vp.asin} ({vp.match_confidence}) -- {vp.amazon_title[:60]}{short_info}", file=sys.stderr)
-                if vp.error:
-                    print(f"    Note: {vp.error}", file=sys.stderr)
-            elif vp is None and consecutive_failures == 0:
-                print(f"    NO MATCH: {product_name}", file=sys.stderr)
-            else:
-                print(f"    NOT FOUND / verification failed", file=sys.stderr)
-
-            # Consecutive failure pause: if 3+ in a row, likely rate-limited
-            if consecutive_failures >= 3:
-                try:
-                    from tools.lib.notify import notify_rate_limited
-                    notify_rate_limited(video_id or "unknown", "verify", wait_minutes=1)
-                except Exception:
-                    pass
-                print(f"    3+ consecutive failures — pausing 30s", file=sys.stderr)
-                time.sleep(30)
-                consecutive_failures = 0
+            _verify_browser(shortlist, pending, results, tag, video_id)
 
-            # Delay between browser searches to avoid throttling
-            if i < len(shortlist) - 1:
-                time.sleep(2.5)
+    if cache and pending:
+        for i in pending:
+            if results[i]:
+                cache.put(shortlist[i], results[i], tag)
+        try:
+            cache.save()
+        except OSError as exc:
+            print(f"[verify] Could not save verification cache: {exc}", file=sys.stderr)
 
-    return verified
+    return [vp for vp in results if vp is not None]
 
 
 # ---------------------------------------------------------------------------
@@ -743,6 +1123,8 @@ def main() -> int:
     parser.add_argument("--shortlist", required=True, help="Path to shortlist JSON")
     parser.add_argument("--video-id", default="", help="Video ID")
     parser.add_argument("--output", default="", help="Output path for verified JSON")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Re-verify every product, ignoring recent results")
     args = parser.parse_args()
 
     load_env_file()
@@ -752,7 +1134,7 @@ def main() -> int:
         print("Empty shortlist", file=sys.stderr)
         return 1
 
-    verified = verify_products(shortlist, video_id=args.video_id)
+    verified = verify_products(shortlist, video_id=args.video_id, use_cache=not args.no_cache)
 
     print(f"\nVerified: {len(verified)}/{len(shortlist)} products found on Amazon US")
 
@@ -5,7 +5,8 @@ immediately during execution, applied to agent memory in real-time, and
 synced to the skill graph — no deferred processing.
 
 Data stores:
-  - data/learning_events.json          (global append-only index)
+  - data/learning_events.db            (global append-only event store,
+                                        see tools/lib/event_store.py)
   - artifacts/videos/<vid>/learning/events/<id>.json  (per-video)
 
 Stdlib only.
@@ -20,6 +21,7 @@ from pathlib import Path
 from typing import Any
 
 from tools.lib.common import now_iso, project_root
+from tools.lib.event_store import EventStore, open_store
 
 EVENTS_PATH: Path = project_root() / "data" / "learning_events.json"
 
@@ -63,23 +65,24 @@ def _make_event_id(timestamp: str, symptom: str) -> str:
 # Persistence helpers
 # ---------------------------------------------------------------------------
 
-def _read_events(path: Path | None = None) -> list[dict]:
-    p = path or EVENTS_PATH
-    if not p.is_file():
-        return []
-    try:
-        data = json.loads(p.read_text(encoding="utf-8"))
-        if isinstance(data, list):
-            return data
-    except (json.JSONDecodeError, OSError):
-        pass
-    return []
+def _index(entry: dict) -> dict:
+    return {
+        "video_id": entry.get("video_id", ""),
+        "component": entry.get("component", ""),
+        "severity": entry.get("severity", ""),
+        "status": entry.get("status", ""),
+        "ts": entry.get("timestamp", ""),
+        "group_key": (entry.get("root_cause") or "")[:80],
+    }
 
 
-def _write_events(entries: list[dict], path: Path | None = None) -> None:
-    from rayvault.io import atomic_write_json
-    p = path or EVENTS_PATH
-    atomic_write_json(p, entries)
+def events_store(path: Path | None = None) -> EventStore:
+    """The global learning event store (shared with rayvault.learning.registry)."""
+    return open_store(path or EVENTS_PATH, id_field="event_id", index=_index)
+
+
+def _read_events(path: Path | None = None) -> list[dict]:
+    return events_store(path).query()
 
 
 def _write_per_video(event: LearningEvent) -> None:
@@ -140,9 +143,7 @@ def create_event(
     )
 
     # Persist to global index
-    entries = _read_events(_path)
-    entries.append(asdict(event))
-    _write_events(entries, _path)
+    events_store(_path).append(asdict(event))
 
     # Persist per-video
     _write_per_video(event)
@@ -172,10 +173,8 @@ def create_event(
 
 def get_event(event_id: str, *, _path: Path | None = None) -> LearningEvent | None:
     """Retrieve a single event by ID."""
-    for entry in _read_events(_path):
-        if entry.get("event_id") == event_id:
-            return _dict_to_event(entry)
-    return None
+    entry = events_store(_path).get(event_id)
+    return _dict_to_event(entry) if entry is not None else None
 
 
 def list_events(
@@ -187,19 +186,11 @@ def list_events(
     _path: Path | None = None,
 ) -> list[LearningEvent]:
     """List events with optional filters."""
-    entries = _read_events(_path)
-    result = []
-    for e in entries:
-        if component and e.get("component") != component:
-            continue
-        if severity and e.get("severity") != severity:
-            continue
-        if video_id and e.get("video_id") != video_id:
-            continue
-        if status and e.get("status") != status:
-            continue
-        result.append(_dict_to_event(e))
-    return result
+    entries = events_store(_path).query(
+        component=component or None, severity=severity or None,
+        video_id=video_id or None, status=status or None,
+    )
+    return [_dict_to_event(e) for e in entries]
 
 
 def update_event(
@@ -212,36 +203,31 @@ def update_event(
     _path: Path | None = None,
 ) -> LearningEvent | None:
     """Update an existing event. Returns updated event or None."""
-    entries = _read_events(_path)
-    for entry in entries:
-        if entry.get("event_id") == event_id:
-            if status:
-                if status not in STATUSES:
-                    raise ValueError(f"Invalid status {status!r}")
-                entry["status"] = status
-            if verification:
-                entry["verification"] = verification
-            if soul_update:
-                entry["soul_update"] = soul_update
-            if obsolete_rules_removed is not None:
-                entry["obsolete_rules_removed"] = obsolete_rules_removed
-            _write_events(entries, _path)
-            # Update per-video copy too
-            evt = _dict_to_event(entry)
-            _write_per_video(evt)
-            return evt
-    return None
+    store = events_store(_path)
+    entry = store.get(event_id)
+    if entry is None:
+        return None
+    if status:
+        if status not in STATUSES:
+            raise ValueError(f"Invalid status {status!r}")
+        entry["status"] = status
+    if verification:
+        entry["verification"] = verification
+    if soul_update:
+        entry["soul_update"] = soul_update
+    if obsolete_rules_removed is not None:
+        entry["obsolete_rules_removed"] = obsolete_rules_removed
+    store.update(event_id, entry)
+    # Update per-video copy too
+    evt = _dict_to_event(entry)
+    _write_per_video(evt)
+    return evt
 
 
 def _update_event_in_store(event: LearningEvent, _path: Path | None = None) -> None:
     """Update an event's data in the global store."""
-    entries = _read_events(_path)
-    for i, entry in enumerate(entries):
-        if entry.get("event_id") == event.event_id:
-            entries[i] = asdict(event)
-            _write_events(entries, _path)
-            _write_per_video(event)
-            return
+    if events_store(_path).update(event.event_id, asdict(event)):
+        _write_per_video(event)
 
 
 def _dict_to_event(d: dict) -> LearningEvent:
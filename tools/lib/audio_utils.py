@@ -28,6 +28,7 @@ Dependencies:
 Usage:
     from tools.lib.audio_utils import scrub_fillers, estimate_duration_sec
     from tools.lib.audio_utils import finalize_segment_audio, FinalizeResult
+    from tools.lib.audio_utils import plan_finalize, FinalizePlan
     from tools.lib.audio_utils import tokenize_pause_tags, total_pause_ms
 """
 
@@ -315,6 +316,58 @@ def tolerance_ms_for_kind(kind: str) -> int:
     return _KIND_TOLERANCE_MS.get(kind, _DEFAULT_TOLERANCE_MS)
 
 
+@dataclass(frozen=True)
+class FinalizePlan:
+    """Gate decision for a measured duration, before any audio is touched.
+
+    delta_ms is target - measured (positive = short, negative = over).
+    """
+    action: Action
+    delta_ms: int
+    rate: Optional[float] = None
+    reason: Optional[str] = None
+
+
+def plan_finalize(
+    measured_ms: int,
+    target_ms: int,
+    *,
+    kind: str = "product",
+    allow_rate_tweak: bool = True,
+    max_over_pct_for_rate: float = 0.02,
+    max_rate: float = 1.05,
+) -> FinalizePlan:
+    """Decide ok / pad_silence / rate_tweak / needs_repair from durations.
+
+    Pure function shared by finalize_segment_audio (which rewrites the
+    segment file) and tools.lib.voice_track (which applies the same
+    decision while streaming the episode track).
+    """
+    tol_ms = tolerance_ms_for_kind(kind)
+    delta_ms = target_ms - measured_ms
+
+    if abs(delta_ms) <= tol_ms:
+        return FinalizePlan("ok", delta_ms, reason=f"within {tol_ms}ms tolerance ({kind})")
+
+    if delta_ms > 0:
+        return FinalizePlan("pad_silence", delta_ms, reason=f"padded +{delta_ms}ms")
+
+    over_ms = -delta_ms
+    over_pct = over_ms / max(target_ms, 1)
+    if allow_rate_tweak and over_pct <= max_over_pct_for_rate:
+        rate = measured_ms / target_ms
+        rate = max(1.0, min(rate, max_rate))
+        return FinalizePlan(
+            "rate_tweak", delta_ms, rate=rate,
+            reason=f"over by {over_ms}ms ({over_pct:.1%}); atempo={rate:.3f}",
+        )
+
+    return FinalizePlan(
+        "needs_repair", delta_ms,
+        reason=f"over by {over_ms}ms ({over_pct:.1%}) exceeds rate_tweak threshold",
+    )
+
+
 # ---------------------------------------------------------------------------
 # Silence padding + pause injection + smart finalize gate
 # ---------------------------------------------------------------------------
@@ -455,21 +508,25 @@ def finalize_segment_audio(
 
     target_ms = int(target_duration * 1000)
     measured_ms = len(audio)
-    tol_ms = tolerance_ms_for_kind(kind)
-    delta_ms = target_ms - measured_ms  # positive = short, negative = over
-
     measured_sec = measured_ms / 1000.0
+    plan = plan_finalize(
+        measured_ms, target_ms, kind=kind,
+        allow_rate_tweak=allow_rate_tweak,
+        max_over_pct_for_rate=max_over_pct_for_rate,
+        max_rate=max_rate,
+    )
+    delta_ms = plan.delta_ms
 
     # Action: OK — within tolerance
-    if abs(delta_ms) <= tol_ms:
+    if plan.action == "ok":
         return FinalizeResult(
             action="ok", input_path=audio_path, output_path=audio_path,
             target_duration_sec=target_duration, measured_duration_sec=measured_sec,
-            delta_ms=delta_ms, reason=f"within {tol_ms}ms tolerance ({kind})",
+            delta_ms=delta_ms, reason=plan.reason,
         )
 
     # Action: PAD_SILENCE — audio shorter than target
-    if delta_ms > 0:
+    if plan.action == "pad_silence":
         silence = _AudioSegment.silent(duration=delta_ms)
         padded = audio + silence
         _export_atomic(padded, audio_path, fmt=fmt)
@@ -478,17 +535,14 @@ def finalize_segment_audio(
             target_duration_sec=target_duration,
             measured_duration_sec=len(padded) / 1000.0,
             delta_ms=int(target_ms - len(padded)),
-            reason=f"padded +{delta_ms}ms",
+            reason=plan.reason,
         )
 
-    # Audio is over target — decide rate_tweak vs needs_repair
-    over_ms = -delta_ms
-    over_pct = over_ms / max(target_ms, 1)
-
     # Action: RATE_TWEAK — slightly over, use FFmpeg atempo
-    if allow_rate_tweak and over_pct <= max_over_pct_for_rate:
-        rate = measured_ms / target_ms
-        rate = max(1.0, min(rate, max_rate))
+    if plan.action == "rate_tweak":
+        rate = plan.rate
+        over_ms = -delta_ms
+        over_pct = over_ms / max(target_ms, 1)
 
         if _has_ffmpeg():
             try:
@@ -507,7 +561,7 @@ def finalize_segment_audio(
                     measured_duration_sec=tweaked_ms / 1000.0,
                     delta_ms=int(target_ms - tweaked_ms),
                     rate=rate,
-                    reason=f"over by {over_ms}ms ({over_pct:.1%}); atempo={rate:.3f}",
+                    reason=plan.reason,
                 )
             except Exception as e:
                 # FFmpeg failed — fall through to needs_repair
@@ -532,6 +586,5 @@ def finalize_segment_audio(
     return FinalizeResult(
         action="needs_repair", input_path=audio_path, output_path=audio_path,
         target_duration_sec=target_duration, measured_duration_sec=measured_sec,
-        delta_ms=delta_ms,
-        reason=f"over by {over_ms}ms ({over_pct:.1%}) exceeds rate_tweak threshold",
+        delta_ms=delta_ms, reason=plan.reason,
     )
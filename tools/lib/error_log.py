@@ -1,9 +1,10 @@
 """Persistent cross-video error log.
 
-Accumulates pipeline errors across all video runs in a single JSON file,
+Accumulates pipeline errors across all video runs in one event store,
 with resolution tracking and recurring-pattern detection.
 
-Data file: data/error_log.json (append-only JSON array, created on first error).
+Data file: data/error_log.db (see tools/lib/event_store.py; a legacy
+data/error_log.json is imported on first use).
 Stdlib only.
 """
 
@@ -11,10 +12,10 @@ from __future__ import annotations
 
 import datetime
 import hashlib
-import json
 from pathlib import Path
 
 from tools.lib.common import now_iso, project_root
+from tools.lib.event_store import EventStore, open_store
 
 ERROR_LOG_PATH: Path = project_root() / "data" / "error_log.json"
 
@@ -23,26 +24,23 @@ ERROR_LOG_PATH: Path = project_root() / "data" / "error_log.json"
 # Internal helpers
 # ---------------------------------------------------------------------------
 
-def _read_log(path: Path | None = None) -> list[dict]:
-    """Read the error log, returning [] on missing/corrupt file."""
-    p = path or ERROR_LOG_PATH
-    if not p.is_file():
-        return []
-    try:
-        data = json.loads(p.read_text(encoding="utf-8"))
-        if isinstance(data, list):
-            return data
-    except (json.JSONDecodeError, OSError):
-        pass
-    return []
+def _index(entry: dict) -> dict:
+    return {
+        "video_id": entry.get("video_id", ""),
+        "component": entry.get("stage", ""),
+        "status": "resolved" if entry.get("resolved") else "open",
+        "ts": entry.get("timestamp", ""),
+        "group_key": (entry.get("error") or "")[:80],
+    }
 
 
-def _write_log(entries: list[dict], path: Path | None = None) -> None:
-    """Write the full log atomically."""
-    p = path or ERROR_LOG_PATH
-    p.parent.mkdir(parents=True, exist_ok=True)
-    p.write_text(json.dumps(entries, indent=2, ensure_ascii=False) + "\n",
-                 encoding="utf-8")
+def _store(path: Path | None = None) -> EventStore:
+    return open_store(path or ERROR_LOG_PATH, id_field="id", index=_index)
+
+
+def _read_log(path: Path | None = None) -> list[dict]:
+    """All log entries in append order ([] when there is no log yet)."""
+    return _store(path).query()
 
 
 def _make_id(timestamp: str, error: str, salt: str = "") -> str:
@@ -67,9 +65,9 @@ def log_error(
 ) -> dict:
     """Append an error entry and return it."""
     ts = now_iso()
-    entries = _read_log(_path)
+    store = _store(_path)
     entry = {
-        "id": _make_id(ts, error, f"{video_id}{len(entries)}"),
+        "id": _make_id(ts, error, f"{video_id}{store.count()}"),
         "video_id": video_id,
         "timestamp": ts,
         "stage": stage,
@@ -79,8 +77,7 @@ def log_error(
         "resolved": False,
         "resolution": None,
     }
-    entries.append(entry)
-    _write_log(entries, _path)
+    store.append(entry)
     return entry
 
 
@@ -92,30 +89,30 @@ def resolve_error(
     _path: Path | None = None,
 ) -> dict | None:
     """Mark an error resolved. Returns updated entry or None if not found."""
-    entries = _read_log(_path)
-    for entry in entries:
-        if entry["id"] == error_id:
-            entry["resolved"] = True
-            entry["resolution"] = {
-                "resolved_at": now_iso(),
-                "root_cause": root_cause,
-                "fix": fix,
-            }
-            _write_log(entries, _path)
-            # Supabase: sync lesson
-            try:
-                from tools.lib.supabase_pipeline import save_lesson
-                save_lesson(
-                    entry.get("stage", "unknown"),
-                    entry.get("error", "")[:80],
-                    f"{root_cause} -> {fix}",
-                    example={"video_id": entry.get("video_id", ""),
-                             "error_id": error_id},
-                )
-            except Exception:
-                pass
-            return entry
-    return None
+    store = _store(_path)
+    entry = store.get(error_id)
+    if entry is None:
+        return None
+    entry["resolved"] = True
+    entry["resolution"] = {
+        "resolved_at": now_iso(),
+        "root_cause": root_cause,
+        "fix": fix,
+    }
+    store.update(error_id, entry)
+    # Supabase: sync lesson
+    try:
+        from tools.lib.supabase_pipeline import save_lesson
+        save_lesson(
+            entry.get("stage", "unknown"),
+            entry.get("error", "")[:80],
+            f"{root_cause} -> {fix}",
+            example={"video_id": entry.get("video_id", ""),
+                     "error_id": error_id},
+        )
+    except Exception:
+        pass
+    return entry
 
 
 def get_unresolved(
@@ -125,13 +122,9 @@ def get_unresolved(
     _path: Path | None = None,
 ) -> list[dict]:
     """Return unresolved errors, optionally filtered by stage/video."""
-    entries = _read_log(_path)
-    result = [e for e in entries if not e.get("resolved")]
-    if stage:
-        result = [e for e in result if e.get("stage") == stage]
-    if video_id:
-        result = [e for e in result if e.get("video_id") == video_id]
-    return result
+    return _store(_path).query(
+        status="open", component=stage or None, video_id=video_id or None,
+    )
 
 
 def get_patterns(
@@ -140,16 +133,10 @@ def get_patterns(
     _path: Path | None = None,
 ) -> list[dict]:
     """Group errors by (stage, error[:80]) and return recurring patterns."""
-    entries = _read_log(_path)
-    groups: dict[tuple[str, str], list[dict]] = {}
-    for e in entries:
-        key = (e.get("stage", ""), e.get("error", "")[:80])
-        groups.setdefault(key, []).append(e)
-
+    store = _store(_path)
     patterns = []
-    for (stage, pattern), items in sorted(groups.items()):
-        if len(items) < min_count:
-            continue
+    for stage, pattern, _ in store.groups(min_count=min_count):
+        items = store.query(component=stage, group_key=pattern)
         patterns.append({
             "stage": stage,
             "pattern": pattern,
@@ -170,8 +157,7 @@ def get_lessons(
     Groups resolved errors by (stage, error[:80]), deduplicates, and returns
     the most recent resolution per pattern.
     """
-    entries = _read_log(_path)
-    resolved = [e for e in entries if e.get("resolved") and e.get("resolution")]
+    resolved = [e for e in _store(_path).query(status="resolved") if e.get("resolution")]
 
     groups: dict[tuple[str, str], list[dict]] = {}
     for e in resolved:
@@ -231,16 +217,14 @@ def get_stale(
     _path: Path | None = None,
 ) -> list[dict]:
     """Return unresolved errors older than *days*."""
-    entries = _read_log(_path)
     cutoff = (
         datetime.datetime.now(datetime.timezone.utc)
         - datetime.timedelta(days=days)
     ).isoformat()
 
     return [
-        e for e in entries
-        if not e.get("resolved")
-        and e.get("timestamp", "") < cutoff
+        e for e in _store(_path).query(status="open", until=cutoff)
+        if e.get("timestamp", "") < cutoff
     ]
 
 
@@ -253,21 +237,17 @@ def format_log_text(
     _path: Path | None = None,
 ) -> str:
     """Human-readable error log for CLI display."""
-    entries = _read_log(_path)
-
-    if not show_resolved:
-        entries = [e for e in entries if not e.get("resolved")]
-    if stage:
-        entries = [e for e in entries if e.get("stage") == stage]
-    if video_id:
-        entries = [e for e in entries if e.get("video_id") == video_id]
-
+    # Most recent first, capped at limit
+    entries = _store(_path).query(
+        status=None if show_resolved else "open",
+        component=stage or None,
+        video_id=video_id or None,
+        limit=limit,
+        newest_first=True,
+    )
     if not entries:
         return "No errors found."
 
-    # Most recent first, capped at limit
-    entries = list(reversed(entries))[:limit]
-
     lines = []
     for e in entries:
         status = "RESOLVED" if e.get("resolved") else "OPEN"
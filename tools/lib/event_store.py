@@ -0,0 +1,287 @@
+"""Append-only event store (SQLite, WAL) behind the pipeline's JSON ledgers.
+
+Backs data/learning_events.json, data/error_log.json and data/run_log.json.
+Each ledger used to be a JSON array that was loaded, mutated and rewritten
+in full for every append; now an append is one INSERT and lookups go
+through indexes on video_id, component, severity, status, timestamp and a
+per-ledger grouping key (the "pattern" used by get_patterns()).
+
+Callers keep passing the legacy JSON path. The database lives next to it
+with a .db suffix. If the JSON file is present when the store is opened,
+its entries are imported once; the import and a "legacy_import" row in the
+meta table commit together, so it never repeats. The JSON file itself is
+left in place (some ledgers are tracked in git).
+
+Each ledger supplies an index function mapping an entry to its indexed
+columns; the full entry is stored as JSON and returned unchanged.
+
+Stdlib only.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Iterable
+
+INDEX_COLUMNS = ("video_id", "component", "severity", "status", "ts", "group_key")
+
+IndexFn = Callable[[dict], dict]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    eid TEXT NOT NULL DEFAULT '',
+    video_id TEXT NOT NULL DEFAULT '',
+    component TEXT NOT NULL DEFAULT '',
+    severity TEXT NOT NULL DEFAULT '',
+    status TEXT NOT NULL DEFAULT '',
+    ts TEXT NOT NULL DEFAULT '',
+    group_key TEXT NOT NULL DEFAULT '',
+    body TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_events_eid ON events(eid);
+CREATE INDEX IF NOT EXISTS ix_events_video ON events(video_id, ts);
+CREATE INDEX IF NOT EXISTS ix_events_component ON events(component, ts);
+CREATE INDEX IF NOT EXISTS ix_events_severity ON events(severity, ts);
+CREATE INDEX IF NOT EXISTS ix_events_status ON events(status, ts);
+CREATE INDEX IF NOT EXISTS ix_events_ts ON events(ts);
+CREATE INDEX IF NOT EXISTS ix_events_group ON events(component, group_key);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+def store_path(json_path: Path) -> Path:
+    """Database file for a legacy JSON ledger path."""
+    return json_path.with_suffix(".db")
+
+
+def _load_legacy(json_path: Path) -> list[dict] | None:
+    """Entries of a legacy JSON array, or None when missing/unreadable."""
+    if not json_path.is_file():
+        return None
+    try:
+        data = json.loads(json_path.read_text(encoding="utf-8"))
+    except (json.JSONDecodeError, OSError, UnicodeDecodeError):
+        return None
+    if not isinstance(data, list):
+        return None
+    return [e for e in data if isinstance(e, dict)]
+
+
+class EventStore:
+    """One ledger: an events table plus its index function."""
+
+    def __init__(self, json_path: Path, id_field: str, index: IndexFn):
+        self.json_path = json_path
+        self.db_path = store_path(json_path)
+        self.id_field = id_field
+        self.index = index
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        self._ino = 0
+        self._legacy_done = False
+
+    # -- connection --------------------------------------------------------
+
+    def _connect(self) -> sqlite3.Connection:
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.db_path), timeout=10, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(_SCHEMA)
+        conn.commit()
+        return conn
+
+    def _db(self, create: bool) -> sqlite3.Connection | None:
+        """Connection (caller holds the lock); None when create=False and empty."""
+        try:
+            ino = os.stat(self.db_path).st_ino
+        except OSError:
+            ino = 0
+        if self._conn is not None and ino != self._ino:
+            # Database was removed or replaced underneath us
+            self._conn.close()
+            self._conn = None
+            self._legacy_done = False
+        if self._conn is None:
+            if not ino:
+                if not create and _load_legacy(self.json_path) is None:
+                    return None
+            self._conn = self._connect()
+            self._ino = os.stat(self.db_path).st_ino
+        if not self._legacy_done:
+            self._migrate(self._conn)
+        return self._conn
+
+    def _migrate(self, conn: sqlite3.Connection) -> None:
+        """Import the legacy JSON array once, recorded in the meta table."""
+        if conn.execute("SELECT 1 FROM meta WHERE key = 'legacy_import'").fetchone():
+            self._legacy_done = True
+            return
+        if not self.json_path.is_file():
+            return
+        entries = _load_legacy(self.json_path) or []
+        with conn:
+            self._insert(conn, entries)
+            conn.execute(
+                "INSERT INTO meta (key, value) VALUES ('legacy_import', ?)",
+                (json.dumps({
+                    "source": self.json_path.name,
+                    "entries": len(entries),
+                    "ts": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+                }),),
+            )
+        self._legacy_done = True
+
+    def _row(self, entry: dict) -> tuple:
+        cols = self.index(entry)
+        eid = str(entry.get(self.id_field, "")) if self.id_field else ""
+        return (eid, *(str(cols.get(c) or "") for c in INDEX_COLUMNS),
+                json.dumps(entry, ensure_ascii=False))
+
+    def _insert(self, conn: sqlite3.Connection, entries: Iterable[dict]) -> None:
+        conn.executemany(
+            "INSERT INTO events (eid, video_id, component, severity, status, ts, "
+            "group_key, body) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            [self._row(e) for e in entries],
+        )
+
+    # -- writes ------------------------------------------------------------
+
+    def append(self, entry: dict) -> None:
+        with self._lock:
+            conn = self._db(create=True)
+            self._insert(conn, [entry])
+            conn.commit()
+
+    def update(self, eid: str, entry: dict) -> bool:
+        """Replace the first entry with this id. Returns False if absent."""
+        with self._lock:
+            conn = self._db(create=False)
+            if conn is None:
+                return False
+            row = conn.execute(
+                "SELECT seq FROM events WHERE eid = ? ORDER BY seq LIMIT 1", (eid,)
+            ).fetchone()
+            if row is None:
+                return False
+            _, *cols, body = self._row(entry)
+            conn.execute(
+                "UPDATE events SET video_id = ?, component = ?, severity = ?, "
+                "status = ?, ts = ?, group_key = ?, body = ? WHERE seq = ?",
+                (*cols, body, row[0]),
+            )
+            conn.commit()
+            return True
+
+    # -- reads -------------------------------------------------------------
+
+    @staticmethod
+    def _where(filters: dict) -> tuple[str, list]:
+        clauses: list[str] = []
+        args: list = []
+        for col in ("video_id", "component", "severity", "status", "group_key"):
+            val = filters.get(col)
+            if val is None:  # "" is a real value (e.g. the empty group_key)
+                continue
+            if isinstance(val, (list, tuple, set, frozenset)):
+                vals = list(val)
+                clauses.append(f"{col} IN ({', '.join('?' * len(vals))})")
+                args.extend(vals)
+            else:
+                clauses.append(f"{col} = ?")
+                args.append(val)
+        if filters.get("since"):
+            clauses.append("ts >= ?")
+            args.append(filters["since"])
+        if filters.get("until"):
+            clauses.append("ts <= ?")
+            args.append(filters["until"])
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", args
+
+    def query(self, *, limit: int = 0, newest_first: bool = False, **filters) -> list[dict]:
+        """Entries matching all filters, in append order.
+
+        Filters: video_id, component, severity, status, group_key (a value
+        or a collection of values; None means unfiltered, "" matches the
+        empty value), since / until (inclusive timestamp bounds).
+
+        limit keeps only the newest N entries; they are still returned
+        oldest first unless newest_first is set.
+        """
+        where, args = self._where(filters)
+        sql = f"SELECT body FROM events{where} ORDER BY seq"
+        if limit:
+            sql += f" DESC LIMIT {int(limit)}"
+        elif newest_first:
+            sql += " DESC"
+        with self._lock:
+            conn = self._db(create=False)
+            if conn is None:
+                return []
+            rows = conn.execute(sql, args).fetchall()
+        out = [json.loads(r[0]) for r in rows]
+        if limit and not newest_first:
+            out.reverse()
+        return out
+
+    def get(self, eid: str) -> dict | None:
+        with self._lock:
+            conn = self._db(create=False)
+            if conn is None:
+                return None
+            row = conn.execute(
+                "SELECT body FROM events WHERE eid = ? ORDER BY seq LIMIT 1", (eid,)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def count(self, **filters) -> int:
+        where, args = self._where(filters)
+        with self._lock:
+            conn = self._db(create=False)
+            if conn is None:
+                return 0
+            return conn.execute(f"SELECT COUNT(*) FROM events{where}", args).fetchone()[0]
+
+    def groups(self, *, min_count: int = 1, **filters) -> list[tuple[str, str, int]]:
+        """(component, group_key, count) for groups with at least min_count entries."""
+        where, args = self._where(filters)
+        with self._lock:
+            conn = self._db(create=False)
+            if conn is None:
+                return []
+            return [tuple(r) for r in conn.execute(
+                f"SELECT component, group_key, COUNT(*) FROM events{where} "
+                "GROUP BY component, group_key HAVING COUNT(*) >= ? "
+                "ORDER BY component, group_key",
+                [*args, max(1, int(min_count))],
+            ).fetchall()]
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+_STORES: dict[str, EventStore] = {}
+_STORES_LOCK = threading.Lock()
+
+
+def open_store(json_path: Path, *, id_field: str, index: IndexFn) -> EventStore:
+    """Process-wide EventStore for a ledger path (one connection per ledger)."""
+    key = str(Path(json_path).absolute())
+    with _STORES_LOCK:
+        store = _STORES.get(key)
+        if store is None:
+            store = EventStore(Path(json_path), id_field, index)
+            _STORES[key] = store
+        return store
@@ -3,8 +3,9 @@
 Keyed by URL. Each cache entry stores:
 - Content hash (SHA-256 of fetched text)
 - FetchResult metadata (method, token_estimate, content_type, etc.)
-- Full text content (in a separate .md file to keep the index small)
-- Timestamp + TTL for expiration
+- Full text content (in a separate .md file to keep the index small,
+  optionally gzip-compressed)
+- Timestamp + TTL for expiration, last access time for LRU eviction
 
 When a URL is requested:
 1. Check cache index for a non-expired entry
@@ -22,6 +23,7 @@ Usage:
     cache = FetchCache()                          # default: ~/.openclaw/cache/fetch/
     cache = FetchCache(ttl_hours=48)              # custom TTL
     cache = FetchCache(cache_dir="./my_cache")    # custom location
+    cache = FetchCache(max_bytes=256 << 20, compress=True)  # LRU cap, gzip
 
     # Check before fetching
     hit = cache.get("https://example.com/review")
@@ -38,10 +40,13 @@ Usage:
 
 from __future__ import annotations
 
+import gzip
 import hashlib
 import json
 import os
+import sqlite3
 import sys
+import threading
 import time
 from dataclasses import dataclass
 from datetime import datetime, timezone
@@ -104,22 +109,82 @@ def _content_hash(text: str) -> str:
 
 _DEFAULT_TTL_HOURS = 24.0
 _DEFAULT_CACHE_DIR = None  # resolved at runtime
+_DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+_DEFAULT_MAX_ENTRIES = 50_000
+
+_ENTRY_FIELDS = (
+    "url", "url_key", "content_hash", "method", "content_type",
+    "token_estimate", "content_length", "fetched_at", "cached_at",
+    "ttl_hours", "text_file",
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    url_key TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    method TEXT NOT NULL DEFAULT '',
+    content_type TEXT NOT NULL DEFAULT '',
+    token_estimate INTEGER,
+    content_length INTEGER NOT NULL DEFAULT 0,
+    fetched_at TEXT NOT NULL DEFAULT '',
+    cached_at TEXT NOT NULL,
+    ttl_hours REAL NOT NULL,
+    text_file TEXT NOT NULL,
+    size_bytes INTEGER NOT NULL DEFAULT 0,
+    expires_at REAL NOT NULL,
+    last_access REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_entries_lru ON entries(last_access);
+CREATE INDEX IF NOT EXISTS ix_entries_expires ON entries(expires_at);
+CREATE TABLE IF NOT EXISTS totals (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    entries INTEGER NOT NULL,
+    bytes INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO totals (id, entries, bytes) VALUES (1, 0, 0);
+CREATE TRIGGER IF NOT EXISTS entries_ins AFTER INSERT ON entries BEGIN
+    UPDATE totals SET entries = entries + 1, bytes = bytes + NEW.size_bytes WHERE id = 1;
+END;
+CREATE TRIGGER IF NOT EXISTS entries_del AFTER DELETE ON entries BEGIN
+    UPDATE totals SET entries = entries - 1, bytes = bytes - OLD.size_bytes WHERE id = 1;
+END;
+CREATE TRIGGER IF NOT EXISTS entries_upd AFTER UPDATE OF size_bytes ON entries BEGIN
+    UPDATE totals SET bytes = bytes - OLD.size_bytes + NEW.size_bytes WHERE id = 1;
+END;
+"""
+
+
+def _expires_at(cached_at: str, ttl_hours: float) -> float:
+    return datetime.fromisoformat(cached_at).timestamp() + ttl_hours * 3600
 
 
 class FetchCache:
-    """Disk-backed URL fetch cache with TTL expiration.
+    """Disk-backed URL fetch cache with TTL expiration and an LRU size cap.
 
     Directory layout:
         <cache_dir>/
-            index.json          # {url_key: CacheEntry metadata}
+            index.db            # SQLite (WAL) index, one row per URL
             content/
-                <url_key>.md    # cached text content
+                <url_key>.md    # cached text content (.md.gz when compressed)
+
+    The index is keyed by url_key, so get()/put()/invalidate() touch one
+    row instead of rewriting a whole index file, and concurrent writers
+    (threads in fetch_markdown_batch, or separate processes) are serialized
+    by SQLite. Content files are written to a temp name and renamed into
+    place. When the cache grows past max_bytes or max_entries (None = no
+    limit), least-recently-used entries are evicted. A legacy index.json
+    is imported once and renamed to index.json.migrated.
     """
 
     def __init__(
         self,
         cache_dir: str | Path | None = None,
         ttl_hours: float = _DEFAULT_TTL_HOURS,
+        *,
+        max_bytes: int | None = _DEFAULT_MAX_BYTES,
+        max_entries: int | None = _DEFAULT_MAX_ENTRIES,
+        compress: bool = False,
     ):
         if cache_dir is None:
             # Default: <repo_root>/.cache/fetch/
@@ -129,54 +194,144 @@ class FetchCache:
             self._dir = Path(cache_dir)
 
         self._content_dir = self._dir / "content"
-        self._index_path = self._dir / "index.json"
+        self._index_path = self._dir / "index.db"
+        self._legacy_index_path = self._dir / "index.json"
         self._ttl_hours = ttl_hours
+        self._max_bytes = max_bytes
+        self._max_entries = max_entries
+        self._compress = compress
+        self._lock = threading.Lock()
 
         # Ensure dirs exist
         self._dir.mkdir(parents=True, exist_ok=True)
         self._content_dir.mkdir(parents=True, exist_ok=True)
 
-        # Load index
-        self._index: dict[str, dict] = self._load_index()
+        self._db = sqlite3.connect(
+            str(self._index_path), timeout=30, check_same_thread=False,
+        )
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(_SCHEMA)
+        self._db.commit()
+        self._migrate_legacy_index()
 
     # ── Index I/O ─────────────────────────────────────────────────────────
 
-    def _load_index(self) -> dict[str, dict]:
-        if self._index_path.exists():
+    def _migrate_legacy_index(self) -> None:
+        if not self._legacy_index_path.exists():
+            return
+        try:
+            legacy = json.loads(self._legacy_index_path.read_text(encoding="utf-8"))
+        except (json.JSONDecodeError, OSError):
+            legacy = {}
+        rows = []
+        now = time.time()
+        for raw in (legacy.values() if isinstance(legacy, dict) else []):
             try:
-                return json.loads(self._index_path.read_text(encoding="utf-8"))
-            except (json.JSONDecodeError, OSError):
-                return {}
-        return {}
-
-    def _save_index(self) -> None:
-        self._index_path.write_text(
-            json.dumps(self._index, indent=2, ensure_ascii=False),
-            encoding="utf-8",
-        )
+                entry = CacheEntry(**{k: raw[k] for k in _ENTRY_FIELDS})
+                expires = entry.expires_at
+            except (TypeError, KeyError, ValueError):
+                continue
+            path = self._dir / entry.text_file
+            if not path.exists():
+                continue
+            rows.append(self._row(entry, path.stat().st_size, expires, now))
+        with self._lock:
+            self._db.executemany(self._UPSERT, rows)
+            self._db.commit()
+        try:
+            self._legacy_index_path.replace(
+                self._legacy_index_path.with_name("index.json.migrated")
+            )
+        except FileNotFoundError:
+            # Another process migrated it first; the upserts above are idempotent
+            pass
+
+    # Upsert (not INSERT OR REPLACE) so the totals triggers see an UPDATE
+    _UPSERT = (
+        "INSERT INTO entries (" + ", ".join(_ENTRY_FIELDS)
+        + ", size_bytes, expires_at, last_access) VALUES ("
+        + ", ".join("?" * (len(_ENTRY_FIELDS) + 3)) + ") "
+        + "ON CONFLICT(url_key) DO UPDATE SET "
+        + ", ".join(f"{c} = excluded.{c}" for c in
+                    (*_ENTRY_FIELDS[:1], *_ENTRY_FIELDS[2:], "size_bytes", "expires_at", "last_access"))
+    )
+
+    @staticmethod
+    def _row(entry: CacheEntry, size: int, expires: float, access: float) -> tuple:
+        return (*(getattr(entry, f) for f in _ENTRY_FIELDS), size, expires, access)
+
+    def _select(self, key: str) -> CacheEntry | None:
+        row = self._db.execute(
+            f"SELECT {', '.join(_ENTRY_FIELDS)} FROM entries WHERE url_key = ?", (key,)
+        ).fetchone()
+        return CacheEntry(*row) if row else None
+
+    def _delete(self, keys: list[str], files: list[str]) -> None:
+        """Drop index rows, then their content files (caller holds the lock)."""
+        self._db.executemany("DELETE FROM entries WHERE url_key = ?", [(k,) for k in keys])
+        self._db.commit()
+        for text_file in files:
+            if text_file:
+                (self._dir / text_file).unlink(missing_ok=True)
+
+    def _enforce_budget(self) -> int:
+        """Evict least-recently-used entries until within budget (lock held)."""
+        evicted = 0
+        while True:
+            count, size = self._db.execute(
+                "SELECT entries, bytes FROM totals WHERE id = 1"
+            ).fetchone()
+            over_n = count - self._max_entries if self._max_entries is not None else 0
+            over_b = size - self._max_bytes if self._max_bytes is not None else 0
+            if over_n <= 0 and over_b <= 0:
+                return evicted
+            victims = self._db.execute(
+                "SELECT url_key, text_file, size_bytes FROM entries "
+                "ORDER BY last_access LIMIT ?",
+                (max(over_n, 1) if over_b <= 0 else 64,),
+            ).fetchall()
+            if not victims:
+                return evicted
+            chosen, freed = [], 0
+            for key, text_file, nbytes in victims:
+                chosen.append((key, text_file))
+                freed += nbytes
+                if len(chosen) >= over_n and freed >= over_b:
+                    break
+            self._delete([k for k, _ in chosen], [f for _, f in chosen])
+            evicted += len(chosen)
+
+    def _read_content(self, text_file: str) -> str:
+        path = self._dir / text_file
+        if text_file.endswith(".gz"):
+            return gzip.decompress(path.read_bytes()).decode("utf-8")
+        return path.read_text(encoding="utf-8")
 
     # ── Public API ────────────────────────────────────────────────────────
 
     def get(self, url: str) -> CacheEntry | None:
         """Look up a URL in cache. Returns CacheEntry or None if miss/expired."""
         key = _url_key(url)
-        raw = self._index.get(key)
-        if raw is None:
-            return None
-
-        entry = CacheEntry(**raw)
-
-        if entry.is_expired:
-            return None
-
-        # Verify content file exists
-        content_path = self._dir / entry.text_file
-        if not content_path.exists():
-            # Stale index entry — remove it
-            del self._index[key]
-            self._save_index()
-            return None
-
+        with self._lock:
+            entry = self._select(key)
+            if entry is None:
+                return None
+
+            if entry.is_expired:
+                return None
+
+            # Verify content file exists
+            content_path = self._dir / entry.text_file
+            if not content_path.exists():
+                # Stale index entry — remove it
+                self._delete([key], [])
+                return None
+
+            self._db.execute(
+                "UPDATE entries SET last_access = ? WHERE url_key = ?", (time.time(), key)
+            )
+            self._db.commit()
         return entry
 
     def get_text(self, url: str) -> str | None:
@@ -184,8 +339,11 @@ class FetchCache:
         entry = self.get(url)
         if entry is None:
             return None
-        content_path = self._dir / entry.text_file
-        return content_path.read_text(encoding="utf-8")
+        try:
+            return self._read_content(entry.text_file)
+        except (OSError, EOFError, gzip.BadGzipFile):
+            # Evicted or replaced by another writer between get() and read
+            return None
 
     def put(
         self,
@@ -203,29 +361,46 @@ class FetchCache:
         now = datetime.now(timezone.utc).isoformat()
         ttl = ttl_hours if ttl_hours is not None else self._ttl_hours
 
-        # Write content file
-        text_file = f"content/{key}.md"
+        # Write content file (temp + rename, so readers never see a partial file)
+        data = text.encode("utf-8")
+        if self._compress:
+            text_file = f"content/{key}.md.gz"
+            data = gzip.compress(data, compresslevel=6)
+        else:
+            text_file = f"content/{key}.md"
         content_path = self._dir / text_file
-        content_path.write_text(text, encoding="utf-8")
-
-        entry_dict = {
-            "url": url,
-            "url_key": key,
-            "content_hash": _content_hash(text),
-            "method": method,
-            "content_type": content_type,
-            "token_estimate": token_estimate,
-            "content_length": len(text),
-            "fetched_at": fetched_at or now,
-            "cached_at": now,
-            "ttl_hours": ttl,
-            "text_file": text_file,
-        }
+        tmp = content_path.with_name(
+            f".{content_path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        tmp.write_bytes(data)
+        os.replace(tmp, content_path)
+
+        entry = CacheEntry(
+            url=url,
+            url_key=key,
+            content_hash=_content_hash(text),
+            method=method,
+            content_type=content_type,
+            token_estimate=token_estimate,
+            content_length=len(text),
+            fetched_at=fetched_at or now,
+            cached_at=now,
+            ttl_hours=ttl,
+            text_file=text_file,
+        )
 
-        self._index[key] = entry_dict
-        self._save_index()
+        with self._lock:
+            old = self._select(key)
+            self._db.execute(
+                self._UPSERT,
+                self._row(entry, len(data), _expires_at(now, ttl), time.time()),
+            )
+            self._db.commit()
+            if old is not None and old.text_file != text_file:
+                (self._dir / old.text_file).unlink(missing_ok=True)
+            self._enforce_budget()
 
-        return CacheEntry(**entry_dict)
+        return entry
 
     def put_result(self, result: Any, *, ttl_hours: float | None = None) -> CacheEntry:
         """Store a FetchResult object in cache. Convenience wrapper around put()."""
@@ -249,65 +424,44 @@ class FetchCache:
     def invalidate(self, url: str) -> bool:
         """Remove a URL from cache. Returns True if it was cached."""
         key = _url_key(url)
-        if key not in self._index:
-            return False
-        # Remove content file
-        entry = self._index[key]
-        content_path = self._dir / entry.get("text_file", "")
-        if content_path.exists():
-            content_path.unlink()
-        del self._index[key]
-        self._save_index()
+        with self._lock:
+            entry = self._select(key)
+            if entry is None:
+                return False
+            self._delete([key], [entry.text_file])
         return True
 
     def evict_expired(self) -> int:
         """Remove all expired entries. Returns count of entries evicted."""
-        now = time.time()
-        expired_keys = []
-        for key, raw in self._index.items():
-            try:
-                entry = CacheEntry(**raw)
-                if entry.is_expired:
-                    expired_keys.append(key)
-            except (TypeError, KeyError):
-                expired_keys.append(key)
-
-        for key in expired_keys:
-            entry_raw = self._index.get(key, {})
-            text_file = entry_raw.get("text_file", "")
-            if text_file:
-                content_path = self._dir / text_file
-                if content_path.exists():
-                    content_path.unlink()
-            del self._index[key]
-
-        if expired_keys:
-            self._save_index()
-        return len(expired_keys)
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT url_key, text_file FROM entries WHERE expires_at < ?", (time.time(),)
+            ).fetchall()
+            if rows:
+                self._delete([k for k, _ in rows], [f for _, f in rows])
+        return len(rows)
+
+    def evict_lru(self) -> int:
+        """Apply the max_bytes/max_entries budget now. Returns count evicted."""
+        with self._lock:
+            return self._enforce_budget()
 
     def clear(self) -> int:
         """Remove all cache entries. Returns count removed."""
-        count = len(self._index)
-        for key, raw in self._index.items():
-            text_file = raw.get("text_file", "")
-            if text_file:
-                content_path = self._dir / text_file
-                if content_path.exists():
-                    content_path.unlink()
-        self._index.clear()
-        self._save_index()
-        return count
+        with self._lock:
+            rows = self._db.execute("SELECT url_key, text_file FROM entries").fetchall()
+            self._delete([k for k, _ in rows], [f for _, f in rows])
+        return len(rows)
 
     def stats(self) -> dict:
         """Return cache statistics."""
-        total = len(self._index)
-        expired = sum(1 for raw in self._index.values()
-                      if CacheEntry(**raw).is_expired)
-        total_bytes = sum(
-            (self._dir / raw.get("text_file", "")).stat().st_size
-            for raw in self._index.values()
-            if (self._dir / raw.get("text_file", "")).exists()
-        )
+        with self._lock:
+            total, total_bytes = self._db.execute(
+                "SELECT entries, bytes FROM totals WHERE id = 1"
+            ).fetchone()
+            expired = self._db.execute(
+                "SELECT COUNT(*) FROM entries WHERE expires_at < ?", (time.time(),)
+            ).fetchone()[0]
         return {
             "total_entries": total,
             "active_entries": total - expired,
@@ -315,10 +469,17 @@ class FetchCache:
             "total_bytes": total_bytes,
             "cache_dir": str(self._dir),
             "default_ttl_hours": self._ttl_hours,
+            "max_bytes": self._max_bytes,
+            "max_entries": self._max_entries,
         }
 
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
     def __len__(self) -> int:
-        return len(self._index)
+        with self._lock:
+            return self._db.execute("SELECT entries FROM totals WHERE id = 1").fetchone()[0]
 
     def __contains__(self, url: str) -> bool:
         return self.get(url) is not None
@@ -0,0 +1,224 @@
+"""File readiness watcher — wake as soon as hand-off files are written.
+
+Dispatch steps hand work to agents that write files into the episode
+directory; the dispatcher then waits for those files. Instead of sleeping
+in fixed steps, wait_until_ready() blocks on inotify events for the parent
+directories (Linux, via ctypes) and falls back to short polling elsewhere.
+
+A path is ready when it exists, is non-empty, its mtime is >= min_mtime,
+and it is complete:
+
+  - already ready when the wait starts                → ready at once
+  - IN_CLOSE_WRITE / IN_MOVED_TO seen for it           → ready at once
+  - otherwise (polling, or writer keeps it open)       → ready once size and
+                                                         mtime held still for
+                                                         SETTLE_SEC
+
+Missing parent directories are fine: the nearest existing ancestor is
+watched and watches move down as directories get created.
+
+Stdlib only.
+
+Usage:
+    from tools.lib.file_watch import wait_until_ready
+
+    result = wait_until_ready([script_path, review_path], 900, min_mtime=run_start)
+    if result.ok:
+        print(result.ready)  # {path: seconds until ready}
+"""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+
+POLL_SEC = float(os.environ.get("FILE_WATCH_POLL_SEC", "0.25"))
+SETTLE_SEC = float(os.environ.get("FILE_WATCH_SETTLE_SEC", "0.5"))
+RESCAN_SEC = 2.0  # inotify safety net (network filesystems, missed events)
+
+# <sys/inotify.h>
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+_WATCH_MASK = (
+    IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE
+    | IN_DELETE_SELF | IN_MOVE_SELF | IN_ONLYDIR
+)
+_EVENT = struct.Struct("iIII")
+
+
+@dataclass
+class WaitResult:
+    ready: dict[str, float] = field(default_factory=dict)  # path -> seconds until ready
+    missing: list[str] = field(default_factory=list)
+    backend: str = "poll"
+    elapsed_sec: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return not self.missing
+
+
+class _Inotify:
+    """Minimal inotify binding: directory watches + event draining."""
+
+    def __init__(self) -> None:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or None, use_errno=True)
+        self._add_watch = libc.inotify_add_watch
+        self._add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self.fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.dirs: dict[int, str] = {}
+
+    def watch_dir(self, path: str) -> bool:
+        wd = self._add_watch(self.fd, os.fsencode(path), _WATCH_MASK)
+        if wd < 0:
+            return False
+        self.dirs[wd] = path
+        return True
+
+    def read(self) -> list[tuple[str, int]]:
+        """Drain pending events as (full path, mask)."""
+        events: list[tuple[str, int]] = []
+        while True:
+            try:
+                buf = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                return events
+            offset = 0
+            while offset + _EVENT.size <= len(buf):
+                wd, mask, _cookie, length = _EVENT.unpack_from(buf, offset)
+                name = buf[offset + _EVENT.size:offset + _EVENT.size + length].rstrip(b"\0")
+                offset += _EVENT.size + length
+                base = self.dirs.get(wd)
+                if mask & IN_IGNORED:
+                    self.dirs.pop(wd, None)
+                if base is not None:
+                    events.append((os.path.join(base, os.fsdecode(name)) if name else base, mask))
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+def _open_inotify() -> _Inotify | None:
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        return _Inotify()
+    except (OSError, AttributeError):
+        return None
+
+
+def _signature(path: str, min_mtime: float) -> tuple[int, int] | None:
+    """(size, mtime_ns) when the file satisfies the size/mtime checks."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    if st.st_size <= 0 or (min_mtime > 0.0 and st.st_mtime < min_mtime):
+        return None
+    return st.st_size, st.st_mtime_ns
+
+
+def _watch_target(path: str) -> str:
+    """Nearest existing ancestor directory of path."""
+    parent = os.path.dirname(path) or "."
+    while not os.path.isdir(parent):
+        up = os.path.dirname(parent)
+        if up == parent:
+            break
+        parent = up
+    return parent
+
+
+def wait_until_ready(
+    paths: Iterable[str],
+    timeout_sec: float,
+    *,
+    min_mtime: float = 0.0,
+    settle_sec: float = SETTLE_SEC,
+    poll_sec: float = POLL_SEC,
+    use_inotify: bool = True,
+) -> WaitResult:
+    """Block until every path is ready or timeout_sec elapses."""
+    start = time.monotonic()
+    pending: list[str] = list(dict.fromkeys(os.path.abspath(p) for p in paths))
+    result = WaitResult()
+    for path in list(pending):
+        if _signature(path, min_mtime) is not None:
+            result.ready[path] = 0.0
+            pending.remove(path)
+
+    notifier = _open_inotify() if (use_inotify and pending) else None
+    result.backend = "inotify" if notifier else "poll"
+    watched: set[str] = set()
+    closed: set[str] = set()
+    seen: dict[str, tuple[tuple[int, int], float]] = {}  # path -> (signature, since)
+    deadline = start + max(0.0, timeout_sec)
+
+    try:
+        while pending:
+            rearmed = False
+            if notifier:
+                for path in pending:
+                    target = _watch_target(path)
+                    if target not in watched and notifier.watch_dir(target):
+                        rearmed = rearmed or bool(watched)
+                        watched.add(target)
+
+            now = time.monotonic()
+            for path in list(pending):
+                sig = _signature(path, min_mtime)
+                if sig is None:
+                    seen.pop(path, None)
+                    continue
+                prev = seen.get(path)
+                if path in closed or (prev and prev[0] == sig and now - prev[1] >= settle_sec):
+                    result.ready[path] = now - start
+                    pending.remove(path)
+                    seen.pop(path, None)
+                elif not prev or prev[0] != sig:
+                    seen[path] = (sig, now)
+            closed.clear()
+            if not pending or now >= deadline:
+                break
+
+            wake = deadline
+            settling = [since + settle_sec for _sig, since in seen.values()]
+            if settling:
+                wake = min(wake, min(settling))
+            # A directory created mid-wait may already hold files we got no
+            # events for — look again soon rather than at the next rescan.
+            wake = min(wake, now + (RESCAN_SEC if notifier and not rearmed else poll_sec))
+            delay = max(0.0, wake - now)
+            if notifier:
+                readable, _, _ = select.select([notifier.fd], [], [], delay)
+                if readable:
+                    for path, mask in notifier.read():
+                        if mask & (IN_CLOSE_WRITE | IN_MOVED_TO):
+                            closed.add(path)
+                        if mask & (IN_DELETE_SELF | IN_MOVE_SELF):
+                            watched.discard(path)
+            else:
+                time.sleep(delay)
+    finally:
+        if notifier:
+            notifier.close()
+
+    result.missing = pending
+    result.elapsed_sec = time.monotonic() - start
+    return result
@@ -46,6 +46,8 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
+from rayvault.probe_cache import probe_duration
+
 
 def _canonical_json(obj: Any) -> str:
     """Canonical JSON for stable hashing."""
@@ -408,20 +410,8 @@ def has_ffprobe() -> bool:
 
 
 def get_video_duration_sec(path: Path) -> float:
-    """Get video duration via ffprobe. Returns 0.0 on failure."""
-    cmd = [
-        "ffprobe", "-v", "error",
-        "-show_entries", "format=duration",
-        "-of", "default=noprint_wrappers=1:nokey=1",
-        str(path),
-    ]
-    try:
-        r = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
-        if r.returncode != 0:
-            return 0.0
-        return float((r.stdout or "").strip() or "0")
-    except Exception:
-        return 0.0
+    """Get video duration via ffprobe (shared probe cache). Returns 0.0 on failure."""
+    return probe_duration(path) or 0.0
 
 
 def is_video_valid(
@@ -13,11 +13,12 @@ Usage:
 
 from __future__ import annotations
 
-import json
 import subprocess
 from pathlib import Path
 from typing import Any, Dict
 
+from rayvault.probe_cache import probe
+
 
 class RenderValidationError(RuntimeError):
     """Raised when a rendered file fails validation."""
@@ -25,21 +26,12 @@ class RenderValidationError(RuntimeError):
 
 
 def ffprobe_json(path: Path) -> Dict[str, Any]:
-    """Run ffprobe and return parsed JSON with format + streams info.
+    """ffprobe JSON with format + streams info (shared probe cache).
 
     Raises subprocess.CalledProcessError if ffprobe fails.
     Raises FileNotFoundError if ffprobe is not installed.
     """
-    cmd = [
-        "ffprobe", "-v", "error",
-        "-show_format", "-show_streams",
-        "-of", "json",
-        str(path),
-    ]
-    result = subprocess.run(
-        cmd, capture_output=True, text=True, check=True, timeout=30,
-    )
-    return json.loads(result.stdout)
+    return probe(path, check=True)
 
 
 def get_duration(path: Path) -> float:
@@ -8,12 +8,16 @@ On crash/restart, resumes from the last completed stage.
 
 Features:
   - Tone Gate 3-level auto-cutter (rate → filler → LLM repair)
-  - Idempotent TTS generation (per-segment digest)
+  - Idempotent TTS generation (per-segment digest), synthesized
+    concurrently under the provider's rate limits
+  - Finalize gate planned per segment, applied once while streaming the
+    episode voice track (runs/<run_id>/02_audio.wav); Dzine renders each
+    segment against its finalized slice of that track
   - Media gate validation before Resolve assembly
   - run_event telemetry per stage transition
   - Integrates with PanicManager for local-first error handling
 
-Stdlib + tools.lib only.
+Stdlib + tools.lib, plus rayvault.tts_provider for TTS request scheduling.
 
 Usage:
     from tools.lib.orchestrator import RayVaultOrchestrator, OrchestratorConfig
@@ -38,9 +42,9 @@ from typing import Any, Callable, Dict, List, Optional, Protocol
 from tools.lib.audio_utils import (
     atomic_write_json,
     estimate_duration_sec,
-    finalize_segment_audio,
-    FinalizeResult,
+    plan_finalize,
     scrub_fillers,
+    total_pause_ms,
 )
 from tools.lib.media_manifest import (
     has_ffprobe,
@@ -54,6 +58,13 @@ from tools.lib.tone_gate import (
     ToneGateRules,
     build_tone_repair_prompt,
 )
+from tools.lib.voice_track import (
+    VoiceChunk,
+    assemble_voice_track,
+    extract_chunk,
+    speech_duration_sec,
+)
+from rayvault.tts_provider import SynthesisTask, provider_limiter, run_synthesis
 
 
 # ---------------------------------------------------------------------------
@@ -132,6 +143,10 @@ class OrchestratorConfig:
     filler_scrub_max_ratio: float = 1.10
     max_repair_attempts: int = 1
 
+    # VOICE_GEN scheduling (quota shared per provider, see rayvault.tts_provider)
+    tts_provider: str = "elevenlabs"
+    tts_concurrency: int = 4
+
     # Media Gate
     min_mp3_bytes: int = 50_000
     min_mp4_bytes: int = 1_000_000
@@ -183,6 +198,33 @@ def _safe_float(x: Any, default: float = 0.0) -> float:
         return default
 
 
+def _plan_finalize_result(
+    audio_path: Path, target_sec: float, text: str, kind: str,
+) -> Dict[str, Any]:
+    """finalize_result telemetry for one segment, without touching the audio.
+
+    Same measurement as assemble_voice_track: natural length plus
+    [pause=Xms] silence, so the plan here is the one the track applies.
+    """
+    measured = speech_duration_sec(audio_path) if audio_path.exists() else None
+    if measured is None:
+        return {
+            "action": "error", "delta_ms": 0, "measured_sec": 0.0,
+            "target_sec": target_sec, "rate": None,
+            "reason": f"could not measure audio: {audio_path}",
+        }
+    measured_ms = int(measured * 1000) + total_pause_ms(text or "")
+    plan = plan_finalize(measured_ms, int(target_sec * 1000), kind=kind)
+    return {
+        "action": plan.action,
+        "delta_ms": plan.delta_ms,
+        "measured_sec": round(measured_ms / 1000.0, 3),
+        "target_sec": target_sec,
+        "rate": plan.rate,
+        "reason": plan.reason,
+    }
+
+
 # ---------------------------------------------------------------------------
 # Orchestrator
 # ---------------------------------------------------------------------------
@@ -362,12 +404,16 @@ class RayVaultOrchestrator:
 
         Per-segment flow:
         1. Skip needs_repair/needs_human segments
-        2. Synthesize TTS (idempotent via has_artifact)
-        3. Run finalize gate → FinalizeResult with 4 possible actions:
+        2. Synthesize TTS (idempotent via has_artifact), up to
+           cfg.tts_concurrency requests in flight under the provider limiter
+        3. Plan the finalize gate (plan_finalize) with 4 possible actions:
            - ok/pad_silence/rate_tweak: audio is ready for Dzine
            - needs_repair: flag segment for LLM text patch (pre-Dzine)
         4. Store finalize_result metadata per segment for telemetry
 
+        Segment files are left as synthesized; pad/rate are applied once
+        by assemble_voice() when it streams the episode track.
+
         Dzine only gets segments where finalize.action != needs_repair.
         """
         if not self.tts:
@@ -377,19 +423,20 @@ class RayVaultOrchestrator:
             ]
 
         out: List[dict] = []
+        tasks: List[SynthesisTask] = []
+        queued: List[dict] = []
         for i, s in enumerate(segments):
             s2 = dict(s)
+            out.append(s2)
 
             if s2.get("needs_repair") or s2.get("needs_human"):
                 s2["audio_path"] = None
-                out.append(s2)
                 continue
 
             text = s2.get("text", "")
             if not text:
                 s2["audio_path"] = None
                 s2["needs_human"] = True
-                out.append(s2)
                 continue
 
             # Apply rate hint as TTS tag
@@ -405,47 +452,46 @@ class RayVaultOrchestrator:
             if self.tts.has_artifact(artifact_id):
                 audio_dir = Path(self.tts.cfg.output_dir) if hasattr(self.tts, 'cfg') else self._audio_dir
                 s2["audio_path"] = str(audio_dir / f"{artifact_id}.mp3")
-                out.append(s2)
                 continue
 
-            try:
-                audio_path = self.tts.synthesize(
-                    run_id=artifact_id, text=tts_text,
-                )
-                s2["audio_path"] = str(audio_path)
-
-                # Smart finalize gate
-                approx = _safe_float(s2.get("approx_duration_sec", 0))
-                kind = s2.get("kind", "product")
-                if approx > 0:
-                    fr = finalize_segment_audio(
-                        audio_path,
-                        target_duration=approx,
-                        source_text=text,
-                        kind=kind,
-                    )
-                    s2["finalize_result"] = {
-                        "action": fr.action,
-                        "delta_ms": fr.delta_ms,
-                        "measured_sec": round(fr.measured_duration_sec, 3),
-                        "target_sec": fr.target_duration_sec,
-                        "rate": fr.rate,
-                        "reason": fr.reason,
-                    }
-
-                    if fr.action == "needs_repair":
-                        s2["needs_repair"] = True
-                        s2["repair_reason"] = fr.reason
-
-            except Exception as e:
+            tasks.append(SynthesisTask(
+                key=artifact_id,
+                text=tts_text,
+                synthesize=lambda a=artifact_id, t=tts_text: self.tts.synthesize(run_id=a, text=t),
+                post=lambda path, seg=s2: self._finalize_voice(seg, path),
+            ))
+            queued.append(s2)
+
+        # Requests run concurrently; the finalize gate for finished segments
+        # overlaps with requests still in flight.
+        outcomes = run_synthesis(
+            tasks,
+            provider_limiter(self.cfg.tts_provider),
+            max_workers=self.cfg.tts_concurrency,
+        )
+        for s2, outcome in zip(queued, outcomes):
+            if outcome.error is not None:
                 s2["audio_path"] = None
-                s2["tts_error"] = str(e)[:300]
+                s2["tts_error"] = str(outcome.error)[:300]
                 s2["needs_human"] = True
 
-            out.append(s2)
-
         return out
 
+    def _finalize_voice(self, s2: dict, audio_path: Path) -> None:
+        """Record audio_path and plan the smart finalize gate for one segment."""
+        s2["audio_path"] = str(audio_path)
+
+        approx = _safe_float(s2.get("approx_duration_sec", 0))
+        if approx > 0:
+            fr = _plan_finalize_result(
+                Path(audio_path), approx, s2.get("text", ""), s2.get("kind", "product"),
+            )
+            s2["finalize_result"] = fr
+
+            if fr["action"] == "needs_repair":
+                s2["needs_repair"] = True
+                s2["repair_reason"] = fr["reason"]
+
     # ------------------------------------------------------------------
     # Repair loop: TTS → finalize → (repair if needed) → re-TTS
     # ------------------------------------------------------------------
@@ -508,22 +554,14 @@ class RayVaultOrchestrator:
                     s["tts_error"] = f"repair attempt {attempt}: {e}"
                     break
 
-                # Re-finalize
+                # Re-plan finalize
                 if approx > 0:
-                    fr_new = finalize_segment_audio(
-                        audio_path, target_duration=approx,
-                        source_text=new_text, kind=kind,
+                    fr_new = _plan_finalize_result(
+                        Path(audio_path), approx, new_text, kind,
                     )
-                    s["finalize_result"] = {
-                        "action": fr_new.action,
-                        "delta_ms": fr_new.delta_ms,
-                        "measured_sec": round(fr_new.measured_duration_sec, 3),
-                        "target_sec": fr_new.target_duration_sec,
-                        "rate": fr_new.rate,
-                        "reason": fr_new.reason,
-                    }
-
-                    if fr_new.action != "needs_repair":
+                    s["finalize_result"] = fr_new
+
+                    if fr_new["action"] != "needs_repair":
                         s["audio_path"] = str(audio_path)
                         s["text"] = new_text
                         s["repair_attempts"] = attempt
@@ -548,16 +586,61 @@ class RayVaultOrchestrator:
 
         return out
 
+    # ------------------------------------------------------------------
+    # Voice track: segment audio → runs/<run_id>/02_audio.wav
+    # ------------------------------------------------------------------
+
+    def voice_track_path(self, run_id: str) -> Path:
+        return Path(self.cfg.state_dir) / "runs" / run_id / "02_audio.wav"
+
+    def assemble_voice(
+        self, run_id: str, segments: List[dict],
+    ) -> Optional[Dict[str, Any]]:
+        """Stream every segment's audio into the episode voice track.
+
+        The planned finalize (pad_silence / rate_tweak) is applied while
+        writing, one decode per segment. Each segment's slice of the track
+        is then written to final_audio_path — the finalized audio Dzine
+        renders against. Returns the timing manifest, or None while any
+        segment still lacks usable audio — a partial track would shift
+        every later segment.
+        """
+        if not segments or any(
+            not s.get("audio_path") or s.get("needs_repair") or s.get("needs_human")
+            for s in segments
+        ):
+            return None
+
+        chunks = [
+            VoiceChunk(
+                chunk_id=s.get("segment_id", f"seg_{i}"),
+                path=Path(s["audio_path"]),
+                text=s.get("text", ""),
+                target_sec=_safe_float(s.get("approx_duration_sec", 0)),
+                kind=s.get("kind") or "product",
+            )
+            for i, s in enumerate(segments)
+        ]
+        track = self.voice_track_path(run_id)
+        timing = assemble_voice_track(chunks, track)
+        for chunk, s, entry in zip(chunks, segments, timing["chunks"]):
+            final = self._audio_dir / f"{run_id}_{chunk.chunk_id}.final.wav"
+            s["final_audio_path"] = str(extract_chunk(track, entry, final))
+        return timing
+
     # ------------------------------------------------------------------
     # Stage: MEDIA_SYNC (build manifest)
     # ------------------------------------------------------------------
 
-    def build_manifest(self, run_id: str, segments: List[dict]) -> Path:
+    def build_manifest(
+        self, run_id: str, segments: List[dict], voice_track: Optional[str] = None,
+    ) -> Path:
         """Build media manifest — single source of truth for assembly."""
         manifest = {
             "manifest_version": "1.0",
             "run_id": run_id,
             "created_at": _utcnow_iso(),
+            "voice_track": voice_track,
             "segments": [],
         }
 
@@ -570,6 +653,7 @@ class RayVaultOrchestrator:
                 "lip_sync_hint": s.get("lip_sync_hint", "neutral"),
                 "approx_duration_sec": s.get("approx_duration_sec", 0),
                 "audio_path": s.get("audio_path"),
+                "final_audio_path": s.get("final_audio_path"),
                 "video_path": s.get("video_path", str(self._video_dir / f"{seg_id}.mp4")),
             })
 
@@ -670,7 +754,8 @@ class RayVaultOrchestrator:
         for seg in segments:
             seg_id = seg.get("segment_id", "?")
             video_path_str = seg.get("video_path", "")
-            audio_path_str = seg.get("audio_path", "")
+            # Finalized slice of 02_audio.wav (padded / rate-tweaked to target)
+            audio_path_str = seg.get("final_audio_path") or seg.get("audio_path", "")
             target_sec = _safe_float(seg.get("approx_duration_sec", 0))
 
             if not video_path_str or not audio_path_str:
@@ -907,14 +992,36 @@ class RayVaultOrchestrator:
                             },
                         )
 
-                self.save_checkpoint(run_id, "MEDIA_SYNC", {"segments": segs})
-                stage, data = "MEDIA_SYNC", {"segments": segs}
+                voice_track = None
+                try:
+                    timing = self.assemble_voice(run_id, segs)
+                except (RuntimeError, OSError) as e:
+                    await self._emit(
+                        run_id, "voice_track_failed", "WARN", {"error": str(e)[:300]},
+                    )
+                else:
+                    if timing:
+                        voice_track = str(self.voice_track_path(run_id))
+                        await self._emit(
+                            run_id, "voice_track_assembled", "INFO",
+                            {
+                                "path": voice_track,
+                                "duration_sec": timing["duration_sec"],
+                                "needs_repair": timing["needs_repair"],
+                            },
+                        )
+
+                data = {"segments": segs, "voice_track": voice_track}
+                self.save_checkpoint(run_id, "MEDIA_SYNC", data)
+                stage = "MEDIA_SYNC"
                 await self._emit(run_id, "stage_done", "INFO", {"stage": "VOICE_GEN"})
 
             if stage == "MEDIA_SYNC":
                 await self._emit(run_id, "stage_enter", "INFO", {"stage": "MEDIA_SYNC"})
                 segs = data["segments"]
-                manifest_path = self.build_manifest(run_id, segs)
+                manifest_path = self.build_manifest(
+                    run_id, segs, voice_track=data.get("voice_track"),
+                )
                 self.save_checkpoint(
                     run_id, "PREFLIGHT",
                     {"manifest_path": str(manifest_path)},
@@ -3,7 +3,11 @@
 Defines the JSON structure for automated/semi-automated video editing
 of Amazon Associates Top 5 product ranking videos.
 
-Stdlib only — no external deps.
+Section timing comes from the voiceover's alignment index
+(rayvault.alignment, voiceover.align.json) when one exists, and from
+word counts at SPEAKING_WPM otherwise.
+
+Stdlib + rayvault.alignment — no external deps.
 """
 
 from __future__ import annotations
@@ -13,6 +17,8 @@ import re
 from dataclasses import dataclass, field
 from pathlib import Path
 
+from rayvault.alignment import AlignmentIndex, ensure_alignment
+
 # ---------------------------------------------------------------------------
 # Constants
 # ---------------------------------------------------------------------------
@@ -167,6 +173,25 @@ def count_words(text: str) -> int:
     return len(cleaned.split())
 
 
+# Sections in the order they are spoken in the voiceover. The avatar intro
+# has its own audio and a fixed slot, so it is not part of the alignment.
+VOICEOVER_SECTION_ORDER = (
+    "hook", "product_5", "product_4", "product_3", "retention_reset",
+    "product_2", "product_1", "conclusion",
+)
+
+
+def aligned_section_durations(
+    sections: dict[str, str], alignment: AlignmentIndex,
+) -> dict[str, float]:
+    """Spoken duration per voiceover section from the alignment index."""
+    keys = [k for k in VOICEOVER_SECTION_ORDER if sections.get(k)]
+    durations = alignment.durations_for_word_counts(
+        [count_words(sections[k]) for k in keys]
+    )
+    return dict(zip(keys, durations))
+
+
 # ---------------------------------------------------------------------------
 # Script parsing
 # ---------------------------------------------------------------------------
@@ -469,6 +494,7 @@ def generate_manifest(
     signature_type: str = "reality_check",
     fps: int = FPS_DEFAULT,
     resolution: tuple[int, int] = RESOLUTION_DEFAULT,
+    alignment: AlignmentIndex | None = None,
 ) -> EditManifest:
     """Generate a complete edit manifest from script + assets.
 
@@ -480,10 +506,22 @@ def generate_manifest(
         product_benefits: Optional {rank: [benefit1, benefit2, ...]}
         signature_line: Channel signature line for this video
         signature_type: "reality_check", "micro_humor", or "micro_comparison"
+        alignment: Voiceover word timings; defaults to the index next to
+            audio/voiceover.wav (built on first use), else WPM estimates
     """
     sections = parse_script_sections(script_text)
     assets = discover_assets(video_dir)
 
+    if alignment is None and assets["voiceover"]:
+        spoken = "\n\n".join(sections.get(k, "") for k in VOICEOVER_SECTION_ORDER)
+        alignment = ensure_alignment(video_dir / assets["voiceover"], spoken)
+    aligned = aligned_section_durations(sections, alignment) if alignment else {}
+
+    def section_seconds(key: str, word_count: int) -> float:
+        if key in aligned:
+            return aligned[key]
+        return words_to_seconds(word_count)
+
     manifest = EditManifest(
         video_id=video_id,
         fps=fps,
@@ -499,7 +537,7 @@ def generate_manifest(
     # --- Hook ---
     hook_text = sections.get("hook", "")
     hook_words = count_words(hook_text)
-    hook_dur = words_to_seconds(hook_words)
+    hook_dur = section_seconds("hook", hook_words)
     manifest.hook_start_s = t
     manifest.hook_end_s = round(t + hook_dur, 1)
     manifest.hook_text = hook_text
@@ -522,7 +560,7 @@ def generate_manifest(
         key = f"product_{rank}"
         text = sections.get(key, "")
         words = count_words(text)
-        dur = words_to_seconds(words)
+        dur = section_seconds(key, words)
 
         # Extract product name from first line or override
         name = product_names.get(rank, "")
@@ -572,7 +610,7 @@ def generate_manifest(
         if rank == 3:
             reset_text = sections.get("retention_reset", "")
             reset_words = count_words(reset_text)
-            reset_dur = words_to_seconds(reset_words)
+            reset_dur = section_seconds("retention_reset", reset_words)
             manifest.retention_reset_start_s = round(t, 1)
             manifest.retention_reset_end_s = round(t + reset_dur, 1)
             manifest.retention_reset_text = reset_text
@@ -581,7 +619,7 @@ def generate_manifest(
     # --- Outro / Conclusion ---
     outro_text = sections.get("conclusion", "")
     outro_words = count_words(outro_text)
-    outro_dur = words_to_seconds(outro_words)
+    outro_dur = section_seconds("conclusion", outro_words)
     manifest.outro_start_s = round(t, 1)
     manifest.outro_end_s = round(t + outro_dur, 1)
     manifest.outro_text = outro_text
@@ -1,19 +1,20 @@
 """Persistent pipeline run log.
 
-Tracks every pipeline command execution — successful or not — in a single
-append-only JSON file. Gives visibility into what ran, how long it took,
+Tracks every pipeline command execution — successful or not — in an
+append-only event store. Gives visibility into what ran, how long it took,
 and which videos progressed.
 
-Data file: data/run_log.json (append-only JSON array, created on first log).
+Data file: data/run_log.db (see tools/lib/event_store.py; a legacy
+data/run_log.json is imported on first use).
 Stdlib only.
 """
 
 from __future__ import annotations
 
-import json
 from pathlib import Path
 
 from tools.lib.common import now_iso, project_root
+from tools.lib.event_store import EventStore, open_store
 
 RUN_LOG_PATH: Path = project_root() / "data" / "run_log.json"
 
@@ -22,26 +23,22 @@ RUN_LOG_PATH: Path = project_root() / "data" / "run_log.json"
 # Internal helpers
 # ---------------------------------------------------------------------------
 
+def _index(entry: dict) -> dict:
+    return {
+        "video_id": entry.get("video_id", ""),
+        "component": entry.get("command", ""),
+        "status": "ok" if entry.get("exit_code", 1) == 0 else "failed",
+        "ts": entry.get("timestamp", ""),
+    }
+
+
+def _store(path: Path | None = None) -> EventStore:
+    return open_store(path or RUN_LOG_PATH, id_field="", index=_index)
+
+
 def _read_log(path: Path | None = None) -> list[dict]:
-    """Read the run log, returning [] on missing/corrupt file."""
-    p = path or RUN_LOG_PATH
-    if not p.is_file():
-        return []
-    try:
-        data = json.loads(p.read_text(encoding="utf-8"))
-        if isinstance(data, list):
-            return data
-    except (json.JSONDecodeError, OSError):
-        pass
-    return []
-
-
-def _write_log(entries: list[dict], path: Path | None = None) -> None:
-    """Write the full log atomically."""
-    p = path or RUN_LOG_PATH
-    p.parent.mkdir(parents=True, exist_ok=True)
-    p.write_text(json.dumps(entries, indent=2, ensure_ascii=False) + "\n",
-                 encoding="utf-8")
+    """All run entries in append order ([] when there is no log yet)."""
+    return _store(path).query()
 
 
 # ---------------------------------------------------------------------------
@@ -66,9 +63,7 @@ def log_run(
         "duration_s": duration_s,
         "niche": niche,
     }
-    entries = _read_log(_path)
-    entries.append(entry)
-    _write_log(entries, _path)
+    _store(_path).append(entry)
     return entry
 
 
@@ -81,14 +76,10 @@ def get_runs(
     _path: Path | None = None,
 ) -> list[dict]:
     """Return run entries, optionally filtered."""
-    entries = _read_log(_path)
-    if video_id:
-        entries = [e for e in entries if e.get("video_id") == video_id]
-    if command:
-        entries = [e for e in entries if e.get("command") == command]
-    if since:
-        entries = [e for e in entries if e.get("timestamp", "") >= since]
-    return entries[-limit:]
+    return _store(_path).query(
+        video_id=video_id or None, component=command or None, since=since,
+        limit=max(0, limit),
+    )
 
 
 def format_runs_text(
@@ -129,8 +120,10 @@ def get_daily_summary(
     if not date:
         date = now_iso()[:10]
 
-    entries = _read_log(_path)
-    day_entries = [e for e in entries if e.get("timestamp", "")[:10] == date]
+    day_entries = [
+        e for e in _store(_path).query(since=date, until=date + "\uffff")
+        if e.get("timestamp", "")[:10] == date
+    ]
 
     by_command: dict[str, dict] = {}
     videos_touched: set[str] = set()
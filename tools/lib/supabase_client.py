@@ -3,19 +3,154 @@
 All Supabase interactions route through here. Every public function checks
 _enabled() first, catches all HTTP errors, and returns a safe fallback.
 Never raises — graceful degradation when SUPABASE_URL is unset.
+
+Requests share a pool of HTTP/1.1 keep-alive connections, so only the first
+request to a host pays for the TCP + TLS handshake. insert()/upsert() with
+defer=True hand the row to a background write-behind queue that coalesces
+rows per table into bulk PostgREST requests; flush() is the barrier.
+When HTTPS_PROXY/HTTP_PROXY applies to the host (NO_PROXY is honoured),
+requests go through urllib.request.urlopen() instead, unpooled.
 """
 
 from __future__ import annotations
 
+import atexit
 import hashlib
+import http.client
+import io
 import json
 import os
+import ssl
 import sys
+import threading
+import time
 import urllib.error
+import urllib.parse
 import urllib.request
 from pathlib import Path
 
 
+# ---------------------------------------------------------------------------
+# Pooled keep-alive transport
+# ---------------------------------------------------------------------------
+
+class _PooledResponse:
+    """Fully-read response; quacks like the object urlopen() returns."""
+
+    def __init__(self, status: int, reason: str, headers, body: bytes):
+        self.status = status
+        self.reason = reason
+        self.headers = headers
+        self._body = body
+
+    def read(self) -> bytes:
+        return self._body
+
+    def getcode(self) -> int:
+        return self.status
+
+    def __enter__(self) -> "_PooledResponse":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        pass
+
+
+class _ConnectionPool:
+    """Idle HTTP(S) connections per (scheme, host), reused across requests.
+
+    Thread-safe: a connection is checked out for one request at a time.
+    A reused connection the server has quietly closed is retried once on a
+    fresh socket; anything else surfaces like urlopen() would (HTTPError for
+    4xx/5xx, URLError for network failures).
+    """
+
+    def __init__(self, max_idle_per_host: int = 8):
+        self._max_idle = max_idle_per_host
+        self._idle: dict[tuple[str, str], list[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+        self._ssl = ssl.create_default_context()
+
+    def _checkout(self, key: tuple[str, str], timeout: float) -> tuple[http.client.HTTPConnection, bool]:
+        with self._lock:
+            idle = self._idle.get(key)
+            conn = idle.pop() if idle else None
+        if conn is not None:
+            conn.timeout = timeout
+            if conn.sock is not None:
+                conn.sock.settimeout(timeout)
+            return conn, True
+        scheme, host = key
+        if scheme == "https":
+            return http.client.HTTPSConnection(host, timeout=timeout, context=self._ssl), False
+        return http.client.HTTPConnection(host, timeout=timeout), False
+
+    def _checkin(self, key: tuple[str, str], conn: http.client.HTTPConnection) -> None:
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self._max_idle:
+                idle.append(conn)
+                return
+        conn.close()
+
+    def open(self, req: urllib.request.Request, timeout: float = 30) -> _PooledResponse:
+        parts = urllib.parse.urlsplit(req.full_url)
+        key = (parts.scheme, parts.netloc)
+        target = parts.path + (f"?{parts.query}" if parts.query else "")
+        headers = dict(req.header_items())
+
+        for attempt in range(2):
+            conn, reused = self._checkout(key, timeout)
+            try:
+                conn.request(req.get_method(), target, body=req.data, headers=headers)
+                resp = conn.getresponse()
+                body = resp.read()
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError) as exc:
+                conn.close()
+                if reused and attempt == 0:
+                    continue  # stale keep-alive socket — retry on a new one
+                raise urllib.error.URLError(exc) from None
+            except (http.client.HTTPException, OSError) as exc:
+                conn.close()
+                raise urllib.error.URLError(exc) from None
+            if resp.will_close:
+                conn.close()
+            else:
+                self._checkin(key, conn)
+            if resp.status >= 400:
+                raise urllib.error.HTTPError(
+                    req.full_url, resp.status, resp.reason, resp.headers, io.BytesIO(body),
+                )
+            return _PooledResponse(resp.status, resp.reason, resp.headers, body)
+        raise urllib.error.URLError("connection_dropped")  # pragma: no cover
+
+    def close(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for conns in idle.values():
+            for conn in conns:
+                conn.close()
+
+
+_POOL = _ConnectionPool()
+
+
+def _proxied(url: str) -> bool:
+    """True when the environment routes url through a proxy."""
+    parts = urllib.parse.urlsplit(url)
+    proxies = urllib.request.getproxies()
+    if parts.scheme not in proxies:
+        return False
+    return not urllib.request.proxy_bypass(parts.hostname or "")
+
+
+def _urlopen(req: urllib.request.Request, timeout: float = 30):
+    """urlopen() over the shared keep-alive pool (plain urlopen via a proxy)."""
+    if _proxied(req.full_url):
+        return urllib.request.urlopen(req, timeout=timeout)
+    return _POOL.open(req, timeout=timeout)
+
+
 # ---------------------------------------------------------------------------
 # Internal helpers
 # ---------------------------------------------------------------------------
@@ -40,22 +175,24 @@ def _base_url() -> str:
     return os.environ["SUPABASE_URL"].strip().rstrip("/")
 
 
-def _postgrest(
+def _postgrest_request(
     method: str,
     table: str,
-    body: dict | None = None,
+    body: dict | list | None = None,
     *,
     params: dict[str, str] | None = None,
     extra_headers: dict[str, str] | None = None,
     return_row: bool = False,
+    base_url: str = "",
+    api_key: str = "",
 ) -> dict | list | None:
-    """Low-level PostgREST request. Returns parsed JSON or None on error."""
-    url = f"{_base_url()}/rest/v1/{table}"
+    """PostgREST request that raises urllib errors instead of swallowing them."""
+    url = f"{base_url or _base_url()}/rest/v1/{table}"
     if params:
         qs = "&".join(f"{k}={v}" for k, v in params.items())
         url = f"{url}?{qs}"
 
-    hdrs = _headers()
+    hdrs = {"apikey": api_key, "Authorization": f"Bearer {api_key}"} if api_key else _headers()
     hdrs["Content-Type"] = "application/json"
     if return_row:
         hdrs["Prefer"] = "return=representation"
@@ -69,15 +206,31 @@ def _postgrest(
 
     data = json.dumps(body).encode() if body is not None else None
     req = urllib.request.Request(url, method=method, headers=hdrs, data=data)
+    with _urlopen(req, timeout=30) as resp:
+        raw = resp.read()
+        if raw and return_row:
+            parsed = json.loads(raw)
+            if isinstance(parsed, list) and parsed:
+                return parsed[0]
+            return parsed
+        return None
+
+
+def _postgrest(
+    method: str,
+    table: str,
+    body: dict | None = None,
+    *,
+    params: dict[str, str] | None = None,
+    extra_headers: dict[str, str] | None = None,
+    return_row: bool = False,
+) -> dict | list | None:
+    """Low-level PostgREST request. Returns parsed JSON or None on error."""
     try:
-        with urllib.request.urlopen(req, timeout=30) as resp:
-            raw = resp.read()
-            if raw and return_row:
-                parsed = json.loads(raw)
-                if isinstance(parsed, list) and parsed:
-                    return parsed[0]
-                return parsed
-            return None
+        return _postgrest_request(
+            method, table, body,
+            params=params, extra_headers=extra_headers, return_row=return_row,
+        )
     except urllib.error.HTTPError as exc:
         body_text = exc.read().decode("utf-8", errors="replace")
         print(f"[supabase] PostgREST {method} {table} failed ({exc.code}): {body_text}", file=sys.stderr)
@@ -100,14 +253,14 @@ def _storage(
 
     req = urllib.request.Request(url, method=method, headers=hdrs, data=data)
     try:
-        with urllib.request.urlopen(req, timeout=120) as resp:
+        with _urlopen(req, timeout=120) as resp:
             resp.read()
     except urllib.error.HTTPError as exc:
         if exc.code == 409 and method == "POST":
             # Already exists — upsert via PUT
             req_put = urllib.request.Request(url, method="PUT", headers=hdrs, data=data)
             try:
-                with urllib.request.urlopen(req_put, timeout=120) as resp:
+                with _urlopen(req_put, timeout=120) as resp:
                     resp.read()
             except Exception as exc2:
                 print(f"[supabase] Storage PUT {bucket}/{path} failed: {exc2}", file=sys.stderr)
@@ -123,21 +276,202 @@ def _storage(
     return f"{_base_url()}/storage/v1/object/public/{bucket}/{path}"
 
 
+# ---------------------------------------------------------------------------
+# Write-behind batching
+# ---------------------------------------------------------------------------
+
+WRITE_BEHIND = os.environ.get("SUPABASE_WRITE_BEHIND", "1").strip() != "0"
+BATCH_MAX_ROWS = int(os.environ.get("SUPABASE_BATCH_MAX", "100"))
+FLUSH_INTERVAL_SEC = float(os.environ.get("SUPABASE_FLUSH_SEC", "0.5"))
+EXIT_FLUSH_TIMEOUT_SEC = 10.0
+
+
+def _write_batch(
+    table: str,
+    rows: list[dict],
+    *,
+    on_conflict: str = "",
+    base_url: str = "",
+    api_key: str = "",
+) -> str:
+    """One bulk INSERT (or UPSERT when on_conflict is set).
+
+    Returns "ok", "rejected" (4xx — the data is the problem) or "offline"
+    (network error, 429, 5xx — worth retrying later).
+    """
+    prefer = "return=minimal"
+    params = None
+    if on_conflict:
+        prefer += ",resolution=merge-duplicates"
+        params = {"on_conflict": on_conflict}
+    body: dict | list = rows[0] if len(rows) == 1 else rows
+    try:
+        _postgrest_request(
+            "POST", table, body,
+            params=params, extra_headers={"Prefer": prefer},
+            base_url=base_url, api_key=api_key,
+        )
+        return "ok"
+    except urllib.error.HTTPError as exc:
+        body_text = exc.read().decode("utf-8", errors="replace")
+        print(f"[supabase] bulk write {table} x{len(rows)} failed ({exc.code}): {body_text}", file=sys.stderr)
+        return "offline" if exc.code == 429 or exc.code >= 500 else "rejected"
+    except Exception as exc:
+        print(f"[supabase] bulk write {table} x{len(rows)} error: {exc}", file=sys.stderr)
+        return "offline"
+
+
+def write_rows(table: str, rows: list[dict], *, on_conflict: str = "") -> bool:
+    """Synchronous bulk INSERT/UPSERT. Returns True when PostgREST accepted it."""
+    if not _enabled() or not rows:
+        return False
+    return _write_batch(table, rows, on_conflict=on_conflict) == "ok"
+
+
+class _WriteBehind:
+    """Background queue that coalesces deferred rows into bulk requests.
+
+    Rows are grouped per (project, table, upsert key, column set) — PostgREST
+    bulk inserts need uniform keys. A group is sent when it reaches
+    max_rows, when its oldest row is flush_sec old, on flush(), or at exit.
+    Batches that cannot reach Supabase are spilled to the worker_ops spool
+    for replay_spool(); a batch rejected with 4xx is retried row by row so
+    one bad row does not sink its neighbours.
+    """
+
+    def __init__(self, *, max_rows: int = BATCH_MAX_ROWS, flush_sec: float = FLUSH_INTERVAL_SEC):
+        self.max_rows = max(1, max_rows)
+        self.flush_sec = flush_sec
+        self._cond = threading.Condition()
+        self._groups: dict[tuple, list[dict]] = {}
+        self._born: dict[tuple, float] = {}
+        self._queued = 0
+        self._done = 0
+        self._flush_to = 0
+        self._thread: threading.Thread | None = None
+
+    def put(self, table: str, row: dict, *, on_conflict: str = "") -> None:
+        key = (_base_url(), os.environ["SUPABASE_SERVICE_ROLE_KEY"].strip(),
+               table, on_conflict, tuple(sorted(row)))
+        with self._cond:
+            group = self._groups.setdefault(key, [])
+            if not group:
+                self._born[key] = time.monotonic()
+            group.append(row)
+            self._queued += 1
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="supabase-write-behind", daemon=True)
+                self._thread.start()
+            if len(group) >= self.max_rows:
+                self._cond.notify_all()
+
+    def pending(self) -> int:
+        with self._cond:
+            return self._queued - self._done
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Block until every row queued before this call was sent or spilled."""
+        with self._cond:
+            target = self._queued
+            if self._done >= target:
+                return True
+            self._flush_to = max(self._flush_to, target)
+            self._cond.notify_all()
+            return self._cond.wait_for(lambda: self._done >= target, timeout)
+
+    def _take_due(self) -> list[tuple[tuple, list[dict]]]:
+        now = time.monotonic()
+        force = self._flush_to > self._done
+        due = []
+        for key, rows in list(self._groups.items()):
+            if force or len(rows) >= self.max_rows or now - self._born[key] >= self.flush_sec:
+                del self._groups[key]
+                del self._born[key]
+                for i in range(0, len(rows), self.max_rows):
+                    due.append((key, rows[i:i + self.max_rows]))
+        return due
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                due = self._take_due()
+                while not due:
+                    if self._born:
+                        wait = max(0.0, min(self._born.values()) + self.flush_sec - time.monotonic())
+                    else:
+                        wait = None
+                    self._cond.wait(wait)
+                    due = self._take_due()
+            for key, rows in due:
+                try:
+                    self._send(key, rows)
+                finally:
+                    with self._cond:
+                        self._done += len(rows)
+                        self._cond.notify_all()
+
+    def _send(self, key: tuple, rows: list[dict]) -> None:
+        base_url, api_key, table, on_conflict, _cols = key
+        kw = {"on_conflict": on_conflict, "base_url": base_url, "api_key": api_key}
+        status = _write_batch(table, rows, **kw)
+        if status == "rejected" and len(rows) > 1:
+            offline = [row for row in rows if _write_batch(table, [row], **kw) == "offline"]
+            status, rows = ("offline", offline) if offline else ("ok", [])
+        if status == "offline":
+            self._spill(table, rows, on_conflict)
+
+    @staticmethod
+    def _spill(table: str, rows: list[dict], on_conflict: str) -> None:
+        run_ids = {row.get("run_id") for row in rows}
+        run_id = str(run_ids.pop()) if len(run_ids) == 1 and None not in run_ids else "supabase"
+        try:
+            from tools.lib.worker_ops import spool_event
+            spool_event(run_id, "supabase_write", {
+                "table": table, "rows": rows, "on_conflict": on_conflict,
+            })
+        except Exception as exc:
+            print(f"[supabase] spill {table} x{len(rows)} failed, rows lost: {exc}", file=sys.stderr)
+
+
+_WRITER = _WriteBehind()
+
+
+def _flush_at_exit() -> None:
+    if _WRITER.pending() and not _WRITER.flush(timeout=EXIT_FLUSH_TIMEOUT_SEC):
+        print(f"[supabase] exit flush timed out, {_WRITER.pending()} row(s) unsent", file=sys.stderr)
+
+
+atexit.register(_flush_at_exit)
+
+
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
 
-def insert(table: str, row: dict, *, return_row: bool = False) -> dict | None:
-    """INSERT a row. Returns the row dict if return_row=True, else None."""
+def insert(table: str, row: dict, *, return_row: bool = False, defer: bool = False) -> dict | None:
+    """INSERT a row. Returns the row dict if return_row=True, else None.
+
+    defer=True queues the row for a batched write-behind INSERT and returns
+    immediately (ignored when return_row=True — the caller needs the row).
+    """
     if not _enabled():
         return None
+    if defer and WRITE_BEHIND and not return_row:
+        _WRITER.put(table, row)
+        return None
     return _postgrest("POST", table, row, return_row=return_row)
 
 
-def upsert(table: str, row: dict, *, on_conflict: str = "id") -> dict | None:
-    """UPSERT a row (merge duplicates on conflict column)."""
+def upsert(table: str, row: dict, *, on_conflict: str = "id", defer: bool = False) -> dict | None:
+    """UPSERT a row (merge duplicates on conflict column).
+
+    defer=True queues the row for a batched write-behind UPSERT and returns None.
+    """
     if not _enabled():
         return None
+    if defer and WRITE_BEHIND:
+        _WRITER.put(table, row, on_conflict=on_conflict)
+        return None
     return _postgrest(
         "POST", table, row,
         extra_headers={
@@ -148,10 +482,17 @@ def upsert(table: str, row: dict, *, on_conflict: str = "id") -> dict | None:
     )
 
 
+def flush(timeout: float | None = None) -> bool:
+    """Wait until all deferred writes were sent (or spilled). False on timeout."""
+    return _WRITER.flush(timeout)
+
+
 def update(table: str, match: dict, data: dict) -> bool:
     """UPDATE rows matching filter. Returns True on success."""
     if not _enabled():
         return False
+    if _WRITER.pending():
+        _WRITER.flush(timeout=30)  # don't PATCH ahead of a queued INSERT
     params = {k: f"eq.{v}" for k, v in match.items()}
     result = _postgrest("PATCH", table, data, params=params)
     # _postgrest returns None on success (no body) or on error;
@@ -170,6 +511,8 @@ def query(
     """SELECT rows. Returns list of dicts, empty on error or disabled."""
     if not _enabled():
         return []
+    if _WRITER.pending():
+        _WRITER.flush(timeout=30)  # read your own deferred writes
     params: dict[str, str] = {"select": select}
     if filters:
         for k, v in filters.items():
@@ -188,7 +531,7 @@ def query(
 
     req = urllib.request.Request(url, method="GET", headers=hdrs)
     try:
-        with urllib.request.urlopen(req, timeout=30) as resp:
+        with _urlopen(req, timeout=30) as resp:
             raw = resp.read()
             return json.loads(raw) if raw else []
     except urllib.error.HTTPError as exc:
@@ -2,12 +2,14 @@
 
 Every function takes run_id as first arg, wraps supabase_client calls.
 All writes are fire-and-forget — failures log to stderr, never raise.
+Row-per-event writes are deferred to the client's write-behind queue and
+reach PostgREST in bulk; complete_run() flushes it.
 """
 
 from __future__ import annotations
 
 from tools.lib.common import now_iso
-from tools.lib.supabase_client import insert, update, upsert, query, upload_file, _enabled
+from tools.lib.supabase_client import insert, update, upsert, query, upload_file, flush, _enabled
 
 
 # ---------------------------------------------------------------------------
@@ -51,6 +53,7 @@ def complete_run(
         data["elapsed_ms"] = elapsed_ms
     if errors:
         data["error_message"] = errors[0][:500]
+    flush(timeout=30)
     update("pipeline_runs", {"id": run_id}, data)
 
 
@@ -93,7 +96,7 @@ def log_event(
             "data": data or {},
         },
         "created_at": now_iso(),
-    })
+    }, defer=True)
 
 
 # ---------------------------------------------------------------------------
@@ -106,7 +109,7 @@ def save_niche(run_id: str, video_id: str, **fields) -> None:
         return
     row = {"run_id": run_id, "video_id": video_id, "created_at": now_iso()}
     row.update(fields)
-    insert("niches", row)
+    insert("niches", row, defer=True)
 
 
 # ---------------------------------------------------------------------------
@@ -119,7 +122,7 @@ def save_research_source(run_id: str, **fields) -> None:
         return
     row = {"run_id": run_id, "created_at": now_iso()}
     row.update(fields)
-    insert("research_sources", row)
+    insert("research_sources", row, defer=True)
 
 
 def save_shortlist_item(run_id: str, **fields) -> None:
@@ -128,7 +131,7 @@ def save_shortlist_item(run_id: str, **fields) -> None:
         return
     row = {"run_id": run_id, "created_at": now_iso()}
     row.update(fields)
-    insert("shortlist_items", row)
+    insert("shortlist_items", row, defer=True)
 
 
 def save_amazon_product(run_id: str, **fields) -> None:
@@ -137,7 +140,7 @@ def save_amazon_product(run_id: str, **fields) -> None:
         return
     row = {"run_id": run_id, "created_at": now_iso()}
     row.update(fields)
-    insert("amazon_products", row)
+    insert("amazon_products", row, defer=True)
 
 
 def save_top5_product(run_id: str, **fields) -> None:
@@ -146,7 +149,7 @@ def save_top5_product(run_id: str, **fields) -> None:
         return
     row = {"run_id": run_id, "created_at": now_iso()}
     row.update(fields)
-    insert("top5", row)
+    insert("top5", row, defer=True)
 
 
 # ---------------------------------------------------------------------------
@@ -173,7 +176,7 @@ def save_script(run_id: str, stage: str, *, text: str = "", word_count: int = 0,
         row["review_notes"] = text[:10000]
     elif stage in ("final", "approved"):
         row["script_final"] = text[:20000]
-    insert("scripts", row)
+    insert("scripts", row, defer=True)
 
 
 def save_asset(run_id: str, *, asset_type: str = "", label: str = "",
@@ -191,7 +194,7 @@ def save_asset(run_id: str, *, asset_type: str = "", label: str = "",
         "created_at": now_iso(),
     }
     row.update(extra)
-    insert("assets", row)
+    insert("assets", row, defer=True)
 
 
 def save_tts_chunk(run_id: str, *, chunk_index: int = 0, text: str = "",
@@ -211,7 +214,7 @@ def save_tts_chunk(run_id: str, *, chunk_index: int = 0, text: str = "",
         "created_at": now_iso(),
     }
     row.update(extra)
-    insert("tts_audio", row)
+    insert("tts_audio", row, defer=True)
 
 
 def upload_video_file(video_id: str, bucket: str, local_path: str,
@@ -236,7 +239,7 @@ def save_lesson(scope: str, trigger: str, rule: str, *,
         "severity": severity,
         "active": True,
         "updated_at": now_iso(),
-    }, on_conflict="scope,trigger")
+    }, on_conflict="scope,trigger", defer=True)
 
 
 def get_active_lessons(scope: str = "") -> list[dict]:
@@ -253,7 +256,7 @@ def set_channel_memory(key: str, value: dict) -> None:
         "key": key,
         "value": value,
         "updated_at": now_iso(),
-    }, on_conflict="key")
+    }, on_conflict="key", defer=True)
 
 
 def get_channel_memory(key: str) -> dict | None:
@@ -367,6 +367,86 @@ def _send_media_group(images: list[ImageEntry], group_caption: str = "") -> int
             tp.unlink(missing_ok=True)
 
 
+_TELEGRAM_VIDEO_MAX_BYTES = 50 * 1024 * 1024  # 50 MB (Bot API upload limit)
+
+
+def _send_video(video_path: str | Path, caption: str = "") -> int | None:
+    """Send a video via Telegram sendVideo (multipart upload, streamable).
+
+    Returns message_id on success, None on failure or if the file exceeds
+    the 50 MB Bot API limit.
+    """
+    token = _bot_token()
+    chat = _chat_id()
+    if not token or not chat:
+        return None
+
+    path = Path(video_path)
+    if not path.is_file():
+        print(f"[image_approval] File not found: {path}", file=sys.stderr)
+        return None
+    if path.stat().st_size > _TELEGRAM_VIDEO_MAX_BYTES:
+        print(f"[image_approval] Video too large for sendVideo: {path}", file=sys.stderr)
+        return None
+
+    fields = {"chat_id": chat, "supports_streaming": "true"}
+    if caption:
+        fields["caption"] = caption
+    files = {"video": (path.name, path.read_bytes(), "video/mp4")}
+    body, boundary = _build_multipart(fields, files)
+
+    url = f"https://api.telegram.org/bot{token}/sendVideo"
+    req = urllib.request.Request(
+        url, method="POST",
+        headers={"Content-Type": f"multipart/form-data; boundary={boundary}"},
+        data=body,
+    )
+    try:
+        with urllib.request.urlopen(req, timeout=120) as resp:
+            result = json.loads(resp.read())
+            if result.get("ok"):
+                return result["result"]["message_id"]
+    except (urllib.error.URLError, urllib.error.HTTPError, OSError) as exc:
+        print(f"[image_approval] sendVideo failed: {exc}", file=sys.stderr)
+    return None
+
+
+def send_review_preview(
+    video_path: str | Path,
+    sheets: list[str | Path],
+    *,
+    video_id: str = "",
+    caption: str = "",
+) -> bool:
+    """Send a proxy preview cut plus its per-segment contact sheets.
+
+    Informational only (no buttons); the approval message that follows is
+    what the reviewer answers. Uses the Bot API when configured, else the
+    OpenClaw channel. Returns True if the video was delivered.
+    """
+    header = caption or "[Rayviews Lab] Preview"
+    if video_id:
+        header += f" — {video_id}"
+
+    if _is_configured():
+        sent = _send_video(video_path, caption=header) is not None
+        entries = [
+            ImageEntry(label=Path(p).stem, path=Path(p), product_name="", variant="sheet")
+            for p in sheets
+        ]
+        for i in range(0, len(entries), 10):
+            _send_media_group(entries[i:i + 10], group_caption=f"{header} — contact sheets" if i == 0 else "")
+        return sent
+
+    if _openclaw_channel_ready():
+        sent = send_telegram_media(str(video_path), caption=header)
+        for p in sheets:
+            send_telegram_media(str(p), caption=Path(p).stem)
+        return sent
+
+    return False
+
+
 # ---------------------------------------------------------------------------
 # Approval message + polling
 # ---------------------------------------------------------------------------
@@ -0,0 +1,386 @@
+"""Voice track assembler — streams TTS chunks into the episode 02_audio.wav.
+
+Builds the full voice track in a single pass instead of re-exporting each
+segment through pydub and re-encoding again to rebuild the episode:
+
+  chunk PCM  →  [pause=Xms] silence  →  finalize pad  →  next chunk ...
+
+Each chunk is decoded exactly once. PCM WAV already at the output format is
+copied frame-for-frame; anything else (mp3, other rates, or a rate_tweak
+tempo change) goes through one ffmpeg → s16le pipe. The finalize decision
+per chunk is tools.lib.audio_utils.plan_finalize, so the track matches what
+finalize_segment_audio would have produced, minus the lossy round trips.
+
+Memory is bounded by a fixed frame window (WINDOW_FRAMES) regardless of
+episode length; the WAV is written to a temp file and replaced atomically.
+
+A timing manifest next to the track records sample-accurate offsets:
+
+  {"sample_rate": 48000, "total_samples": N, "chunks": [
+      {"chunk_id", "start_sample", "speech_samples", "pause_samples",
+       "pad_samples", "end_sample", "action", "rate", ...}]}
+
+Input chunks come from a tts_chunks_manifest.json (rayvault TTS_RENDER_CHUNKS
+job: "chunks" with chunk_id/path) or an orchestrator media manifest
+("segments" with segment_id/audio_path/approx_duration_sec/kind).
+
+Stdlib + ffmpeg (only for non-WAV chunks and tempo changes).
+
+Usage:
+    from tools.lib.voice_track import assemble_voice_track, load_voice_chunks
+
+    chunks = load_voice_chunks(Path("tts/tts_chunks_manifest.json"))
+    timing = assemble_voice_track(chunks, run_dir / "02_audio.wav")
+
+    python3 -m tools.lib.voice_track --manifest tts_chunks_manifest.json \\
+        --out state/runs/RUN_ID/02_audio.wav
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import wave
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from rayvault.probe_cache import probe_duration
+from tools.lib.audio_utils import atomic_write_json, plan_finalize, total_pause_ms
+
+SAMPLE_RATE = 48000
+CHANNELS = 1
+SAMPLE_WIDTH = 2  # s16le
+WINDOW_FRAMES = 16384  # ~0.34s at 48kHz; caps the in-flight PCM buffer
+
+
+@dataclass(frozen=True)
+class VoiceChunk:
+    """One piece of narration in track order."""
+    chunk_id: str
+    path: Path
+    text: str = ""
+    target_sec: float = 0.0  # 0 = no finalize gate, keep natural length
+    kind: str = "product"
+
+
+def load_voice_chunks(manifest_path: Path) -> List[VoiceChunk]:
+    """Read chunks from a TTS chunk manifest or orchestrator media manifest.
+
+    Relative paths resolve against the manifest's directory.
+    """
+    data = json.loads(manifest_path.read_text(encoding="utf-8"))
+    base = manifest_path.parent
+    chunks: List[VoiceChunk] = []
+    for i, item in enumerate(data.get("chunks") or data.get("segments") or []):
+        raw = item.get("path") or item.get("audio_path")
+        if not raw:
+            continue
+        path = Path(raw)
+        if not path.is_absolute():
+            path = base / path
+        chunks.append(VoiceChunk(
+            chunk_id=str(item.get("chunk_id") or item.get("segment_id") or f"chunk_{i:02d}"),
+            path=path,
+            text=str(item.get("text") or ""),
+            target_sec=float(item.get("target_sec") or item.get("approx_duration_sec") or 0.0),
+            kind=str(item.get("kind") or "product"),
+        ))
+    return chunks
+
+
+def default_timing_path(out_path: Path) -> Path:
+    """02_audio.wav → 02_audio.timing.json"""
+    return out_path.with_suffix(".timing.json")
+
+
+def speech_duration_sec(path: Path) -> Optional[float]:
+    """Natural length of a chunk: WAV header when readable, else ffprobe."""
+    if path.suffix.lower() == ".wav":
+        try:
+            with wave.open(str(path), "rb") as wf:
+                rate = wf.getframerate()
+                if rate > 0:
+                    return wf.getnframes() / float(rate)
+        except (wave.Error, EOFError, OSError):
+            pass
+    return probe_duration(path)
+
+
+# ---------------------------------------------------------------------------
+# PCM sources (fixed-size windows)
+# ---------------------------------------------------------------------------
+
+def _native_wav_frames(path: Path, sample_rate: int, channels: int) -> Optional[int]:
+    """Frame count if path is a WAV already in the output format, else None."""
+    if path.suffix.lower() != ".wav":
+        return None
+    try:
+        with wave.open(str(path), "rb") as wf:
+            if (wf.getframerate(), wf.getnchannels(), wf.getsampwidth()) != (
+                sample_rate, channels, SAMPLE_WIDTH,
+            ):
+                return None
+            return wf.getnframes()
+    except (wave.Error, EOFError, OSError):
+        return None
+
+
+def _iter_wav(path: Path, window_frames: int) -> Iterator[bytes]:
+    with wave.open(str(path), "rb") as wf:
+        while True:
+            data = wf.readframes(window_frames)
+            if not data:
+                return
+            yield data
+
+
+def _iter_ffmpeg(
+    path: Path,
+    *,
+    sample_rate: int,
+    channels: int,
+    rate: Optional[float],
+    window_frames: int,
+) -> Iterator[bytes]:
+    cmd = ["ffmpeg", "-v", "error", "-i", str(path)]
+    if rate:
+        cmd += ["-filter:a", f"atempo={rate:.6f}"]
+    cmd += ["-f", "s16le", "-ac", str(channels), "-ar", str(sample_rate), "-"]
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    block = window_frames * channels * SAMPLE_WIDTH
+    try:
+        while True:
+            data = proc.stdout.read(block)
+            if not data:
+                break
+            yield data
+        stderr = proc.stderr.read()
+        if proc.wait() != 0:
+            raise RuntimeError(
+                f"ffmpeg decode failed for {path.name}: "
+                f"{stderr.decode('utf-8', errors='ignore')[:400]}"
+            )
+    finally:
+        if proc.poll() is None:
+            proc.kill()
+            proc.wait()
+        proc.stdout.close()
+        proc.stderr.close()
+
+
+def _write_silence(wf: wave.Wave_write, frames: int, channels: int, window_frames: int) -> None:
+    block = b"\x00" * (window_frames * channels * SAMPLE_WIDTH)
+    while frames > 0:
+        n = min(frames, window_frames)
+        wf.writeframesraw(block[: n * channels * SAMPLE_WIDTH])
+        frames -= n
+
+
+def _ms_to_frames(ms: float, sample_rate: int) -> int:
+    return int(round(ms * sample_rate / 1000.0))
+
+
+# ---------------------------------------------------------------------------
+# Assembler
+# ---------------------------------------------------------------------------
+
+def assemble_voice_track(
+    chunks: List[VoiceChunk],
+    out_path: Path,
+    *,
+    timing_path: Optional[Path] = None,
+    sample_rate: int = SAMPLE_RATE,
+    channels: int = CHANNELS,
+    window_frames: int = WINDOW_FRAMES,
+    finalize: bool = True,
+) -> Dict[str, Any]:
+    """Stream chunks + pauses + finalize padding into one WAV.
+
+    With finalize=True, chunks that carry a target_sec get the
+    plan_finalize decision applied inline: pad_silence pads to the exact
+    target sample, rate_tweak decodes through atempo then pads, and
+    needs_repair chunks are kept at natural length and flagged in the
+    timing manifest. Returns the timing manifest (also written to
+    timing_path, default 02_audio.timing.json next to the track).
+    """
+    if not chunks:
+        raise ValueError("no chunks to assemble")
+    missing = [c.chunk_id for c in chunks if not c.path.exists()]
+    if missing:
+        raise FileNotFoundError(f"voice chunks missing: {', '.join(missing)}")
+
+    have_ffmpeg = shutil.which("ffmpeg") is not None
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = out_path.with_suffix(out_path.suffix + ".tmp")
+    entries: List[Dict[str, Any]] = []
+    cursor = 0
+
+    try:
+        with wave.open(str(tmp), "wb") as wf:
+            wf.setnchannels(channels)
+            wf.setsampwidth(SAMPLE_WIDTH)
+            wf.setframerate(sample_rate)
+
+            for chunk in chunks:
+                native_frames = _native_wav_frames(chunk.path, sample_rate, channels)
+                pause_ms = total_pause_ms(chunk.text) if chunk.text else 0
+                pause_frames = _ms_to_frames(pause_ms, sample_rate)
+
+                action, rate, reason = "ok", None, None
+                target_frames = 0
+                if finalize and chunk.target_sec > 0:
+                    if native_frames is not None:
+                        measured_ms = native_frames * 1000.0 / sample_rate
+                    else:
+                        measured_ms = (speech_duration_sec(chunk.path) or 0.0) * 1000.0
+                    plan = plan_finalize(
+                        int(measured_ms + pause_ms), int(chunk.target_sec * 1000),
+                        kind=chunk.kind,
+                    )
+                    action, reason = plan.action, plan.reason
+                    target_frames = _ms_to_frames(chunk.target_sec * 1000, sample_rate)
+                    if action == "rate_tweak":
+                        if have_ffmpeg:
+                            rate = plan.rate
+                        else:
+                            action = "needs_repair"
+                            reason = f"{plan.reason}; ffmpeg not available"
+
+                if native_frames is not None and rate is None:
+                    source = _iter_wav(chunk.path, window_frames)
+                elif have_ffmpeg:
+                    source = _iter_ffmpeg(
+                        chunk.path, sample_rate=sample_rate, channels=channels,
+                        rate=rate, window_frames=window_frames,
+                    )
+                else:
+                    raise RuntimeError(
+                        f"ffmpeg required to decode {chunk.path.name} "
+                        f"(not {sample_rate}Hz/{channels}ch 16-bit WAV)"
+                    )
+
+                speech_bytes = 0
+                for data in source:
+                    wf.writeframesraw(data)
+                    speech_bytes += len(data)
+                speech_frames = speech_bytes // (channels * SAMPLE_WIDTH)
+
+                _write_silence(wf, pause_frames, channels, window_frames)
+                pad_frames = 0
+                if action in ("pad_silence", "rate_tweak"):
+                    pad_frames = max(0, target_frames - speech_frames - pause_frames)
+                    _write_silence(wf, pad_frames, channels, window_frames)
+
+                end = cursor + speech_frames + pause_frames + pad_frames
+                entries.append({
+                    "chunk_id": chunk.chunk_id,
+                    "path": str(chunk.path),
+                    "start_sample": cursor,
+                    "speech_samples": speech_frames,
+                    "pause_samples": pause_frames,
+                    "pad_samples": pad_frames,
+                    "end_sample": end,
+                    "start_sec": round(cursor / sample_rate, 6),
+                    "end_sec": round(end / sample_rate, 6),
+                    "target_sec": chunk.target_sec or None,
+                    "action": action,
+                    "rate": rate,
+                    "reason": reason,
+                })
+                cursor = end
+        with open(tmp, "rb") as f:
+            os.fsync(f.fileno())
+        os.replace(tmp, out_path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+    timing = {
+        "version": 1,
+        "audio": out_path.name,
+        "sample_rate": sample_rate,
+        "channels": channels,
+        "total_samples": cursor,
+        "duration_sec": round(cursor / sample_rate, 6),
+        "needs_repair": [e["chunk_id"] for e in entries if e["action"] == "needs_repair"],
+        "chunks": entries,
+    }
+    atomic_write_json(timing_path or default_timing_path(out_path), timing)
+    return timing
+
+
+def extract_chunk(
+    track_path: Path,
+    entry: Dict[str, Any],
+    out_path: Path,
+    *,
+    window_frames: int = WINDOW_FRAMES,
+) -> Path:
+    """Copy one timing entry's [start_sample, end_sample) out of the track.
+
+    The slice is the chunk as finalized in the track (speech, pauses and
+    pad), so per-segment consumers get the same audio as the episode.
+    """
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = out_path.with_suffix(out_path.suffix + ".tmp")
+    try:
+        with wave.open(str(track_path), "rb") as src, wave.open(str(tmp), "wb") as dst:
+            dst.setnchannels(src.getnchannels())
+            dst.setsampwidth(src.getsampwidth())
+            dst.setframerate(src.getframerate())
+            src.setpos(int(entry["start_sample"]))
+            left = int(entry["end_sample"]) - int(entry["start_sample"])
+            while left > 0:
+                data = src.readframes(min(left, window_frames))
+                if not data:
+                    break
+                dst.writeframesraw(data)
+                left -= len(data) // (src.getnchannels() * src.getsampwidth())
+        os.replace(tmp, out_path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    return out_path
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(description="Stream TTS chunks into 02_audio.wav")
+    ap.add_argument("--manifest", required=True,
+                    help="tts_chunks_manifest.json or orchestrator media manifest")
+    ap.add_argument("--out", required=True, help="Output WAV (e.g. run_dir/02_audio.wav)")
+    ap.add_argument("--timing", default="", help="Timing manifest path (default: <out>.timing.json)")
+    ap.add_argument("--sample-rate", type=int, default=SAMPLE_RATE)
+    ap.add_argument("--no-finalize", action="store_true",
+                    help="Concatenate at natural length (skip pad/rate gate)")
+    args = ap.parse_args(argv)
+
+    chunks = load_voice_chunks(Path(args.manifest))
+    try:
+        timing = assemble_voice_track(
+            chunks, Path(args.out),
+            timing_path=Path(args.timing) if args.timing else None,
+            sample_rate=args.sample_rate,
+            finalize=not args.no_finalize,
+        )
+    except (ValueError, FileNotFoundError, RuntimeError) as e:
+        print(f"[FAIL] {e}", file=sys.stderr)
+        return 1
+
+    print(f"[OK] {args.out}: {len(chunks)} chunks, {timing['duration_sec']:.2f}s")
+    if timing["needs_repair"]:
+        print(f"[WARN] needs_repair: {', '.join(timing['needs_repair'])}")
+        return 2
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -67,6 +67,11 @@ def spool_event(run_id: str, event_type: str, payload: dict) -> str:
     ts = int(time.time())
     fname = f"{run_id}_{ts}_{event_type}.json"
     path = os.path.join(SPOOL_DIR, fname)
+    seq = 1
+    while os.path.exists(path):
+        # Same run + event within one second — don't overwrite the earlier one
+        path = os.path.join(SPOOL_DIR, f"{run_id}_{ts}_{event_type}_{seq}.json")
+        seq += 1
     record = {
         "run_id": run_id,
         "event_type": event_type,
@@ -147,10 +152,18 @@ def _default_spool_send(record: dict) -> bool:
 
     Maps the spool timestamp into payload.spool_ts to preserve
     original timing without conflicting with DB-generated created_at.
+    "supabase_write" records (rows spilled by the write-behind queue)
+    are replayed as one bulk write into their original table instead.
     """
     try:
-        from tools.lib.supabase_client import insert
+        from tools.lib.supabase_client import insert, write_rows
         import uuid as _uuid
+        if record.get("event_type") == "supabase_write":
+            spilled = record.get("payload", {})
+            return write_rows(
+                spilled["table"], spilled["rows"],
+                on_conflict=spilled.get("on_conflict", ""),
+            )
         payload = dict(record.get("payload", {}))
         if "ts" in record:
             payload.setdefault("spool_ts", record["ts"])
@@ -5,7 +5,7 @@ Reads Rayviews pipeline_runs/{run_id}/ artifacts (timestamps, products, assets,
 and produces a RayVault-compatible directory structure with:
   - 00_manifest.json
   - 01_script.txt
-  - 02_audio.wav  (ffmpeg convert from voiceover.mp3)
+  - 02_audio.wav  (voice track streamed from voiceover.mp3/.wav)
   - 03_frame.png  (dark frame or provided)
   - 05_render_config.json (v1.3 typed segments)
   - products/p{rank:02d}/source_images/{01_main,02_glam,03_broll}.png
@@ -171,32 +171,23 @@ def load_rayviews_run(run_dir: Path) -> Dict[str, Any]:
 
 
 # ---------------------------------------------------------------------------
-# 2. Convert MP3 → WAV
+# 2. Voice track (voiceover → 02_audio.wav)
 # ---------------------------------------------------------------------------
 
 
-def convert_mp3_to_wav(mp3_path: Path, wav_path: Path) -> bool:
-    """Convert voiceover.mp3 to 48kHz mono WAV via ffmpeg. Returns True on success."""
-    if not shutil.which("ffmpeg"):
-        raise RuntimeError(
-            "ffmpeg not found. Install: brew install ffmpeg"
-        )
-    if not mp3_path.exists():
-        return False
+def build_voice_track(source: Path, wav_path: Path) -> float:
+    """Stream voiceover (mp3 or wav) into 48kHz mono 02_audio.wav.
 
-    wav_path.parent.mkdir(parents=True, exist_ok=True)
-    tmp = wav_path.with_suffix(".wav.tmp")
-    try:
-        subprocess.run(
-            ["ffmpeg", "-y", "-i", str(mp3_path),
-             "-ar", str(AUDIO_SAMPLE_RATE), "-ac", "1", str(tmp)],
-            check=True, capture_output=True,
-        )
-        os.replace(tmp, wav_path)
-        return True
-    except subprocess.CalledProcessError as e:
-        tmp.unlink(missing_ok=True)
-        raise RuntimeError(f"ffmpeg conversion failed: {e.stderr.decode()[:200]}") from e
+    One decode through tools.lib.voice_track, which also writes the
+    02_audio.timing.json sample map. Returns the track duration in seconds.
+    """
+    from tools.lib.voice_track import VoiceChunk, assemble_voice_track
+
+    timing = assemble_voice_track(
+        [VoiceChunk(chunk_id="voiceover", path=source)], wav_path,
+        sample_rate=AUDIO_SAMPLE_RATE, finalize=False,
+    )
+    return float(timing["duration_sec"])
 
 
 # ---------------------------------------------------------------------------
@@ -621,34 +612,23 @@ def convert(
     # Create output directory
     rayvault_dir.mkdir(parents=True, exist_ok=True)
 
-    # --- Audio conversion ---
-    mp3_path = run_dir / "voice" / "voiceover.mp3"
+    # --- Voice track ---
     wav_path = rayvault_dir / "02_audio.wav"
     audio_available = False
     audio_duration_sec = timestamps.get("estimated_duration_ms", 0) / 1000
 
-    if mp3_path.exists():
-        convert_mp3_to_wav(mp3_path, wav_path)
+    voice_source = next(
+        (p for p in (run_dir / "voice" / "voiceover.mp3", run_dir / "voice" / "voiceover.wav")
+         if p.exists()),
+        None,
+    )
+    if voice_source is not None:
+        audio_duration_sec = build_voice_track(voice_source, wav_path)
         audio_available = True
-        # Try to get actual duration from WAV
-        try:
-            import wave
-            with wave.open(str(wav_path), "rb") as w:
-                rate = w.getframerate()
-                if rate > 0:
-                    audio_duration_sec = w.getnframes() / float(rate)
-        except Exception:
-            pass
     else:
-        # Check if wav already exists in voice/
-        wav_source = run_dir / "voice" / "voiceover.wav"
-        if wav_source.exists():
-            shutil.copy2(wav_source, wav_path)
-            audio_available = True
-        else:
-            warnings.append(
-                "WAITING_ASSETS: voiceover.mp3 not found, using estimated duration"
-            )
+        warnings.append(
+            "WAITING_ASSETS: voiceover.mp3 not found, using estimated duration"
+        )
 
     # --- Frame ---
     frame = Path(frame_path) if frame_path else None
@@ -13,6 +13,7 @@ import urllib.request
 from typing import Dict, List, Optional, Tuple
 
 from lib.common import load_env_file, now_iso
+from lib.file_watch import WaitResult, wait_until_ready
 
 
 BASE_DIR = os.environ.get("PROJECT_ROOT", os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
@@ -1176,38 +1177,34 @@ def notify_agent(agent: str, message: str, *, session_id: str = "") -> Tuple[boo
     return ok, out
 
 
-def wait_for_file(path: str, max_seconds: int, step_seconds: int = 6, min_mtime: float = 0.0) -> bool:
-    waited = 0
-    while waited < max_seconds:
-        if os.path.exists(path) and os.path.getsize(path) > 0:
-            if min_mtime <= 0.0 or os.path.getmtime(path) >= min_mtime:
-                return True
-        time.sleep(step_seconds)
-        waited += step_seconds
-    if os.path.exists(path) and os.path.getsize(path) > 0:
-        if min_mtime <= 0.0 or os.path.getmtime(path) >= min_mtime:
-            return True
-    return False
+def report_file_wait(result: WaitResult, min_mtime: float = 0.0) -> None:
+    append_ops_event(
+        "market_dispatch_file_wait",
+        "files ready" if result.ok else f"{len(result.missing)} file(s) not ready",
+        {
+            "backend": result.backend,
+            "elapsed_sec": round(result.elapsed_sec, 3),
+            "ready_latency_sec": {p: round(sec, 3) for p, sec in result.ready.items()},
+            "missing": result.missing,
+            "min_mtime": min_mtime,
+        },
+    )
 
 
-def wait_for_files(
-    paths: List[str], max_seconds: int, step_seconds: int = 6, min_mtime: float = 0.0
-) -> Tuple[bool, List[str]]:
-    waited = 0
-    missing: List[str] = []
-    while waited < max_seconds:
-        missing = []
-        for p in paths:
-            if not os.path.exists(p) or os.path.getsize(p) == 0:
-                missing.append(p)
-                continue
-            if min_mtime > 0.0 and os.path.getmtime(p) < min_mtime:
-                missing.append(p)
-        if not missing:
-            return True, []
-        time.sleep(step_seconds)
-        waited += step_seconds
-    return False, missing
+def wait_for_file(path: str, max_seconds: int, min_mtime: float = 0.0) -> bool:
+    ok, _missing = wait_for_files([path], max_seconds, min_mtime=min_mtime)
+    return ok
+
+
+def wait_for_files(paths: List[str], max_seconds: int, min_mtime: float = 0.0) -> Tuple[bool, List[str]]:
+    # Wakes on inotify close/rename events (polling fallback) instead of fixed sleeps.
+    result = wait_until_ready(paths, max_seconds, min_mtime=min_mtime)
+    report_file_wait(result, min_mtime)
+    if result.ok:
+        return True, []
+    # Report the caller's spelling of each path, not the absolute one.
+    missing = set(result.missing)
+    return False, [p for p in paths if os.path.abspath(p) in missing]
 
 
 def ready_after_step(path: str, ok: bool, output: str, wait_seconds: int, min_mtime: float) -> bool:
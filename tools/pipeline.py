@@ -1408,6 +1408,10 @@ def _request_assets_approval(
     if not images:
         raise RuntimeError("No Dzine images found for Telegram asset approval")
 
+    preview = _render_review_preview(run_dir)
+    if preview:
+        _send_review_preview(preview, run_id, "Asset review preview")
+
     result = request_image_approval(images, video_id=run_id, timeout_s=timeout_s, skip=False)
     report = {
         "run_id": run_id,
@@ -1422,6 +1426,51 @@ def _request_assets_approval(
     return bool(result.all_approved), report
 
 
+def _render_review_preview(run_dir: Path) -> Optional[Dict[str, Any]]:
+    """Proxy-render the RayVault cut (540p, cached) for a gate review.
+
+    Returns None when the run has no rayvault/05_render_config.json yet or
+    the preview cannot be rendered; reviews never block on the preview.
+    """
+    rayvault_dir = run_dir / "rayvault"
+    if not (rayvault_dir / "05_render_config.json").exists():
+        return None
+    try:
+        from rayvault.blob_store import BlobStore, default_blob_root
+        from rayvault.proxy_render import render_proxy
+
+        result = render_proxy(rayvault_dir, blob_store=BlobStore(default_blob_root()))
+    except Exception as exc:
+        print(f"[WARN] Preview render failed: {exc}")
+        return None
+    if not result.ok:
+        print(f"[WARN] Preview render {result.status}: {'; '.join(result.errors[:2])}")
+        return None
+    print(
+        f"[OK] Preview: {result.output_path} ({result.w}x{result.h}, "
+        f"{result.segments_rendered} rendered / {result.segments_cached} cached, "
+        f"{result.elapsed_sec:.1f}s)"
+    )
+    return {
+        "path": result.output_path,
+        "sheets": list(result.sheets),
+        "status": result.status,
+        "elapsed_sec": result.elapsed_sec,
+    }
+
+
+def _send_review_preview(preview: Dict[str, Any], run_id: str, caption: str) -> bool:
+    from lib.telegram_image_approval import send_review_preview
+
+    try:
+        return send_review_preview(
+            preview["path"], preview.get("sheets", []), video_id=run_id, caption=caption,
+        )
+    except Exception as exc:
+        print(f"[WARN] Preview send failed: {exc}")
+        return False
+
+
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
@@ -4987,12 +5036,16 @@ def cmd_run_e2e(args):
         if changed:
             save_run_config(run_dir, run_config)
         if gates["gate2"]["status"] != "approved":
+            preview = _render_review_preview(run_dir)
             if telegram_enabled and "gate2" in telegram_stages:
+                if preview:
+                    _send_review_preview(preview, run_id, "Gate 2 preview")
                 details = [
                     f"Owner: {TELEGRAM_APPROVAL_STAGE_OWNERS['gate2']}",
                     f"Originality: {auto_checks.get('originality', {}).get('status', 'unknown')}",
                     f"Compliance: {auto_checks.get('compliance', {}).get('status', 'unknown')}",
                     f"Render inputs: {auto_checks.get('render_inputs', {}).get('status', 'unknown')}",
+                    f"Preview: {preview['path'] if preview else 'unavailable'}",
                 ]
                 gate2_ok = _request_text_approval(
                     run_id=run_id,
@@ -5023,6 +5076,8 @@ def cmd_run_e2e(args):
                 print("WAITING FOR GATE 2 APPROVAL")
                 print(f"{'='*60}")
                 print(f"Run: {run_id}")
+                if preview:
+                    print(f"Preview: {preview['path']}")
                 print(f"Approve: python3 tools/pipeline.py approve-gate2 --run-id {run_id} --reviewer Ray --notes \"GO\"")
                 print(f"Reject : python3 tools/pipeline.py reject-gate2 --run-id {run_id} --reviewer Ray --notes \"Regenerate assets\"")
                 return
@@ -15,11 +15,15 @@ Stdlib only (+ Playwright for browser fallback).
 
 from __future__ import annotations
 
+import asyncio
 import json
+import os
 import re
 import sys
 import time
-from dataclasses import dataclass, field
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
 
 _repo = Path(__file__).resolve().parent.parent
@@ -27,7 +31,7 @@ if str(_repo) not in sys.path:
     sys.path.insert(0, str(_repo))
 
 from tools.lib.common import load_env_file, now_iso, project_root
-from tools.lib.page_reader import extract_headings, fetch_page_data, fetch_page_text
+from tools.lib.page_reader import extract_headings, fetch_page_data, fetch_page_text, html_to_text
 from tools.lib.web_search import web_search
 
 # ---------------------------------------------------------------------------
@@ -195,6 +199,45 @@ def _is_comparison_page(title: str, url: str) -> bool:
     return has_url_signal or has_title_signal
 
 
+def _search_source(niche: str, source_name: str, info: dict) -> list[tuple[str, str, str]]:
+    """Run the site-restricted search for one source; up to 2 comparison pages."""
+    domain = info["domain"]
+    # Target comparison/best-of pages explicitly
+    query = f"best {niche} site:{domain}"
+    log = [f"  Searching {source_name}..."]
+    articles: list[tuple[str, str, str]] = []
+
+    try:
+        results = web_search(query, count=3)
+    except Exception as exc:
+        log.append(f"    Search failed: {exc}")
+        results = None
+    else:
+        if not results:
+            log.append(f"    No coverage")
+
+    # Take up to 2 COMPARISON pages per source
+    for r in (results or [])[:3]:
+        if len(articles) >= 2:
+            break
+        # Enforce domain restriction
+        if not any(d in r.url for d in _ALLOWED_DOMAINS):
+            log.append(f"    SKIPPED (domain violation): {r.url}")
+            continue
+        # Enforce comparison-page requirement
+        if not _is_comparison_page(r.title, r.url):
+            log.append(f"    SKIPPED (not a comparison page): {r.title[:60]}")
+            continue
+        articles.append((source_name, r.url, r.title))
+        log.append(f"    -> {r.title[:70]}")
+    if results and not articles:
+        log.append(f"    No comparison pages found")
+
+    # Printed as one block so concurrent searches don't interleave
+    print("\n".join(log), file=sys.stderr)
+    return articles
+
+
 def _find_review_articles(niche: str) -> list[tuple[str, str, str]]:
     """Search Google for comparison/review list pages — exactly 3 sources.
 
@@ -202,46 +245,15 @@ def _find_review_articles(niche: str) -> list[tuple[str, str, str]]:
     lists (e.g., "Best X of 2026", "Top 5 X", "Our Picks").
     Rejects individual product reviews, news articles, and fluff.
 
+    The per-source searches run concurrently; results keep TRUSTED_SOURCES
+    order.
+
     Returns list of (source_name, url, search_title).
     """
-    articles: list[tuple[str, str, str]] = []
-
-    for source_name, info in TRUSTED_SOURCES.items():
-        domain = info["domain"]
-        # Target comparison/best-of pages explicitly
-        query = f"best {niche} site:{domain}"
-
-        print(f"  Searching {source_name}...", file=sys.stderr)
-        try:
-            results = web_search(query, count=3)
-        except Exception as exc:
-            print(f"    Search failed: {exc}", file=sys.stderr)
-            continue
-
-        if not results:
-            print(f"    No coverage", file=sys.stderr)
-            continue
-
-        # Take up to 2 COMPARISON pages per source
-        added = 0
-        for r in results[:3]:
-            if added >= 2:
-                break
-            # Enforce domain restriction
-            if not any(d in r.url for d in _ALLOWED_DOMAINS):
-                print(f"    SKIPPED (domain violation): {r.url}", file=sys.stderr)
-                continue
-            # Enforce comparison-page requirement
-            if not _is_comparison_page(r.title, r.url):
-                print(f"    SKIPPED (not a comparison page): {r.title[:60]}", file=sys.stderr)
-                continue
-            articles.append((source_name, r.url, r.title))
-            print(f"    -> {r.title[:70]}", file=sys.stderr)
-            added += 1
-        if added == 0:
-            print(f"    No comparison pages found", file=sys.stderr)
-
-    return articles
+    sources = list(TRUSTED_SOURCES.items())
+    with ThreadPoolExecutor(max_workers=len(sources) or 1) as pool:
+        per_source = list(pool.map(lambda item: _search_source(niche, *item), sources))
+    return [article for found in per_source for article in found]
 
 
 # ---------------------------------------------------------------------------
@@ -747,15 +759,16 @@ def _extract_downside(lines: list[str], product_line: int, brand: str) -> str:
     return ""
 
 
-def _open_and_extract(
-    source_name: str, url: str, title: str
+def _extract_report(
+    source_name: str,
+    url: str,
+    title: str,
+    text: str,
+    method: str,
+    raw_html: str | None,
 ) -> SourceReport:
-    """Open a review page and extract products. The core browsing step."""
+    """Build a SourceReport from already-fetched page content (no network)."""
     report = SourceReport(source_name=source_name, url=url, title=title)
-
-    print(f"\n  Opening {source_name}: {url[:80]}...", file=sys.stderr)
-
-    text, method, raw_html = fetch_page_data(url)
     report.fetch_method = method
 
     if not text:
@@ -795,12 +808,205 @@ def _open_and_extract(
         reasons_str = f" ({len(p.reasons)} reasons)" if p.reasons else ""
         print(f"      - {p.product_name}{label}{reasons_str}", file=sys.stderr)
 
+    return report
+
+
+def _open_and_extract(
+    source_name: str, url: str, title: str
+) -> SourceReport:
+    """Open a review page and extract products. The core browsing step."""
+    print(f"\n  Opening {source_name}: {url[:80]}...", file=sys.stderr)
+
+    text, method, raw_html = fetch_page_data(url)
+    report = _extract_report(source_name, url, title, text, method, raw_html)
+
     # Small delay between pages to be respectful
-    time.sleep(1.0)
+    if text:
+        time.sleep(1.0)
 
     return report
 
 
+# ---------------------------------------------------------------------------
+# Step 2 (concurrent): crawl all pages at once, politely per domain
+# ---------------------------------------------------------------------------
+
+# Pages fetched from the same host at once, and the gap between two
+# requests to that host. Cache hits skip both.
+CRAWL_PER_DOMAIN = int(os.environ.get("RESEARCH_CRAWL_PER_DOMAIN", "2"))
+CRAWL_DELAY_SEC = float(os.environ.get("RESEARCH_CRAWL_DELAY_SEC", "1.0"))
+EXTRACT_WORKERS = int(os.environ.get("RESEARCH_EXTRACT_WORKERS", "4"))
+
+_PAGE_CACHE_HTML = "text/html"
+_PAGE_CACHE_TEXT = "text/plain"
+
+
+def _open_caches() -> tuple[object | None, object | None]:
+    """Return (FetchCache, EvidenceCache) for the crawl, or Nones if unusable.
+
+    Pages go in their own cache directory because entries here hold the raw
+    HTML (needed for heading-first extraction), not the markdown/text that
+    fetch_markdown() stores in the shared fetch cache.
+    """
+    try:
+        from tools.lib.evidence_cache import EvidenceCache
+        from tools.lib.fetch_cache import FetchCache
+        root = project_root() / ".cache"
+        return FetchCache(cache_dir=root / "research_pages"), EvidenceCache(cache_dir=root / "evidence")
+    except Exception as exc:
+        print(f"  [research] Cache unavailable, crawling uncached: {exc}", file=sys.stderr)
+        return None, None
+
+
+def _cached_page(fetch_cache, url: str) -> tuple[str, str, str | None] | None:
+    """Return (text, method, raw_html) from the page cache, or None on miss."""
+    if fetch_cache is None:
+        return None
+    entry = fetch_cache.get(url)
+    if entry is None:
+        return None
+    body = fetch_cache.get_text(url)
+    if not body:
+        return None
+    if entry.content_type == _PAGE_CACHE_HTML:
+        return html_to_text(body), entry.method, body
+    return body, entry.method, None
+
+
+def _store_page(fetch_cache, url: str, text: str, method: str, raw_html: str | None) -> None:
+    if fetch_cache is None or not text:
+        return
+    try:
+        if raw_html:
+            fetch_cache.put(url, raw_html, method=method, content_type=_PAGE_CACHE_HTML)
+        else:
+            fetch_cache.put(url, text, method=method, content_type=_PAGE_CACHE_TEXT)
+    except Exception as exc:
+        print(f"    [research] Page cache write failed: {exc}", file=sys.stderr)
+
+
+def _report_from_evidence(
+    source_name: str, url: str, title: str, text: str, method: str, evidence: list,
+) -> SourceReport:
+    """Rebuild a SourceReport from cached evidence (page content unchanged)."""
+    products = [ProductEvidence(**item) for item in evidence]
+    print(f"    Reusing evidence for unchanged page ({len(products)} products)", file=sys.stderr)
+    return SourceReport(
+        source_name=source_name, url=url, title=title, date=_extract_date(text),
+        fetch_method=method, products_found=products,
+    )
+
+
+def _domain_of(url: str) -> str:
+    return urllib.parse.urlsplit(url).netloc.lower()
+
+
+class _DomainGate:
+    """Per-host concurrency cap plus a minimum gap between request starts."""
+
+    def __init__(self, limit: int, delay_sec: float):
+        self._sem = asyncio.Semaphore(max(1, limit))
+        self._delay = max(0.0, delay_sec)
+        self._lock = asyncio.Lock()
+        self._next_start = 0.0
+
+    async def __aenter__(self):
+        await self._sem.acquire()
+        async with self._lock:
+            loop = asyncio.get_running_loop()
+            wait = self._next_start - loop.time()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            self._next_start = loop.time() + self._delay
+        return self
+
+    async def __aexit__(self, *exc):
+        self._sem.release()
+
+
+async def _crawl_async(
+    articles: list[tuple[str, str, str]],
+    *,
+    fetch_cache,
+    evidence_cache,
+    per_domain: int,
+    delay_sec: float,
+    pool: ThreadPoolExecutor,
+    force: bool,
+) -> list[SourceReport]:
+    loop = asyncio.get_running_loop()
+    gates: dict[str, _DomainGate] = {}
+
+    async def crawl_one(source_name: str, url: str, title: str) -> SourceReport:
+        page = None if force else await asyncio.to_thread(_cached_page, fetch_cache, url)
+        if page is None:
+            gate = gates.setdefault(_domain_of(url), _DomainGate(per_domain, delay_sec))
+            async with gate:
+                print(f"\n  Opening {source_name}: {url[:80]}...", file=sys.stderr)
+                page = await asyncio.to_thread(fetch_page_data, url)
+            await asyncio.to_thread(_store_page, fetch_cache, url, *page)
+        else:
+            print(f"\n  Opening {source_name} (cached): {url[:80]}...", file=sys.stderr)
+        text, method, raw_html = page
+
+        content = raw_html or text
+        if evidence_cache is not None and text and not force:
+            prior = evidence_cache.get_evidence(url, content)
+            if prior is not None:
+                return _report_from_evidence(source_name, url, title, text, method, prior)
+
+        report = await loop.run_in_executor(
+            pool, _extract_report, source_name, url, title, text, method, raw_html,
+        )
+        if evidence_cache is not None and text:
+            try:
+                evidence_cache.put_evidence(
+                    url, content, [asdict(p) for p in report.products_found],
+                    source_name=source_name,
+                )
+            except Exception as exc:
+                print(f"    [research] Evidence cache write failed: {exc}", file=sys.stderr)
+        return report
+
+    return list(await asyncio.gather(*(crawl_one(*a) for a in articles)))
+
+
+def _crawl_articles(
+    articles: list[tuple[str, str, str]],
+    *,
+    fetch_cache=None,
+    evidence_cache=None,
+    per_domain: int = CRAWL_PER_DOMAIN,
+    delay_sec: float = CRAWL_DELAY_SEC,
+    max_workers: int = EXTRACT_WORKERS,
+    force: bool = False,
+) -> list[SourceReport]:
+    """Open all review pages concurrently and extract products.
+
+    Each page is read from the page cache first; misses are fetched under a
+    per-domain gate (at most ``per_domain`` in flight, ``delay_sec`` between
+    request starts) and written back. Extraction runs on a thread pool so it
+    overlaps with the remaining fetches, and is skipped entirely when the
+    EvidenceCache already holds products for identical page content.
+    ``force`` bypasses cache reads (results are still stored).
+
+    Returns one SourceReport per article, in the order given — the same
+    reports the serial _open_and_extract() loop would produce.
+    """
+    if not articles:
+        return []
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(articles)))) as pool:
+        return asyncio.run(_crawl_async(
+            articles,
+            fetch_cache=fetch_cache,
+            evidence_cache=evidence_cache,
+            per_domain=per_domain,
+            delay_sec=delay_sec,
+            pool=pool,
+            force=force,
+        ))
+
+
 # ---------------------------------------------------------------------------
 # Step 3: Aggregate across sources
 # ---------------------------------------------------------------------------
@@ -1147,7 +1353,8 @@ def run_reviews_research(
 
     Steps:
     1. Search Google for review articles from trusted sources
-    2. Open each page, read content, extract products with evidence
+    2. Open the pages concurrently (cache-first, polite per domain),
+       read content, extract products with evidence
     3. Aggregate across sources
     4. Validate DONE criteria
     5. Write outputs + notify
@@ -1185,15 +1392,27 @@ def run_reviews_research(
 
     # --- Step 2: Open each page and extract products ---
     print(f"\n[research] Step 2: Opening {len(articles)} review pages...", file=sys.stderr)
-    for source_name, url, title in articles:
-        # Enforce domain restriction
-        if not any(d in url for d in _ALLOWED_DOMAINS):
-            err = f"Source violation – research restricted to 3 domains. Blocked: {url}"
-            print(f"  ABORT: {err}", file=sys.stderr)
-            report.validation_errors.append(err)
-            return report
-        source_report = _open_and_extract(source_name, url, title)
-        report.sources_reviewed.append(source_report)
+    # Enforce domain restriction — pages before the first violation are
+    # still reviewed, then the run aborts (same as the old serial loop)
+    violation = next(
+        (i for i, (_, url, _) in enumerate(articles)
+         if not any(d in url for d in _ALLOWED_DOMAINS)),
+        None,
+    )
+    allowed = articles if violation is None else articles[:violation]
+    fetch_cache, evidence_cache = _open_caches()
+    try:
+        report.sources_reviewed.extend(_crawl_articles(
+            allowed, fetch_cache=fetch_cache, evidence_cache=evidence_cache, force=force,
+        ))
+    finally:
+        if fetch_cache is not None:
+            fetch_cache.close()
+    if violation is not None:
+        err = f"Source violation – research restricted to 3 domains. Blocked: {articles[violation][1]}"
+        print(f"  ABORT: {err}", file=sys.stderr)
+        report.validation_errors.append(err)
+        return report
 
     # --- Step 3: Aggregate ---
     print(f"\n[research] Step 3: Aggregating evidence...", file=sys.stderr)
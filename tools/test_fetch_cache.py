@@ -14,6 +14,7 @@ import sys
 import tempfile
 import time
 import unittest
+from datetime import datetime, timezone
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -289,6 +290,100 @@ class TestFetchCache(unittest.TestCase):
         self.assertIsNone(self.cache.get(url))
 
 
+class TestFetchCacheIndex(unittest.TestCase):
+    """SQLite index: LRU budget, compression, legacy migration, concurrency."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        import shutil
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def test_lru_evicts_by_entries(self):
+        cache = FetchCache(cache_dir=self.tmpdir, max_entries=2)
+        cache.put("https://example.com/a", "content a")
+        cache.put("https://example.com/b", "content b")
+        time.sleep(0.01)
+        self.assertIsNotNone(cache.get("https://example.com/a"))  # a is now newest
+        cache.put("https://example.com/c", "content c")
+        self.assertEqual(len(cache), 2)
+        self.assertIn("https://example.com/a", cache)
+        self.assertNotIn("https://example.com/b", cache)
+        self.assertFalse((Path(self.tmpdir) / "content" / f"{_url_key('https://example.com/b')}.md").exists())
+
+    def test_lru_evicts_by_bytes(self):
+        cache = FetchCache(cache_dir=self.tmpdir, max_bytes=250)
+        for i in range(5):
+            cache.put(f"https://example.com/{i}", "x" * 100)
+        s = cache.stats()
+        self.assertEqual(s["total_entries"], 2)
+        self.assertLessEqual(s["total_bytes"], 250)
+        self.assertIn("https://example.com/4", cache)
+
+    def test_compressed_content(self):
+        cache = FetchCache(cache_dir=self.tmpdir, compress=True)
+        text = "# Review\n\n" + "compressible words " * 200
+        entry = cache.put("https://example.com/z", text)
+        self.assertTrue(entry.text_file.endswith(".md.gz"))
+        self.assertEqual(cache.get_text("https://example.com/z"), text)
+        self.assertLess(cache.stats()["total_bytes"], len(text))
+        # Switching compression off replaces the old file
+        plain = FetchCache(cache_dir=self.tmpdir)
+        plain.put("https://example.com/z", text)
+        self.assertFalse((Path(self.tmpdir) / entry.text_file).exists())
+        self.assertEqual(len(plain), 1)
+
+    def test_migrates_legacy_index_json(self):
+        content = Path(self.tmpdir) / "content"
+        content.mkdir(parents=True)
+        key = _url_key("https://example.com/old")
+        (content / f"{key}.md").write_text("legacy text", encoding="utf-8")
+        now = datetime.now(timezone.utc).isoformat()
+        legacy = {key: {
+            "url": "https://example.com/old", "url_key": key, "content_hash": _content_hash("legacy text"),
+            "method": "markdown", "content_type": "", "token_estimate": None, "content_length": 11,
+            "fetched_at": now, "cached_at": now, "ttl_hours": 24.0, "text_file": f"content/{key}.md",
+        }}
+        (Path(self.tmpdir) / "index.json").write_text(json.dumps(legacy), encoding="utf-8")
+        cache = FetchCache(cache_dir=self.tmpdir)
+        self.assertEqual(cache.get_text("https://example.com/old"), "legacy text")
+        self.assertFalse((Path(self.tmpdir) / "index.json").exists())
+        self.assertTrue((Path(self.tmpdir) / "index.json.migrated").exists())
+
+    def test_legacy_index_renamed_by_another_process(self):
+        content = Path(self.tmpdir) / "content"
+        content.mkdir(parents=True)
+        key = _url_key("https://example.com/old")
+        (content / f"{key}.md").write_text("legacy text", encoding="utf-8")
+        now = datetime.now(timezone.utc).isoformat()
+        legacy = {key: {
+            "url": "https://example.com/old", "url_key": key, "content_hash": _content_hash("legacy text"),
+            "method": "markdown", "content_type": "", "token_estimate": None, "content_length": 11,
+            "fetched_at": now, "cached_at": now, "ttl_hours": 24.0, "text_file": f"content/{key}.md",
+        }}
+        (Path(self.tmpdir) / "index.json").write_text(json.dumps(legacy), encoding="utf-8")
+        # The other process's rename lands between our read and ours
+        with patch.object(Path, "replace", side_effect=FileNotFoundError):
+            cache = FetchCache(cache_dir=self.tmpdir)
+        self.assertEqual(cache.get_text("https://example.com/old"), "legacy text")
+
+    def test_concurrent_puts(self):
+        from concurrent.futures import ThreadPoolExecutor
+        cache = FetchCache(cache_dir=self.tmpdir)
+        other = FetchCache(cache_dir=self.tmpdir)  # second handle, like another process
+        urls = [f"https://example.com/p{i}" for i in range(40)]
+
+        def work(i):
+            (cache if i % 2 else other).put(urls[i], f"page {i}")
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(work, range(len(urls))))
+        self.assertEqual(len(cache), 40)
+        self.assertEqual(cache.get_text(urls[7]), "page 7")
+        self.assertEqual(cache.stats()["total_bytes"], sum(len(f"page {i}") for i in range(40)))
+
+
 class TestCacheIntegrationWithFetch(unittest.TestCase):
     """Test cache integration with fetch_markdown()."""
 
@@ -5604,6 +5604,40 @@ class TestOrchestrator(unittest.TestCase):
                 self.assertTrue(s.get("needs_human"))
                 self.assertIsNone(s.get("audio_path"))
 
+    def test_voice_gen_concurrent_keeps_order_and_errors(self):
+        """voice_gen overlaps TTS requests; results stay in segment order."""
+        from lib.orchestrator import RayVaultOrchestrator, OrchestratorConfig
+        with tempfile.TemporaryDirectory() as td:
+            cfg = OrchestratorConfig(
+                state_dir=td, checkpoints_dir=f"{td}/cp",
+                jobs_dir=f"{td}/jobs", audio_dir=f"{td}/audio",
+                video_dir=f"{td}/video", output_dir=f"{td}/output",
+                tts_provider="mock", tts_concurrency=6,
+            )
+
+            class SlowTTS:
+                def synthesize(self, *, run_id, text):
+                    time.sleep(0.05)
+                    if run_id.endswith("s3"):
+                        raise RuntimeError("voice rejected")
+                    return Path(td) / f"{run_id}.mp3"
+                def has_artifact(self, run_id):
+                    return False
+
+            orch = RayVaultOrchestrator(
+                config=cfg, panic_mgr=self._make_mock_panic(), tts_engine=SlowTTS(),
+            )
+            segs = [{"segment_id": f"s{i}", "text": f"line {i}"} for i in range(12)]
+            t0 = time.monotonic()
+            result = orch.voice_gen("RAY-1", segs)
+            elapsed = time.monotonic() - t0
+            self.assertLess(elapsed, 12 * 0.05 / 2)
+            self.assertEqual([s["segment_id"] for s in result], [s["segment_id"] for s in segs])
+            self.assertTrue(result[0]["audio_path"].endswith("RAY-1_s0.mp3"))
+            self.assertIsNone(result[3]["audio_path"])
+            self.assertTrue(result[3]["needs_human"])
+            self.assertIn("voice rejected", result[3]["tts_error"])
+
     def test_build_manifest(self):
         """Manifest built correctly from segments."""
         from lib.orchestrator import RayVaultOrchestrator, OrchestratorConfig
@@ -6110,6 +6144,19 @@ class TestToleranceMsForKind(unittest.TestCase):
         self.assertEqual(tolerance_ms_for_kind("unknown"), 80)
         self.assertEqual(tolerance_ms_for_kind(""), 80)
 
+    def test_plan_finalize_actions(self):
+        """plan_finalize decides without touching audio (no pydub needed)."""
+        from lib.audio_utils import plan_finalize
+        self.assertEqual(plan_finalize(5050, 5000, kind="product").action, "ok")
+        pad = plan_finalize(4000, 5000)
+        self.assertEqual((pad.action, pad.delta_ms), ("pad_silence", 1000))
+        tweak = plan_finalize(5090, 5000, kind="intro")
+        self.assertEqual(tweak.action, "rate_tweak")
+        self.assertAlmostEqual(tweak.rate, 1.018)
+        self.assertEqual(plan_finalize(5090, 5000, kind="intro", allow_rate_tweak=False).action,
+                         "needs_repair")
+        self.assertEqual(plan_finalize(8000, 5000).action, "needs_repair")
+
 
 class TestFinalizeGate(unittest.TestCase):
     """Tests for finalize_segment_audio smart gate (v0.2.0).
@@ -6237,6 +6284,14 @@ class TestExportAtomic(unittest.TestCase):
             self.assertFalse(out.with_suffix(".mp3.tmp").exists())
 
 
+def _write_silent_wav(path: Path, duration_ms: int, rate: int = 48000) -> None:
+    with wave.open(str(path), "wb") as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(rate)
+        wf.writeframes(b"\x00\x00" * (duration_ms * rate // 1000))
+
+
 class TestOrchestratorFinalizeIntegration(unittest.TestCase):
     """Tests for orchestrator voice_gen with smart finalize gate."""
 
@@ -6251,10 +6306,6 @@ class TestOrchestratorFinalizeIntegration(unittest.TestCase):
     def test_voice_gen_stores_finalize_result(self):
         """voice_gen stores finalize_result metadata per segment."""
         from lib.orchestrator import RayVaultOrchestrator, OrchestratorConfig
-        try:
-            from pydub import AudioSegment
-        except ImportError:
-            self.skipTest("pydub not installed")
 
         with tempfile.TemporaryDirectory() as td:
             cfg = OrchestratorConfig(
@@ -6269,9 +6320,8 @@ class TestOrchestratorFinalizeIntegration(unittest.TestCase):
 
             class MockTTS:
                 def synthesize(self, *, run_id, text):
-                    path = audio_dir / f"{run_id}.mp3"
-                    seg = AudioSegment.silent(duration=4500)
-                    seg.export(path, format="mp3")
+                    path = audio_dir / f"{run_id}.wav"
+                    _write_silent_wav(path, 4500)
                     return path
                 def has_artifact(self, run_id):
                     return False
@@ -6297,10 +6347,6 @@ class TestOrchestratorFinalizeIntegration(unittest.TestCase):
     def test_voice_gen_marks_repair_on_way_over(self):
         """voice_gen marks segment needs_repair when finalize says so."""
         from lib.orchestrator import RayVaultOrchestrator, OrchestratorConfig
-        try:
-            from pydub import AudioSegment
-        except ImportError:
-            self.skipTest("pydub not installed")
 
         with tempfile.TemporaryDirectory() as td:
             cfg = OrchestratorConfig(
@@ -6313,10 +6359,9 @@ class TestOrchestratorFinalizeIntegration(unittest.TestCase):
 
             class MockTTS:
                 def synthesize(self, *, run_id, text):
-                    path = audio_dir / f"{run_id}.mp3"
+                    path = audio_dir / f"{run_id}.wav"
                     # 8 seconds audio for 5 second target → 60% over → needs_repair
-                    seg = AudioSegment.silent(duration=8000)
-                    seg.export(path, format="mp3")
+                    _write_silent_wav(path, 8000)
                     return path
                 def has_artifact(self, run_id):
                     return False
@@ -6337,6 +6382,77 @@ class TestOrchestratorFinalizeIntegration(unittest.TestCase):
             fr = result[0]["finalize_result"]
             self.assertEqual(fr["action"], "needs_repair")
 
+    def _make_orch(self, td, tts=None):
+        from lib.orchestrator import RayVaultOrchestrator, OrchestratorConfig
+        cfg = OrchestratorConfig(
+            state_dir=td, checkpoints_dir=f"{td}/cp",
+            jobs_dir=f"{td}/jobs", audio_dir=f"{td}/audio",
+            video_dir=f"{td}/video", output_dir=f"{td}/output",
+        )
+        return RayVaultOrchestrator(
+            config=cfg, panic_mgr=self._make_mock_panic(), tts_engine=tts,
+        )
+
+    def test_voice_gen_plans_without_rewriting_audio(self):
+        """Finalize is plan-only: pad_silence recorded, segment file untouched."""
+        with tempfile.TemporaryDirectory() as td:
+            audio_dir = Path(td) / "audio"
+
+            class MockTTS:
+                def synthesize(self, *, run_id, text):
+                    path = audio_dir / f"{run_id}.wav"
+                    _write_silent_wav(path, 4000)
+                    return path
+                def has_artifact(self, run_id):
+                    return False
+
+            orch = self._make_orch(td, MockTTS())
+            segs = [{
+                "segment_id": "intro", "kind": "intro",
+                "text": "Hello [pause=500ms] world.", "approx_duration_sec": 5.0,
+            }]
+            result = orch.voice_gen("TEST-P", segs)
+            fr = result[0]["finalize_result"]
+            self.assertEqual(fr["action"], "pad_silence")
+            self.assertEqual(fr["measured_sec"], 4.5)
+            self.assertEqual(fr["delta_ms"], 500)
+            with wave.open(result[0]["audio_path"], "rb") as wf:
+                self.assertEqual(wf.getnframes(), 4 * 48000)
+
+    def test_assemble_voice_writes_padded_track(self):
+        """assemble_voice streams segments into runs/<run_id>/02_audio.wav."""
+        with tempfile.TemporaryDirectory() as td:
+            orch = self._make_orch(td)
+            a, b = Path(td) / "a.wav", Path(td) / "b.wav"
+            _write_silent_wav(a, 4000)
+            _write_silent_wav(b, 3000)
+            segs = [
+                {"segment_id": "intro", "kind": "intro", "audio_path": str(a),
+                 "text": "Hi.", "approx_duration_sec": 5.0},
+                {"segment_id": "p1", "kind": "product", "audio_path": str(b),
+                 "text": "Product.", "approx_duration_sec": 3.0},
+            ]
+            timing = orch.assemble_voice("RUN-V", segs)
+            track = Path(td) / "runs" / "RUN-V" / "02_audio.wav"
+            self.assertEqual(orch.voice_track_path("RUN-V"), track)
+            self.assertEqual([c["action"] for c in timing["chunks"]], ["pad_silence", "ok"])
+            self.assertEqual(timing["chunks"][1]["start_sample"], 5 * 48000)
+            with wave.open(str(track), "rb") as wf:
+                self.assertEqual(wf.getnframes(), 8 * 48000)
+
+    def test_assemble_voice_waits_for_every_segment(self):
+        """No partial track while a segment still needs repair or a human."""
+        with tempfile.TemporaryDirectory() as td:
+            orch = self._make_orch(td)
+            a = Path(td) / "a.wav"
+            _write_silent_wav(a, 1000)
+            segs = [
+                {"segment_id": "intro", "audio_path": str(a)},
+                {"segment_id": "p1", "audio_path": None, "needs_human": True},
+            ]
+            self.assertIsNone(orch.assemble_voice("RUN-W", segs))
+            self.assertFalse(orch.voice_track_path("RUN-W").exists())
+
     def test_voice_gen_no_tts_engine(self):
         """voice_gen without TTS marks all needs_human."""
         from lib.orchestrator import RayVaultOrchestrator, OrchestratorConfig
@@ -6388,10 +6504,6 @@ class TestRepairLoop(unittest.TestCase):
 
     def test_repair_loop_succeeds(self):
         """Repair engine fixes text, re-TTS succeeds."""
-        try:
-            from pydub import AudioSegment
-        except ImportError:
-            self.skipTest("pydub not installed")
         from lib.orchestrator import RayVaultOrchestrator, OrchestratorConfig
 
         with tempfile.TemporaryDirectory() as td:
@@ -6409,11 +6521,10 @@ class TestRepairLoop(unittest.TestCase):
             class MockTTS:
                 def synthesize(self, *, run_id, text):
                     call_count[0] += 1
-                    path = audio_dir / f"{run_id}.mp3"
+                    path = audio_dir / f"{run_id}.wav"
                     # First call: 8s (way over), repair calls: 5s (fits)
                     dur = 8000 if call_count[0] == 1 else 5000
-                    seg = AudioSegment.silent(duration=dur)
-                    seg.export(path, format="mp3")
+                    _write_silent_wav(path, dur)
                     return path
                 def has_artifact(self, run_id):
                     return False
@@ -6444,10 +6555,6 @@ class TestRepairLoop(unittest.TestCase):
 
     def test_repair_loop_exhausted_panics(self):
         """Repair exhausted triggers panic."""
-        try:
-            from pydub import AudioSegment
-        except ImportError:
-            self.skipTest("pydub not installed")
         from lib.orchestrator import RayVaultOrchestrator, OrchestratorConfig
 
         with tempfile.TemporaryDirectory() as td:
@@ -6462,10 +6569,9 @@ class TestRepairLoop(unittest.TestCase):
 
             class MockTTS:
                 def synthesize(self, *, run_id, text):
-                    path = audio_dir / f"{run_id}.mp3"
+                    path = audio_dir / f"{run_id}.wav"
                     # Always 8s — never fits
-                    seg = AudioSegment.silent(duration=8000)
-                    seg.export(path, format="mp3")
+                    _write_silent_wav(path, 8000)
                     return path
                 def has_artifact(self, run_id):
                     return False
@@ -6935,6 +7041,62 @@ class TestDzineRenderFailFast(unittest.TestCase):
             self.assertIn("DZINE_RENDER_FAIL", str(ctx.exception))
             self.assertTrue(any("panic_dzine_ui_failure" in c[0] for c in pm.calls))
 
+    def test_pad_silence_segment_renders_at_target(self):
+        """VOICE_GEN → assemble → dzine_render: Dzine gets the padded slice."""
+        from lib.orchestrator import RayVaultOrchestrator, OrchestratorConfig
+        with tempfile.TemporaryDirectory() as td:
+            cfg = OrchestratorConfig(
+                state_dir=td, checkpoints_dir=f"{td}/cp",
+                jobs_dir=f"{td}/jobs", audio_dir=f"{td}/audio",
+                video_dir=f"{td}/video", video_final_dir=f"{td}/vfinal",
+                video_index_path=f"{td}/index.json",
+                output_dir=f"{td}/output",
+            )
+            audio_dir = Path(td) / "audio"
+
+            class MockTTS:
+                def synthesize(self, *, run_id, text):
+                    path = audio_dir / f"{run_id}.wav"
+                    _write_silent_wav(path, 4000)
+                    return path
+                def has_artifact(self, run_id):
+                    return False
+
+            rendered = {}
+
+            class AudioLengthDzine:
+                """Writes a 'video' as long as the audio it was handed."""
+                def render_segment(self, *, audio_path, expected_video_path, **kw):
+                    with wave.open(str(audio_path), "rb") as wf:
+                        rendered[str(expected_video_path)] = wf.getnframes() / wf.getframerate()
+                    expected_video_path.parent.mkdir(parents=True, exist_ok=True)
+                    expected_video_path.write_bytes(b"\x00" * 600_000)
+
+            def probe(path, target_sec, *, tolerance_sec, min_bytes):
+                dur = rendered.get(str(path), 0.0)
+                return abs(dur - target_sec) <= tolerance_sec, dur
+
+            pm = self._make_mock_panic()
+            orch = RayVaultOrchestrator(
+                config=cfg, panic_mgr=pm,
+                tts_engine=MockTTS(), dzine_agent=AudioLengthDzine(),
+            )
+            segs = orch.voice_gen("TEST-PAD", [{
+                "segment_id": "intro", "kind": "intro",
+                "text": "Hello there.", "approx_duration_sec": 5.0,
+            }])
+            self.assertEqual(segs[0]["finalize_result"]["action"], "pad_silence")
+            timing = orch.assemble_voice("TEST-PAD", segs)
+            self.assertIsNotNone(timing)
+            manifest_path = orch.build_manifest(
+                "TEST-PAD", segs, voice_track=str(orch.voice_track_path("TEST-PAD")),
+            )
+            with patch("lib.orchestrator.is_video_valid", probe):
+                summary = orch.dzine_render("TEST-PAD", manifest_path)
+            self.assertEqual(summary["rendered"], 1)
+            self.assertEqual(list(rendered.values()), [5.0])
+            self.assertEqual(pm.calls, [])
+
 
 class TestHasFfprobe(unittest.TestCase):
     """Tests for has_ffprobe availability check."""